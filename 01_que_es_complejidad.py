@@ -58,49 +58,94 @@ def ejemplo_busqueda_binaria(array, target):
     return None
 
 
+def ejemplo_busqueda_interpolacion(array, target):
+    """
+    Búsqueda por interpolación: ADIVINA dónde está según el valor
+
+    Como buscar en el diccionario: la "Z" está casi al final, no al medio.
+
+    Complejidad: O(log log n) si los valores están repartidos parejos
+    - ¡Todavía más rápido que la binaria!
+    - Pero si los valores están amontonados puede llegar a O(n)
+      (02b_binary_search.py tiene una versión que se protege de eso)
+    """
+    pasos = 0
+    low = 0
+    high = len(array) - 1
+
+    while low <= high and array[low] <= target <= array[high]:
+        pasos += 1
+        if array[high] == array[low]:
+            pos = low
+        else:
+            # ¿Qué fracción del camino entre array[low] y array[high] es target?
+            pos = low + (target - array[low]) * (high - low) // (array[high] - array[low])
+        guess = array[pos]
+        print(f"Paso {pasos}: Revisando posición {pos}, valor = {guess}")
+
+        if guess == target:
+            print(f"✅ ¡Encontrado en {pasos} pasos!")
+            return pos
+        elif guess > target:
+            high = pos - 1
+        else:
+            low = pos + 1
+
+    print(f"❌ No encontrado después de {pasos} pasos")
+    return None
+
+
 # 🎯 COMPARACIÓN PRÁCTICA
 
-print("=" * 60)
-print("COMPARACIÓN: Búsqueda Lineal vs Búsqueda Binaria")
-print("=" * 60)
+if __name__ == "__main__":
+    print("=" * 60)
+    print("COMPARACIÓN: Búsqueda Lineal vs Búsqueda Binaria")
+    print("=" * 60)
+
+    # Crear un array grande
+    array_grande = list(range(1, 1000001))  # 1 a 1,000,000
+    target = 500000
 
-# Crear un array grande
-array_grande = list(range(1, 1000001))  # 1 a 1,000,000
-target = 500000
+    print(f"\n🔍 Buscando {target} en un array de 1,000,000 elementos\n")
 
-print(f"\n🔍 Buscando {target} en un array de 1,000,000 elementos\n")
+    print("1️⃣  BÚSQUEDA LINEAL (O(n)):")
+    print("-" * 60)
+    # Nota: Esto tardará mucho, así que usemos un ejemplo más pequeño para ver los pasos
+    array_pequeño = list(range(1, 101))  # 1 a 100
+    ejemplo_busqueda_lineal(array_pequeño, 75)
 
-print("1️⃣  BÚSQUEDA LINEAL (O(n)):")
-print("-" * 60)
-# Nota: Esto tardará mucho, así que usemos un ejemplo más pequeño para ver los pasos
-array_pequeño = list(range(1, 101))  # 1 a 100
-ejemplo_busqueda_lineal(array_pequeño, 75)
+    print("\n2️⃣  BÚSQUEDA BINARIA (O(log n)):")
+    print("-" * 60)
+    ejemplo_busqueda_binaria(array_pequeño, 75)
 
-print("\n2️⃣  BÚSQUEDA BINARIA (O(log n)):")
-print("-" * 60)
-ejemplo_busqueda_binaria(array_pequeño, 75)
+    print("\n3️⃣  BÚSQUEDA POR INTERPOLACIÓN (O(log log n) con datos parejos):")
+    print("-" * 60)
+    ejemplo_busqueda_interpolacion(array_pequeño, 75)
 
-print("\n" + "=" * 60)
-print("💡 CONCLUSIÓN:")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("💡 CONCLUSIÓN:")
+    print("=" * 60)
+    print("""
 Con 100 elementos:
 - Búsqueda lineal: hasta 100 pasos
 - Búsqueda binaria: máximo ~7 pasos
+- Búsqueda por interpolación: 1 paso (¡los números van de 1 en 1!)
 
 Con 1,000,000 elementos:
 - Búsqueda lineal: hasta 1,000,000 pasos 😱
 - Búsqueda binaria: máximo ~20 pasos 🚀
+- Búsqueda por interpolación: ~5 pasos si los valores son parejos 🚀🚀
 
 ¡La diferencia es ENORME cuando el array es grande!
 """)
 
-# 📊 TABLA DE COMPLEJIDADES COMUNES
-print("=" * 60)
-print("📊 COMPLEJIDADES MÁS COMUNES (de mejor a peor):")
-print("=" * 60)
-print("""
+    # 📊 TABLA DE COMPLEJIDADES COMUNES
+    print("=" * 60)
+    print("📊 COMPLEJIDADES MÁS COMUNES (de mejor a peor):")
+    print("=" * 60)
+    print("""
 O(1)        - Constante:      Acceder a un elemento del array
+O(log log n) - Doble log:     Búsqueda por interpolación (datos parejos)
 O(log n)    - Logarítmica:    Búsqueda binaria
 O(n)        - Lineal:         Recorrer un array
 O(n log n)  - Cuasi-lineal:   Quick sort, Merge sort
@@ -56,6 +56,44 @@ def ejemplo_busqueda_binaria(array, target)
   nil
 end
 
+def ejemplo_busqueda_interpolacion(array, target)
+  # Búsqueda por interpolación: ADIVINA dónde está según el valor
+  #
+  # Como buscar en el diccionario: la "Z" está casi al final, no al medio.
+  #
+  # Complejidad: O(log log n) si los valores están repartidos parejos
+  # - ¡Todavía más rápido que la binaria!
+  # - Pero si los valores están amontonados puede llegar a O(n)
+  #   (02b_binary_search.rb tiene una versión que se protege de eso)
+  pasos = 0
+  low = 0
+  high = array.length - 1
+
+  while low <= high && array[low] <= target && target <= array[high]
+    pasos += 1
+    if array[high] == array[low]
+      pos = low
+    else
+      # ¿Qué fracción del camino entre array[low] y array[high] es target?
+      pos = low + (target - array[low]) * (high - low) / (array[high] - array[low])
+    end
+    guess = array[pos]
+    puts "Paso #{pasos}: Revisando posición #{pos}, valor = #{guess}"
+
+    if guess == target
+      puts "✅ ¡Encontrado en #{pasos} pasos!"
+      return pos
+    elsif guess > target
+      high = pos - 1
+    else
+      low = pos + 1
+    end
+  end
+
+  puts "❌ No encontrado después de #{pasos} pasos"
+  nil
+end
+
 # 🎯 COMPARACIÓN PRÁCTICA
 
 puts "=" * 60
@@ -78,6 +116,10 @@ puts "\n2️⃣  BÚSQUEDA BINARIA (O(log n)):"
 puts "-" * 60
 ejemplo_busqueda_binaria(array_pequeño, 75)
 
+puts "\n3️⃣  BÚSQUEDA POR INTERPOLACIÓN (O(log log n) con datos parejos):"
+puts "-" * 60
+ejemplo_busqueda_interpolacion(array_pequeño, 75)
+
 puts "\n" + "=" * 60
 puts "💡 CONCLUSIÓN:"
 puts "=" * 60
@@ -85,10 +127,12 @@ puts """
 Con 100 elementos:
 - Búsqueda lineal: hasta 100 pasos
 - Búsqueda binaria: máximo ~7 pasos
+- Búsqueda por interpolación: 1 paso (¡los números van de 1 en 1!)
 
 Con 1,000,000 elementos:
 - Búsqueda lineal: hasta 1,000,000 pasos 😱
 - Búsqueda binaria: máximo ~20 pasos 🚀
+- Búsqueda por interpolación: ~5 pasos si los valores son parejos 🚀🚀
 
 ¡La diferencia es ENORME cuando el array es grande!
 """
@@ -99,6 +143,7 @@ puts "📊 COMPLEJIDADES MÁS COMUNES (de mejor a peor):"
 puts "=" * 60
 puts """
 O(1)        - Constante:      Acceder a un elemento del array
+O(log log n) - Doble log:     Búsqueda por interpolación (datos parejos)
 O(log n)    - Logarítmica:    Búsqueda binaria
 O(n)        - Lineal:         Recorrer un array
 O(n log n)  - Cuasi-lineal:   Quick sort, Merge sort
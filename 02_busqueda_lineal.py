@@ -8,6 +8,8 @@ Es como buscar un libro en una pila desordenada:
 ¡No hay más remedio que revisar uno por uno!
 """
 
+import collections
+
 
 def busqueda_lineal(array, target):
     """
@@ -47,32 +49,199 @@ def busqueda_lineal_sin_prints(array, target):
     return None
 
 
+# ============================================
+# BÚSQUEDA LINEAL CON CENTINELA
+# ============================================
+#
+# El for de arriba hace DOS preguntas por vuelta:
+#   1. ¿Ya llegué al final? (i < len(array))
+#   2. ¿Es este el que busco? (array[i] == target)
+#
+# Truco del centinela: ponemos una copia del target AL FINAL del array.
+# Ahora es seguro que lo vamos a encontrar, así que la pregunta 1 sobra:
+#
+#   [5, 2, 8, 1]  buscamos 7  ->  [5, 2, 8, 1, 7]
+#                                              ^ centinela
+#   Si lo encontramos en la posición 4 (la del centinela), no estaba.
+#
+# En C o en assembler esto ahorra casi la mitad de las comparaciones.
+# En Python, cada "i += 1" cuesta más que la comparación que ahorramos,
+# así que es MÁS lento que el for (ver EJEMPLO 4): el truco es para
+# entender cómo trabajan por dentro funciones como list.index.
+
+
+def busqueda_lineal_centinela(array, target):
+    """
+    Búsqueda lineal con centinela: una sola comparación por elemento.
+
+    Args:
+        array: Solo una list: se le agrega el centinela y se le quita al
+               terminar (también si una comparación lanza una excepción).
+               Para tuplas u otras secuencias, busqueda_lineal_rapida
+        target: El elemento que estamos buscando
+
+    Returns:
+        El índice del elemento si lo encuentra, None si no existe
+    """
+    if not isinstance(array, list):
+        raise TypeError("busqueda_lineal_centinela necesita una list (le agrega el centinela); "
+                        f"recibió {type(array).__name__}")
+    n = len(array)
+    array.append(target)          # El centinela: seguro que lo encontramos
+    try:
+        i = 0
+        # Sin preguntar "¿llegué al final?". El "is" va primero, como en
+        # list.index: NaN != NaN, pero el centinela ES target y corta igual
+        while array[i] is not target and array[i] != target:
+            i += 1
+    finally:
+        array.pop()               # Dejamos el array como estaba
+    return i if i < n else None
+
+
+def busqueda_lineal_rapida(array, target):
+    """
+    Igual que busqueda_lineal_sin_prints, pero el recorrido lo hace C:
+    - arrays de NumPy: se comparan TODOS los elementos de una vez
+    - listas, tuplas, array.array: su método .index (un for escrito en C)
+    - cualquier otra secuencia: el for de siempre
+    """
+    if hasattr(array, "searchsorted"):
+        # NumPy: array == target es un array de True/False, y argmax
+        # devuelve la posición del primer True
+        coincidencias = array == target
+        if not coincidencias.any():
+            return None
+        return int(coincidencias.argmax())
+    if isinstance(array, (list, tuple)) or hasattr(array, "typecode"):
+        try:
+            return array.index(target)
+        except ValueError:
+            return None
+    return busqueda_lineal_sin_prints(array, target)
+
+
+# ============================================
+# MUCHOS TARGETS EN UNA SOLA PASADA
+# ============================================
+#
+# Buscar k targets llamando k veces a la búsqueda lineal recorre el
+# array k veces: O(n · k). Si guardamos los targets en un set, cada
+# elemento se revisa UNA vez y preguntar "¿es alguno de los que busco?"
+# cuesta O(1) (archivo 19, hashing): O(n + k) en total.
+
+Apariciones = collections.namedtuple("Apariciones", "primero ultimo todos")
+
+
+def busqueda_lineal_multi(array, targets):
+    """
+    Busca varios targets recorriendo el array una sola vez.
+
+    Args:
+        array: Lista (o array de NumPy) de elementos, ordenada o no
+        targets: Los elementos a buscar (tienen que poder ir en un set)
+
+    Returns:
+        Diccionario target -> Apariciones(primero, ultimo, todos):
+        la primera y la última posición (None si no está) y la lista de
+        todas las posiciones donde aparece.
+    """
+    posiciones = {target: [] for target in targets}
+
+    if hasattr(array, "searchsorted"):
+        # NumPy: una pasada vectorizada marca los elementos que son alguno
+        # de los targets; el for solo recorre esas coincidencias
+        import numpy  # Si nos pasaron un ndarray, NumPy ya está cargado
+        indices = numpy.flatnonzero(numpy.isin(array, list(posiciones)))
+        for i, valor in zip(indices.tolist(), array[indices].tolist()):
+            posiciones[valor].append(i)
+    else:
+        for i, elemento in enumerate(array):
+            if elemento in posiciones:    # O(1): es un diccionario
+                posiciones[elemento].append(i)
+
+    return {
+        target: Apariciones(todos[0] if todos else None, todos[-1] if todos else None, todos)
+        for target, todos in posiciones.items()
+    }
+
+
 # 🎯 EJEMPLOS DE USO
 
-print("=" * 60)
-print("EJEMPLO 1: Buscar en un array pequeño")
-print("=" * 60)
-array1 = [5, 2, 8, 1, 9, 3]
-resultado1 = busqueda_lineal(array1, 8)
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Buscar algo que no existe")
-print("=" * 60)
-array2 = [1, 2, 3, 4, 5]
-resultado2 = busqueda_lineal(array2, 10)
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Buscar en array con duplicados")
-print("=" * 60)
-array3 = [2, 5, 2, 8, 2, 9]
-resultado3 = busqueda_lineal(array3, 2)  # Encuentra el primero
-
-# 💡 CARACTERÍSTICAS IMPORTANTES
-
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE BÚSQUEDA LINEAL")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Buscar en un array pequeño")
+    print("=" * 60)
+    array1 = [5, 2, 8, 1, 9, 3]
+    resultado1 = busqueda_lineal(array1, 8)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Buscar algo que no existe")
+    print("=" * 60)
+    array2 = [1, 2, 3, 4, 5]
+    resultado2 = busqueda_lineal(array2, 10)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Buscar en array con duplicados")
+    print("=" * 60)
+    array3 = [2, 5, 2, 8, 2, 9]
+    resultado3 = busqueda_lineal(array3, 2)  # Encuentra el primero
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Centinela, list.index y NumPy")
+    print("=" * 60)
+    import random
+    import time
+
+    grande = list(range(1_000_000))
+    random.shuffle(grande)
+    target = -1  # No está: el peor caso, hay que revisar todo
+
+    for nombre, funcion in [("for (sin_prints)", busqueda_lineal_sin_prints),
+                            ("centinela", busqueda_lineal_centinela),
+                            ("rapida (list.index)", busqueda_lineal_rapida)]:
+        start = time.time()
+        funcion(grande, target)
+        print(f"{nombre:<22} {time.time() - start:.4f} segundos")
+    try:
+        import numpy
+        grande_numpy = numpy.array(grande)
+        start = time.time()
+        busqueda_lineal_rapida(grande_numpy, target)
+        print(f"{'rapida (NumPy)':<22} {time.time() - start:.4f} segundos")
+    except ImportError:
+        print("(instala NumPy para ver la versión vectorizada)")
+    print("💡 En Python gana el que recorre en C, no el que hace menos preguntas")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Muchos targets en una sola pasada")
+    print("=" * 60)
+    array5 = [4, 7, 1, 7, 3, 9, 7, 1]
+    targets = [7, 1, 5]
+    print(f"Array: {array5}")
+    print(f"Targets: {targets}")
+    for target, apariciones in busqueda_lineal_multi(array5, targets).items():
+        print(f"  {target}: primero={apariciones.primero}, ultimo={apariciones.ultimo}, "
+              f"todos={apariciones.todos}")
+
+    targets = random.sample(range(1_000_000), 200)
+    start = time.time()
+    uno_por_uno = {t: busqueda_lineal_rapida(grande, t) for t in targets}
+    tiempo_k_pasadas = time.time() - start
+    start = time.time()
+    multi = busqueda_lineal_multi(grande, targets)
+    tiempo_una_pasada = time.time() - start
+    print(f"\n200 targets en 1,000,000 elementos:")
+    print(f"  200 pasadas (una por target): {tiempo_k_pasadas:.3f} segundos")
+    print(f"  1 pasada con un set:          {tiempo_una_pasada:.3f} segundos")
+    print(f"  ¿Mismo resultado? {all(multi[t].primero == uno_por_uno[t] for t in targets)}")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE BÚSQUEDA LINEAL")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Súper simple de entender y programar
    - Funciona con arrays ordenados Y desordenados
@@ -85,6 +254,7 @@ print("""
 📊 COMPLEJIDAD:
    - Tiempo: O(n) - revisa hasta n elementos
    - Espacio: O(1) - solo usa memoria constante
+   - k targets con busqueda_lineal_multi: O(n + k) en vez de O(n · k)
 
 🎯 CUÁNDO USARLA:
    - Arrays pequeños (< 100 elementos)
@@ -92,12 +262,12 @@ print("""
    - Cuando es más importante la simplicidad que la velocidad
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica la función para que cuente cuántas veces aparece el target
    Ejemplo: buscar 2 en [2, 5, 2, 8, 2] → aparece 3 veces
 
@@ -41,6 +41,79 @@ def busqueda_lineal_sin_prints(array, target)
   nil
 end
 
+# ============================================
+# BÚSQUEDA LINEAL CON CENTINELA
+# ============================================
+#
+# El recorrido de arriba hace DOS preguntas por vuelta:
+#   1. ¿Ya llegué al final?
+#   2. ¿Es este el que busco?
+#
+# Truco del centinela: ponemos una copia del target AL FINAL del array.
+# Ahora es seguro que lo vamos a encontrar, así que la pregunta 1 sobra:
+#
+#   [5, 2, 8, 1]  buscamos 7  ->  [5, 2, 8, 1, 7]
+#                                              ^ centinela
+#   Si lo encontramos en la posición 4 (la del centinela), no estaba.
+#
+# En C o en assembler esto ahorra casi la mitad de las comparaciones.
+# En Ruby el while con centinela le gana a each_with_index (ver EJEMPLO 4),
+# pero Array#index, que recorre en C, les gana a los dos.
+
+def busqueda_lineal_centinela(array, target)
+  # Búsqueda lineal con centinela: una sola comparación por elemento.
+  # Solo acepta un Array: se le agrega el centinela y se le quita al
+  # terminar (también si una comparación lanza una excepción).
+  unless array.is_a?(Array)
+    raise ArgumentError, "busqueda_lineal_centinela necesita un Array (le agrega el centinela); " \
+                         "recibió #{array.class}"
+  end
+  n = array.length
+  array.push(target)            # El centinela: seguro que lo encontramos
+  begin
+    i = 0
+    # Sin preguntar "¿llegué al final?". El equal? va primero, como en
+    # Array#index: NaN != NaN, pero el centinela ES target y corta igual
+    i += 1 while !array[i].equal?(target) && array[i] != target
+  ensure
+    array.pop                   # Dejamos el array como estaba
+  end
+  i < n ? i : nil
+end
+
+def busqueda_lineal_rapida(array, target)
+  # Igual que busqueda_lineal_sin_prints, pero el recorrido lo hace C
+  # (Array#index está escrito en C).
+  array.index(target)
+end
+
+# ============================================
+# MUCHOS TARGETS EN UNA SOLA PASADA
+# ============================================
+#
+# Buscar k targets llamando k veces a la búsqueda lineal recorre el
+# array k veces: O(n · k). Si guardamos los targets en un Hash, cada
+# elemento se revisa UNA vez y preguntar "¿es alguno de los que busco?"
+# cuesta O(1) (archivo 19, hashing): O(n + k) en total.
+
+Apariciones = Struct.new(:primero, :ultimo, :todos)
+
+def busqueda_lineal_multi(array, targets)
+  # Busca varios targets recorriendo el array una sola vez.
+  #
+  # Returns:
+  #     Hash target -> Apariciones(primero, ultimo, todos): la primera y
+  #     la última posición (nil si no está) y todas las posiciones.
+  posiciones = targets.to_h { |target| [target, []] }
+
+  array.each_with_index do |elemento, i|
+    todos = posiciones[elemento]   # O(1): es un Hash
+    todos << i if todos
+  end
+
+  posiciones.transform_values { |todos| Apariciones.new(todos.first, todos.last, todos) }
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -61,6 +134,45 @@ puts "=" * 60
 array3 = [2, 5, 2, 8, 2, 9]
 resultado3 = busqueda_lineal(array3, 2)  # Encuentra el primero
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Centinela e index"
+puts "=" * 60
+grande = (0...1_000_000).to_a.shuffle
+target = -1  # No está: el peor caso, hay que revisar todo
+
+[["each (sin_prints)", :busqueda_lineal_sin_prints],
+ ["centinela", :busqueda_lineal_centinela],
+ ["rapida (index)", :busqueda_lineal_rapida]].each do |nombre, funcion|
+  start = Time.now
+  send(funcion, grande, target)
+  puts "#{nombre.ljust(22)} #{(Time.now - start).round(4)} segundos"
+end
+puts "💡 En Ruby gana el que recorre en C, no el que hace menos preguntas"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 5: Muchos targets en una sola pasada"
+puts "=" * 60
+array5 = [4, 7, 1, 7, 3, 9, 7, 1]
+targets = [7, 1, 5]
+puts "Array: #{array5}"
+puts "Targets: #{targets}"
+busqueda_lineal_multi(array5, targets).each do |target, apariciones|
+  puts "  #{target}: primero=#{apariciones.primero.inspect}, ultimo=#{apariciones.ultimo.inspect}, " \
+       "todos=#{apariciones.todos}"
+end
+
+targets = (0...1_000_000).to_a.sample(200)
+start = Time.now
+uno_por_uno = targets.to_h { |t| [t, busqueda_lineal_rapida(grande, t)] }
+tiempo_k_pasadas = Time.now - start
+start = Time.now
+multi = busqueda_lineal_multi(grande, targets)
+tiempo_una_pasada = Time.now - start
+puts "\n200 targets en 1,000,000 elementos:"
+puts "  200 pasadas (una por target): #{tiempo_k_pasadas.round(3)} segundos"
+puts "  1 pasada con un Hash:         #{tiempo_una_pasada.round(3)} segundos"
+puts "  ¿Mismo resultado? #{targets.all? { |t| multi[t].primero == uno_por_uno[t] }}"
+
 # 💡 CARACTERÍSTICAS IMPORTANTES
 
 puts "\n" + "=" * 60
@@ -79,6 +191,7 @@ puts """
 📊 COMPLEJIDAD:
    - Tiempo: O(n) - revisa hasta n elementos
    - Espacio: O(1) - solo usa memoria constante
+   - k targets con busqueda_lineal_multi: O(n + k) en vez de O(n · k)
 
 🎯 CUÁNDO USARLA:
    - Arrays pequeños (< 100 elementos)
@@ -100,7 +213,7 @@ puts """
 3. Crea una función que busque el elemento MÍNIMO usando búsqueda lineal
 
 4. Modifica la función para que busque en un array de strings
-   Ejemplo: buscar "hola" en ["hi", "hola", "hello"]
+   Ejemplo: buscar \"hola\" en [\"hi\", \"hola\", \"hello\"]
 
 💡 Pista: Puedes usar el código de arriba como base y modificarlo
 """
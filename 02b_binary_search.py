@@ -1,3 +1,5 @@
+import math
+
 
 def binary_search(array, item):
     """
@@ -40,9 +42,444 @@ def binary_search(array, item):
     return None
 
 
+def binary_search_sin_prints(array, item):
+    """Versión limpia sin prints (para usar en otros algoritmos)."""
+    low = 0
+    high = len(array) - 1
+
+    while low <= high:
+        mid = (low + high) // 2
+        guess = array[mid]
+        if guess == item:
+            return mid
+        elif guess > item:
+            high = mid - 1
+        else:
+            low = mid + 1
+    return None
+
+
+# ============================================
+# FAMILIA lower_bound / upper_bound
+# ============================================
+#
+# binary_search dice SI está y DÓNDE, pero con repetidos devuelve
+# cualquiera de ellos, y si no está solo dice None. Muchas veces queremos
+# algo más útil: "¿en qué posición iría este valor?".
+#
+#   array = [1, 3, 3, 3, 7]
+#   lower_bound(array, 3) -> 1   primera posición con valor >= 3
+#   upper_bound(array, 3) -> 4   primera posición con valor >  3
+#   equal_range(array, 3) -> (1, 4)   los 3 están en array[1:4]
+#   lower_bound(array, 5) -> 4   el 5 iría antes del 7
+#
+# Son lo mismo que bisect.bisect_left y bisect.bisect_right de Python.
+#
+# Versión "sin ramas": en vez de un if/elif/else con tres caminos y un
+# while que puede terminar antes, el bucle corre SIEMPRE log2(n) vueltas
+# y en cada una solo decide si la base avanza o no:
+#
+#   base = 0, n = 5          [1, 3, 3, 3, 7]   buscamos 3
+#   mitad = 2  array[2]=3 < 3? no  -> base = 0, n = 3
+#   mitad = 1  array[1]=3 < 3? no  -> base = 0, n = 2
+#   mitad = 1  array[1]=3 < 3? no  -> base = 0, n = 1
+#   al final:  array[0]=1 < 3? sí  -> 0 + 1 = 1
+#
+# Funciona con cualquier cosa que tenga len() e índices: listas,
+# array.array, memoryview... sin copiar nada. Si es un array de NumPy,
+# usamos su searchsorted, que hace lo mismo en C.
+
+
+def lower_bound(array, item, low=0, high=None):
+    """
+    Primera posición de array[low:high] cuyo valor es >= item.
+
+    Args:
+        array: Secuencia ordenada (lista, array.array, ndarray de NumPy...)
+        item: Valor a ubicar
+        low, high: Rango donde buscar (por defecto, todo el array)
+
+    Returns:
+        Índice entre low y high. Si es high, todos son menores que item.
+    """
+    if high is None:
+        high = len(array)
+    if hasattr(array, "searchsorted"):
+        # array[low:high] en NumPy es una vista: no copia
+        return low + int(array[low:high].searchsorted(item, side="left"))
+
+    base = low
+    n = high - low
+    if n == 0:
+        return low
+    while n > 1:
+        mitad = n // 2
+        # El único "if": ¿la base avanza hasta la mitad o se queda?
+        base = base + mitad if array[base + mitad] < item else base
+        n -= mitad
+    return base + (array[base] < item)
+
+
+def upper_bound(array, item, low=0, high=None):
+    """
+    Primera posición de array[low:high] cuyo valor es > item.
+
+    Igual que lower_bound, pero los iguales a item quedan a la izquierda.
+    """
+    if high is None:
+        high = len(array)
+    if hasattr(array, "searchsorted"):
+        # array[low:high] en NumPy es una vista: no copia
+        return low + int(array[low:high].searchsorted(item, side="right"))
+
+    base = low
+    n = high - low
+    if n == 0:
+        return low
+    while n > 1:
+        mitad = n // 2
+        base = base + mitad if not item < array[base + mitad] else base
+        n -= mitad
+    return base + (not item < array[base])
+
+
+def equal_range(array, item):
+    """
+    Rango (inicio, fin) donde están TODAS las copias de item:
+    array[inicio:fin] son exactamente los iguales a item.
+    Si no está, inicio == fin (la posición donde iría).
+    """
+    inicio = lower_bound(array, item)
+    # Los iguales no pueden estar antes de inicio: buscamos solo desde ahí
+    return inicio, upper_bound(array, item, inicio)
+
+
+def search_many(sorted_array, queries):
+    """
+    Busca muchos valores de una vez, en UNA pasada por sorted_array.
+
+    Ordenamos las consultas: así la respuesta de cada una está a la
+    DERECHA de la anterior. Desde ahí "galopamos": miramos 1, 2, 4, 8...
+    posiciones más adelante hasta pasarnos, y solo ese último salto se
+    busca con lower_bound. Si la siguiente respuesta está a d lugares,
+    cuesta O(log d) en vez de O(log n): con muchas consultas (d chico)
+    es casi recorrer los dos en paralelo, como el merge de Merge Sort.
+
+    Args:
+        sorted_array: Secuencia ordenada
+        queries: Valores a buscar (en cualquier orden)
+
+    Returns:
+        Lista con, para cada consulta en su orden original, el índice de su
+        primera aparición en sorted_array, o None si no está.
+    """
+    if hasattr(sorted_array, "searchsorted"):
+        # NumPy: todas las consultas en una sola llamada, y también la
+        # comparación "¿el de esa posición es igual a la consulta?"
+        posiciones = sorted_array.searchsorted(queries, side="left")
+        n = len(sorted_array)
+        if n == 0:
+            return [None] * len(posiciones)
+        encontrados = (sorted_array.take(posiciones.clip(0, n - 1)) == queries) & (posiciones < n)
+        return [p if e else None for p, e in zip(posiciones.tolist(), encontrados.tolist())]
+
+    queries = list(queries)
+    n = len(sorted_array)
+    resultado = [None] * len(queries)
+    desde = 0  # Todo lo anterior a desde es menor que la consulta actual
+    for i in sorted(range(len(queries)), key=queries.__getitem__):
+        q = queries[i]
+        # Galope: saltos de 1, 2, 4... hasta llegar a un valor >= q
+        fin, salto = desde, 1
+        while fin < n and sorted_array[fin] < q:
+            desde = fin + 1
+            fin += salto
+            salto *= 2
+        # La respuesta está en [desde, fin]: un tramo del tamaño del último salto
+        desde = lower_bound(sorted_array, q, desde, min(fin, n))
+        if desde < n and sorted_array[desde] == q:
+            resultado[i] = desde
+    return resultado
+
+
+# ============================================
+# BÚSQUEDA POR INTERPOLACIÓN
+# ============================================
+#
+# Para buscar "Martínez" en la guía telefónica no abrimos por la mitad:
+# abrimos más o menos a la mitad, porque la M está ahí. Y para "Zapata",
+# casi al final. Eso es interpolar: ADIVINAR la posición por el valor.
+#
+#   array = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]    buscamos 70
+#   70 está a (70 - 10) / (100 - 10) = 2/3 del camino entre 10 y 100
+#   -> miramos la posición 2/3 * 9 = 6 -> array[6] = 70 ¡en 1 paso!
+#
+# Si los valores están repartidos de forma PAREJA (ids, timestamps), el
+# rango se achica muchísimo en cada paso: O(log log n). Con un millón de
+# elementos son ~5 pasos en vez de 20.
+#
+# Pero si los valores están "amontonados" ([1, 2, 3, 4, 1000000]) las
+# adivinanzas fallan y puede tardar O(n). Por eso:
+# - después de cada adivinanza miramos también una posición a √rango de
+#   distancia, para cerrar el rango por los DOS lados
+# - si aun así una vuelta no achica el rango al menos a la mitad (lo que
+#   haría la búsqueda binaria), nos pasamos a lower_bound. Así el peor
+#   caso sigue siendo O(log n).
+
+
+def _numero_python(valor):
+    """Un escalar de NumPy (np.int64...) como int o float de Python."""
+    return valor.item() if hasattr(valor, "item") else valor
+
+
+def interpolation_lower_bound(array, item):
+    """
+    Igual que lower_bound (primera posición con valor >= item), pero
+    adivinando la posición por interpolación.
+
+    Args:
+        array: Secuencia ordenada de NÚMEROS (hay que poder restarlos)
+        item: Número a ubicar
+
+    Returns:
+        Índice entre 0 y len(array)
+    """
+    n = len(array)
+    if n == 0:
+        return 0
+    menor, mayor = array[0], array[n - 1]
+    if not menor < item:
+        return 0
+    if mayor < item:
+        return n
+
+    # Invariante: array[low - 1] < item <= array[high]
+    # y conocemos esos dos valores (menor y mayor)
+    low, high = 1, n - 1
+    isqrt = math.isqrt
+    item_python = _numero_python(item)
+    while low < high:
+        ancho = high - low
+        # ¿A qué fracción del camino entre menor y mayor está item?
+        # Con números de Python: en un array de NumPy, (item - menor) * ancho
+        # en int64 se desborda con timestamps en nanosegundos (~1.6e18)
+        desde_menor = item_python - _numero_python(menor)
+        pos = low + int(desde_menor * ancho // (_numero_python(mayor) - _numero_python(menor)))
+        if pos >= high:
+            pos = high - 1
+        valor = array[pos]
+        paso = isqrt(ancho)
+        if valor < item:
+            low, menor = pos + 1, valor
+            # ¿Quedó cerca? Probamos √ancho más a la derecha
+            if low + paso < high:
+                valor = array[low + paso]
+                if valor < item:
+                    low, menor = low + paso + 1, valor
+                else:
+                    high, mayor = low + paso, valor
+        else:
+            high, mayor = pos, valor
+            if high - paso > low:
+                valor = array[high - paso]
+                if valor < item:
+                    low, menor = high - paso + 1, valor
+                else:
+                    high, mayor = high - paso, valor
+
+        if (high - low) * 2 > ancho:
+            # La interpolación no está ayudando: datos no uniformes
+            return lower_bound(array, item, low, high)
+    return low
+
+
+def interpolation_search(array, item):
+    """
+    Índice de item en un array ordenado de números, o None si no está.
+    Como binary_search, pero O(log log n) si los valores son parejos.
+    """
+    pos = interpolation_lower_bound(array, item)
+    if pos < len(array) and array[pos] == item:
+        return pos
+    return None
+
+
+# ============================================
+# BÚSQUEDA EXPONENCIAL (GALOPANTE)
+# ============================================
+#
+# ¿Y si NO sabemos cuántos elementos hay? Por ejemplo, leyendo un log
+# ordenado por fecha que todavía se está escribiendo. La búsqueda binaria
+# necesita saber dónde termina el array.
+#
+# La búsqueda exponencial da saltos que se DUPLICAN: mira las
+# posiciones 0, 1, 3, 7, 15, 31... hasta pasarse (o llegar al final).
+# Ahí sabe que la respuesta está entre el salto anterior y este, y hace
+# una búsqueda binaria solo en ese pedazo.
+#
+#   buscamos 40 en [3, 8, 15, 22, 29, 36, 43, 50, ...]
+#   posición 0 -> 3 < 40, posición 1 -> 8 < 40, posición 3 -> 22 < 40,
+#   posición 7 -> 50 >= 40  => está entre 4 y 7: búsqueda binaria ahí
+#
+# Cuesta O(log p), donde p es la POSICIÓN de la respuesta, no el total:
+# si lo que buscamos está cerca del principio, es rapidísima.
+
+
+class ArrayPerezoso:
+    """
+    Se ve como un array, pero va leyendo de un iterador (un archivo, un
+    generador...) solo hasta la posición que se le pide.
+
+    No sabe cuánto mide: pedir una posición más allá del final lanza
+    IndexError, igual que una lista.
+    """
+
+    def __init__(self, iterable):
+        self._iterador = iter(iterable)
+        self._leidos = []
+
+    def __getitem__(self, i):
+        if i < 0:
+            raise IndexError("ArrayPerezoso no sabe dónde termina: no acepta índices negativos")
+        while len(self._leidos) <= i:
+            try:
+                self._leidos.append(next(self._iterador))
+            except StopIteration:
+                raise IndexError(f"El iterador terminó antes de la posición {i}") from None
+        return self._leidos[i]
+
+    def cantidad_leida(self):
+        """Cuántos elementos se leyeron del iterador hasta ahora."""
+        return len(self._leidos)
+
+
+def exponential_search(array, item, inicio=0):
+    """
+    Primera posición (desde inicio) con valor >= item, SIN usar len().
+
+    El final se detecta con IndexError, así que sirve para arrays de largo
+    desconocido. Si recibe un iterador, lo envuelve en un ArrayPerezoso.
+
+    Args:
+        array: Secuencia ordenada, ArrayPerezoso o cualquier iterable ordenado
+        item: Valor a ubicar
+        inicio: Desde dónde buscar (por ejemplo, donde terminó la búsqueda
+                anterior)
+
+    Returns:
+        La posición; si todos son menores, la cantidad de elementos.
+    """
+    if not hasattr(array, "__getitem__"):
+        array = ArrayPerezoso(array)
+
+    # FASE 1: galopar. Todo lo anterior a 'low' es menor que item
+    low = inicio
+    salto = 1
+    while True:
+        high = inicio + salto - 1
+        try:
+            if not array[high] < item:
+                break                   # Nos pasamos: está entre low y high
+        except IndexError:
+            break                       # Se terminó el array antes de high
+        low = high + 1
+        salto *= 2
+
+    # FASE 2: búsqueda binaria entre low y high. Lo que está más allá del
+    # final cuenta como "infinito" (mayor que todo)
+    while low < high:
+        mid = (low + high) // 2
+        try:
+            menor = array[mid] < item
+        except IndexError:
+            menor = False
+        if menor:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
 # Ejemplo de uso: el array DEBE estar ordenado para que funcione
-sorted_array = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 23, 34, 56, 88]
-target = 88
+if __name__ == "__main__":
+    sorted_array = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 23, 34, 56, 88]
+    target = 88
+
+    print(f"Buscando {target} en el array ordenado:")
+    print(f"Resultado: {binary_search(sorted_array, target)}")
+
+    print("\n" + "=" * 50)
+    print("lower_bound / upper_bound / equal_range")
+    print("=" * 50)
+    con_repetidos = [1, 3, 3, 3, 7, 9, 9]
+    print(f"Array: {con_repetidos}")
+    for valor in [3, 5, 9, 0, 10]:
+        print(f"  {valor:>2}: lower_bound={lower_bound(con_repetidos, valor)}"
+              f"  upper_bound={upper_bound(con_repetidos, valor)}"
+              f"  equal_range={equal_range(con_repetidos, valor)}")
+
+    # Sin copiar: array.array guarda los números juntos en memoria, como en C
+    from array import array
+    numeros = array("i", range(0, 2_000_000, 2))
+    print(f"\narray.array de {len(numeros):,} pares: lower_bound(777_777) = {lower_bound(numeros, 777_777)}")
+
+    consultas = [88, 5, 21, 1, 56, 100]
+    print(f"\nsearch_many({consultas}) = {search_many(sorted_array, consultas)}")
+
+    print("\n" + "=" * 50)
+    print("Interpolación: ¿cuántas posiciones mira?")
+    print("=" * 50)
+    import random
+
+    class ContadorDeLecturas(list):
+        """Una lista que cuenta cuántas veces se lee una posición."""
+        lecturas = 0
+
+        def __getitem__(self, i):
+            self.lecturas += 1
+            return super().__getitem__(i)
+
+    parejos = ContadorDeLecturas(sorted(random.sample(range(10**9), 10**6)))
+    amontonados = ContadorDeLecturas(sorted(x ** 4 for x in random.sample(range(10**7), 10**6)))
+    for nombre, datos in [("parejos (timestamps)", parejos), ("amontonados", amontonados)]:
+        consultas = random.sample(datos, 1000)
+        datos.lecturas = 0
+        for q in consultas:
+            binary_search_sin_prints(datos, q)
+        binaria = datos.lecturas / len(consultas)
+        datos.lecturas = 0
+        for q in consultas:
+            interpolation_search(datos, q)
+        interpolacion = datos.lecturas / len(consultas)
+        print(f"  {nombre:<22} binaria: {binaria:4.1f}   interpolación: {interpolacion:4.1f}")
+    print("  (con datos amontonados se pasa sola a la binaria: unas pocas lecturas de más, nunca O(n))")
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        # Timestamps en nanosegundos: en int64, (item - menor) * ancho se desbordaría
+        nanos = np.sort(np.array(random.sample(range(1_600_000_000 * 10**9, 1_700_000_000 * 10**9),
+                                               100_000), dtype=np.int64))
+        claves = [nanos[i] for i in random.sample(range(len(nanos)), 200)]
+        iguales = all(interpolation_lower_bound(nanos, k) == nanos.searchsorted(k) for k in claves)
+        print(f"  200 timestamps en ns (int64 de NumPy): ¿igual que searchsorted? {iguales}")
+
+    print("\n" + "=" * 50)
+    print("Búsqueda exponencial sin saber el largo")
+    print("=" * 50)
+
+    def lineas_del_log():
+        """Simula un log que se va leyendo: timestamps crecientes, sin fin conocido."""
+        t = 1_700_000_000
+        for _ in range(10**6):
+            t += random.randint(1, 5)
+            yield t
+
+    log = ArrayPerezoso(lineas_del_log())
+    buscado = 1_700_000_000 + 300
+    posicion = exponential_search(log, buscado)
+    print(f"Primer timestamp >= {buscado}: posición {posicion} ({log[posicion]})")
+    print(f"Se leyeron {log.cantidad_leida()} líneas de 1,000,000")
 
-print(f"Buscando {target} en el array ordenado:")
-print(f"Resultado: {binary_search(sorted_array, target)}")
\ No newline at end of file
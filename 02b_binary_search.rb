@@ -39,6 +39,279 @@ def binary_search(array, item)
   nil
 end
 
+def binary_search_sin_prints(array, item)
+  # Versión limpia sin prints (para usar en otros algoritmos).
+  low = 0
+  high = array.length - 1
+
+  while low <= high
+    mid = (low + high) / 2
+    guess = array[mid]
+    if guess == item
+      return mid
+    elsif guess > item
+      high = mid - 1
+    else
+      low = mid + 1
+    end
+  end
+  nil
+end
+
+# ============================================
+# FAMILIA lower_bound / upper_bound
+# ============================================
+#
+# binary_search dice SI está y DÓNDE, pero con repetidos devuelve
+# cualquiera de ellos, y si no está solo dice nil. Muchas veces queremos
+# algo más útil: "¿en qué posición iría este valor?".
+#
+#   array = [1, 3, 3, 3, 7]
+#   lower_bound(array, 3) -> 1   primera posición con valor >= 3
+#   upper_bound(array, 3) -> 4   primera posición con valor >  3
+#   equal_range(array, 3) -> [1, 4]   los 3 están en array[1...4]
+#   lower_bound(array, 5) -> 4   el 5 iría antes del 7
+#
+# Versión "sin ramas": el bucle corre SIEMPRE log2(n) vueltas y en cada
+# una solo decide si la base avanza o no.
+
+def lower_bound(array, item, low = 0, high = nil)
+  # Primera posición de array[low...high] cuyo valor es >= item.
+  high ||= array.length
+  base = low
+  n = high - low
+  return low if n == 0
+
+  while n > 1
+    mitad = n / 2
+    # El único "if": ¿la base avanza hasta la mitad o se queda?
+    base = array[base + mitad] < item ? base + mitad : base
+    n -= mitad
+  end
+  array[base] < item ? base + 1 : base
+end
+
+def upper_bound(array, item, low = 0, high = nil)
+  # Primera posición de array[low...high] cuyo valor es > item.
+  high ||= array.length
+  base = low
+  n = high - low
+  return low if n == 0
+
+  while n > 1
+    mitad = n / 2
+    base = item < array[base + mitad] ? base : base + mitad
+    n -= mitad
+  end
+  item < array[base] ? base : base + 1
+end
+
+def equal_range(array, item)
+  # [inicio, fin]: array[inicio...fin] son exactamente los iguales a item.
+  inicio = lower_bound(array, item)
+  # Los iguales no pueden estar antes de inicio: buscamos solo desde ahí
+  [inicio, upper_bound(array, item, inicio)]
+end
+
+def search_many(sorted_array, queries)
+  # Busca muchos valores de una vez, en UNA pasada por sorted_array.
+  #
+  # Ordenamos las consultas: así la respuesta de cada una está a la
+  # DERECHA de la anterior. Desde ahí "galopamos": miramos 1, 2, 4, 8...
+  # posiciones más adelante hasta pasarnos, y solo ese último salto se
+  # busca con lower_bound. Si la siguiente respuesta está a d lugares,
+  # cuesta O(log d) en vez de O(log n): con muchas consultas (d chico)
+  # es casi recorrer los dos en paralelo, como el merge de Merge Sort.
+  #
+  # Returns:
+  #     Para cada consulta (en su orden original), el índice de su primera
+  #     aparición, o nil si no está
+  n = sorted_array.length
+  resultado = Array.new(queries.length)
+  desde = 0 # Todo lo anterior a desde es menor que la consulta actual
+  (0...queries.length).sort_by { |i| queries[i] }.each do |i|
+    q = queries[i]
+    # Galope: saltos de 1, 2, 4... hasta llegar a un valor >= q
+    fin = desde
+    salto = 1
+    while fin < n && sorted_array[fin] < q
+      desde = fin + 1
+      fin += salto
+      salto *= 2
+    end
+    # La respuesta está en [desde, fin]: un tramo del tamaño del último salto
+    desde = lower_bound(sorted_array, q, desde, [fin, n].min)
+    resultado[i] = desde if desde < n && sorted_array[desde] == q
+  end
+  resultado
+end
+
+# ============================================
+# BÚSQUEDA POR INTERPOLACIÓN
+# ============================================
+#
+# Para buscar "Martínez" en la guía telefónica no abrimos por la mitad:
+# abrimos más o menos a la mitad, porque la M está ahí. Y para "Zapata",
+# casi al final. Eso es interpolar: ADIVINAR la posición por el valor.
+#
+#   array = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]    buscamos 70
+#   70 está a (70 - 10) / (100 - 10) = 2/3 del camino entre 10 y 100
+#   -> miramos la posición 2/3 * 9 = 6 -> array[6] = 70 ¡en 1 paso!
+#
+# Si los valores están repartidos de forma PAREJA (ids, timestamps), el
+# rango se achica muchísimo en cada paso: O(log log n). Con un millón de
+# elementos son ~5 pasos en vez de 20.
+#
+# Pero si los valores están "amontonados" ([1, 2, 3, 4, 1000000]) las
+# adivinanzas fallan y puede tardar O(n). Por eso:
+# - después de cada adivinanza miramos también una posición a √rango de
+#   distancia, para cerrar el rango por los DOS lados
+# - si aun así una vuelta no achica el rango al menos a la mitad (lo que
+#   haría la búsqueda binaria), nos pasamos a lower_bound. Así el peor
+#   caso sigue siendo O(log n).
+
+def interpolation_lower_bound(array, item)
+  # Igual que lower_bound (primera posición con valor >= item), pero
+  # adivinando la posición por interpolación. El array debe tener NÚMEROS.
+  n = array.length
+  return 0 if n == 0
+
+  menor = array[0]
+  mayor = array[n - 1]
+  return 0 unless menor < item
+  return n if mayor < item
+
+  # Invariante: array[low - 1] < item <= array[high]
+  # y conocemos esos dos valores (menor y mayor)
+  low = 1
+  high = n - 1
+  while low < high
+    ancho = high - low
+    # ¿A qué fracción del camino entre menor y mayor está item?
+    pos = low + ((item - menor) * ancho / (mayor - menor)).floor
+    pos = [pos, high - 1].min
+    valor = array[pos]
+    paso = Integer.sqrt(ancho)
+    if valor < item
+      low = pos + 1
+      menor = valor
+      # ¿Quedó cerca? Probamos √ancho más a la derecha
+      if low + paso < high
+        valor = array[low + paso]
+        if valor < item
+          low += paso + 1
+          menor = valor
+        else
+          high = low + paso
+          mayor = valor
+        end
+      end
+    else
+      high = pos
+      mayor = valor
+      if high - paso > low
+        valor = array[high - paso]
+        if valor < item
+          low = high - paso + 1
+          menor = valor
+        else
+          high -= paso
+          mayor = valor
+        end
+      end
+    end
+
+    # La interpolación no está ayudando: datos no uniformes
+    return lower_bound(array, item, low, high) if (high - low) * 2 > ancho
+  end
+  low
+end
+
+def interpolation_search(array, item)
+  # Índice de item en un array ordenado de números, o nil si no está.
+  # Como binary_search, pero O(log log n) si los valores son parejos.
+  pos = interpolation_lower_bound(array, item)
+  pos < array.length && array[pos] == item ? pos : nil
+end
+
+# ============================================
+# BÚSQUEDA EXPONENCIAL (GALOPANTE)
+# ============================================
+#
+# ¿Y si NO sabemos cuántos elementos hay? Por ejemplo, leyendo un log
+# ordenado por fecha que todavía se está escribiendo. La búsqueda binaria
+# necesita saber dónde termina el array.
+#
+# La búsqueda exponencial da saltos que se DUPLICAN: mira las
+# posiciones 0, 1, 3, 7, 15, 31... hasta pasarse (o llegar al final).
+# Ahí sabe que la respuesta está entre el salto anterior y este, y hace
+# una búsqueda binaria solo en ese pedazo.
+#
+# Cuesta O(log p), donde p es la POSICIÓN de la respuesta, no el total.
+
+class ArrayPerezoso
+  # Se ve como un array, pero va leyendo de un Enumerator (un archivo,
+  # un generador...) solo hasta la posición que se le pide.
+  # No sabe cuánto mide: más allá del final devuelve nil, como un Array.
+
+  def initialize(enumerable)
+    @enumerador = enumerable.each_entry
+    @leidos = []
+  end
+
+  def [](i)
+    raise IndexError, "ArrayPerezoso no sabe dónde termina: no acepta índices negativos" if i < 0
+
+    while @leidos.length <= i
+      begin
+        @leidos << @enumerador.next
+      rescue StopIteration
+        return nil
+      end
+    end
+    @leidos[i]
+  end
+
+  def cantidad_leida
+    # Cuántos elementos se leyeron hasta ahora.
+    @leidos.length
+  end
+end
+
+def exponential_search(array, item, inicio = 0)
+  # Primera posición (desde inicio) con valor >= item, SIN usar length.
+  # El final se detecta cuando array[i] devuelve nil.
+  #
+  # Returns:
+  #     La posición; si todos son menores, la cantidad de elementos.
+
+  # FASE 1: galopar. Todo lo anterior a 'low' es menor que item
+  low = inicio
+  salto = 1
+  high = inicio
+  while true
+    high = inicio + salto - 1
+    valor = array[high]
+    break if valor.nil? || !(valor < item)  # Nos pasamos o se terminó
+
+    low = high + 1
+    salto *= 2
+  end
+
+  # FASE 2: búsqueda binaria entre low y high. Lo que está más allá del
+  # final (nil) cuenta como "infinito"
+  while low < high
+    mid = (low + high) / 2
+    valor = array[mid]
+    if !valor.nil? && valor < item
+      low = mid + 1
+    else
+      high = mid
+    end
+  end
+  low
+end
+
 # Ejemplo de uso: el array DEBE estar ordenado para que funcione
 sorted_array = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 23, 34, 56, 88]
 target = 88
@@ -46,3 +319,44 @@ target = 88
 puts "Buscando #{target} en el array ordenado:"
 puts "Resultado: #{binary_search(sorted_array, target)}"
 
+puts "\n" + "=" * 50
+puts "lower_bound / upper_bound / equal_range"
+puts "=" * 50
+con_repetidos = [1, 3, 3, 3, 7, 9, 9]
+puts "Array: #{con_repetidos}"
+[3, 5, 9, 0, 10].each do |valor|
+  puts "  #{valor.to_s.rjust(2)}: lower_bound=#{lower_bound(con_repetidos, valor)}" \
+       "  upper_bound=#{upper_bound(con_repetidos, valor)}" \
+       "  equal_range=#{equal_range(con_repetidos, valor)}"
+end
+
+consultas = [88, 5, 21, 1, 56, 100]
+puts "\nsearch_many(#{consultas}) = #{search_many(sorted_array, consultas)}"
+
+puts "\n" + "=" * 50
+puts "Interpolación vs binaria en datos parejos"
+puts "=" * 50
+parejos = (0...10**9).step(1000).first(10**6)
+consultas = parejos.sample(1000)
+inicio = Time.now
+consultas.each { |q| binary_search_sin_prints(parejos, q) }
+tiempo_binaria = Time.now - inicio
+inicio = Time.now
+consultas.each { |q| interpolation_search(parejos, q) }
+tiempo_interpolacion = Time.now - inicio
+puts "Binaria:       #{(tiempo_binaria * 1000).round(2)} ms"
+puts "Interpolación: #{(tiempo_interpolacion * 1000).round(2)} ms"
+
+puts "\n" + "=" * 50
+puts "Búsqueda exponencial sin saber el largo"
+puts "=" * 50
+lineas_del_log = Enumerator.new do |y|
+  # Simula un log que se va leyendo: timestamps crecientes, sin fin conocido
+  t = 1_700_000_000
+  (10**6).times { y << (t += rand(1..5)) }
+end
+log = ArrayPerezoso.new(lineas_del_log)
+buscado = 1_700_000_000 + 300
+posicion = exponential_search(log, buscado)
+puts "Primer timestamp >= #{buscado}: posición #{posicion} (#{log[posicion]})"
+puts "Se leyeron #{log.cantidad_leida} líneas de 1,000,000"
@@ -0,0 +1,291 @@
+"""
+Búsqueda binaria "amigable con la caché": el layout de Eytzinger
+
+La búsqueda binaria hace pocas comparaciones (log2 n), pero salta por
+todo el array: primero al medio, después a 1/4 o 3/4, después a 1/8...
+Con millones de elementos, cada salto cae en una zona de memoria que el
+procesador no tiene en su caché, y traerla de la RAM es MUY lento
+comparado con comparar dos números.
+
+La idea de Eytzinger: guardar los MISMOS datos en otro orden, el de un
+árbol binario recorrido por niveles (como BFS, archivo 18):
+
+    ordenado:   [1, 2, 3, 4, 5, 6, 7]
+
+    árbol:              4                 nivel 0
+                    /       \\
+                  2           6           nivel 1
+                /   \\       /   \\
+               1     3     5     7        nivel 2
+
+    eytzinger:  [_, 4, 2, 6, 1, 3, 5, 7]   (la posición 0 no se usa)
+
+Los hijos de la posición k están en 2k y 2k+1 (como en un heap), así que
+no hacen falta punteros. Y lo importante: los primeros niveles, que TODAS
+las búsquedas visitan, quedan juntos al principio del array y viven
+siempre en la caché. Además, los 16 descendientes de k cuatro niveles más
+abajo están uno al lado del otro (de 16k a 16k+15): el procesador los
+trae en uno o dos viajes a memoria.
+"""
+
+
+def permutacion_eytzinger(n):
+    """
+    Calcula en qué orden van los índices 0..n-1 de un array ordenado
+    dentro del layout de Eytzinger.
+
+    Recorremos el árbol "en orden" (izquierda, raíz, derecha) y vamos
+    numerando los nodos: así cada nodo queda mayor que su subárbol
+    izquierdo y menor que el derecho.
+
+    Returns:
+        Lista de largo n + 1: posiciones[k] es el índice (en el array
+        ordenado) del valor que va en el nodo k. posiciones[0] no se usa.
+    """
+    posiciones = [0] * (n + 1)
+    siguiente = 0
+
+    def llenar(k):
+        nonlocal siguiente
+        if k > n:
+            return
+        llenar(2 * k)                      # Subárbol izquierdo: los menores
+        posiciones[k] = siguiente
+        siguiente += 1
+        llenar(2 * k + 1)                  # Subárbol derecho: los mayores
+
+    llenar(1)
+    return posiciones
+
+
+def construir_eytzinger(ordenado):
+    """
+    Reordena un array ordenado en el layout de Eytzinger.
+
+    Returns:
+        (valores, posiciones): valores[k] es el valor del nodo k y
+        posiciones[k] el índice que tenía en el array ordenado.
+        La posición 0 de ambos no se usa.
+    """
+    posiciones = permutacion_eytzinger(len(ordenado))
+    valores = [None] + [ordenado[i] for i in posiciones[1:]]
+    return valores, posiciones
+
+
+class IndiceEytzinger:
+    """
+    Índice de búsqueda sobre un array ordenado, guardado en layout de
+    Eytzinger. Devuelve los MISMOS índices que buscar en el array ordenado,
+    así que se puede usar en su lugar.
+
+    Acepta listas, array.array y arrays de NumPy:
+    - con array.array se guarda otro array.array del mismo tipo
+      (los números quedan juntos en memoria, sin objetos sueltos)
+    - con NumPy, buscar_muchos busca todas las consultas a la vez,
+      bajando un nivel del árbol por vuelta
+    """
+
+    def __init__(self, ordenado):
+        self.n = len(ordenado)
+        self.posiciones = permutacion_eytzinger(self.n)
+        self.es_numpy = hasattr(ordenado, "searchsorted")
+
+        if self.es_numpy:
+            import numpy  # Si nos pasaron un ndarray, NumPy ya está cargado
+            self.posiciones = numpy.array(self.posiciones)
+            # En el nodo 0 queda ordenado[0]: no se usa
+            self.valores = ordenado[self.posiciones] if self.n else ordenado
+        elif hasattr(ordenado, "typecode") and self.n > 0:
+            self.valores = type(ordenado)(ordenado.typecode,
+                                          (ordenado[i] for i in self.posiciones))
+        else:
+            self.valores = [None] + [ordenado[i] for i in self.posiciones[1:]]
+
+    def _nodo(self, item):
+        """
+        Baja por el árbol y devuelve el nodo del primer valor >= item
+        (0 si todos son menores).
+
+        En cada nivel anotamos un bit: 1 si fuimos a la derecha (el valor
+        era menor que item), 0 si fuimos a la izquierda. Al salir, k es
+        el camino completo en binario:
+
+            k = 1 0 1 1 1      (derecha, izquierda, derecha, derecha...)
+                  ^
+            El último 0 es el último nodo donde fuimos a la izquierda:
+            el primer valor >= item. Le sacamos los 1 del final y ese 0.
+        """
+        valores = self.valores
+        n = self.n
+        k = 1
+        while k <= n:
+            k = 2 * k + (valores[k] < item)
+        k = int(k)  # Con NumPy, k terminó siendo un entero de NumPy
+        # (~k) & (k + 1) aísla el 0 más bajo; bit_length cuenta cuánto correr
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def lower_bound(self, item):
+        """Primera posición del array ordenado con valor >= item (n si ninguna)."""
+        k = self._nodo(item)
+        return int(self.posiciones[k]) if k else self.n
+
+    def buscar(self, item):
+        """
+        Índice de item en el array ordenado, o None si no está.
+        Igual que binary_search (02b) y busqueda_binaria_recursiva (07);
+        si item está repetido, devuelve siempre la primera aparición.
+        """
+        k = self._nodo(item)
+        if k and self.valores[k] == item:
+            return int(self.posiciones[k])
+        return None
+
+    def buscar_muchos(self, consultas):
+        """
+        Busca varias consultas; devuelve lo mismo que search_many (02b).
+
+        Con NumPy no hay un bucle por consulta: en cada vuelta, TODAS las
+        consultas bajan un nivel del árbol a la vez.
+        """
+        if not self.es_numpy:
+            return [self.buscar(q) for q in consultas]
+
+        import numpy
+        n = self.n
+        consultas = numpy.asarray(consultas)
+        if n == 0:
+            return [None] * len(consultas)
+        k = numpy.ones(len(consultas), dtype=numpy.int64)
+        for _ in range(n.bit_length()):               # Altura del árbol
+            # Las que ya salieron del árbol (k > n) se quedan donde están
+            k = numpy.where(k <= n, 2 * k + (self.valores[numpy.minimum(k, n)] < consultas), k)
+        k = k // (2 * ((~k) & (k + 1)))               # Lo mismo que en _nodo
+        encontrados = (k > 0) & (self.valores[k] == consultas)
+        return [p if e else None
+                for p, e in zip(self.posiciones[k].tolist(), encontrados.tolist())]
+
+
+def binary_search_sin_prints(array, item):
+    """La búsqueda binaria del archivo 02b, para comparar."""
+    low = 0
+    high = len(array) - 1
+    while low <= high:
+        mid = (low + high) // 2
+        guess = array[mid]
+        if guess == item:
+            return mid
+        elif guess > item:
+            high = mid - 1
+        else:
+            low = mid + 1
+    return None
+
+
+# 🎯 EJEMPLOS DE USO
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Cómo queda el array")
+    print("=" * 60)
+    ordenado = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    valores, posiciones = construir_eytzinger(ordenado)
+    print(f"Ordenado:   {ordenado}")
+    print(f"Eytzinger:  {valores[1:]}")
+    print(f"Posiciones: {posiciones[1:]}  (de dónde vino cada uno)")
+    nivel, inicio = 0, 1
+    while inicio <= len(ordenado):
+        print(f"  nivel {nivel}: {valores[inicio:2 * inicio]}")
+        nivel, inicio = nivel + 1, 2 * inicio
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Mismos resultados que la búsqueda binaria")
+    print("=" * 60)
+    indice = IndiceEytzinger(ordenado)
+    for buscado in [7, 1, 10, 0, 11, 5.5]:
+        print(f"  buscar({buscado:>4}): eytzinger={indice.buscar(buscado)!s:>4}"
+              f"  binaria={binary_search_sin_prints(ordenado, buscado)!s:>4}"
+              f"  lower_bound={indice.lower_bound(buscado)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Comparación de velocidad con un array GRANDE")
+    print("=" * 60)
+    import random
+    import time
+
+    n = 2_000_000
+    grande = sorted(random.sample(range(10 * n), n))
+    consultas = [random.randrange(10 * n) for _ in range(100_000)]
+
+    start = time.time()
+    indice = IndiceEytzinger(grande)
+    print(f"Construir el índice ({n:,} elementos): {time.time() - start:.2f} segundos (una sola vez)")
+
+    start = time.time()
+    resultado_binaria = [binary_search_sin_prints(grande, q) for q in consultas]
+    tiempo_binaria = time.time() - start
+
+    start = time.time()
+    resultado_eytzinger = [indice.buscar(q) for q in consultas]
+    tiempo_eytzinger = time.time() - start
+
+    print(f"{len(consultas):,} búsquedas:")
+    print(f"Binaria (ordenado): {tiempo_binaria:.3f} segundos")
+    print(f"Eytzinger:          {tiempo_eytzinger:.3f} segundos ({tiempo_binaria / tiempo_eytzinger:.1f}x)")
+    print(f"¿Mismo resultado? {resultado_binaria == resultado_eytzinger}")
+    print("""
+💡 En Python puro la ganancia es chica: cada vuelta del while cuesta más
+   en el intérprete que el viaje a memoria. Con NumPy (buscar_muchos) el
+   bucle corre en C y ahí sí se nota: en arrays de millones de elementos
+   suele ser ~2x más rápido que numpy.searchsorted sobre el array ordenado.
+   Para medirlo: python -m algoritmos.benchmark_busqueda""")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DEL LAYOUT DE EYTZINGER")
+    print("=" * 60)
+    print("""
+✅ VENTAJAS:
+   - Mismas comparaciones que la búsqueda binaria, pero menos viajes a la RAM
+   - Los primeros niveles del árbol siempre están en la caché
+   - El bucle no tiene if/else: solo "k = 2k o 2k + 1"
+   - No necesita punteros: los hijos de k están en 2k y 2k+1
+
+❌ DESVENTAJAS:
+   - Hay que construirlo (O(n)) y guardarlo aparte del array ordenado
+   - Recorrer los datos EN ORDEN ya no es recorrer el array
+   - Insertar un elemento obliga a reconstruir todo
+   - En arrays chicos (que entran enteros en la caché) no gana nada
+
+📊 COMPLEJIDAD:
+   - Construir: O(n)
+   - Buscar: O(log n) comparaciones, igual que la búsqueda binaria
+   - La diferencia está en la MEMORIA: de ~log2(n) fallos de caché
+     a ~log2(n) / 4 por búsqueda
+
+🎯 CUÁNDO USARLO:
+   - Arrays GRANDES (más que la caché L2, unos pocos MB) que no cambian
+   - Muchísimas búsquedas: índices de bases de datos, tablas de rutas
+""")
+
+    # 🏋️ EJERCICIOS PARA PRACTICAR
+
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
+1. Dibuja el árbol de Eytzinger para [10, 20, 30, 40, 50]
+   ¿En qué posición queda el 10?
+
+2. Agrega upper_bound a IndiceEytzinger
+   Pista: cambia valores[k] < item por valores[k] <= item
+
+3. Cuenta cuántas veces se visita cada posición de valores en 1000
+   búsquedas al azar. ¿Qué posiciones se visitan en TODAS?
+
+4. Escribe la función inversa: de un array en layout de Eytzinger,
+   recupera el array ordenado (pista: recorrido in-order, archivo 15)
+
+💡 Dos algoritmos con el mismo Big O pueden ser muy distintos en la práctica:
+   la memoria también cuenta!
+""")
@@ -0,0 +1,245 @@
+# Búsqueda binaria "amigable con la caché": el layout de Eytzinger
+#
+# La búsqueda binaria hace pocas comparaciones (log2 n), pero salta por
+# todo el array: primero al medio, después a 1/4 o 3/4, después a 1/8...
+# Con millones de elementos, cada salto cae en una zona de memoria que el
+# procesador no tiene en su caché, y traerla de la RAM es MUY lento
+# comparado con comparar dos números.
+#
+# La idea de Eytzinger: guardar los MISMOS datos en otro orden, el de un
+# árbol binario recorrido por niveles (como BFS, archivo 18):
+#
+#     ordenado:   [1, 2, 3, 4, 5, 6, 7]
+#
+#     árbol:              4                 nivel 0
+#                     /       \
+#                   2           6           nivel 1
+#                 /   \       /   \
+#                1     3     5     7        nivel 2
+#
+#     eytzinger:  [_, 4, 2, 6, 1, 3, 5, 7]   (la posición 0 no se usa)
+#
+# Los hijos de la posición k están en 2k y 2k+1 (como en un heap), así que
+# no hacen falta punteros. Y lo importante: los primeros niveles, que TODAS
+# las búsquedas visitan, quedan juntos al principio del array y viven
+# siempre en la caché. Además, los 16 descendientes de k cuatro niveles más
+# abajo están uno al lado del otro (de 16k a 16k+15): el procesador los
+# trae en uno o dos viajes a memoria.
+
+def permutacion_eytzinger(n)
+  # Calcula en qué orden van los índices 0..n-1 de un array ordenado
+  # dentro del layout de Eytzinger.
+  #
+  # Recorremos el árbol "en orden" (izquierda, raíz, derecha) y vamos
+  # numerando los nodos: así cada nodo queda mayor que su subárbol
+  # izquierdo y menor que el derecho.
+  #
+  # Returns:
+  #     Array de largo n + 1: posiciones[k] es el índice (en el array
+  #     ordenado) del valor que va en el nodo k. posiciones[0] no se usa.
+  posiciones = Array.new(n + 1, 0)
+  siguiente = 0
+
+  llenar = lambda do |k|
+    return if k > n
+
+    llenar.call(2 * k)                     # Subárbol izquierdo: los menores
+    posiciones[k] = siguiente
+    siguiente += 1
+    llenar.call(2 * k + 1)                 # Subárbol derecho: los mayores
+  end
+
+  llenar.call(1)
+  posiciones
+end
+
+def construir_eytzinger(ordenado)
+  # Reordena un array ordenado en el layout de Eytzinger.
+  #
+  # Returns:
+  #     [valores, posiciones]: valores[k] es el valor del nodo k y
+  #     posiciones[k] el índice que tenía en el array ordenado.
+  #     La posición 0 de ambos no se usa.
+  posiciones = permutacion_eytzinger(ordenado.length)
+  valores = [nil] + posiciones[1..].map { |i| ordenado[i] }
+  [valores, posiciones]
+end
+
+class IndiceEytzinger
+  # Índice de búsqueda sobre un array ordenado, guardado en layout de
+  # Eytzinger. Devuelve los MISMOS índices que buscar en el array ordenado,
+  # así que se puede usar en su lugar.
+
+  attr_reader :n
+
+  def initialize(ordenado)
+    @n = ordenado.length
+    @valores, @posiciones = construir_eytzinger(ordenado)
+  end
+
+  def lower_bound(item)
+    # Primera posición del array ordenado con valor >= item (n si ninguna).
+    k = nodo(item)
+    k > 0 ? @posiciones[k] : @n
+  end
+
+  def buscar(item)
+    # Índice de item en el array ordenado, o nil si no está.
+    # Igual que binary_search (02b) y busqueda_binaria_recursiva (07);
+    # si item está repetido, devuelve siempre la primera aparición.
+    k = nodo(item)
+    k > 0 && @valores[k] == item ? @posiciones[k] : nil
+  end
+
+  def buscar_muchos(consultas)
+    # Devuelve lo mismo que search_many (02b).
+    consultas.map { |q| buscar(q) }
+  end
+
+  private
+
+  def nodo(item)
+    # Baja por el árbol y devuelve el nodo del primer valor >= item
+    # (0 si todos son menores).
+    #
+    # En cada nivel anotamos un bit: 1 si fuimos a la derecha (el valor
+    # era menor que item), 0 si fuimos a la izquierda. Al salir, k es
+    # el camino completo en binario:
+    #
+    #     k = 1 0 1 1 1      (derecha, izquierda, derecha, derecha...)
+    #           ^
+    #     El último 0 es el último nodo donde fuimos a la izquierda:
+    #     el primer valor >= item. Le sacamos los 1 del final y ese 0.
+    k = 1
+    k = 2 * k + (@valores[k] < item ? 1 : 0) while k <= @n
+    # (~k) & (k + 1) aísla el 0 más bajo; bit_length cuenta cuánto correr
+    k >> ((~k) & (k + 1)).bit_length
+  end
+end
+
+def binary_search_sin_prints(array, item)
+  # La búsqueda binaria del archivo 02b, para comparar.
+  low = 0
+  high = array.length - 1
+  while low <= high
+    mid = (low + high) / 2
+    guess = array[mid]
+    if guess == item
+      return mid
+    elsif guess > item
+      high = mid - 1
+    else
+      low = mid + 1
+    end
+  end
+  nil
+end
+
+# 🎯 EJEMPLOS DE USO
+
+puts "=" * 60
+puts "EJEMPLO 1: Cómo queda el array"
+puts "=" * 60
+ordenado = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+valores, posiciones = construir_eytzinger(ordenado)
+puts "Ordenado:   #{ordenado}"
+puts "Eytzinger:  #{valores[1..]}"
+puts "Posiciones: #{posiciones[1..]}  (de dónde vino cada uno)"
+nivel = 0
+inicio = 1
+while inicio <= ordenado.length
+  puts "  nivel #{nivel}: #{valores[inicio...2 * inicio]}"
+  nivel += 1
+  inicio *= 2
+end
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 2: Mismos resultados que la búsqueda binaria"
+puts "=" * 60
+indice = IndiceEytzinger.new(ordenado)
+[7, 1, 10, 0, 11, 5.5].each do |buscado|
+  puts "  buscar(#{buscado.to_s.rjust(4)}): eytzinger=#{indice.buscar(buscado).inspect.rjust(4)}" \
+       "  binaria=#{binary_search_sin_prints(ordenado, buscado).inspect.rjust(4)}" \
+       "  lower_bound=#{indice.lower_bound(buscado)}"
+end
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 3: Comparación de velocidad con un array GRANDE"
+puts "=" * 60
+n = 2_000_000
+grande = (0...10 * n).to_a.sample(n).sort
+consultas = Array.new(100_000) { rand(10 * n) }
+
+start = Time.now
+indice = IndiceEytzinger.new(grande)
+puts "Construir el índice (#{n} elementos): #{(Time.now - start).round(2)} segundos (una sola vez)"
+
+start = Time.now
+resultado_binaria = consultas.map { |q| binary_search_sin_prints(grande, q) }
+tiempo_binaria = Time.now - start
+
+start = Time.now
+resultado_eytzinger = consultas.map { |q| indice.buscar(q) }
+tiempo_eytzinger = Time.now - start
+
+puts "#{consultas.length} búsquedas:"
+puts "Binaria (ordenado): #{tiempo_binaria.round(3)} segundos"
+puts "Eytzinger:          #{tiempo_eytzinger.round(3)} segundos (#{(tiempo_binaria / tiempo_eytzinger).round(1)}x)"
+puts "¿Mismo resultado? #{resultado_binaria == resultado_eytzinger}"
+puts """
+💡 En Ruby, como en Python, cada vuelta del while cuesta más en el
+   intérprete que el viaje a memoria: la ganancia es chica. En lenguajes
+   compilados (C, Rust) o con NumPy, el layout de Eytzinger suele ser
+   ~2x más rápido en arrays de millones de elementos.
+"""
+
+# 💡 CARACTERÍSTICAS IMPORTANTES
+
+puts "\n" + "=" * 60
+puts "💡 CARACTERÍSTICAS DEL LAYOUT DE EYTZINGER"
+puts "=" * 60
+puts """
+✅ VENTAJAS:
+   - Mismas comparaciones que la búsqueda binaria, pero menos viajes a la RAM
+   - Los primeros niveles del árbol siempre están en la caché
+   - El bucle no tiene if/else: solo \"k = 2k o 2k + 1\"
+   - No necesita punteros: los hijos de k están en 2k y 2k+1
+
+❌ DESVENTAJAS:
+   - Hay que construirlo (O(n)) y guardarlo aparte del array ordenado
+   - Recorrer los datos EN ORDEN ya no es recorrer el array
+   - Insertar un elemento obliga a reconstruir todo
+   - En arrays chicos (que entran enteros en la caché) no gana nada
+
+📊 COMPLEJIDAD:
+   - Construir: O(n)
+   - Buscar: O(log n) comparaciones, igual que la búsqueda binaria
+   - La diferencia está en la MEMORIA: de ~log2(n) fallos de caché
+     a ~log2(n) / 4 por búsqueda
+
+🎯 CUÁNDO USARLO:
+   - Arrays GRANDES (más que la caché L2, unos pocos MB) que no cambian
+   - Muchísimas búsquedas: índices de bases de datos, tablas de rutas
+"""
+
+# 🏋️ EJERCICIOS PARA PRACTICAR
+
+puts "\n" + "=" * 60
+puts "🏋️  EJERCICIOS"
+puts "=" * 60
+puts """
+1. Dibuja el árbol de Eytzinger para [10, 20, 30, 40, 50]
+   ¿En qué posición queda el 10?
+
+2. Agrega upper_bound a IndiceEytzinger
+   Pista: cambia @valores[k] < item por @valores[k] <= item
+
+3. Cuenta cuántas veces se visita cada posición de @valores en 1000
+   búsquedas al azar. ¿Qué posiciones se visitan en TODAS?
+
+4. Escribe la función inversa: de un array en layout de Eytzinger,
+   recupera el array ordenado (pista: recorrido in-order, archivo 15)
+
+💡 Dos algoritmos con el mismo Big O pueden ser muy distintos en la práctica:
+   la memoria también cuenta!
+"""
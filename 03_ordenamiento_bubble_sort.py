@@ -69,8 +69,22 @@ def bubble_sort(array, mostrar_pasos=True):
     return arr
 
 
-def bubble_sort_sin_prints(array):
-    """Versión limpia sin prints (para usar en otros algoritmos)."""
+def bubble_sort_sin_prints(array, modo="clasico"):
+    """
+    Versión limpia sin prints (para usar en otros algoritmos).
+
+    Args:
+        array: Lista de números a ordenar
+        modo: "clasico", "ultimo_intercambio", "cocktail" o "comb"
+              (ver las funciones de abajo)
+    """
+    if modo == "ultimo_intercambio":
+        return bubble_sort_ultimo_intercambio(array)
+    if modo == "cocktail":
+        return cocktail_shaker_sort(array)
+    if modo == "comb":
+        return comb_sort(array)
+
     arr = array.copy()
     n = len(arr)
     
@@ -86,42 +100,160 @@ def bubble_sort_sin_prints(array):
     return arr
 
 
+# 🚀 MEJORAS DE BUBBLE SORT
+#
+# Bubble Sort tiene dos problemas:
+# 1. Aunque el final del array ya esté ordenado, lo sigue recorriendo
+# 2. Las "tortugas": un número chico al FINAL avanza solo una posición
+#    por pasada (en [2, 3, 4, 5, 1] el 1 necesita 4 pasadas)
+# Estas variantes los atacan sin dejar de ser Bubble Sort.
+
+
+def bubble_sort_ultimo_intercambio(array):
+    """
+    Bubble Sort que recuerda DÓNDE fue el último intercambio.
+
+    Todo lo que está después del último intercambio ya está ordenado,
+    así que la siguiente pasada termina ahí (no solo una posición antes).
+    Si el array está casi ordenado, el tramo a revisar se achica muy rápido.
+    """
+    arr = array.copy()
+    limite = len(arr) - 1  # Revisamos pares (j, j+1) con j < limite
+
+    while limite > 0:
+        ultimo_intercambio = 0
+        for j in range(limite):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                ultimo_intercambio = j
+        # Si no hubo intercambios, ultimo_intercambio = 0 y terminamos
+        limite = ultimo_intercambio
+
+    return arr
+
+
+def cocktail_shaker_sort(array):
+    """
+    Bubble Sort en las DOS direcciones (Cocktail Shaker Sort).
+
+    Una pasada de izquierda a derecha lleva el mayor al final;
+    otra de derecha a izquierda lleva el menor al principio.
+    Así las "tortugas" también avanzan rápido.
+    """
+    arr = array.copy()
+    inicio = 0
+    fin = len(arr) - 1
+
+    while inicio < fin:
+        # Hacia la derecha: el mayor "burbujea" hasta el final
+        ultimo_intercambio = inicio
+        for j in range(inicio, fin):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                ultimo_intercambio = j
+        fin = ultimo_intercambio
+        if inicio >= fin:
+            break
+
+        # Hacia la izquierda: el menor "se hunde" hasta el principio
+        ultimo_intercambio = fin
+        for j in range(fin, inicio, -1):
+            if arr[j - 1] > arr[j]:
+                arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                ultimo_intercambio = j
+        inicio = ultimo_intercambio
+
+    return arr
+
+
+FACTOR_COMB = 1.3  # Cuánto se achica la distancia en cada pasada
+
+
+def comb_sort(array):
+    """
+    Comb Sort ("ordenamiento peine"): Bubble Sort con saltos.
+
+    En lugar de comparar vecinos, compara elementos separados por una
+    distancia (gap) que empieza grande y se divide por 1.3 en cada pasada.
+    Las tortugas dan saltos largos hacia adelante. Cuando el gap llega
+    a 1, es un Bubble Sort normal sobre un array casi ordenado.
+    """
+    arr = array.copy()
+    n = len(arr)
+    gap = n
+    ordenado = False
+
+    while not ordenado:
+        gap = max(1, int(gap / FACTOR_COMB))
+        if gap in (9, 10):
+            gap = 11  # "Regla del 11": evita secuencias de gaps que funcionan mal
+        ordenado = gap == 1
+
+        for i in range(n - gap):
+            if arr[i] > arr[i + gap]:
+                arr[i], arr[i + gap] = arr[i + gap], arr[i]
+                ordenado = False
+
+    return arr
+
+
 # 🎯 EJEMPLOS DE USO
 
-print("=" * 60)
-print("EJEMPLO 1: Ordenar array pequeño paso a paso")
-print("=" * 60)
-array1 = [64, 34, 25, 12, 22, 11, 90]
-print(f"Original: {array1}\n")
-ordenado1 = bubble_sort(array1, mostrar_pasos=True)
-print(f"✅ Resultado final: {ordenado1}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Comparar antes y después")
-print("=" * 60)
-array2 = [5, 2, 8, 1, 9, 3]
-print(f"Antes:  {array2}")
-ordenado2 = bubble_sort(array2, mostrar_pasos=False)
-print(f"Después: {ordenado2}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Array que ya está ordenado (caso óptimo)")
-print("=" * 60)
-array3 = [1, 2, 3, 4, 5]
-ordenado3 = bubble_sort(array3, mostrar_pasos=True)
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Array ordenado al revés (caso peor)")
-print("=" * 60)
-array4 = [5, 4, 3, 2, 1]
-ordenado4 = bubble_sort(array4, mostrar_pasos=True)
-
-# 💡 CARACTERÍSTICAS IMPORTANTES
-
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE BUBBLE SORT")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Ordenar array pequeño paso a paso")
+    print("=" * 60)
+    array1 = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Original: {array1}\n")
+    ordenado1 = bubble_sort(array1, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Comparar antes y después")
+    print("=" * 60)
+    array2 = [5, 2, 8, 1, 9, 3]
+    print(f"Antes:  {array2}")
+    ordenado2 = bubble_sort(array2, mostrar_pasos=False)
+    print(f"Después: {ordenado2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Array que ya está ordenado (caso óptimo)")
+    print("=" * 60)
+    array3 = [1, 2, 3, 4, 5]
+    ordenado3 = bubble_sort(array3, mostrar_pasos=True)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Array ordenado al revés (caso peor)")
+    print("=" * 60)
+    array4 = [5, 4, 3, 2, 1]
+    ordenado4 = bubble_sort(array4, mostrar_pasos=True)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Variantes con casi ordenados y 'tortugas'")
+    print("=" * 60)
+    import random
+    import time
+
+    casi_ordenado = list(range(2000))
+    for _ in range(10):
+        a, b = random.randrange(2000), random.randrange(2000)
+        casi_ordenado[a], casi_ordenado[b] = casi_ordenado[b], casi_ordenado[a]
+    con_tortuga = list(range(1, 2000)) + [0]  # El 0 está al final
+
+    for nombre, datos in [("Casi ordenado", casi_ordenado), ("Tortuga al final", con_tortuga)]:
+        print(f"{nombre} ({len(datos)} elementos):")
+        for modo in ["clasico", "ultimo_intercambio", "cocktail", "comb"]:
+            start = time.time()
+            resultado = bubble_sort_sin_prints(datos, modo=modo)
+            tiempo = time.time() - start
+            print(f"  {modo:<20} {tiempo:.4f} segundos  ¿ordenado? {resultado == sorted(datos)}")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE BUBBLE SORT")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Súper fácil de entender
    - Fácil de implementar
@@ -137,6 +269,7 @@ print("""
    - Tiempo mejor caso: O(n) - cuando ya está ordenado (con optimización)
    - Tiempo peor caso: O(n²) - cuando está ordenado al revés
    - Espacio: O(1) - solo usa memoria constante
+   - Comb Sort: en la práctica cerca de O(n log n), aunque el peor caso es O(n²)
 
 🎯 CUÁNDO USARLO:
    - Para aprender conceptos básicos
@@ -146,12 +279,12 @@ print("""
 ⚠️  EN PRODUCCIÓN: Usa algoritmos más eficientes como Quick Sort o Merge Sort
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica bubble_sort para ordenar de MAYOR a MENOR (descendente)
 
 2. Crea una función que cuente cuántos intercambios hace bubble_sort
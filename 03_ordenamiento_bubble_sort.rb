@@ -75,8 +75,17 @@ def bubble_sort(array, mostrar_pasos = true)
   arr
 end
 
-def bubble_sort_sin_prints(array)
+def bubble_sort_sin_prints(array, modo = "clasico")
   # Versión limpia sin prints (para usar en otros algoritmos).
+  #
+  # Args:
+  #     array: Lista de números a ordenar
+  #     modo: "clasico", "ultimo_intercambio", "cocktail" o "comb"
+  #           (ver las funciones de abajo)
+  return bubble_sort_ultimo_intercambio(array) if modo == "ultimo_intercambio"
+  return cocktail_shaker_sort(array) if modo == "cocktail"
+  return comb_sort(array) if modo == "comb"
+
   arr = array.dup
   n = arr.length
   
@@ -94,6 +103,104 @@ def bubble_sort_sin_prints(array)
   arr
 end
 
+# 🚀 MEJORAS DE BUBBLE SORT
+#
+# Bubble Sort tiene dos problemas:
+# 1. Aunque el final del array ya esté ordenado, lo sigue recorriendo
+# 2. Las "tortugas": un número chico al FINAL avanza solo una posición
+#    por pasada (en [2, 3, 4, 5, 1] el 1 necesita 4 pasadas)
+# Estas variantes los atacan sin dejar de ser Bubble Sort.
+
+def bubble_sort_ultimo_intercambio(array)
+  # Bubble Sort que recuerda DÓNDE fue el último intercambio.
+  #
+  # Todo lo que está después del último intercambio ya está ordenado,
+  # así que la siguiente pasada termina ahí (no solo una posición antes).
+  # Si el array está casi ordenado, el tramo a revisar se achica muy rápido.
+  arr = array.dup
+  limite = arr.length - 1  # Revisamos pares (j, j+1) con j < limite
+
+  while limite > 0
+    ultimo_intercambio = 0
+    (0...limite).each do |j|
+      if arr[j] > arr[j + 1]
+        arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        ultimo_intercambio = j
+      end
+    end
+    # Si no hubo intercambios, ultimo_intercambio = 0 y terminamos
+    limite = ultimo_intercambio
+  end
+
+  arr
+end
+
+def cocktail_shaker_sort(array)
+  # Bubble Sort en las DOS direcciones (Cocktail Shaker Sort).
+  #
+  # Una pasada de izquierda a derecha lleva el mayor al final;
+  # otra de derecha a izquierda lleva el menor al principio.
+  # Así las "tortugas" también avanzan rápido.
+  arr = array.dup
+  inicio = 0
+  fin = arr.length - 1
+
+  while inicio < fin
+    # Hacia la derecha: el mayor "burbujea" hasta el final
+    ultimo_intercambio = inicio
+    (inicio...fin).each do |j|
+      if arr[j] > arr[j + 1]
+        arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        ultimo_intercambio = j
+      end
+    end
+    fin = ultimo_intercambio
+    break if inicio >= fin
+
+    # Hacia la izquierda: el menor "se hunde" hasta el principio
+    ultimo_intercambio = fin
+    fin.downto(inicio + 1) do |j|
+      if arr[j - 1] > arr[j]
+        arr[j - 1], arr[j] = arr[j], arr[j - 1]
+        ultimo_intercambio = j
+      end
+    end
+    inicio = ultimo_intercambio
+  end
+
+  arr
+end
+
+FACTOR_COMB = 1.3  # Cuánto se achica la distancia en cada pasada
+
+def comb_sort(array)
+  # Comb Sort ("ordenamiento peine"): Bubble Sort con saltos.
+  #
+  # En lugar de comparar vecinos, compara elementos separados por una
+  # distancia (gap) que empieza grande y se divide por 1.3 en cada pasada.
+  # Las tortugas dan saltos largos hacia adelante. Cuando el gap llega
+  # a 1, es un Bubble Sort normal sobre un array casi ordenado.
+  arr = array.dup
+  n = arr.length
+  gap = n
+  ordenado = false
+
+  until ordenado
+    gap = [1, (gap / FACTOR_COMB).to_i].max
+    gap = 11 if gap == 9 || gap == 10  # "Regla del 11": evita secuencias de gaps que funcionan mal
+    ordenado = gap == 1
+
+    (0...n - gap).each do |i|
+      if arr[i] > arr[i + gap]
+        arr[i], arr[i + gap] = arr[i + gap], arr[i]
+        ordenado = false
+      end
+    end
+  end
+
+  arr
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -124,6 +231,27 @@ puts "=" * 60
 array4 = [5, 4, 3, 2, 1]
 ordenado4 = bubble_sort(array4, true)
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 5: Variantes con casi ordenados y 'tortugas'"
+puts "=" * 60
+
+casi_ordenado = (0...2000).to_a
+10.times do
+  a, b = rand(2000), rand(2000)
+  casi_ordenado[a], casi_ordenado[b] = casi_ordenado[b], casi_ordenado[a]
+end
+con_tortuga = (1...2000).to_a + [0]  # El 0 está al final
+
+[["Casi ordenado", casi_ordenado], ["Tortuga al final", con_tortuga]].each do |nombre, datos|
+  puts "#{nombre} (#{datos.length} elementos):"
+  ["clasico", "ultimo_intercambio", "cocktail", "comb"].each do |modo|
+    start = Time.now
+    resultado = bubble_sort_sin_prints(datos, modo)
+    tiempo = Time.now - start
+    puts "  #{modo.ljust(20)} #{tiempo.round(4)} segundos  ¿ordenado? #{resultado == datos.sort}"
+  end
+end
+
 # 💡 CARACTERÍSTICAS IMPORTANTES
 
 puts "\n" + "=" * 60
@@ -141,10 +269,11 @@ puts """
    - Hace muchas comparaciones innecesarias
 
 📊 COMPLEJIDAD:
-   - Tiempo promedio: O(n²) - "O de n al cuadrado"
+   - Tiempo promedio: O(n²) - O de n al cuadrado
    - Tiempo mejor caso: O(n) - cuando ya está ordenado (con optimización)
    - Tiempo peor caso: O(n²) - cuando está ordenado al revés
    - Espacio: O(1) - solo usa memoria constante
+   - Comb Sort: en la práctica cerca de O(n log n), aunque el peor caso es O(n²)
 
 🎯 CUÁNDO USARLO:
    - Para aprender conceptos básicos
@@ -168,7 +297,7 @@ puts """
    Tip: usa Time.now
 
 4. Ordena un array de strings alfabéticamente usando bubble_sort
-   Ejemplo: ["banana", "apple", "cherry"]
+   Ejemplo: ['banana', 'apple', 'cherry']
 
 💡 Experimenta cambiando el código y viendo qué pasa
 """
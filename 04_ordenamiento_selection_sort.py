@@ -71,8 +71,19 @@ def selection_sort(array, mostrar_pasos=True):
     return arr
 
 
-def selection_sort_sin_prints(array):
-    """Versión limpia sin prints (para usar en otros algoritmos)."""
+def selection_sort_sin_prints(array, modo="clasico"):
+    """
+    Versión limpia sin prints (para usar en otros algoritmos).
+
+    Args:
+        array: Lista de números a ordenar
+        modo: "clasico", "doble" o "torneo" (ver las funciones de abajo)
+    """
+    if modo == "doble":
+        return selection_sort_doble(array)
+    if modo == "torneo":
+        return selection_sort_torneo(array)
+
     arr = array.copy()
     n = len(arr)
     
@@ -86,37 +97,151 @@ def selection_sort_sin_prints(array):
     return arr
 
 
+# ✍️ MENOS PASADAS, MISMAS POCAS ESCRITURAS
+#
+# La gran virtud de Selection Sort es que ESCRIBE poco: como mucho un
+# intercambio por posición, O(n) en total. Eso importa cuando escribir
+# es caro (memoria flash, archivos en disco). Estas variantes hacen menos
+# trabajo buscando, sin perder esa virtud.
+
+
+def selection_sort_doble(array):
+    """
+    Selection Sort que busca el mínimo Y el máximo en la misma pasada.
+
+    El mínimo va al principio del tramo y el máximo al final, así que
+    cada pasada deja DOS elementos en su lugar: la mitad de pasadas.
+    Sigue haciendo como mucho 2 intercambios por pasada.
+    """
+    arr = array.copy()
+    izq, der = 0, len(arr) - 1
+
+    while izq < der:
+        min_idx = max_idx = izq
+        for j in range(izq + 1, der + 1):
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+            elif arr[j] > arr[max_idx]:
+                max_idx = j
+
+        if min_idx != izq:
+            arr[izq], arr[min_idx] = arr[min_idx], arr[izq]
+            # Si el máximo estaba en 'izq', el intercambio lo llevó a min_idx
+            if max_idx == izq:
+                max_idx = min_idx
+        if max_idx != der:
+            arr[der], arr[max_idx] = arr[max_idx], arr[der]
+
+        izq += 1
+        der -= 1
+
+    return arr
+
+
+def selection_sort_torneo(array):
+    """
+    Selection Sort con un árbol de torneo: buscar el mínimo cuesta
+    O(log n) comparaciones en vez de O(n).
+
+    Cómo funciona:
+    1. Los elementos juegan un torneo por parejas: el menor de cada par
+       pasa a la siguiente ronda, hasta que queda un campeón (el mínimo)
+    2. El campeón se intercambia a su lugar (una sola escritura en el array)
+    3. Solo se vuelven a jugar los partidos del camino de las dos
+       posiciones que cambiaron, no el torneo entero
+
+    El árbol guarda ÍNDICES (no valores) en memoria aparte, así que el
+    array sigue recibiendo como mucho un intercambio por posición.
+    Tiempo: O(n log n). Memoria extra: O(n) para el árbol.
+    """
+    arr = array.copy()
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    hojas = 1
+    while hojas < n:
+        hojas *= 2
+
+    def ganador(a, b):
+        # None = jugador eliminado (posición ya ordenada o que no existe)
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return b if arr[b] < arr[a] else a
+
+    def rejugar(posicion):
+        # Sube desde la hoja de 'posicion' hasta la raíz
+        nodo = (hojas + posicion) // 2
+        while nodo >= 1:
+            arbol[nodo] = ganador(arbol[2 * nodo], arbol[2 * nodo + 1])
+            nodo //= 2
+
+    # arbol[1] es la raíz; las hojas están en arbol[hojas:]
+    arbol = [None] * (2 * hojas)
+    for k in range(n):
+        arbol[hojas + k] = k
+    for nodo in range(hojas - 1, 0, -1):
+        arbol[nodo] = ganador(arbol[2 * nodo], arbol[2 * nodo + 1])
+
+    for i in range(n):
+        campeon = arbol[1]
+        arbol[hojas + i] = None  # La posición i queda ordenada
+        if campeon != i:
+            # arr[i] se muda a la posición del campeón y sigue jugando
+            arr[i], arr[campeon] = arr[campeon], arr[i]
+            rejugar(campeon)
+        rejugar(i)
+
+    return arr
+
+
 # 🎯 EJEMPLOS DE USO
 
-print("=" * 60)
-print("EJEMPLO 1: Ordenar array pequeño paso a paso")
-print("=" * 60)
-array1 = [64, 25, 12, 22, 11]
-print(f"Original: {array1}\n")
-ordenado1 = selection_sort(array1, mostrar_pasos=True)
-print(f"✅ Resultado final: {ordenado1}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Comparar antes y después")
-print("=" * 60)
-array2 = [5, 2, 8, 1, 9, 3]
-print(f"Antes:  {array2}")
-ordenado2 = selection_sort(array2, mostrar_pasos=False)
-print(f"Después: {ordenado2}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Visualización gráfica del proceso")
-print("=" * 60)
-array3 = [7, 3, 5, 1, 9, 2]
-print(f"Original: {array3}")
-ordenado3 = selection_sort(array3, mostrar_pasos=True)
-
-# 💡 COMPARACIÓN CON BUBBLE SORT
-
-print("\n" + "=" * 60)
-print("💡 SELECTION SORT vs BUBBLE SORT")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Ordenar array pequeño paso a paso")
+    print("=" * 60)
+    array1 = [64, 25, 12, 22, 11]
+    print(f"Original: {array1}\n")
+    ordenado1 = selection_sort(array1, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Comparar antes y después")
+    print("=" * 60)
+    array2 = [5, 2, 8, 1, 9, 3]
+    print(f"Antes:  {array2}")
+    ordenado2 = selection_sort(array2, mostrar_pasos=False)
+    print(f"Después: {ordenado2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Visualización gráfica del proceso")
+    print("=" * 60)
+    array3 = [7, 3, 5, 1, 9, 2]
+    print(f"Original: {array3}")
+    ordenado3 = selection_sort(array3, mostrar_pasos=True)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Variantes doble y torneo")
+    print("=" * 60)
+    import random
+    import time
+
+    array4 = [random.randint(0, 100000) for _ in range(3000)]
+    for modo in ["clasico", "doble", "torneo"]:
+        start = time.time()
+        resultado = selection_sort_sin_prints(array4, modo=modo)
+        tiempo = time.time() - start
+        print(f"  {modo:<8} {tiempo:.4f} segundos  ¿ordenado? {resultado == sorted(array4)}")
+
+    # 💡 COMPARACIÓN CON BUBBLE SORT
+
+    print("\n" + "=" * 60)
+    print("💡 SELECTION SORT vs BUBBLE SORT")
+    print("=" * 60)
+    print("""
 SELECTION SORT:
 ✅ Hace MENOS intercambios que Bubble Sort
    - Solo hace un intercambio por pasada
@@ -132,12 +257,12 @@ BUBBLE SORT:
 📊 AMBOS tienen complejidad O(n²) en promedio
 """)
 
-# 💡 CARACTERÍSTICAS IMPORTANTES
+    # 💡 CARACTERÍSTICAS IMPORTANTES
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE SELECTION SORT")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE SELECTION SORT")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Simple de entender e implementar
    - Hace menos intercambios que Bubble Sort
@@ -151,7 +276,9 @@ print("""
 
 📊 COMPLEJIDAD:
    - Tiempo: O(n²) - siempre, en todos los casos
+     (modo="torneo": O(n log n) con O(n) de memoria extra)
    - Espacio: O(1) - solo usa memoria constante
+   - Escrituras: O(n) - como mucho un intercambio por posición (en todos los modos)
 
 🎯 CUÁNDO USARLO:
    - Para aprender conceptos básicos
@@ -159,12 +286,12 @@ print("""
    - Arrays pequeños donde la simplicidad importa más
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica selection_sort para ordenar de MAYOR a MENOR
 
 2. Crea una función que cuente cuántas comparaciones hace selection_sort
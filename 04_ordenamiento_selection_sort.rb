@@ -78,8 +78,15 @@ def selection_sort(array, mostrar_pasos = true)
   arr
 end
 
-def selection_sort_sin_prints(array)
+def selection_sort_sin_prints(array, modo = "clasico")
   # Versión limpia sin prints (para usar en otros algoritmos).
+  #
+  # Args:
+  #     array: Lista de números a ordenar
+  #     modo: "clasico", "doble" o "torneo" (ver las funciones de abajo)
+  return selection_sort_doble(array) if modo == "doble"
+  return selection_sort_torneo(array) if modo == "torneo"
+
   arr = array.dup
   n = arr.length
   
@@ -94,6 +101,106 @@ def selection_sort_sin_prints(array)
   arr
 end
 
+# ✍️ MENOS PASADAS, MISMAS POCAS ESCRITURAS
+#
+# La gran virtud de Selection Sort es que ESCRIBE poco: como mucho un
+# intercambio por posición, O(n) en total. Eso importa cuando escribir
+# es caro (memoria flash, archivos en disco). Estas variantes hacen menos
+# trabajo buscando, sin perder esa virtud.
+
+def selection_sort_doble(array)
+  # Selection Sort que busca el mínimo Y el máximo en la misma pasada.
+  #
+  # El mínimo va al principio del tramo y el máximo al final, así que
+  # cada pasada deja DOS elementos en su lugar: la mitad de pasadas.
+  # Sigue haciendo como mucho 2 intercambios por pasada.
+  arr = array.dup
+  izq = 0
+  der = arr.length - 1
+
+  while izq < der
+    min_idx = max_idx = izq
+    ((izq + 1)..der).each do |j|
+      if arr[j] < arr[min_idx]
+        min_idx = j
+      elsif arr[j] > arr[max_idx]
+        max_idx = j
+      end
+    end
+
+    if min_idx != izq
+      arr[izq], arr[min_idx] = arr[min_idx], arr[izq]
+      # Si el máximo estaba en 'izq', el intercambio lo llevó a min_idx
+      max_idx = min_idx if max_idx == izq
+    end
+    arr[der], arr[max_idx] = arr[max_idx], arr[der] if max_idx != der
+
+    izq += 1
+    der -= 1
+  end
+
+  arr
+end
+
+def selection_sort_torneo(array)
+  # Selection Sort con un árbol de torneo: buscar el mínimo cuesta
+  # O(log n) comparaciones en vez de O(n).
+  #
+  # Cómo funciona:
+  # 1. Los elementos juegan un torneo por parejas: el menor de cada par
+  #    pasa a la siguiente ronda, hasta que queda un campeón (el mínimo)
+  # 2. El campeón se intercambia a su lugar (una sola escritura en el array)
+  # 3. Solo se vuelven a jugar los partidos del camino de las dos
+  #    posiciones que cambiaron, no el torneo entero
+  #
+  # El árbol guarda ÍNDICES (no valores) en memoria aparte, así que el
+  # array sigue recibiendo como mucho un intercambio por posición.
+  # Tiempo: O(n log n). Memoria extra: O(n) para el árbol.
+  arr = array.dup
+  n = arr.length
+  return arr if n <= 1
+
+  hojas = 1
+  hojas *= 2 while hojas < n
+
+  # arbol[1] es la raíz; las hojas están desde arbol[hojas]
+  arbol = Array.new(2 * hojas)
+
+  ganador = lambda do |a, b|
+    # nil = jugador eliminado (posición ya ordenada o que no existe)
+    next b if a.nil?
+    next a if b.nil?
+    arr[b] < arr[a] ? b : a
+  end
+
+  rejugar = lambda do |posicion|
+    # Sube desde la hoja de 'posicion' hasta la raíz
+    nodo = (hojas + posicion) / 2
+    while nodo >= 1
+      arbol[nodo] = ganador.call(arbol[2 * nodo], arbol[2 * nodo + 1])
+      nodo /= 2
+    end
+  end
+
+  (0...n).each { |k| arbol[hojas + k] = k }
+  (hojas - 1).downto(1) do |nodo|
+    arbol[nodo] = ganador.call(arbol[2 * nodo], arbol[2 * nodo + 1])
+  end
+
+  (0...n).each do |i|
+    campeon = arbol[1]
+    arbol[hojas + i] = nil  # La posición i queda ordenada
+    if campeon != i
+      # arr[i] se muda a la posición del campeón y sigue jugando
+      arr[i], arr[campeon] = arr[campeon], arr[i]
+      rejugar.call(campeon)
+    end
+    rejugar.call(i)
+  end
+
+  arr
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -119,6 +226,18 @@ array3 = [7, 3, 5, 1, 9, 2]
 puts "Original: #{array3}"
 ordenado3 = selection_sort(array3, true)
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Variantes doble y torneo"
+puts "=" * 60
+
+array4 = Array.new(3000) { rand(0..100000) }
+["clasico", "doble", "torneo"].each do |modo|
+  start = Time.now
+  resultado = selection_sort_sin_prints(array4, modo)
+  tiempo = Time.now - start
+  puts "  #{modo.ljust(8)} #{tiempo.round(4)} segundos  ¿ordenado? #{resultado == array4.sort}"
+end
+
 # 💡 COMPARACIÓN CON BUBBLE SORT
 
 puts "\n" + "=" * 60
@@ -159,7 +278,9 @@ puts """
 
 📊 COMPLEJIDAD:
    - Tiempo: O(n²) - siempre, en todos los casos
+     (modo torneo: O(n log n) con O(n) de memoria extra)
    - Espacio: O(1) - solo usa memoria constante
+   - Escrituras: O(n) - como mucho un intercambio por posición (en todos los modos)
 
 🎯 CUÁNDO USARLO:
    - Para aprender conceptos básicos
@@ -60,11 +60,22 @@ def insertion_sort(array, mostrar_pasos=True):
     return arr
 
 
-def insertion_sort_sin_prints(array):
-    """Versión limpia sin prints (para usar en otros algoritmos)."""
+def insertion_sort_sin_prints(array, key=None, reverse=False):
+    """
+    Versión limpia sin prints (para usar en otros algoritmos).
+
+    Args:
+        array: Lista a ordenar
+        key: Función que da la clave de cada elemento (como en sorted()).
+             Se llama UNA sola vez por elemento
+        reverse: Si True, ordena de MAYOR a MENOR (sigue siendo estable)
+    """
     arr = array.copy()
     n = len(arr)
-    
+
+    if key is not None or reverse:
+        return _insertion_sort_con_claves(arr, key, reverse)
+
     for i in range(1, n):
         valor_actual = arr[i]
         j = i - 1
@@ -78,43 +89,159 @@ def insertion_sort_sin_prints(array):
     return arr
 
 
+def _insertion_sort_con_claves(arr, key, reverse):
+    """
+    Insertion Sort que compara CLAVES en lugar de elementos.
+
+    Las claves se calculan una vez y se guardan en una lista paralela:
+    cuando un elemento se mueve, su clave se mueve con él.
+    """
+    claves = [key(x) for x in arr] if key is not None else arr.copy()
+
+    for i in range(1, len(arr)):
+        valor_actual = arr[i]
+        clave_actual = claves[i]
+        j = i - 1
+
+        # Solo corremos elementos que van ESTRICTAMENTE después: así los
+        # iguales mantienen su orden original (estabilidad)
+        if reverse:
+            while j >= 0 and claves[j] < clave_actual:
+                arr[j + 1] = arr[j]
+                claves[j + 1] = claves[j]
+                j -= 1
+        else:
+            while j >= 0 and claves[j] > clave_actual:
+                arr[j + 1] = arr[j]
+                claves[j + 1] = claves[j]
+                j -= 1
+
+        arr[j + 1] = valor_actual
+        claves[j + 1] = clave_actual
+
+    return arr
+
+
+# 🔍 INSERTION SORT CON BÚSQUEDA BINARIA
+#
+# En insertion_sort_sin_prints hay dos trabajos mezclados:
+# 1. BUSCAR dónde va el elemento (comparando uno por uno hacia atrás)
+# 2. MOVER los mayores una posición a la derecha (de a uno)
+# Pero la parte de la izquierda YA está ordenada: podemos buscar con
+# búsqueda binaria (02b_binary_search.py) y mover todo el bloque de una vez.
+
+
+def posicion_insercion(arr, valor, fin):
+    """
+    Busca en arr[0:fin] (ordenado) dónde insertar 'valor'.
+
+    Es el mismo bucle de binary_search() de 02b_binary_search.py, pero en
+    lugar de buscar un valor exacto devuelve la posición DESPUÉS de todos
+    los iguales (así Insertion Sort sigue siendo estable).
+    """
+    low = 0
+    high = fin - 1
+
+    while low <= high:
+        mid = (low + high) // 2
+        if arr[mid] > valor:
+            high = mid - 1  # Va en la mitad izquierda
+        else:
+            low = mid + 1   # Va en la mitad derecha (o después de un igual)
+
+    return low
+
+
+def insertion_sort_binaria(array):
+    """
+    Insertion Sort que busca la posición con búsqueda binaria y mueve
+    los elementos con una sola asignación de slice.
+
+    Las comparaciones bajan de O(n²) a O(n log n). Los movimientos siguen
+    siendo O(n²), pero el slice los hace en C de un solo golpe (como un
+    memmove), mucho más rápido que moverlos de a uno en Python.
+    """
+    arr = array.copy()
+
+    for i in range(1, len(arr)):
+        valor_actual = arr[i]
+        pos = posicion_insercion(arr, valor_actual, i)
+        if pos < i:
+            # Corremos arr[pos:i] una posición a la derecha, todo junto
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = valor_actual
+
+    return arr
+
+
 # 🎯 EJEMPLOS DE USO
 
-print("=" * 60)
-print("EJEMPLO 1: Ordenar array pequeño paso a paso")
-print("=" * 60)
-array1 = [12, 11, 13, 5, 6]
-print(f"Original: {array1}\n")
-ordenado1 = insertion_sort(array1, mostrar_pasos=True)
-print(f"✅ Resultado final: {ordenado1}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Comparar antes y después")
-print("=" * 60)
-array2 = [5, 2, 8, 1, 9, 3]
-print(f"Antes:  {array2}")
-ordenado2 = insertion_sort(array2, mostrar_pasos=False)
-print(f"Después: {ordenado2}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Array casi ordenado (caso óptimo)")
-print("=" * 60)
-array3 = [1, 2, 3, 5, 4, 6, 7]  # Solo el 4 está fuera de lugar
-print(f"Original: {array3}")
-ordenado3 = insertion_sort(array3, mostrar_pasos=True)
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Array ordenado al revés (caso peor)")
-print("=" * 60)
-array4 = [5, 4, 3, 2, 1]
-ordenado4 = insertion_sort(array4, mostrar_pasos=True)
-
-# 💡 COMPARACIÓN CON OTROS ALGORITMOS
-
-print("\n" + "=" * 60)
-print("💡 INSERTION SORT vs OTROS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Ordenar array pequeño paso a paso")
+    print("=" * 60)
+    array1 = [12, 11, 13, 5, 6]
+    print(f"Original: {array1}\n")
+    ordenado1 = insertion_sort(array1, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Comparar antes y después")
+    print("=" * 60)
+    array2 = [5, 2, 8, 1, 9, 3]
+    print(f"Antes:  {array2}")
+    ordenado2 = insertion_sort(array2, mostrar_pasos=False)
+    print(f"Después: {ordenado2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Array casi ordenado (caso óptimo)")
+    print("=" * 60)
+    array3 = [1, 2, 3, 5, 4, 6, 7]  # Solo el 4 está fuera de lugar
+    print(f"Original: {array3}")
+    ordenado3 = insertion_sort(array3, mostrar_pasos=True)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Array ordenado al revés (caso peor)")
+    print("=" * 60)
+    array4 = [5, 4, 3, 2, 1]
+    ordenado4 = insertion_sort(array4, mostrar_pasos=True)
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Ordenar registros por una clave (key) y al revés (reverse)")
+    print("=" * 60)
+    alumnos = [("Ana", 8), ("Luis", 10), ("Sofía", 8), ("Pedro", 6), ("Juan", 10)]
+    print(f"Original: {alumnos}")
+    por_nota = insertion_sort_sin_prints(alumnos, key=lambda alumno: alumno[1], reverse=True)
+    print(f"Por nota (mayor a menor): {por_nota}")
+    print("Ana sigue antes que Sofía y Luis antes que Juan: ¡es estable!")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 6: Insertion Sort con búsqueda binaria")
+    print("=" * 60)
+    import random
+    import time
+
+    array6 = [random.randint(0, 100000) for _ in range(5000)]
+
+    start = time.time()
+    resultado_normal = insertion_sort_sin_prints(array6)
+    tiempo_normal = time.time() - start
+
+    start = time.time()
+    resultado_binaria = insertion_sort_binaria(array6)
+    tiempo_binaria = time.time() - start
+
+    print(f"{len(array6)} elementos:")
+    print(f"Insertion Sort normal:  {tiempo_normal:.4f} segundos")
+    print(f"Insertion Sort binaria: {tiempo_binaria:.4f} segundos")
+    print(f"¿Mismo resultado? {resultado_normal == resultado_binaria}")
+
+    # 💡 COMPARACIÓN CON OTROS ALGORITMOS
+
+    print("\n" + "=" * 60)
+    print("💡 INSERTION SORT vs OTROS")
+    print("=" * 60)
+    print("""
 INSERTION SORT:
 ✅ Muy eficiente para arrays pequeños (< 50 elementos)
 ✅ Excelente si el array está casi ordenado
@@ -130,12 +257,12 @@ BUBBLE SORT vs SELECTION SORT:
 - Mejor comportamiento en arrays casi ordenados
 """)
 
-# 💡 CARACTERÍSTICAS IMPORTANTES
+    # 💡 CARACTERÍSTICAS IMPORTANTES
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE INSERTION SORT")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE INSERTION SORT")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Eficiente para arrays pequeños
    - Muy rápido si el array está casi ordenado
@@ -161,12 +288,12 @@ print("""
    - En la vida real: muchos algoritmos híbridos lo usan para casos pequeños
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica insertion_sort para ordenar de MAYOR a MENOR
 
 2. Crea una función que cuente cuántas comparaciones hace insertion_sort
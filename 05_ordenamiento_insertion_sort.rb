@@ -61,11 +61,19 @@ def insertion_sort(array, mostrar_pasos = true)
   arr
 end
 
-def insertion_sort_sin_prints(array)
+def insertion_sort_sin_prints(array, key = nil, reverse = false)
   # Versión limpia sin prints (para usar en otros algoritmos).
+  #
+  # Args:
+  #     array: Lista a ordenar
+  #     key: Lambda que da la clave de cada elemento (como en sort_by).
+  #          Se llama UNA sola vez por elemento
+  #     reverse: Si true, ordena de MAYOR a MENOR (sigue siendo estable)
   arr = array.dup
   n = arr.length
-  
+
+  return insertion_sort_con_claves(arr, key, reverse) if !key.nil? || reverse
+
   (1...n).each do |i|
     valor_actual = arr[i]
     j = i - 1
@@ -81,6 +89,84 @@ def insertion_sort_sin_prints(array)
   arr
 end
 
+def insertion_sort_con_claves(arr, key, reverse)
+  # Insertion Sort que compara CLAVES en lugar de elementos.
+  #
+  # Las claves se calculan una vez y se guardan en una lista paralela:
+  # cuando un elemento se mueve, su clave se mueve con él.
+  claves = key.nil? ? arr.dup : arr.map { |x| key.call(x) }
+
+  (1...arr.length).each do |i|
+    valor_actual = arr[i]
+    clave_actual = claves[i]
+    j = i - 1
+
+    # Solo corremos elementos que van ESTRICTAMENTE después: así los
+    # iguales mantienen su orden original (estabilidad)
+    while j >= 0 && (reverse ? claves[j] < clave_actual : claves[j] > clave_actual)
+      arr[j + 1] = arr[j]
+      claves[j + 1] = claves[j]
+      j -= 1
+    end
+
+    arr[j + 1] = valor_actual
+    claves[j + 1] = clave_actual
+  end
+
+  arr
+end
+
+# 🔍 INSERTION SORT CON BÚSQUEDA BINARIA
+#
+# En insertion_sort_sin_prints hay dos trabajos mezclados:
+# 1. BUSCAR dónde va el elemento (comparando uno por uno hacia atrás)
+# 2. MOVER los mayores una posición a la derecha (de a uno)
+# Pero la parte de la izquierda YA está ordenada: podemos buscar con
+# búsqueda binaria (02b_binary_search.rb) y mover todo el bloque de una vez.
+
+def posicion_insercion(arr, valor, fin)
+  # Busca en arr[0...fin] (ordenado) dónde insertar 'valor'.
+  #
+  # Es el mismo bucle de binary_search de 02b_binary_search.rb, pero en
+  # lugar de buscar un valor exacto devuelve la posición DESPUÉS de todos
+  # los iguales (así Insertion Sort sigue siendo estable).
+  low = 0
+  high = fin - 1
+
+  while low <= high
+    mid = (low + high) / 2
+    if arr[mid] > valor
+      high = mid - 1  # Va en la mitad izquierda
+    else
+      low = mid + 1   # Va en la mitad derecha (o después de un igual)
+    end
+  end
+
+  low
+end
+
+def insertion_sort_binaria(array)
+  # Insertion Sort que busca la posición con búsqueda binaria y mueve
+  # los elementos con una sola asignación de rango.
+  #
+  # Las comparaciones bajan de O(n²) a O(n log n). Los movimientos siguen
+  # siendo O(n²), pero la asignación los hace en C de un solo golpe
+  # (como un memmove), mucho más rápido que moverlos de a uno en Ruby.
+  arr = array.dup
+
+  (1...arr.length).each do |i|
+    valor_actual = arr[i]
+    pos = posicion_insercion(arr, valor_actual, i)
+    if pos < i
+      # Corremos arr[pos...i] una posición a la derecha, todo junto
+      arr[(pos + 1)..i] = arr[pos...i]
+      arr[pos] = valor_actual
+    end
+  end
+
+  arr
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -112,6 +198,34 @@ puts "=" * 60
 array4 = [5, 4, 3, 2, 1]
 ordenado4 = insertion_sort(array4, true)
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 5: Ordenar registros por una clave (key) y al revés (reverse)"
+puts "=" * 60
+alumnos = [["Ana", 8], ["Luis", 10], ["Sofía", 8], ["Pedro", 6], ["Juan", 10]]
+puts "Original: #{alumnos}"
+por_nota = insertion_sort_sin_prints(alumnos, ->(alumno) { alumno[1] }, true)
+puts "Por nota (mayor a menor): #{por_nota}"
+puts "Ana sigue antes que Sofía y Luis antes que Juan: ¡es estable!"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 6: Insertion Sort con búsqueda binaria"
+puts "=" * 60
+
+array6 = Array.new(5000) { rand(0..100000) }
+
+start = Time.now
+resultado_normal = insertion_sort_sin_prints(array6)
+tiempo_normal = Time.now - start
+
+start = Time.now
+resultado_binaria = insertion_sort_binaria(array6)
+tiempo_binaria = Time.now - start
+
+puts "#{array6.length} elementos:"
+puts "Insertion Sort normal:  #{tiempo_normal.round(4)} segundos"
+puts "Insertion Sort binaria: #{tiempo_binaria.round(4)} segundos"
+puts "¿Mismo resultado? #{resultado_normal == resultado_binaria}"
+
 # 💡 COMPARACIÓN CON OTROS ALGORITMOS
 
 puts "\n" + "=" * 60
@@ -179,7 +293,7 @@ puts """
    ¿Cuántas comparaciones hace? (Debería ser muy pocas)
 
 4. Ordena un array de strings usando insertion_sort
-   Ejemplo: ["zebra", "apple", "banana", "cherry"]
+   Ejemplo: ['zebra', 'apple', 'banana', 'cherry']
 
 5. Compara el rendimiento de los 3 algoritmos básicos:
    - Bubble Sort
@@ -10,18 +10,30 @@ Usa la estrategia "Divide y Vencerás":
 Es como organizar una lista: eliges un punto medio y separas todo a los lados.
 """
 
+import heapq
 
-def quick_sort(array, mostrar_pasos=False):
+def quick_sort(array, mostrar_pasos=False, key=None, reverse=False):
     """
     Ordena un array usando el algoritmo Quick Sort.
     
     Args:
         array: Lista de números a ordenar
         mostrar_pasos: Si True, muestra el proceso (puede ser verbose)
+        key: Función que da la clave de cada elemento (como en sorted()).
+             Se llama UNA sola vez por elemento
+        reverse: Si True, ordena de MAYOR a MENOR
     
     Returns:
-        El array ordenado
+        El array ordenado (esta versión es estable: los iguales
+        mantienen su orden original)
     """
+    if key is not None or reverse:
+        # Decorar - ordenar - desdecorar: calculamos las claves una vez
+        # y ordenamos las POSICIONES comparando esas claves
+        claves = [key(x) for x in array] if key is not None else array
+        orden = _quick_sort_indices(list(range(len(array))), claves, reverse)
+        return [array[i] for i in orden]
+
     if len(array) <= 1:
         return array
     
@@ -48,7 +60,29 @@ def quick_sort(array, mostrar_pasos=False):
     return quick_sort(menores, mostrar_pasos) + iguales + quick_sort(mayores, mostrar_pasos)
 
 
-def quick_sort_inplace(array, low=0, high=None, mostrar_pasos=False):
+def _quick_sort_indices(indices, claves, reverse):
+    """
+    Igual que quick_sort(), pero ordena posiciones comparando claves[i].
+
+    Las listas por comprensión mantienen el orden original dentro de
+    menores, iguales y mayores, por eso el resultado es estable.
+    """
+    if len(indices) <= 1:
+        return indices
+
+    pivot = claves[indices[len(indices) // 2]]
+    menores = [i for i in indices if claves[i] < pivot]
+    iguales = [i for i in indices if claves[i] == pivot]
+    mayores = [i for i in indices if claves[i] > pivot]
+
+    if reverse:
+        return (_quick_sort_indices(mayores, claves, reverse) + iguales
+                + _quick_sort_indices(menores, claves, reverse))
+    return (_quick_sort_indices(menores, claves, reverse) + iguales
+            + _quick_sort_indices(mayores, claves, reverse))
+
+
+def quick_sort_inplace(array, low=0, high=None, mostrar_pasos=False, modo="clasico"):
     """
     Versión in-place de Quick Sort (más eficiente en memoria).
     Modifica el array original en lugar de crear nuevos.
@@ -58,10 +92,20 @@ def quick_sort_inplace(array, low=0, high=None, mostrar_pasos=False):
         low: Índice inicial
         high: Índice final
         mostrar_pasos: Si True, muestra el proceso
+        modo: "clasico" (Lomuto puro), "introsort" (peor caso O(n log n))
+              o "tres_vias" (ideal cuando hay muchos repetidos)
     """
     if high is None:
         high = len(array) - 1
-    
+
+    if modo == "introsort":
+        introsort(array, low, high)
+        return
+
+    if modo == "tres_vias":
+        quick_sort_tres_vias(array, low, high, mostrar_pasos)
+        return
+
     if low < high:
         # Particionamos y obtenemos la posición del pivote
         pivot_idx = partition(array, low, high, mostrar_pasos)
@@ -105,35 +149,397 @@ def partition(array, low, high, mostrar_pasos=False):
     return i + 1
 
 
-# 🎯 EJEMPLOS DE USO
+# 🛡️ INTROSORT: Quick Sort con "red de seguridad"
+#
+# Quick Sort puede caer en O(n²) con pivotes malos (por ejemplo, un array
+# ya ordenado con el último elemento como pivote). Introsort vigila la
+# profundidad de la recursión y, si crece demasiado, cambia a Heap Sort,
+# que SIEMPRE es O(n log n). Para pedazos chicos usa Insertion Sort.
+
+UMBRAL_INSERTION = 16  # Tamaño a partir del cual conviene Insertion Sort
+
+
+def insertion_sort_sin_prints(array):
+    """
+    Versión limpia de Insertion Sort (la misma de 05_ordenamiento_insertion_sort.py).
+
+    La copiamos aquí porque los archivos que empiezan con número
+    no se pueden importar con "import" normal.
+    """
+    arr = array.copy()
+    n = len(arr)
+
+    for i in range(1, n):
+        valor_actual = arr[i]
+        j = i - 1
+
+        while j >= 0 and arr[j] > valor_actual:
+            arr[j + 1] = arr[j]
+            j -= 1
+
+        arr[j + 1] = valor_actual
+
+    return arr
+
+
+def heap_sort_rango(array, low, high):
+    """
+    Ordena in-place solo el tramo array[low..high] usando Heap Sort.
+
+    Es el "plan B" de introsort: nunca pasa de O(n log n).
+    """
+    n = high - low + 1
+
+    def hundir(raiz, fin):
+        # Baja el elemento de 'raiz' hasta que sus hijos sean menores
+        while True:
+            hijo = 2 * raiz + 1
+            if hijo >= fin:
+                return
+            if hijo + 1 < fin and array[low + hijo] < array[low + hijo + 1]:
+                hijo += 1
+            if array[low + raiz] >= array[low + hijo]:
+                return
+            array[low + raiz], array[low + hijo] = array[low + hijo], array[low + raiz]
+            raiz = hijo
+
+    # Construimos el heap (el máximo queda en array[low])
+    for inicio in range(n // 2 - 1, -1, -1):
+        hundir(inicio, n)
+
+    # Sacamos el máximo una y otra vez y lo ponemos al final
+    for fin in range(n - 1, 0, -1):
+        array[low], array[low + fin] = array[low + fin], array[low]
+        hundir(0, fin)
+
+
+def mediana_de_tres(array, low, high):
+    """
+    Elige como pivote la mediana entre el primero, el del medio y el último,
+    y la deja en array[high] para que partition() la use.
+
+    Así un array ya ordenado (o al revés) deja de ser el peor caso.
+    """
+    medio = (low + high) // 2
+    if array[medio] < array[low]:
+        array[medio], array[low] = array[low], array[medio]
+    if array[high] < array[low]:
+        array[high], array[low] = array[low], array[high]
+    if array[medio] < array[high]:
+        array[medio], array[high] = array[high], array[medio]
+
+
+def introsort(array, low=0, high=None, profundidad_max=None):
+    """
+    Ordena in-place con Introsort (Quick Sort + Heap Sort + Insertion Sort).
+
+    Cómo funciona:
+    1. Si el tramo es chico (<= UMBRAL_INSERTION), usa Insertion Sort
+    2. Si la recursión es demasiado profunda, usa Heap Sort en ese tramo
+    3. Si no, particiona como Quick Sort (pivote = mediana de tres)
+
+    Args:
+        array: Lista a ordenar (se modifica in-place)
+        low: Índice inicial
+        high: Índice final
+        profundidad_max: Límite de recursión (por defecto 2 * log2(n))
+    """
+    if high is None:
+        high = len(array) - 1
+
+    if profundidad_max is None:
+        profundidad_max = 2 * max(high - low + 1, 1).bit_length()
+
+    while high - low + 1 > UMBRAL_INSERTION:
+        if profundidad_max == 0:
+            # Demasiados pivotes malos: cambiamos a Heap Sort
+            heap_sort_rango(array, low, high)
+            return
+        profundidad_max -= 1
+
+        mediana_de_tres(array, low, high)
+        pivot_idx = partition(array, low, high)
+
+        # Recursión en la parte más chica y bucle en la más grande:
+        # así la pila nunca pasa de O(log n)
+        if pivot_idx - low < high - pivot_idx:
+            introsort(array, low, pivot_idx - 1, profundidad_max)
+            low = pivot_idx + 1
+        else:
+            introsort(array, pivot_idx + 1, high, profundidad_max)
+            high = pivot_idx - 1
+
+    # Tramo pequeño: Insertion Sort es lo más rápido aquí
+    if low < high:
+        array[low:high + 1] = insertion_sort_sin_prints(array[low:high + 1])
+
+
+# 🚩 PARTICIÓN EN TRES VÍAS (Bentley-McIlroy)
+#
+# Si el array tiene MUCHOS valores repetidos (por ejemplo, solo 0, 1 y 2),
+# partition() sigue comparando y moviendo los iguales al pivote una y otra vez.
+# La partición en tres vías separa el tramo en:  < pivote | == pivote | > pivote
+# y los iguales ya NO se vuelven a tocar. Todo in-place, sin crear listas
+# nuevas como hace quick_sort() con menores/iguales/mayores.
+
+
+def partition_tres_vias(array, low, high, mostrar_pasos=False):
+    """
+    Particiona array[low..high] en tres zonas usando el esquema de
+    Bentley-McIlroy.
+
+    Durante el recorrido, los elementos iguales al pivote se guardan en
+    los extremos del tramo; al final se llevan al centro.
+
+    Returns:
+        (fin_menores, inicio_mayores): los menores quedan en
+        array[low..fin_menores] y los mayores en array[inicio_mayores..high]
+    """
+    # El pivote es el elemento del medio: quien llama lo elige y lo deja ahí
+    # (mediana de tres en quick_sort_tres_vias, mediana de medianas en nth_element)
+    medio = (low + high) // 2
+    array[low], array[medio] = array[medio], array[low]
+    pivot = array[low]
+
+    if mostrar_pasos:
+        print(f"\nParticionando en tres vías desde {low} hasta {high}")
+        print(f"Pivote: {pivot}")
+        print(f"Array: {array[low:high+1]}")
+
+    i, j = low, high + 1
+    p, q = low, high + 1  # Zonas de iguales: array[low..p] y array[q..high]
+
+    while True:
+        i += 1
+        while array[i] < pivot:
+            if i == high:
+                break
+            i += 1
+        j -= 1
+        while pivot < array[j]:
+            if j == low:
+                break
+            j -= 1
+
+        # Los índices se cruzaron
+        if i == j and array[i] == pivot:
+            p += 1
+            array[p], array[i] = array[i], array[p]
+        if i >= j:
+            break
+
+        array[i], array[j] = array[j], array[i]
+        if array[i] == pivot:
+            p += 1
+            array[p], array[i] = array[i], array[p]
+        if array[j] == pivot:
+            q -= 1
+            array[q], array[j] = array[j], array[q]
+
+    # Llevamos los iguales de los extremos al centro
+    i = j + 1
+    for k in range(low, p + 1):
+        array[k], array[j] = array[j], array[k]
+        j -= 1
+    for k in range(high, q - 1, -1):
+        array[k], array[i] = array[i], array[k]
+        i += 1
+
+    if mostrar_pasos:
+        print(f"Menores: {array[low:j+1]}  Iguales: {array[j+1:i]}  Mayores: {array[i:high+1]}\n")
+
+    return j, i
+
+
+def quick_sort_tres_vias(array, low=0, high=None, mostrar_pasos=False, profundidad_max=None):
+    """
+    Quick Sort in-place con partición en tres vías.
+
+    Con k valores distintos hace O(n log k) trabajo: si hay pocos valores
+    distintos (k pequeño) es prácticamente lineal, y no crea listas nuevas.
+    Como introsort, elige el pivote con mediana de tres y, si la recursión
+    se hace demasiado profunda, termina el tramo con Heap Sort: el peor
+    caso queda en O(n log n).
+
+    Args:
+        array: Lista a ordenar (se modifica in-place)
+        low: Índice inicial
+        high: Índice final
+        mostrar_pasos: Si True, muestra el proceso
+        profundidad_max: Límite de recursión (por defecto 2 * log2(n))
+    """
+    if high is None:
+        high = len(array) - 1
+
+    if profundidad_max is None:
+        profundidad_max = 2 * max(high - low + 1, 1).bit_length()
+
+    while low < high:
+        if profundidad_max == 0:
+            # Demasiados pivotes malos (por ejemplo 1 2 3 ... 3 2 1): Heap Sort
+            heap_sort_rango(array, low, high)
+            return
+        profundidad_max -= 1
+
+        # Pivote = mediana de tres, llevado al medio (donde lo busca partition_tres_vias)
+        mediana_de_tres(array, low, high)
+        medio = (low + high) // 2
+        array[high], array[medio] = array[medio], array[high]
+
+        fin_menores, inicio_mayores = partition_tres_vias(array, low, high, mostrar_pasos)
+
+        # Recursión en la parte más chica y bucle en la más grande
+        if fin_menores - low < high - inicio_mayores:
+            quick_sort_tres_vias(array, low, fin_menores, mostrar_pasos, profundidad_max)
+            low = inicio_mayores
+        else:
+            quick_sort_tres_vias(array, inicio_mayores, high, mostrar_pasos, profundidad_max)
+            high = fin_menores
+
+
+# 🏆 SELECCIÓN: cuando solo necesitas los k primeros
+#
+# Para sacar el TOP 100 de millones de datos no hace falta ordenar todo.
+# Después de particionar, el pivote queda en su posición FINAL: si esa
+# posición es la que buscamos, listo; si no, seguimos SOLO en el lado
+# donde está (Quick Sort sigue en los dos). Eso es Quickselect.
+#
+# Con un pivote malo Quickselect también cae en O(n²). La "mediana de
+# medianas" elige un pivote que siempre deja al menos ~30% de los datos
+# de cada lado, y así el tiempo queda garantizado en O(n).
+
+TAMANO_GRUPO = 5  # Grupos de 5 para la mediana de medianas
+
+
+def mediana_de_medianas(array, low, high):
+    """
+    Elige un buen pivote para array[low..high] y devuelve su posición.
+
+    Cómo funciona:
+    1. Divide el tramo en grupos de 5 y ordena cada grupo (son chicos)
+    2. Junta las medianas de los grupos al principio del tramo
+    3. Busca la mediana de esas medianas con nth_element (recursión)
+    """
+    if high - low + 1 <= TAMANO_GRUPO:
+        array[low:high + 1] = insertion_sort_sin_prints(array[low:high + 1])
+        return (low + high) // 2
+
+    destino = low  # Las medianas se van juntando en array[low], array[low+1]...
+    for inicio in range(low, high + 1, TAMANO_GRUPO):
+        fin = min(inicio + TAMANO_GRUPO - 1, high)
+        array[inicio:fin + 1] = insertion_sort_sin_prints(array[inicio:fin + 1])
+        mediana = (inicio + fin) // 2
+        array[destino], array[mediana] = array[mediana], array[destino]
+        destino += 1
+
+    medio = (low + destino - 1) // 2
+    nth_element(array, medio, low, destino - 1)
+    return medio
+
+
+def nth_element(array, n, low=0, high=None):
+    """
+    Reacomoda el array in-place para que array[n] quede con el valor que
+    tendría si estuviera ordenado, todos los de la izquierda sean <= y
+    todos los de la derecha >= (como std::nth_element de C++).
+
+    Usa la partición en tres vías en lugar de partition(): con muchos
+    valores repetidos partition() deja todos los iguales del mismo lado y
+    el tramo se achica de a uno (O(n²) otra vez).
+
+    Args:
+        array: Lista (se modifica in-place)
+        n: Posición buscada (0 = el mínimo, len - 1 = el máximo)
+        low: Índice inicial
+        high: Índice final
+
+    Returns:
+        El valor que quedó en array[n]
+    """
+    if high is None:
+        high = len(array) - 1
+    if not low <= n <= high:
+        raise IndexError(f"n={n} está fuera del tramo [{low}, {high}]")
+
+    while high - low + 1 > TAMANO_GRUPO:
+        # Llevamos el pivote al medio, que es donde lo busca partition_tres_vias
+        pivote = mediana_de_medianas(array, low, high)
+        medio = (low + high) // 2
+        array[pivote], array[medio] = array[medio], array[pivote]
+
+        fin_menores, inicio_mayores = partition_tres_vias(array, low, high)
+        if n <= fin_menores:
+            high = fin_menores        # Está entre los menores
+        elif n >= inicio_mayores:
+            low = inicio_mayores      # Está entre los mayores
+        else:
+            return array[n]           # Cayó en la zona de iguales: listo
+
+    array[low:high + 1] = insertion_sort_sin_prints(array[low:high + 1])
+    return array[n]
+
+
+def partial_sort(array, k):
+    """
+    Ordena in-place solo los k menores: array[:k] queda ordenado y el
+    resto queda en cualquier orden. O(n + k log k) en vez de O(n log n).
+    """
+    k = min(k, len(array))
+    if k <= 0:
+        return
+    if k < len(array):
+        nth_element(array, k - 1)  # Los k menores quedan en array[:k]
+    introsort(array, 0, k - 1)
+
+
+def top_k(array, k):
+    """
+    Devuelve los k MAYORES de mayor a menor, sin ordenar todo el array.
+
+    Args:
+        array: Lista de elementos (no se modifica)
+        k: Cuántos queremos
+
+    Returns:
+        Lista con los k mayores, el primero es el máximo
+    """
+    arr = list(array)
+    k = min(k, len(arr))
+    if k <= 0:
+        return []
+
+    inicio = len(arr) - k
+    if inicio > 0:
+        nth_element(arr, inicio)  # Los k mayores quedan en arr[inicio:]
+    mayores = arr[inicio:]
+    introsort(mayores)
+    mayores.reverse()
+    return mayores
+
+
+def top_k_streaming(iterable, k):
+    """
+    Igual que top_k() pero para datos que llegan de a uno (un archivo,
+    un generador...) y que NO entran en memoria.
+
+    Guarda solo los k mejores en un min-heap: el más chico de los k
+    está siempre arriba, así que cada dato nuevo se compara con uno solo.
+    O(n log k) de tiempo y O(k) de memoria.
+    """
+    if k <= 0:
+        return []
+
+    mejores = []  # Min-heap con los k mayores vistos hasta ahora
+    for x in iterable:
+        if len(mejores) < k:
+            heapq.heappush(mejores, x)
+        elif x > mejores[0]:
+            heapq.heapreplace(mejores, x)  # Sale el más chico, entra x
+
+    mayores = [heapq.heappop(mejores) for _ in range(len(mejores))]
+    mayores.reverse()
+    return mayores
 
-print("=" * 60)
-print("EJEMPLO 1: Quick Sort (versión simple)")
-print("=" * 60)
-array1 = [64, 34, 25, 12, 22, 11, 90]
-print(f"Original: {array1}")
-ordenado1 = quick_sort(array1, mostrar_pasos=True)
-print(f"✅ Resultado final: {ordenado1}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Quick Sort in-place (más eficiente)")
-print("=" * 60)
-array2 = [5, 2, 8, 1, 9, 3, 7]
-print(f"Antes:  {array2}")
-quick_sort_inplace(array2, mostrar_pasos=False)
-print(f"Después: {array2}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Comparación de velocidad")
-print("=" * 60)
-import time
-
-array_grande = [64, 34, 25, 12, 22, 11, 90, 5, 77, 88, 99, 1, 2, 3, 4, 55, 66, 44, 33, 22]
-
-# Quick Sort
-start = time.time()
-resultado_quick = quick_sort(array_grande.copy())
-tiempo_quick = time.time() - start
 
 # Bubble Sort (para comparar) - versión simple
 def bubble_sort_simple(arr):
@@ -145,21 +551,130 @@ def bubble_sort_simple(arr):
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
     return arr
 
-start = time.time()
-resultado_bubble = bubble_sort_simple(array_grande.copy())
-tiempo_bubble = time.time() - start
 
-print(f"Array de {len(array_grande)} elementos:")
-print(f"Quick Sort:  {tiempo_quick:.6f} segundos")
-print(f"Bubble Sort: {tiempo_bubble:.6f} segundos")
-print(f"Quick Sort es {tiempo_bubble/tiempo_quick:.1f}x más rápido! 🚀")
+# 🎯 EJEMPLOS DE USO
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Quick Sort (versión simple)")
+    print("=" * 60)
+    array1 = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Original: {array1}")
+    ordenado1 = quick_sort(array1, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Quick Sort in-place (más eficiente)")
+    print("=" * 60)
+    array2 = [5, 2, 8, 1, 9, 3, 7]
+    print(f"Antes:  {array2}")
+    quick_sort_inplace(array2, mostrar_pasos=False)
+    print(f"Después: {array2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2b: Ordenar palabras por largo (key) de mayor a menor (reverse)")
+    print("=" * 60)
+    palabras = ["sol", "estrella", "luna", "cometa", "mar", "nube"]
+    print(f"Original: {palabras}")
+    print(f"Por largo: {quick_sort(palabras, key=len, reverse=True)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Comparación de velocidad")
+    print("=" * 60)
+    import time
+
+    array_grande = [64, 34, 25, 12, 22, 11, 90, 5, 77, 88, 99, 1, 2, 3, 4, 55, 66, 44, 33, 22]
+
+    # Quick Sort
+    start = time.time()
+    resultado_quick = quick_sort(array_grande.copy())
+    tiempo_quick = time.time() - start
+
+    start = time.time()
+    resultado_bubble = bubble_sort_simple(array_grande.copy())
+    tiempo_bubble = time.time() - start
+
+    print(f"Array de {len(array_grande)} elementos:")
+    print(f"Quick Sort:  {tiempo_quick:.6f} segundos")
+    print(f"Bubble Sort: {tiempo_bubble:.6f} segundos")
+    print(f"Quick Sort es {tiempo_bubble/tiempo_quick:.1f}x más rápido! 🚀")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Introsort con un array YA ordenado (peor caso clásico)")
+    print("=" * 60)
+    array_ordenado = list(range(3000))
 
-# 💡 CARACTERÍSTICAS IMPORTANTES
+    # Con el último elemento como pivote, el array ordenado es el peor caso:
+    # cada partición deja n-1 elementos de un lado y la recursión llega a ~3000
+    # niveles (más que el límite de Python). Introsort no tiene ese problema.
+    start = time.time()
+    quick_sort_inplace(array_ordenado, modo="introsort")
+    tiempo_intro = time.time() - start
+    print(f"Introsort con {len(array_ordenado)} elementos ya ordenados: {tiempo_intro:.6f} segundos")
+    print(f"¿Sigue ordenado? {array_ordenado == list(range(3000))}")
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE QUICK SORT")
-print("=" * 60)
-print("""
+    array_al_reves = list(range(3000, 0, -1))
+    quick_sort_inplace(array_al_reves, modo="introsort")
+    print(f"¿Array al revés ordenado? {array_al_reves == list(range(1, 3001))}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Muchos repetidos con partición en tres vías")
+    print("=" * 60)
+    array5 = [2, 0, 1, 2, 1, 0, 0, 2, 1, 1]
+    print(f"Antes:  {array5}")
+    quick_sort_inplace(array5, mostrar_pasos=True, modo="tres_vias")
+    print(f"Después: {array5}")
+
+    # Con solo 3 valores distintos, cada partición deja lista toda una zona de iguales
+    import random
+    muchos_repetidos = [random.choice([0, 1, 2]) for _ in range(20000)]
+    start = time.time()
+    quick_sort_inplace(muchos_repetidos, modo="tres_vias")
+    tiempo_tres_vias = time.time() - start
+    print(f"20000 elementos con 3 valores distintos: {tiempo_tres_vias:.6f} segundos")
+    print(f"¿Ordenado? {muchos_repetidos == sorted(muchos_repetidos)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 6: Top k sin ordenar todo (nth_element, partial_sort, top_k)")
+    print("=" * 60)
+    array6 = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+    copia = array6.copy()
+    mediana = nth_element(copia, len(copia) // 2)
+    print(f"Original:          {array6}")
+    print(f"nth_element(5):    {copia}  -> array[5] = {mediana}")
+    copia = array6.copy()
+    partial_sort(copia, 3)
+    print(f"partial_sort(3):   {copia}")
+    print(f"top_k(3):          {top_k(array6, 3)}")
+
+    datos = [random.randint(0, 10**9) for _ in range(200000)]
+    start = time.time()
+    top_ordenando = sorted(datos, reverse=True)[:100]
+    tiempo_sorted = time.time() - start
+
+    start = time.time()
+    top_seleccion = top_k(datos, 100)
+    tiempo_top_k = time.time() - start
+
+    # Con un generador los datos llegan de a uno y el heap nunca guarda más de 100
+    start = time.time()
+    top_heap = top_k_streaming((x for x in datos), 100)
+    tiempo_heap = time.time() - start
+
+    # sorted() está escrito en C, así que le gana a top_k en Python puro;
+    # lo importante es que top_k hace O(n) trabajo y el heap usa O(k) memoria
+    print(f"\nTop 100 de {len(datos)} números:")
+    print(f"Ordenando todo (sorted): {tiempo_sorted:.4f} segundos")
+    print(f"top_k (mediana de medianas): {tiempo_top_k:.4f} segundos")
+    print(f"top_k_streaming (heap de 100): {tiempo_heap:.4f} segundos")
+    print(f"¿Mismo resultado? {top_ordenando == top_seleccion == top_heap}")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE QUICK SORT")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - MUY rápido en promedio (uno de los más rápidos)
    - Eficiente en memoria (versión in-place)
@@ -168,13 +683,18 @@ print("""
 
 ❌ DESVENTAJAS:
    - Peor caso puede ser lento O(n²) si el pivote es malo
-   - No es estable (puede cambiar orden de elementos iguales)
+   - La versión in-place no es estable (puede cambiar orden de elementos iguales);
+     quick_sort() con listas sí lo es
    - Más complejo que algoritmos básicos
 
 📊 COMPLEJIDAD:
    - Tiempo promedio: O(n log n) - MUY rápido ✨
    - Tiempo mejor caso: O(n log n)
    - Tiempo peor caso: O(n²) - raro, pero puede pasar
+     (con modo="introsort" el peor caso baja a O(n log n))
+   - Con muchos repetidos: O(n log k) con modo="tres_vias" (k = valores distintos)
+   - nth_element / top_k: O(n) garantizado (mediana de medianas)
+   - top_k_streaming: O(n log k) de tiempo y solo O(k) de memoria
    - Espacio: O(log n) - para la recursión
 
 🎯 CUÁNDO USARLO:
@@ -186,12 +706,12 @@ print("""
    pero Quick Sort es excelente para entender Divide y Vencerás
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica quick_sort para elegir el pivote de diferentes formas:
    - Primer elemento
    - Último elemento
@@ -204,7 +724,7 @@ print("""
    en arrays de diferentes tamaños
 
 4. Implementa una versión que ordene de MAYOR a MENOR
+   (después compárala con quick_sort(array, reverse=True))
 
 💡 Quick Sort es el algoritmo de ordenamiento más usado en la práctica!
 """)
-
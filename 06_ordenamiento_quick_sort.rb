@@ -8,15 +8,27 @@
 #
 # Es como organizar una lista: eliges un punto medio y separas todo a los lados.
 
-def quick_sort(array, mostrar_pasos = false)
+def quick_sort(array, mostrar_pasos = false, key = nil, reverse = false)
   # Ordena un array usando el algoritmo Quick Sort.
   #
   # Args:
   #     array: Lista de números a ordenar
   #     mostrar_pasos: Si true, muestra el proceso (puede ser verbose)
+  #     key: Lambda que da la clave de cada elemento (como en sort_by).
+  #          Se llama UNA sola vez por elemento
+  #     reverse: Si true, ordena de MAYOR a MENOR
   #
   # Returns:
-  #     El array ordenado
+  #     El array ordenado (esta versión es estable: los iguales
+  #     mantienen su orden original)
+  if !key.nil? || reverse
+    # Decorar - ordenar - desdecorar: calculamos las claves una vez
+    # y ordenamos las POSICIONES comparando esas claves
+    claves = key.nil? ? array : array.map { |x| key.call(x) }
+    orden = quick_sort_indices((0...array.length).to_a, claves, reverse)
+    return orden.map { |i| array[i] }
+  end
+
   return array if array.length <= 1
   
   # Elegimos el pivote (puede ser el primer, último, o del medio)
@@ -44,7 +56,26 @@ def quick_sort(array, mostrar_pasos = false)
   quick_sort(menores, mostrar_pasos) + iguales + quick_sort(mayores, mostrar_pasos)
 end
 
-def quick_sort_inplace(array, low = 0, high = nil, mostrar_pasos = false)
+def quick_sort_indices(indices, claves, reverse)
+  # Igual que quick_sort, pero ordena posiciones comparando claves[i].
+  #
+  # select mantiene el orden original dentro de menores, iguales y
+  # mayores, por eso el resultado es estable.
+  return indices if indices.length <= 1
+
+  pivot = claves[indices[indices.length / 2]]
+  menores = indices.select { |i| claves[i] < pivot }
+  iguales = indices.select { |i| claves[i] == pivot }
+  mayores = indices.select { |i| claves[i] > pivot }
+
+  if reverse
+    quick_sort_indices(mayores, claves, reverse) + iguales + quick_sort_indices(menores, claves, reverse)
+  else
+    quick_sort_indices(menores, claves, reverse) + iguales + quick_sort_indices(mayores, claves, reverse)
+  end
+end
+
+def quick_sort_inplace(array, low = 0, high = nil, mostrar_pasos = false, modo = "clasico")
   # Versión in-place de Quick Sort (más eficiente en memoria).
   # Modifica el array original en lugar de crear nuevos.
   #
@@ -53,8 +84,20 @@ def quick_sort_inplace(array, low = 0, high = nil, mostrar_pasos = false)
   #     low: Índice inicial
   #     high: Índice final
   #     mostrar_pasos: Si true, muestra el proceso
+  #     modo: "clasico" (Lomuto puro), "introsort" (peor caso O(n log n))
+  #           o "tres_vias" (ideal cuando hay muchos repetidos)
   high = array.length - 1 if high.nil?
-  
+
+  if modo == "introsort"
+    introsort(array, low, high)
+    return
+  end
+
+  if modo == "tres_vias"
+    quick_sort_tres_vias(array, low, high, mostrar_pasos)
+    return
+  end
+
   if low < high
     # Particionamos y obtenemos la posición del pivote
     pivot_idx = partition(array, low, high, mostrar_pasos)
@@ -102,6 +145,405 @@ def partition(array, low, high, mostrar_pasos = false)
   i + 1
 end
 
+# 🛡️ INTROSORT: Quick Sort con "red de seguridad"
+#
+# Quick Sort puede caer en O(n²) con pivotes malos (por ejemplo, un array
+# ya ordenado con el último elemento como pivote). Introsort vigila la
+# profundidad de la recursión y, si crece demasiado, cambia a Heap Sort,
+# que SIEMPRE es O(n log n). Para pedazos chicos usa Insertion Sort.
+
+UMBRAL_INSERTION = 16  # Tamaño a partir del cual conviene Insertion Sort
+
+def insertion_sort_rango(array, low, high)
+  # Insertion Sort in-place solo sobre array[low..high]
+  # (la misma idea de 05_ordenamiento_insertion_sort.rb).
+  #
+  # Ojo: en Ruby NO conviene hacer array[low..high] = ordenar(array[low..high]).
+  # El slice comparte memoria con el array original y, al escribir, Ruby
+  # tiene que copiar el array ENTERO (copy-on-write): O(n) por cada tramo.
+  ((low + 1)..high).each do |i|
+    valor_actual = array[i]
+    j = i - 1
+
+    while j >= low && array[j] > valor_actual
+      array[j + 1] = array[j]
+      j -= 1
+    end
+
+    array[j + 1] = valor_actual
+  end
+end
+
+def hundir_rango(array, low, raiz, fin)
+  # Baja el elemento de 'raiz' hasta que sus hijos sean menores
+  loop do
+    hijo = 2 * raiz + 1
+    return if hijo >= fin
+    hijo += 1 if hijo + 1 < fin && array[low + hijo] < array[low + hijo + 1]
+    return if array[low + raiz] >= array[low + hijo]
+    array[low + raiz], array[low + hijo] = array[low + hijo], array[low + raiz]
+    raiz = hijo
+  end
+end
+
+def heap_sort_rango(array, low, high)
+  # Ordena in-place solo el tramo array[low..high] usando Heap Sort.
+  #
+  # Es el "plan B" de introsort: nunca pasa de O(n log n).
+  n = high - low + 1
+
+  # Construimos el heap (el máximo queda en array[low])
+  (n / 2 - 1).downto(0) { |inicio| hundir_rango(array, low, inicio, n) }
+
+  # Sacamos el máximo una y otra vez y lo ponemos al final
+  (n - 1).downto(1) do |fin|
+    array[low], array[low + fin] = array[low + fin], array[low]
+    hundir_rango(array, low, 0, fin)
+  end
+end
+
+def mediana_de_tres(array, low, high)
+  # Elige como pivote la mediana entre el primero, el del medio y el último,
+  # y la deja en array[high] para que partition la use.
+  #
+  # Así un array ya ordenado (o al revés) deja de ser el peor caso.
+  medio = (low + high) / 2
+  array[medio], array[low] = array[low], array[medio] if array[medio] < array[low]
+  array[high], array[low] = array[low], array[high] if array[high] < array[low]
+  array[medio], array[high] = array[high], array[medio] if array[medio] < array[high]
+end
+
+def introsort(array, low = 0, high = nil, profundidad_max = nil)
+  # Ordena in-place con Introsort (Quick Sort + Heap Sort + Insertion Sort).
+  #
+  # Cómo funciona:
+  # 1. Si el tramo es chico (<= UMBRAL_INSERTION), usa Insertion Sort
+  # 2. Si la recursión es demasiado profunda, usa Heap Sort en ese tramo
+  # 3. Si no, particiona como Quick Sort (pivote = mediana de tres)
+  #
+  # Args:
+  #     array: Lista a ordenar (se modifica in-place)
+  #     low: Índice inicial
+  #     high: Índice final
+  #     profundidad_max: Límite de recursión (por defecto 2 * log2(n))
+  high = array.length - 1 if high.nil?
+  profundidad_max = 2 * [high - low + 1, 1].max.bit_length if profundidad_max.nil?
+
+  while high - low + 1 > UMBRAL_INSERTION
+    if profundidad_max == 0
+      # Demasiados pivotes malos: cambiamos a Heap Sort
+      heap_sort_rango(array, low, high)
+      return
+    end
+    profundidad_max -= 1
+
+    mediana_de_tres(array, low, high)
+    pivot_idx = partition(array, low, high)
+
+    # Recursión en la parte más chica y bucle en la más grande:
+    # así la pila nunca pasa de O(log n)
+    if pivot_idx - low < high - pivot_idx
+      introsort(array, low, pivot_idx - 1, profundidad_max)
+      low = pivot_idx + 1
+    else
+      introsort(array, pivot_idx + 1, high, profundidad_max)
+      high = pivot_idx - 1
+    end
+  end
+
+  # Tramo pequeño: Insertion Sort es lo más rápido aquí
+  insertion_sort_rango(array, low, high) if low < high
+end
+
+# 🚩 PARTICIÓN EN TRES VÍAS (Bentley-McIlroy)
+#
+# Si el array tiene MUCHOS valores repetidos (por ejemplo, solo 0, 1 y 2),
+# partition sigue comparando y moviendo los iguales al pivote una y otra vez.
+# La partición en tres vías separa el tramo en:  < pivote | == pivote | > pivote
+# y los iguales ya NO se vuelven a tocar. Todo in-place, sin crear arrays
+# nuevos como hace quick_sort con menores/iguales/mayores.
+
+def partition_tres_vias(array, low, high, mostrar_pasos = false)
+  # Particiona array[low..high] en tres zonas usando el esquema de
+  # Bentley-McIlroy.
+  #
+  # Durante el recorrido, los elementos iguales al pivote se guardan en
+  # los extremos del tramo; al final se llevan al centro.
+  #
+  # Returns:
+  #     [fin_menores, inicio_mayores]: los menores quedan en
+  #     array[low..fin_menores] y los mayores en array[inicio_mayores..high]
+
+  # El pivote es el elemento del medio: quien llama lo elige y lo deja ahí
+  # (mediana de tres en quick_sort_tres_vias, mediana de medianas en nth_element)
+  medio = (low + high) / 2
+  array[low], array[medio] = array[medio], array[low]
+  pivot = array[low]
+
+  if mostrar_pasos
+    puts "\nParticionando en tres vías desde #{low} hasta #{high}"
+    puts "Pivote: #{pivot}"
+    puts "Array: #{array[low..high]}"
+  end
+
+  i, j = low, high + 1
+  p, q = low, high + 1  # Zonas de iguales: array[low..p] y array[q..high]
+
+  loop do
+    i += 1
+    while array[i] < pivot
+      break if i == high
+      i += 1
+    end
+    j -= 1
+    while pivot < array[j]
+      break if j == low
+      j -= 1
+    end
+
+    # Los índices se cruzaron
+    if i == j && array[i] == pivot
+      p += 1
+      array[p], array[i] = array[i], array[p]
+    end
+    break if i >= j
+
+    array[i], array[j] = array[j], array[i]
+    if array[i] == pivot
+      p += 1
+      array[p], array[i] = array[i], array[p]
+    end
+    if array[j] == pivot
+      q -= 1
+      array[q], array[j] = array[j], array[q]
+    end
+  end
+
+  # Llevamos los iguales de los extremos al centro
+  i = j + 1
+  (low..p).each do |k|
+    array[k], array[j] = array[j], array[k]
+    j -= 1
+  end
+  high.downto(q) do |k|
+    array[k], array[i] = array[i], array[k]
+    i += 1
+  end
+
+  if mostrar_pasos
+    puts "Menores: #{array[low...(j + 1)]}  Iguales: #{array[(j + 1)...i]}  Mayores: #{array[i..high]}\n"
+  end
+
+  [j, i]
+end
+
+def quick_sort_tres_vias(array, low = 0, high = nil, mostrar_pasos = false, profundidad_max = nil)
+  # Quick Sort in-place con partición en tres vías.
+  #
+  # Con k valores distintos hace O(n log k) trabajo: si hay pocos valores
+  # distintos (k pequeño) es prácticamente lineal, y no crea arrays nuevos.
+  # Como introsort, elige el pivote con mediana de tres y, si la recursión
+  # se hace demasiado profunda, termina el tramo con Heap Sort: el peor
+  # caso queda en O(n log n).
+  #
+  # Args:
+  #     array: Lista a ordenar (se modifica in-place)
+  #     low: Índice inicial
+  #     high: Índice final
+  #     mostrar_pasos: Si true, muestra el proceso
+  #     profundidad_max: Límite de recursión (por defecto 2 * log2(n))
+  high = array.length - 1 if high.nil?
+  profundidad_max = 2 * [high - low + 1, 1].max.bit_length if profundidad_max.nil?
+
+  while low < high
+    if profundidad_max == 0
+      # Demasiados pivotes malos (por ejemplo 1 2 3 ... 3 2 1): Heap Sort
+      heap_sort_rango(array, low, high)
+      return
+    end
+    profundidad_max -= 1
+
+    # Pivote = mediana de tres, llevado al medio (donde lo busca partition_tres_vias)
+    mediana_de_tres(array, low, high)
+    medio = (low + high) / 2
+    array[high], array[medio] = array[medio], array[high]
+
+    fin_menores, inicio_mayores = partition_tres_vias(array, low, high, mostrar_pasos)
+
+    # Recursión en la parte más chica y bucle en la más grande
+    if fin_menores - low < high - inicio_mayores
+      quick_sort_tres_vias(array, low, fin_menores, mostrar_pasos, profundidad_max)
+      low = inicio_mayores
+    else
+      quick_sort_tres_vias(array, inicio_mayores, high, mostrar_pasos, profundidad_max)
+      high = fin_menores
+    end
+  end
+end
+
+# 🏆 SELECCIÓN: cuando solo necesitas los k primeros
+#
+# Para sacar el TOP 100 de millones de datos no hace falta ordenar todo.
+# Después de particionar, el pivote queda en su posición FINAL: si esa
+# posición es la que buscamos, listo; si no, seguimos SOLO en el lado
+# donde está (Quick Sort sigue en los dos). Eso es Quickselect.
+#
+# Con un pivote malo Quickselect también cae en O(n²). La "mediana de
+# medianas" elige un pivote que siempre deja al menos ~30% de los datos
+# de cada lado, y así el tiempo queda garantizado en O(n).
+
+TAMANO_GRUPO = 5  # Grupos de 5 para la mediana de medianas
+
+def mediana_de_medianas(array, low, high)
+  # Elige un buen pivote para array[low..high] y devuelve su posición.
+  #
+  # Cómo funciona:
+  # 1. Divide el tramo en grupos de 5 y ordena cada grupo (son chicos)
+  # 2. Junta las medianas de los grupos al principio del tramo
+  # 3. Busca la mediana de esas medianas con nth_element (recursión)
+  if high - low + 1 <= TAMANO_GRUPO
+    insertion_sort_rango(array, low, high)
+    return (low + high) / 2
+  end
+
+  destino = low  # Las medianas se van juntando en array[low], array[low+1]...
+  (low..high).step(TAMANO_GRUPO) do |inicio|
+    fin = [inicio + TAMANO_GRUPO - 1, high].min
+    insertion_sort_rango(array, inicio, fin)
+    mediana = (inicio + fin) / 2
+    array[destino], array[mediana] = array[mediana], array[destino]
+    destino += 1
+  end
+
+  medio = (low + destino - 1) / 2
+  nth_element(array, medio, low, destino - 1)
+  medio
+end
+
+def nth_element(array, n, low = 0, high = nil)
+  # Reacomoda el array in-place para que array[n] quede con el valor que
+  # tendría si estuviera ordenado, todos los de la izquierda sean <= y
+  # todos los de la derecha >= (como std::nth_element de C++).
+  #
+  # Usa la partición en tres vías en lugar de partition: con muchos
+  # valores repetidos partition deja todos los iguales del mismo lado y
+  # el tramo se achica de a uno (O(n²) otra vez).
+  #
+  # Args:
+  #     array: Lista (se modifica in-place)
+  #     n: Posición buscada (0 = el mínimo, length - 1 = el máximo)
+  #     low: Índice inicial
+  #     high: Índice final
+  #
+  # Returns:
+  #     El valor que quedó en array[n]
+  high = array.length - 1 if high.nil?
+  raise IndexError, "n=#{n} está fuera del tramo [#{low}, #{high}]" unless low <= n && n <= high
+
+  while high - low + 1 > TAMANO_GRUPO
+    # Llevamos el pivote al medio, que es donde lo busca partition_tres_vias
+    pivote = mediana_de_medianas(array, low, high)
+    medio = (low + high) / 2
+    array[pivote], array[medio] = array[medio], array[pivote]
+
+    fin_menores, inicio_mayores = partition_tres_vias(array, low, high)
+    if n <= fin_menores
+      high = fin_menores        # Está entre los menores
+    elsif n >= inicio_mayores
+      low = inicio_mayores      # Está entre los mayores
+    else
+      return array[n]           # Cayó en la zona de iguales: listo
+    end
+  end
+
+  insertion_sort_rango(array, low, high)
+  array[n]
+end
+
+def partial_sort(array, k)
+  # Ordena in-place solo los k menores: array[0...k] queda ordenado y el
+  # resto queda en cualquier orden. O(n + k log k) en vez de O(n log n).
+  k = [k, array.length].min
+  return if k <= 0
+
+  nth_element(array, k - 1) if k < array.length  # Los k menores quedan en array[0...k]
+  introsort(array, 0, k - 1)
+end
+
+def top_k(array, k)
+  # Devuelve los k MAYORES de mayor a menor, sin ordenar todo el array.
+  #
+  # Args:
+  #     array: Lista de elementos (no se modifica)
+  #     k: Cuántos queremos
+  #
+  # Returns:
+  #     Array con los k mayores, el primero es el máximo
+  arr = array.to_a.dup
+  k = [k, arr.length].min
+  return [] if k <= 0
+
+  inicio = arr.length - k
+  nth_element(arr, inicio) if inicio > 0  # Los k mayores quedan en arr[inicio..]
+  mayores = arr[inicio..]
+  introsort(mayores)
+  mayores.reverse
+end
+
+def top_k_streaming(enumerable, k)
+  # Igual que top_k pero para datos que llegan de a uno (un archivo,
+  # un Enumerator...) y que NO entran en memoria.
+  #
+  # Guarda solo los k mejores en un min-heap: el más chico de los k
+  # está siempre arriba, así que cada dato nuevo se compara con uno solo.
+  # O(n log k) de tiempo y O(k) de memoria.
+  return [] if k <= 0
+
+  mejores = []  # Min-heap con los k mayores vistos hasta ahora
+  enumerable.each do |x|
+    if mejores.length < k
+      mejores << x
+      heap_subir(mejores, mejores.length - 1)
+    elsif x > mejores[0]
+      mejores[0] = x  # Sale el más chico, entra x
+      heap_bajar(mejores, 0)
+    end
+  end
+
+  mayores = []
+  until mejores.empty?
+    mayores << mejores[0]
+    ultimo = mejores.pop
+    unless mejores.empty?
+      mejores[0] = ultimo
+      heap_bajar(mejores, 0)
+    end
+  end
+  mayores.reverse
+end
+
+def heap_subir(heap, i)
+  # Sube heap[i] mientras sea menor que su padre (min-heap).
+  while i > 0
+    padre = (i - 1) / 2
+    break if heap[padre] <= heap[i]
+    heap[padre], heap[i] = heap[i], heap[padre]
+    i = padre
+  end
+end
+
+def heap_bajar(heap, i)
+  # Baja heap[i] mientras sea mayor que alguno de sus hijos (min-heap).
+  loop do
+    hijo = 2 * i + 1
+    break if hijo >= heap.length
+    hijo += 1 if hijo + 1 < heap.length && heap[hijo + 1] < heap[hijo]
+    break if heap[i] <= heap[hijo]
+    heap[i], heap[hijo] = heap[hijo], heap[i]
+    i = hijo
+  end
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -120,6 +562,13 @@ puts "Antes:  #{array2}"
 quick_sort_inplace(array2, 0, nil, false)
 puts "Después: #{array2}"
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 2b: Ordenar palabras por largo (key) de mayor a menor (reverse)"
+puts "=" * 60
+palabras = ["sol", "estrella", "luna", "cometa", "mar", "nube"]
+puts "Original: #{palabras}"
+puts "Por largo: #{quick_sort(palabras, false, ->(palabra) { palabra.length }, true)}"
+
 puts "\n" + "=" * 60
 puts "EJEMPLO 3: Comparación de velocidad"
 puts "=" * 60
@@ -154,6 +603,74 @@ puts "Quick Sort:  #{tiempo_quick.round(6)} segundos"
 puts "Bubble Sort: #{tiempo_bubble.round(6)} segundos"
 puts "Quick Sort es #{(tiempo_bubble / tiempo_quick).round(1)}x más rápido! 🚀"
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Introsort con un array YA ordenado (peor caso clásico)"
+puts "=" * 60
+array_ordenado = (0...3000).to_a
+
+# Con el último elemento como pivote, el array ordenado es el peor caso:
+# cada partición deja n-1 elementos de un lado. Introsort no tiene ese problema.
+start = Time.now
+quick_sort_inplace(array_ordenado, 0, nil, false, "introsort")
+tiempo_intro = Time.now - start
+puts "Introsort con #{array_ordenado.length} elementos ya ordenados: #{tiempo_intro.round(6)} segundos"
+puts "¿Sigue ordenado? #{array_ordenado == (0...3000).to_a}"
+
+array_al_reves = 3000.downto(1).to_a
+quick_sort_inplace(array_al_reves, 0, nil, false, "introsort")
+puts "¿Array al revés ordenado? #{array_al_reves == (1..3000).to_a}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 5: Muchos repetidos con partición en tres vías"
+puts "=" * 60
+array5 = [2, 0, 1, 2, 1, 0, 0, 2, 1, 1]
+puts "Antes:  #{array5}"
+quick_sort_inplace(array5, 0, nil, true, "tres_vias")
+puts "Después: #{array5}"
+
+# Con solo 3 valores distintos, cada partición deja lista toda una zona de iguales
+muchos_repetidos = Array.new(20000) { [0, 1, 2].sample }
+start = Time.now
+quick_sort_inplace(muchos_repetidos, 0, nil, false, "tres_vias")
+tiempo_tres_vias = Time.now - start
+puts "20000 elementos con 3 valores distintos: #{tiempo_tres_vias.round(6)} segundos"
+puts "¿Ordenado? #{muchos_repetidos == muchos_repetidos.sort}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 6: Top k sin ordenar todo (nth_element, partial_sort, top_k)"
+puts "=" * 60
+array6 = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0]
+copia = array6.dup
+mediana = nth_element(copia, copia.length / 2)
+puts "Original:          #{array6}"
+puts "nth_element(5):    #{copia}  -> array[5] = #{mediana}"
+copia = array6.dup
+partial_sort(copia, 3)
+puts "partial_sort(3):   #{copia}"
+puts "top_k(3):          #{top_k(array6, 3)}"
+
+datos = Array.new(200000) { rand(0..10**9) }
+start = Time.now
+top_ordenando = datos.sort.reverse[0, 100]
+tiempo_sort = Time.now - start
+
+start = Time.now
+top_seleccion = top_k(datos, 100)
+tiempo_top_k = Time.now - start
+
+# Con un Enumerator los datos llegan de a uno y el heap nunca guarda más de 100
+start = Time.now
+top_heap = top_k_streaming(datos.each, 100)
+tiempo_heap = Time.now - start
+
+# sort está escrito en C, así que le gana a top_k en Ruby puro;
+# lo importante es que top_k hace O(n) trabajo y el heap usa O(k) memoria
+puts "\nTop 100 de #{datos.length} números:"
+puts "Ordenando todo (sort): #{tiempo_sort.round(4)} segundos"
+puts "top_k (mediana de medianas): #{tiempo_top_k.round(4)} segundos"
+puts "top_k_streaming (heap de 100): #{tiempo_heap.round(4)} segundos"
+puts "¿Mismo resultado? #{top_ordenando == top_seleccion && top_seleccion == top_heap}"
+
 # 💡 CARACTERÍSTICAS IMPORTANTES
 
 puts "\n" + "=" * 60
@@ -168,13 +685,18 @@ puts """
 
 ❌ DESVENTAJAS:
    - Peor caso puede ser lento O(n²) si el pivote es malo
-   - No es estable (puede cambiar orden de elementos iguales)
+   - La versión in-place no es estable (puede cambiar orden de elementos iguales);
+     quick_sort con arrays sí lo es
    - Más complejo que algoritmos básicos
 
 📊 COMPLEJIDAD:
    - Tiempo promedio: O(n log n) - MUY rápido ✨
    - Tiempo mejor caso: O(n log n)
    - Tiempo peor caso: O(n²) - raro, pero puede pasar
+     (con modo introsort el peor caso baja a O(n log n))
+   - Con muchos repetidos: O(n log k) con modo tres_vias (k = valores distintos)
+   - nth_element / top_k: O(n) garantizado (mediana de medianas)
+   - top_k_streaming: O(n log k) de tiempo y solo O(k) de memoria
    - Espacio: O(log n) - para la recursión
 
 🎯 CUÁNDO USARLO:
@@ -204,6 +726,7 @@ puts """
    en arrays de diferentes tamaños
 
 4. Implementa una versión que ordene de MAYOR a MENOR
+   (después compárala con quick_sort(array, false, nil, true))
 
 💡 Quick Sort es el algoritmo de ordenamiento más usado en la práctica!
 """
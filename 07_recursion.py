@@ -134,63 +134,64 @@ def busqueda_binaria_recursiva(array, target, low=0, high=None):
 
 # 🎯 DEMOSTRACIONES
 
-print("=" * 60)
-print("EJEMPLO 1: Factorial")
-print("=" * 60)
-print("\nCalculando factorial(5):")
-resultado = factorial(5)
-print(f"\n✅ Resultado: {resultado}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Fibonacci")
-print("=" * 60)
-print("\nPrimeros 10 números de Fibonacci:")
-for i in range(10):
-    print(f"fibonacci({i}) = {fibonacci(i)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Suma Recursiva")
-print("=" * 60)
-array = [1, 2, 3, 4, 5]
-print(f"Array: {array}")
-print(f"Suma: {suma_recursiva(array)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Potencia")
-print("=" * 60)
-print(f"2^8 = {potencia(2, 8)}")
-print(f"5^3 = {potencia(5, 3)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 5: Contar Elementos")
-print("=" * 60)
-array = [1, 2, 3, 4, 5, 6, 7]
-print(f"Array: {array}")
-print(f"Cantidad de elementos: {contar_elementos(array)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 6: Máximo Recursivo")
-print("=" * 60)
-array = [3, 7, 2, 9, 1, 5]
-print(f"Array: {array}")
-print(f"Máximo: {maximo_recursivo(array)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 7: Búsqueda Binaria Recursiva")
-print("=" * 60)
-array_ordenado = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
-target = 11
-print(f"Array ordenado: {array_ordenado}")
-print(f"Buscando: {target}")
-resultado = busqueda_binaria_recursiva(array_ordenado, target)
-print(f"Encontrado en posición: {resultado}")
-
-# 💡 CONCEPTOS IMPORTANTES
-
-print("\n" + "=" * 60)
-print("💡 CONCEPTOS CLAVE DE RECURSIÓN")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Factorial")
+    print("=" * 60)
+    print("\nCalculando factorial(5):")
+    resultado = factorial(5)
+    print(f"\n✅ Resultado: {resultado}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Fibonacci")
+    print("=" * 60)
+    print("\nPrimeros 10 números de Fibonacci:")
+    for i in range(10):
+        print(f"fibonacci({i}) = {fibonacci(i)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Suma Recursiva")
+    print("=" * 60)
+    array = [1, 2, 3, 4, 5]
+    print(f"Array: {array}")
+    print(f"Suma: {suma_recursiva(array)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Potencia")
+    print("=" * 60)
+    print(f"2^8 = {potencia(2, 8)}")
+    print(f"5^3 = {potencia(5, 3)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Contar Elementos")
+    print("=" * 60)
+    array = [1, 2, 3, 4, 5, 6, 7]
+    print(f"Array: {array}")
+    print(f"Cantidad de elementos: {contar_elementos(array)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 6: Máximo Recursivo")
+    print("=" * 60)
+    array = [3, 7, 2, 9, 1, 5]
+    print(f"Array: {array}")
+    print(f"Máximo: {maximo_recursivo(array)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 7: Búsqueda Binaria Recursiva")
+    print("=" * 60)
+    array_ordenado = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    target = 11
+    print(f"Array ordenado: {array_ordenado}")
+    print(f"Buscando: {target}")
+    resultado = busqueda_binaria_recursiva(array_ordenado, target)
+    print(f"Encontrado en posición: {resultado}")
+
+    # 💡 CONCEPTOS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CONCEPTOS CLAVE DE RECURSIÓN")
+    print("=" * 60)
+    print("""
 1. CASO BASE:
    - Es la condición que detiene la recursión
    - Sin caso base, la función se llamaría infinitamente
@@ -220,12 +221,12 @@ print("""
    y viceversa. Cada una tiene sus ventajas.
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Implementa factorial de forma ITERATIVA (con un loop)
    Compara con la versión recursiva
 
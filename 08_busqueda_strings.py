@@ -3,6 +3,18 @@ Búsqueda en Strings
 
 Algoritmos para buscar patrones dentro de textos.
 Fundamentales para procesamiento de texto.
+
+La búsqueda naive prueba el patrón en CADA posición del texto: O(n · m).
+Los algoritmos de este archivo "preparan" el patrón una sola vez y
+después lo usan para buscar en todos los textos que quieras:
+
+- KMP (Knuth-Morris-Pratt): nunca vuelve para atrás en el texto.
+  Lee cada carácter UNA vez: O(n + m) siempre, aunque el patrón sea
+  muy repetitivo ("aaaaab" en "aaaa...").
+- Horspool (Boyer-Moore-Horspool): compara desde el FINAL del patrón y,
+  si no coincide, salta varias posiciones de golpe. Con patrones largos
+  ni siquiera mira la mayoría de los caracteres del texto: en promedio
+  es SUBLINEAL, ~n / m lecturas.
 """
 
 
@@ -14,17 +26,317 @@ def busqueda_naive(texto, patron):
     n = len(texto)
     m = len(patron)
     posiciones = []
-    
+
     for i in range(n - m + 1):
-        if texto[i:i + m] == patron:
+        # startswith(patron, i) compara en el lugar; texto[i:i + m] == patron
+        # crearía un string nuevo (una copia) en cada posición
+        if texto.startswith(patron, i):
             posiciones.append(i)
-    
+
     return posiciones
 
 
+# ============================================
+# KMP: NUNCA VOLVER PARA ATRÁS
+# ============================================
+#
+# Buscando "ABABC" en "ABABABC": los primeros 4 caracteres coinciden y
+# el 5to no ("A" en vez de "C"):
+#
+#   texto:   A B A B A B C
+#   patrón:  A B A B C
+#                    ^ falla
+#
+# La naive volvería a empezar en la posición 1. Pero ya SABEMOS qué hay
+# en el texto: "ABAB". Y "ABAB" termina con "AB", que es como empieza el
+# patrón. Así que seguimos comparando desde el 3er carácter del patrón,
+# sin mover el texto para atrás:
+#
+#   texto:   A B A B A B C
+#   patrón:      A B A B C      ✅
+#
+# La tabla de fallos guarda, para cada prefijo del patrón, el largo del
+# pedazo más largo que es a la vez prefijo y sufijo:
+#
+#   patrón:  A  B  A  B  C
+#   fallos: [0, 0, 1, 2, 0]     "ABAB" empieza y termina con "AB" -> 2
+
+
+def tabla_de_fallos(patron):
+    """
+    Tabla de fallos (o función prefijo) de KMP.
+
+    Returns:
+        Lista donde fallos[j] es el largo del prefijo más largo de
+        patron[:j + 1] que también es sufijo (sin contar el total).
+    """
+    fallos = [0] * len(patron)
+    k = 0  # Largo del prefijo que coincide hasta ahora
+    for j in range(1, len(patron)):
+        while k > 0 and patron[j] != patron[k]:
+            k = fallos[k - 1]  # Probamos con el prefijo más corto
+        if patron[j] == patron[k]:
+            k += 1
+        fallos[j] = k
+    return fallos
+
+
+class PatronKMP:
+    """
+    Patrón preparado para buscar con KMP. Se arma una vez y se puede usar
+    para buscar en muchos textos.
+
+    Complejidad: O(m) para armarlo, O(n) para cada búsqueda.
+    """
+
+    def __init__(self, patron):
+        self.patron = patron
+        self.fallos = tabla_de_fallos(patron)
+
+    def buscar(self, texto):
+        """Todas las posiciones donde aparece el patrón (igual que busqueda_naive)."""
+        patron, fallos, m = self.patron, self.fallos, len(self.patron)
+        if m == 0:
+            return list(range(len(texto) + 1))
+
+        posiciones = []
+        j = 0  # Cuántos caracteres del patrón coinciden
+        for i, c in enumerate(texto):
+            while j > 0 and c != patron[j]:
+                j = fallos[j - 1]  # El texto no retrocede: solo el patrón
+            if c == patron[j]:
+                j += 1
+                if j == m:
+                    posiciones.append(i - m + 1)
+                    j = fallos[j - 1]  # Para encontrar las que se solapan
+        return posiciones
+
+
+# ============================================
+# HORSPOOL: COMPARAR DESDE EL FINAL Y SALTAR
+# ============================================
+#
+# Miramos el carácter del texto que queda bajo el ÚLTIMO del patrón.
+# Si ese carácter no aparece en el patrón, ninguna alineación que lo
+# incluya puede coincidir: saltamos el patrón entero.
+#
+#   texto:   E R R O R   E N   E L   D I S C O
+#   patrón:  D I S C O
+#                    ^ "R" no está en "DISCO": saltamos 5
+#   patrón:            D I S C O
+#                              ^ "E" tampoco: saltamos 5
+#   patrón:                      D I S C O
+#                                        ^ "D" está 4 lugares antes del final
+#   patrón:                              D I S C O     ✅
+#
+# 4 alineaciones en vez de 14. La tabla de saltos dice, para cada
+# carácter, cuánto mover el patrón para alinearlo con su última
+# aparición (sin contar el último carácter del patrón):
+#
+#   "DISCO" -> {D: 4, I: 3, S: 2, C: 1}, cualquier otro: 5
+
+
+def tabla_de_saltos(patron):
+    """
+    Tabla de saltos de Horspool.
+
+    Returns:
+        Diccionario carácter -> salto. Los caracteres que no están
+        saltan len(patron).
+    """
+    m = len(patron)
+    # Si un carácter se repite, gana la última aparición (el salto más corto)
+    return {patron[j]: m - 1 - j for j in range(m - 1)}
+
+
+class PatronHorspool:
+    """
+    Patrón preparado para buscar con Boyer-Moore-Horspool. Se arma una vez
+    y se puede usar para buscar en muchos textos.
+
+    Complejidad: O(m) para armarlo. Cada búsqueda es ~n / m en promedio
+    (con un alfabeto grande), pero O(n · m) en el peor caso.
+    """
+
+    def __init__(self, patron):
+        self.patron = patron
+        self.saltos = tabla_de_saltos(patron)
+
+    def buscar(self, texto):
+        """Todas las posiciones donde aparece el patrón (igual que busqueda_naive)."""
+        patron, m = self.patron, len(self.patron)
+        if m == 0:
+            return list(range(len(texto) + 1))
+
+        posiciones = []
+        ultimo = patron[-1]
+        salto = self.saltos.get
+        i = 0
+        while i <= len(texto) - m:
+            c = texto[i + m - 1]  # El carácter bajo el final del patrón
+            if c == ultimo and texto.startswith(patron, i):
+                posiciones.append(i)
+            i += salto(c, m)
+        return posiciones
+
+
+class PatronNaive:
+    """La búsqueda naive con la misma forma que los otros patrones."""
+
+    def __init__(self, patron):
+        self.patron = patron
+
+    def buscar(self, texto):
+        """Todas las posiciones donde aparece el patrón."""
+        return busqueda_naive(texto, self.patron)
+
+
+# ============================================
+# ¿CUÁL USAR? ELEGIR SOLO
+# ============================================
+#
+# Horspool salta, en promedio, algo así como min(m, alfabeto) posiciones:
+# - patrones largos en texto "normal" (logs, código, lenguaje): saltos
+#   grandes, gana Horspool
+# - alfabetos chicos (ADN tiene 4 letras, binario tiene 2) o patrones
+#   muy repetitivos ("aaaaab"): los saltos son cortos y Horspool puede
+#   llegar a O(n · m); KMP garantiza O(n) pase lo que pase
+# - patrones de 1 o 2 caracteres: preparar tablas no vale la pena
+
+
+def compilar_patron(patron, alfabeto=None):
+    """
+    Elige el algoritmo según el patrón y lo prepara.
+
+    Args:
+        patron: Lo que vamos a buscar (str o bytes)
+        alfabeto: Cuántos caracteres distintos puede tener el TEXTO
+            (4 para ADN, 2 para binario...). Si no se sabe, se supone
+            texto normal y solo se mira si el patrón es repetitivo.
+
+    Returns:
+        Un PatronNaive, PatronKMP o PatronHorspool: todos tienen
+        .buscar(texto) y devuelven lo mismo.
+    """
+    if len(patron) <= 2:
+        return PatronNaive(patron)
+    if alfabeto is not None and alfabeto <= 4:
+        return PatronKMP(patron)
+    if len(set(patron)) <= 2:  # "aaaaab", "0110": el peor caso de Horspool
+        return PatronKMP(patron)
+    return PatronHorspool(patron)
+
+
+def buscar_patron(texto, patron, alfabeto=None):
+    """Todas las posiciones de patron en texto, con el algoritmo que convenga."""
+    return compilar_patron(patron, alfabeto).buscar(texto)
+
+
 # Más detalle en 10_strings_algoritmos.py
 # Este archivo es complementario
 
-print("Para más algoritmos de strings, ver: 10_strings_algoritmos.py")
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Tabla de fallos de KMP")
+    print("=" * 60)
+    for patron in ["ABABC", "AAAA", "ABCABD"]:
+        print(f"  {patron:<8} -> {tabla_de_fallos(patron)}")
+    kmp = PatronKMP("ABABC")
+    print(f"\nBuscar 'ABABC' en 'ABABABCABABC': {kmp.buscar('ABABABCABABC')}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Tabla de saltos de Horspool")
+    print("=" * 60)
+    horspool = PatronHorspool("DISCO")
+    print(f"  'DISCO' -> {horspool.saltos}, cualquier otro: 5")
+    print(f"\nBuscar 'DISCO' en 'ERROR EN EL DISCO': {horspool.buscar('ERROR EN EL DISCO')}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Elegir el algoritmo")
+    print("=" * 60)
+    for patron, alfabeto in [("ab", None), ("ACGTACGA", 4), ("0110", None),
+                             ("ERROR disk full", None), ("aaaaab", None)]:
+        elegido = compilar_patron(patron, alfabeto)
+        print(f"  {patron!r:<18} alfabeto={alfabeto!s:<5} -> {type(elegido).__name__}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Buscar en un log GRANDE")
+    print("=" * 60)
+    import random
+    import time
+
+    niveles = ["INFO", "INFO", "INFO", "DEBUG", "WARN"]
+    lineas = [f"2024-05-{random.randint(1, 28):02d} {random.choice(niveles)} "
+              f"request id={random.randrange(10**6)} took {random.randrange(500)}ms"
+              for _ in range(200_000)]
+    lineas[150_000] = "2024-05-17 ERROR disk full on /var/lib/postgresql"
+    log = "\n".join(lineas)
+    patron = "ERROR disk full on /var/lib"
+    print(f"Log de {len(log):,} caracteres, buscando {patron!r}")
+
+    resultados = []
+    for nombre, buscar in [("naive", lambda t: busqueda_naive(t, patron)),
+                           ("KMP", PatronKMP(patron).buscar),
+                           ("Horspool", PatronHorspool(patron).buscar)]:
+        start = time.time()
+        resultados.append(buscar(log))
+        print(f"  {nombre:<10} {time.time() - start:.3f} segundos")
+    print(f"  ¿Mismo resultado? {resultados[0] == resultados[1] == resultados[2]}")
+
+    saltos = PatronHorspool(patron).saltos
+    i = alineaciones = 0
+    while i <= len(log) - len(patron):
+        alineaciones += 1
+        i += saltos.get(log[i + len(patron) - 1], len(patron))
+    print(f"\nHorspool miró {alineaciones:,} alineaciones de {len(log) - len(patron) + 1:,} "
+          f"posibles ({alineaciones / len(log):.1%})")
+    print("""
+💡 La naive y KMP leen TODOS los caracteres del texto; Horspool se
+   saltea la mayor parte y gana por mucho. (str.find, que está escrito
+   en C y usa ideas parecidas, es todavía más rápido: estos algoritmos
+   sirven para entender cómo funciona por dentro.)""")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE KMP Y HORSPOOL")
+    print("=" * 60)
+    print("""
+✅ VENTAJAS:
+   - El patrón se prepara UNA vez y sirve para muchos textos
+   - KMP: nunca retrocede en el texto (sirve para leer de a pedazos)
+   - Horspool: con patrones largos se saltea casi todo el texto
+
+❌ DESVENTAJAS:
+   - Hay que armar una tabla: con patrones cortos no vale la pena
+   - Horspool con alfabetos chicos salta poco, y en el peor caso es O(n · m)
+
+📊 COMPLEJIDAD (n=texto, m=patrón):
+   - Naive: O(n · m)
+   - KMP: O(m) para preparar, O(n) para buscar, SIEMPRE
+   - Horspool: O(m) para preparar, ~O(n / m) en promedio, O(n · m) en el peor caso
+
+🎯 CUÁNDO USARLOS:
+   - Horspool: patrones largos en texto normal (buscar en logs, editores)
+   - KMP: alfabetos chicos (ADN, binario) o cuando necesitas la garantía
+   - compilar_patron elige solo
+   - Muchas búsquedas en el MISMO texto: mejor un índice (08d_suffix_array.py)
+""")
+
+    # 🏋️ EJERCICIOS PARA PRACTICAR
+
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
+1. Calcula a mano la tabla de fallos de "AABAAAB"
+
+2. Agrega a PatronKMP un método contar(texto) que no arme la lista
+
+3. ¿Cuántas alineaciones mira Horspool buscando "WXYZ" en "ABCD" * 1000?
+   ¿Y buscando "AAAA" en "A" * 4000? ¿Por qué tanta diferencia?
 
+4. Modifica PatronHorspool para que ignore mayúsculas y minúsculas
+""")
 
+    print("Para más algoritmos de strings, ver: 10_strings_algoritmos.py")
@@ -2,6 +2,18 @@
 #
 # Algoritmos para buscar patrones dentro de textos.
 # Fundamentales para procesamiento de texto.
+#
+# La búsqueda naive prueba el patrón en CADA posición del texto: O(n · m).
+# Los algoritmos de este archivo "preparan" el patrón una sola vez y
+# después lo usan para buscar en todos los textos que quieras:
+#
+# - KMP (Knuth-Morris-Pratt): nunca vuelve para atrás en el texto.
+#   Lee cada carácter UNA vez: O(n + m) siempre, aunque el patrón sea
+#   muy repetitivo ("aaaaab" en "aaaa...").
+# - Horspool (Boyer-Moore-Horspool): compara desde el FINAL del patrón y,
+#   si no coincide, salta varias posiciones de golpe. Con patrones largos
+#   ni siquiera mira la mayoría de los caracteres del texto: en promedio
+#   es SUBLINEAL, ~n / m lecturas.
 
 def busqueda_naive(texto, patron)
   # Búsqueda simple: compara el patrón en cada posición.
@@ -9,18 +21,318 @@ def busqueda_naive(texto, patron)
   n = texto.length
   m = patron.length
   posiciones = []
-  
+
   (0..n - m).each do |i|
     if texto[i, m] == patron
       posiciones << i
     end
   end
-  
+
   posiciones
 end
 
+# ============================================
+# KMP: NUNCA VOLVER PARA ATRÁS
+# ============================================
+#
+# Buscando "ABABC" en "ABABABC": los primeros 4 caracteres coinciden y
+# el 5to no ("A" en vez de "C"):
+#
+#   texto:   A B A B A B C
+#   patrón:  A B A B C
+#                    ^ falla
+#
+# La naive volvería a empezar en la posición 1. Pero ya SABEMOS qué hay
+# en el texto: "ABAB". Y "ABAB" termina con "AB", que es como empieza el
+# patrón. Así que seguimos comparando desde el 3er carácter del patrón,
+# sin mover el texto para atrás:
+#
+#   texto:   A B A B A B C
+#   patrón:      A B A B C      ✅
+#
+# La tabla de fallos guarda, para cada prefijo del patrón, el largo del
+# pedazo más largo que es a la vez prefijo y sufijo:
+#
+#   patrón:  A  B  A  B  C
+#   fallos: [0, 0, 1, 2, 0]     "ABAB" empieza y termina con "AB" -> 2
+
+def tabla_de_fallos(patron)
+  # Tabla de fallos (o función prefijo) de KMP.
+  #
+  # Returns:
+  #     Array donde fallos[j] es el largo del prefijo más largo de
+  #     patron[0..j] que también es sufijo (sin contar el total).
+  fallos = Array.new(patron.length, 0)
+  k = 0 # Largo del prefijo que coincide hasta ahora
+  (1...patron.length).each do |j|
+    k = fallos[k - 1] while k > 0 && patron[j] != patron[k] # Probamos con el prefijo más corto
+    k += 1 if patron[j] == patron[k]
+    fallos[j] = k
+  end
+  fallos
+end
+
+class PatronKMP
+  # Patrón preparado para buscar con KMP. Se arma una vez y se puede usar
+  # para buscar en muchos textos.
+  #
+  # Complejidad: O(m) para armarlo, O(n) para cada búsqueda.
+
+  attr_reader :patron, :fallos
+
+  def initialize(patron)
+    @patron = patron
+    @fallos = tabla_de_fallos(patron)
+  end
+
+  def buscar(texto)
+    # Todas las posiciones donde aparece el patrón (igual que busqueda_naive).
+    m = @patron.length
+    return (0..texto.length).to_a if m == 0
+
+    posiciones = []
+    caracteres = @patron.chars # patron[j] crearía un string nuevo en cada vuelta
+    j = 0 # Cuántos caracteres del patrón coinciden
+    texto.each_char.with_index do |c, i|
+      j = @fallos[j - 1] while j > 0 && c != caracteres[j] # El texto no retrocede: solo el patrón
+      next unless c == caracteres[j]
+
+      j += 1
+      if j == m
+        posiciones << i - m + 1
+        j = @fallos[j - 1] # Para encontrar las que se solapan
+      end
+    end
+    posiciones
+  end
+end
+
+# ============================================
+# HORSPOOL: COMPARAR DESDE EL FINAL Y SALTAR
+# ============================================
+#
+# Miramos el carácter del texto que queda bajo el ÚLTIMO del patrón.
+# Si ese carácter no aparece en el patrón, ninguna alineación que lo
+# incluya puede coincidir: saltamos el patrón entero.
+#
+#   texto:   E R R O R   E N   E L   D I S C O
+#   patrón:  D I S C O
+#                    ^ "R" no está en "DISCO": saltamos 5
+#   patrón:            D I S C O
+#                              ^ "E" tampoco: saltamos 5
+#   patrón:                      D I S C O
+#                                        ^ "D" está 4 lugares antes del final
+#   patrón:                              D I S C O     ✅
+#
+# 4 alineaciones en vez de 14. La tabla de saltos dice, para cada
+# carácter, cuánto mover el patrón para alinearlo con su última
+# aparición (sin contar el último carácter del patrón):
+#
+#   "DISCO" -> {D: 4, I: 3, S: 2, C: 1}, cualquier otro: 5
+
+def tabla_de_saltos(patron)
+  # Tabla de saltos de Horspool.
+  #
+  # Returns:
+  #     Hash carácter -> salto. Los caracteres que no están
+  #     saltan patron.length.
+  m = patron.length
+  saltos = {}
+  # Si un carácter se repite, gana la última aparición (el salto más corto)
+  (0...m - 1).each { |j| saltos[patron[j]] = m - 1 - j }
+  saltos
+end
+
+class PatronHorspool
+  # Patrón preparado para buscar con Boyer-Moore-Horspool. Se arma una vez
+  # y se puede usar para buscar en muchos textos.
+  #
+  # Complejidad: O(m) para armarlo. Cada búsqueda es ~n / m en promedio
+  # (con un alfabeto grande), pero O(n · m) en el peor caso.
+
+  attr_reader :patron, :saltos
+
+  def initialize(patron)
+    @patron = patron
+    @saltos = tabla_de_saltos(patron)
+  end
+
+  def buscar(texto)
+    # Todas las posiciones donde aparece el patrón (igual que busqueda_naive).
+    m = @patron.length
+    return (0..texto.length).to_a if m == 0
+
+    posiciones = []
+    ultimo = @patron[-1]
+    i = 0
+    while i <= texto.length - m
+      c = texto[i + m - 1] # El carácter bajo el final del patrón
+      posiciones << i if c == ultimo && texto[i, m] == @patron
+      i += @saltos.fetch(c, m)
+    end
+    posiciones
+  end
+end
+
+class PatronNaive
+  # La búsqueda naive con la misma forma que los otros patrones.
+
+  attr_reader :patron
+
+  def initialize(patron)
+    @patron = patron
+  end
+
+  def buscar(texto)
+    # Todas las posiciones donde aparece el patrón.
+    busqueda_naive(texto, @patron)
+  end
+end
+
+# ============================================
+# ¿CUÁL USAR? ELEGIR SOLO
+# ============================================
+#
+# Horspool salta, en promedio, algo así como min(m, alfabeto) posiciones:
+# - patrones largos en texto "normal" (logs, código, lenguaje): saltos
+#   grandes, gana Horspool
+# - alfabetos chicos (ADN tiene 4 letras, binario tiene 2) o patrones
+#   muy repetitivos ("aaaaab"): los saltos son cortos y Horspool puede
+#   llegar a O(n · m); KMP garantiza O(n) pase lo que pase
+# - patrones de 1 o 2 caracteres: preparar tablas no vale la pena
+
+def compilar_patron(patron, alfabeto = nil)
+  # Elige el algoritmo según el patrón y lo prepara.
+  #
+  # Args:
+  #     patron: Lo que vamos a buscar
+  #     alfabeto: Cuántos caracteres distintos puede tener el TEXTO
+  #         (4 para ADN, 2 para binario...). Si no se sabe, se supone
+  #         texto normal y solo se mira si el patrón es repetitivo.
+  #
+  # Returns:
+  #     Un PatronNaive, PatronKMP o PatronHorspool: todos tienen
+  #     .buscar(texto) y devuelven lo mismo.
+  return PatronNaive.new(patron) if patron.length <= 2
+  return PatronKMP.new(patron) if alfabeto && alfabeto <= 4
+  return PatronKMP.new(patron) if patron.chars.uniq.length <= 2 # "aaaaab", "0110": el peor caso de Horspool
+
+  PatronHorspool.new(patron)
+end
+
+def buscar_patron(texto, patron, alfabeto = nil)
+  # Todas las posiciones de patron en texto, con el algoritmo que convenga.
+  compilar_patron(patron, alfabeto).buscar(texto)
+end
+
 # Más detalle en 10_strings_algoritmos.rb
 # Este archivo es complementario
 
-puts "Para más algoritmos de strings, ver: 10_strings_algoritmos.rb"
+puts "=" * 60
+puts "EJEMPLO 1: Tabla de fallos de KMP"
+puts "=" * 60
+["ABABC", "AAAA", "ABCABD"].each do |patron|
+  puts "  #{patron.ljust(8)} -> #{tabla_de_fallos(patron)}"
+end
+kmp = PatronKMP.new("ABABC")
+puts "\nBuscar 'ABABC' en 'ABABABCABABC': #{kmp.buscar('ABABABCABABC')}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 2: Tabla de saltos de Horspool"
+puts "=" * 60
+horspool = PatronHorspool.new("DISCO")
+puts "  'DISCO' -> #{horspool.saltos}, cualquier otro: 5"
+puts "\nBuscar 'DISCO' en 'ERROR EN EL DISCO': #{horspool.buscar('ERROR EN EL DISCO')}"
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 3: Elegir el algoritmo"
+puts "=" * 60
+[["ab", nil], ["ACGTACGA", 4], ["0110", nil],
+ ["ERROR disk full", nil], ["aaaaab", nil]].each do |patron, alfabeto|
+  elegido = compilar_patron(patron, alfabeto)
+  puts "  #{patron.inspect.ljust(18)} alfabeto=#{alfabeto.inspect.ljust(5)} -> #{elegido.class}"
+end
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Buscar en un log GRANDE"
+puts "=" * 60
+niveles = ["INFO", "INFO", "INFO", "DEBUG", "WARN"]
+lineas = Array.new(200_000) do
+  "2024-05-#{format('%02d', rand(1..28))} #{niveles.sample} " \
+    "request id=#{rand(10**6)} took #{rand(500)}ms"
+end
+lineas[150_000] = "2024-05-17 ERROR disk full on /var/lib/postgresql"
+log = lineas.join("\n")
+patron = "ERROR disk full on /var/lib"
+puts "Log de #{log.length} caracteres, buscando #{patron.inspect}"
+
+resultados = []
+[["naive", ->(t) { busqueda_naive(t, patron) }],
+ ["KMP", PatronKMP.new(patron).method(:buscar)],
+ ["Horspool", PatronHorspool.new(patron).method(:buscar)]].each do |nombre, buscar|
+  start = Time.now
+  resultados << buscar.call(log)
+  puts "  #{nombre.ljust(10)} #{(Time.now - start).round(3)} segundos"
+end
+puts "  ¿Mismo resultado? #{resultados.uniq.length == 1}"
+
+saltos = PatronHorspool.new(patron).saltos
+i = 0
+alineaciones = 0
+while i <= log.length - patron.length
+  alineaciones += 1
+  i += saltos.fetch(log[i + patron.length - 1], patron.length)
+end
+puts "\nHorspool miró #{alineaciones} alineaciones de #{log.length - patron.length + 1} " \
+     "posibles (#{(100.0 * alineaciones / log.length).round(1)}%)"
+puts """
+💡 La naive y KMP leen TODOS los caracteres del texto; Horspool se
+   saltea la mayor parte y gana por mucho. (String#index, que está
+   escrito en C, es todavía más rápido: estos algoritmos sirven para
+   entender cómo funciona por dentro.)
+"""
+
+# 💡 CARACTERÍSTICAS IMPORTANTES
+
+puts "\n" + "=" * 60
+puts "💡 CARACTERÍSTICAS DE KMP Y HORSPOOL"
+puts "=" * 60
+puts """
+✅ VENTAJAS:
+   - El patrón se prepara UNA vez y sirve para muchos textos
+   - KMP: nunca retrocede en el texto (sirve para leer de a pedazos)
+   - Horspool: con patrones largos se saltea casi todo el texto
+
+❌ DESVENTAJAS:
+   - Hay que armar una tabla: con patrones cortos no vale la pena
+   - Horspool con alfabetos chicos salta poco, y en el peor caso es O(n · m)
+
+📊 COMPLEJIDAD (n=texto, m=patrón):
+   - Naive: O(n · m)
+   - KMP: O(m) para preparar, O(n) para buscar, SIEMPRE
+   - Horspool: O(m) para preparar, ~O(n / m) en promedio, O(n · m) en el peor caso
+
+🎯 CUÁNDO USARLOS:
+   - Horspool: patrones largos en texto normal (buscar en logs, editores)
+   - KMP: alfabetos chicos (ADN, binario) o cuando necesitas la garantía
+   - compilar_patron elige solo
+   - Muchas búsquedas en el MISMO texto: mejor un índice (08d_suffix_array.rb)
+"""
+
+# 🏋️ EJERCICIOS PARA PRACTICAR
+
+puts "\n" + "=" * 60
+puts "🏋️  EJERCICIOS"
+puts "=" * 60
+puts """
+1. Calcula a mano la tabla de fallos de \"AABAAAB\"
+
+2. Agrega a PatronKMP un método contar(texto) que no arme el array
+
+3. ¿Cuántas alineaciones mira Horspool buscando \"WXYZ\" en \"ABCD\" * 1000?
+   ¿Y buscando \"AAAA\" en \"A\" * 4000? ¿Por qué tanta diferencia?
+
+4. Modifica PatronHorspool para que ignore mayúsculas y minúsculas
+"""
+
+puts "Para más algoritmos de strings, ver: 10_strings_algoritmos.rb"
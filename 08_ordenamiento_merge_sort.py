@@ -11,17 +11,27 @@ Cómo funciona:
 """
 
 
-def merge_sort(array, mostrar_pasos=False):
+def merge_sort(array, mostrar_pasos=False, key=None, reverse=False):
     """
     Ordena un array usando Merge Sort.
     
     Args:
         array: Lista de números a ordenar
         mostrar_pasos: Si True, muestra el proceso
+        key: Función que da la clave de cada elemento (como en sorted()).
+             Se llama UNA sola vez por elemento
+        reverse: Si True, ordena de MAYOR a MENOR (sigue siendo estable)
     
     Returns:
         El array ordenado
     """
+    if key is not None or reverse:
+        # Decorar - ordenar - desdecorar: las claves se calculan una vez,
+        # se ordenan las POSICIONES y al final se arma el resultado
+        claves = [key(x) for x in array] if key is not None else array
+        orden = _merge_sort_indices(list(range(len(array))), claves, reverse)
+        return [array[i] for i in orden]
+
     # Caso base: array con 0 o 1 elemento ya está ordenado
     if len(array) <= 1:
         return array
@@ -84,51 +94,707 @@ def merge(izquierda, derecha, mostrar_pasos=False):
     return resultado
 
 
+def _merge_sort_indices(indices, claves, reverse):
+    """Igual que merge_sort(), pero ordena posiciones comparando claves[i]."""
+    if len(indices) <= 1:
+        return indices
+
+    medio = len(indices) // 2
+    izquierda = _merge_sort_indices(indices[:medio], claves, reverse)
+    derecha = _merge_sort_indices(indices[medio:], claves, reverse)
+
+    resultado = []
+    i = j = 0
+    while i < len(izquierda) and j < len(derecha):
+        clave_izq = claves[izquierda[i]]
+        clave_der = claves[derecha[j]]
+        # Solo tomamos de la derecha si va ESTRICTAMENTE antes (estabilidad)
+        if (clave_der > clave_izq) if reverse else (clave_der < clave_izq):
+            resultado.append(derecha[j])
+            j += 1
+        else:
+            resultado.append(izquierda[i])
+            i += 1
+
+    resultado.extend(izquierda[i:])
+    resultado.extend(derecha[j:])
+    return resultado
+
+
+# 🔁 MERGE SORT ITERATIVO (bottom-up) CON UN SOLO BUFFER
+#
+# merge_sort() corta el array con slices y merge() crea una lista nueva
+# ("resultado") en CADA combinación: con millones de elementos eso son
+# millones de listas pequeñas que luego hay que liberar.
+#
+# La versión bottom-up hace lo contrario: sin recursión, primero combina
+# pares de tramos de tamaño 1, luego de tamaño 2, 4, 8... y reserva UN solo
+# array auxiliar al principio. En cada pasada lee de un array y escribe en
+# el otro ("ping-pong"), así que la memoria extra es siempre exactamente n.
+
+
+def merge_en_buffer(origen, destino, inicio, medio, fin):
+    """
+    Combina origen[inicio:medio] y origen[medio:fin] (ya ordenados)
+    escribiendo el resultado en destino[inicio:fin].
+
+    Igual que merge(), pero sin crear listas nuevas.
+    """
+    i = inicio  # Índice en el tramo izquierdo
+    j = medio   # Índice en el tramo derecho
+    k = inicio  # Dónde escribimos en destino
+
+    while i < medio and j < fin:
+        if origen[i] <= origen[j]:  # <= mantiene la estabilidad
+            destino[k] = origen[i]
+            i += 1
+        else:
+            destino[k] = origen[j]
+            j += 1
+        k += 1
+
+    # Copiamos lo que sobre (solo uno de los dos tramos puede tener restos)
+    if i < medio:
+        destino[k:fin] = origen[i:medio]
+    elif j < fin:
+        destino[k:fin] = origen[j:fin]
+
+
+def merge_sort_bottom_up(array, mostrar_pasos=False):
+    """
+    Ordena un array con Merge Sort iterativo (de abajo hacia arriba).
+
+    Cómo funciona:
+    1. Considera cada elemento como un tramo ordenado de tamaño 1
+    2. Combina tramos vecinos de tamaño 'ancho' en tramos de tamaño 2*ancho
+    3. Duplica 'ancho' y repite hasta cubrir todo el array
+
+    Args:
+        array: Lista de números a ordenar
+        mostrar_pasos: Si True, muestra el array después de cada pasada
+
+    Returns:
+        El array ordenado (el original no se modifica)
+    """
+    n = len(array)
+    origen = array.copy()
+    destino = [None] * n  # El ÚNICO buffer auxiliar
+
+    ancho = 1
+    while ancho < n:
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(inicio + 2 * ancho, n)
+            merge_en_buffer(origen, destino, inicio, medio, fin)
+
+        # Intercambiamos los papeles: lo que escribimos ahora se lee después
+        origen, destino = destino, origen
+
+        if mostrar_pasos:
+            print(f"Tramos de tamaño {2 * ancho}: {origen}")
+
+        ancho *= 2
+
+    return origen
+
+
+# 🏃 MERGE SORT NATURAL (al estilo de TimSort)
+#
+# Los datos reales casi nunca están totalmente desordenados: muchas veces
+# son pedazos ya ordenados pegados uno detrás de otro. merge_sort() igual
+# los corta hasta llegar a elementos sueltos.
+#
+# La versión "natural" primero DETECTA esos pedazos ordenados (runs):
+# - Tramos ascendentes (a <= b <= c ...) se usan tal cual
+# - Tramos estrictamente descendentes (a > b > c ...) se dan vuelta
+# Después combina los runs de a pares. Si el array ya venía ordenado,
+# hay un solo run y el costo es O(n).
+
+MIN_RUN = 32   # Runs más cortos se alargan con Insertion Sort
+GALOPE = 7     # Victorias seguidas de un lado antes de empezar a "galopar"
+
+
+def detectar_runs(arr, min_run=MIN_RUN):
+    """
+    Recorre arr (se modifica in-place) buscando runs ordenados.
+
+    Los runs descendentes se dan vuelta y los muy cortos se completan
+    con Insertion Sort hasta tener min_run elementos.
+
+    Returns:
+        Lista con los límites de los runs: [0, fin_run1, fin_run2, ..., n]
+    """
+    n = len(arr)
+    limites = [0]
+    inicio = 0
+
+    while inicio < n:
+        fin = inicio + 1
+        if fin < n and arr[fin] < arr[inicio]:
+            # Run estrictamente descendente: lo damos vuelta
+            # (estricto para no cambiar el orden de elementos iguales)
+            while fin < n and arr[fin] < arr[fin - 1]:
+                fin += 1
+            arr[inicio:fin] = arr[inicio:fin][::-1]
+        else:
+            # Run ascendente
+            while fin < n and arr[fin] >= arr[fin - 1]:
+                fin += 1
+
+        # Run demasiado corto: lo alargamos insertando los siguientes elementos
+        if fin - inicio < min_run and fin < n:
+            nuevo_fin = min(inicio + min_run, n)
+            for i in range(fin, nuevo_fin):
+                valor_actual = arr[i]
+                j = i - 1
+                while j >= inicio and arr[j] > valor_actual:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                arr[j + 1] = valor_actual
+            fin = nuevo_fin
+
+        limites.append(fin)
+        inicio = fin
+
+    return limites
+
+
+def galopar(valor, arr, inicio, fin, incluir_iguales):
+    """
+    Busca en arr[inicio:fin] (ordenado) la primera posición cuyo elemento
+    va DESPUÉS de 'valor'.
+
+    Primero da saltos de 1, 2, 4, 8... (búsqueda exponencial) y luego
+    hace búsqueda binaria en el último salto. Si hay k elementos antes de
+    'valor', cuesta O(log k) en lugar de O(k).
+
+    Args:
+        incluir_iguales: Si True, los iguales a 'valor' cuentan como "antes"
+    """
+    def va_antes(x):
+        return x <= valor if incluir_iguales else x < valor
+
+    if inicio >= fin or not va_antes(arr[inicio]):
+        return inicio
+
+    # Saltos exponenciales: arr[bajo] siempre va antes de 'valor'
+    bajo = inicio
+    salto = 1
+    alto = inicio + 1
+    while alto < fin and va_antes(arr[alto]):
+        bajo = alto
+        salto *= 2
+        alto = inicio + salto
+    alto = min(alto, fin)
+
+    # Búsqueda binaria entre el último salto bueno y el primero malo
+    bajo += 1
+    while bajo < alto:
+        medio = (bajo + alto) // 2
+        if va_antes(arr[medio]):
+            bajo = medio + 1
+        else:
+            alto = medio
+    return bajo
+
+
+def merge_galopando(origen, destino, inicio, medio, fin):
+    """
+    Como merge_en_buffer(), pero cuando un lado gana GALOPE veces seguidas
+    copia de una vez todo el bloque que también va a ganar (usando galopar()).
+
+    Ideal para runs largos que casi no se intercalan.
+    """
+    # Atajo: si los dos runs ya están en orden, solo copiamos
+    if origen[medio - 1] <= origen[medio]:
+        destino[inicio:fin] = origen[inicio:fin]
+        return
+
+    i, j, k = inicio, medio, inicio
+    racha_izq = racha_der = 0
+
+    while i < medio and j < fin:
+        if origen[j] < origen[i]:
+            destino[k] = origen[j]
+            j += 1
+            racha_der += 1
+            racha_izq = 0
+        else:
+            destino[k] = origen[i]
+            i += 1
+            racha_izq += 1
+            racha_der = 0
+        k += 1
+
+        if racha_izq >= GALOPE and i < medio and j < fin:
+            # Copiamos de una vez todos los de la izquierda <= origen[j]
+            corte = galopar(origen[j], origen, i, medio, incluir_iguales=True)
+            destino[k:k + corte - i] = origen[i:corte]
+            k += corte - i
+            i = corte
+            racha_izq = 0
+        elif racha_der >= GALOPE and i < medio and j < fin:
+            # Copiamos de una vez todos los de la derecha < origen[i]
+            corte = galopar(origen[i], origen, j, fin, incluir_iguales=False)
+            destino[k:k + corte - j] = origen[j:corte]
+            k += corte - j
+            j = corte
+            racha_der = 0
+
+    if i < medio:
+        destino[k:fin] = origen[i:medio]
+    elif j < fin:
+        destino[k:fin] = origen[j:fin]
+
+
+def merge_sort_natural(array, mostrar_pasos=False):
+    """
+    Ordena un array aprovechando los tramos que ya vienen ordenados.
+
+    Cómo funciona:
+    1. Detecta los runs (dando vuelta los descendentes)
+    2. Combina los runs de a pares con merge_galopando()
+    3. Repite hasta que queda un solo run
+
+    Args:
+        array: Lista de números a ordenar
+        mostrar_pasos: Si True, muestra los runs en cada pasada
+
+    Returns:
+        El array ordenado (el original no se modifica)
+    """
+    origen = array.copy()
+    limites = detectar_runs(origen)
+    destino = [None] * len(origen)
+
+    if mostrar_pasos:
+        print(f"Runs detectados: {[origen[a:b] for a, b in zip(limites, limites[1:])]}")
+
+    while len(limites) > 2:
+        nuevos_limites = [0]
+        for r in range(0, len(limites) - 1, 2):
+            inicio = limites[r]
+            if r + 2 < len(limites):
+                medio, fin = limites[r + 1], limites[r + 2]
+                merge_galopando(origen, destino, inicio, medio, fin)
+            else:
+                # Run sin pareja: pasa tal cual a la siguiente ronda
+                fin = limites[r + 1]
+                destino[inicio:fin] = origen[inicio:fin]
+            nuevos_limites.append(fin)
+
+        origen, destino = destino, origen
+        limites = nuevos_limites
+
+        if mostrar_pasos:
+            print(f"Después de combinar: {[origen[a:b] for a, b in zip(limites, limites[1:])]}")
+
+    return origen
+
+
+# 💾 MERGE SORT EXTERNO (datos que NO entran en memoria)
+#
+# ¿Y si hay que ordenar 5 GB de números con solo 100 MB de RAM?
+# La idea de merge() sigue sirviendo, solo que los "mazos" ahora viven
+# en archivos:
+# 1. Leemos un pedazo que SÍ entra en memoria, lo ordenamos con merge_sort()
+#    y lo guardamos en un archivo temporal (un "run")
+# 2. Repetimos hasta terminar la entrada
+# 3. Combinamos TODOS los runs a la vez (k-way merge): un heap nos dice
+#    cuál run tiene el menor elemento actual
+#
+# Los runs se guardan en binario compacto con el módulo array
+# ('q' = entero de 8 bytes), mucho más chico y rápido que texto.
+
+import array as array_binario
+import heapq
+import os
+import tempfile
+
+
+def escribir_run(valores, ruta, tipo="q"):
+    """Guarda una lista ya ordenada en un archivo binario."""
+    with open(ruta, "wb") as archivo:
+        array_binario.array(tipo, valores).tofile(archivo)
+
+
+def leer_run(ruta, elementos_por_bloque, tipo="q"):
+    """
+    Lee un run desde disco de a bloques (nunca el archivo entero).
+
+    Yields:
+        Los valores del run, en orden
+    """
+    with open(ruta, "rb") as archivo:
+        while True:
+            bloque = array_binario.array(tipo)
+            try:
+                bloque.fromfile(archivo, elementos_por_bloque)
+            except EOFError:
+                # Último bloque incompleto: fromfile igual carga lo que había
+                pass
+            if not bloque:
+                return
+            yield from bloque
+
+
+def merge_k_runs(runs):
+    """
+    Combina k secuencias ordenadas usando un heap (k-way merge).
+
+    Es merge() generalizado: en vez de comparar 2 elementos, el heap
+    nos da el menor entre k en O(log k).
+
+    Yields:
+        Todos los valores en orden
+    """
+    heap = []
+    for indice, run in enumerate(runs):
+        primero = next(run, None)
+        if primero is not None:
+            # El índice desempata y evita comparar los iteradores
+            heap.append((primero, indice, run))
+    heapq.heapify(heap)
+
+    while heap:
+        valor, indice, run = heap[0]
+        yield valor
+        siguiente = next(run, None)
+        if siguiente is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (siguiente, indice, run))
+
+
+def merge_sort_externo(numeros, memoria_max=100000, directorio=None, tipo="q", mostrar_pasos=False):
+    """
+    Ordena una secuencia de números que puede no entrar en memoria.
+
+    Args:
+        numeros: Cualquier iterable de enteros (lista, generador, archivo...)
+        memoria_max: Máximo de elementos que tenemos en memoria a la vez
+        directorio: Dónde crear los archivos temporales (None = el del sistema)
+        tipo: Código de array para el formato binario ('q' enteros, 'd' decimales)
+        mostrar_pasos: Si True, muestra cuántos runs se crean
+
+    Yields:
+        Los números en orden, de a uno (la salida tampoco se guarda entera)
+    """
+    with tempfile.TemporaryDirectory(dir=directorio) as carpeta:
+        rutas = []
+        pedazo = []
+
+        # FASE 1: cortar en runs ordenados y guardarlos en disco
+        for numero in numeros:
+            pedazo.append(numero)
+            if len(pedazo) == memoria_max:
+                ruta = os.path.join(carpeta, f"run_{len(rutas)}.bin")
+                escribir_run(merge_sort(pedazo), ruta, tipo)
+                rutas.append(ruta)
+                pedazo = []
+        if pedazo:
+            ruta = os.path.join(carpeta, f"run_{len(rutas)}.bin")
+            escribir_run(merge_sort(pedazo), ruta, tipo)
+            rutas.append(ruta)
+            pedazo = []
+
+        if mostrar_pasos:
+            print(f"Se crearon {len(rutas)} runs de hasta {memoria_max} elementos")
+
+        # FASE 2: combinar todos los runs; cada uno lee bloques pequeños
+        # para que el total en memoria siga siendo ~memoria_max
+        elementos_por_bloque = max(1, memoria_max // max(1, len(rutas)))
+        runs = [leer_run(ruta, elementos_por_bloque, tipo) for ruta in rutas]
+        yield from merge_k_runs(runs)
+
+
+# ⚡ MERGE SORT PARALELO (varios procesadores a la vez)
+#
+# "Se puede paralelizar fácilmente": cada mitad se ordena por separado,
+# así que cada núcleo puede encargarse de un pedazo.
+# 1. Cortamos el array en P particiones y cada proceso ordena la suya
+# 2. Elegimos P-1 "separadores" y cortamos cada partición en P tramos:
+#    todos los valores entre dos separadores forman un grupo
+# 3. Cada proceso combina (k-way merge) UN grupo y lo escribe directo
+#    en su lugar final del resultado
+#
+# Los datos NO viajan entre procesos como listas (eso obliga a copiarlos
+# con pickle): viven en memoria compartida (shared_memory) como enteros
+# de 8 bytes y cada proceso lee y escribe su parte.
+
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+def _ordenar_particion(nombre_memoria, inicio, fin):
+    """Trabajo de cada proceso en la fase 1: ordena memoria[inicio:fin]."""
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    vista = memoria.buf.cast("q")
+    try:
+        tramo = merge_sort_bottom_up(vista[inicio:fin].tolist())
+        vista[inicio:fin] = array_binario.array("q", tramo)
+    finally:
+        vista.release()
+        memoria.close()
+
+
+def _combinar_grupo(nombre_entrada, nombre_salida, tramos, destino_inicio):
+    """
+    Trabajo de cada proceso en la fase 2: combina los tramos (ya ordenados)
+    de un grupo y los escribe en salida a partir de destino_inicio.
+    """
+    entrada = shared_memory.SharedMemory(name=nombre_entrada)
+    salida = shared_memory.SharedMemory(name=nombre_salida)
+    vista_entrada = entrada.buf.cast("q")
+    vista_salida = salida.buf.cast("q")
+    try:
+        runs = [iter(vista_entrada[a:b].tolist()) for a, b in tramos]
+        combinado = array_binario.array("q", merge_k_runs(runs))
+        vista_salida[destino_inicio:destino_inicio + len(combinado)] = combinado
+    finally:
+        vista_entrada.release()
+        vista_salida.release()
+        entrada.close()
+        salida.close()
+
+
+def merge_sort_paralelo(array, procesos=None, mostrar_pasos=False):
+    """
+    Ordena una lista de enteros usando varios procesos.
+
+    Args:
+        array: Lista de enteros (deben entrar en 8 bytes con signo)
+        procesos: Cantidad de procesos (None = uno por núcleo)
+        mostrar_pasos: Si True, muestra particiones y grupos
+
+    Returns:
+        El array ordenado (el original no se modifica)
+    """
+    n = len(array)
+    procesos = procesos or os.cpu_count() or 1
+    procesos = min(procesos, max(1, n // 2))
+    if procesos == 1:
+        return merge_sort_bottom_up(array)
+
+    # El sistema puede redondear size hacia arriba (a una página, en macOS):
+    # las vistas pueden ser más largas que n, así que siempre usamos [:n]
+    entrada = shared_memory.SharedMemory(create=True, size=n * 8)
+    salida = shared_memory.SharedMemory(create=True, size=n * 8)
+    vista_entrada = entrada.buf.cast("q")
+    vista_salida = salida.buf.cast("q")
+    try:
+        vista_entrada[:n] = array_binario.array("q", array)
+        limites = [p * n // procesos for p in range(procesos + 1)]
+        particiones = list(zip(limites, limites[1:]))
+
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            # FASE 1: cada proceso ordena su partición
+            tareas = [ejecutor.submit(_ordenar_particion, entrada.name, a, b)
+                      for a, b in particiones]
+            for tarea in tareas:
+                tarea.result()
+
+            # Elegimos los separadores a partir de una muestra de cada partición
+            muestra = []
+            for a, b in particiones:
+                muestra.extend(vista_entrada[a + (b - a) * k // procesos]
+                               for k in range(1, procesos))
+            muestra.sort()
+            separadores = [muestra[k * len(muestra) // procesos] for k in range(1, procesos)]
+
+            # Cortamos cada partición en tramos según los separadores
+            cortes = []
+            for a, b in particiones:
+                cortes.append([a] + [bisect.bisect_left(vista_entrada, x, a, b)
+                                     for x in separadores] + [b])
+
+            if mostrar_pasos:
+                print(f"Particiones: {particiones}")
+                print(f"Separadores: {separadores}")
+
+            # FASE 2: cada proceso combina un grupo y lo escribe en su lugar
+            tareas = []
+            destino_inicio = 0
+            for g in range(procesos):
+                tramos = [(corte[g], corte[g + 1]) for corte in cortes]
+                tareas.append(ejecutor.submit(_combinar_grupo, entrada.name,
+                                              salida.name, tramos, destino_inicio))
+                destino_inicio += sum(b - a for a, b in tramos)
+            for tarea in tareas:
+                tarea.result()
+
+        return vista_salida[:n].tolist()
+    finally:
+        vista_entrada.release()
+        vista_salida.release()
+        for memoria in (entrada, salida):
+            memoria.close()
+            memoria.unlink()
+
+
+# Comparar con Quick Sort (versión simple para comparación)
+def quick_sort_simple(array):
+    if len(array) <= 1:
+        return array
+    pivot = array[len(array) // 2]
+    menores = [x for x in array if x < pivot]
+    iguales = [x for x in array if x == pivot]
+    mayores = [x for x in array if x > pivot]
+    return quick_sort_simple(menores) + iguales + quick_sort_simple(mayores)
+
+
 # 🎯 EJEMPLOS DE USO
 
-print("=" * 60)
-print("EJEMPLO 1: Merge Sort paso a paso")
-print("=" * 60)
-array1 = [38, 27, 43, 3, 9, 82, 10]
-print(f"Original: {array1}\n")
-ordenado1 = merge_sort(array1, mostrar_pasos=True)
-print(f"✅ Resultado final: {ordenado1}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Comparación con otros algoritmos")
-print("=" * 60)
-array2 = [64, 34, 25, 12, 22, 11, 90]
-print(f"Original: {array2}")
-ordenado2 = merge_sort(array2, mostrar_pasos=False)
-print(f"Ordenado: {ordenado2}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Array grande")
-print("=" * 60)
-import time
-
-array_grande = [64, 34, 25, 12, 22, 11, 90, 5, 77, 88, 99, 1, 2, 3, 4, 55, 66, 44, 33, 22]
-
-start = time.time()
-resultado_merge = merge_sort(array_grande.copy(), mostrar_pasos=False)
-tiempo_merge = time.time() - start
-
-# Comparar con Quick Sort
-from 06_ordenamiento_quick_sort import quick_sort
-start = time.time()
-resultado_quick = quick_sort(array_grande.copy(), mostrar_pasos=False)
-tiempo_quick = time.time() - start
-
-print(f"Array de {len(array_grande)} elementos:")
-print(f"Merge Sort:  {tiempo_merge:.6f} segundos")
-print(f"Quick Sort:  {tiempo_quick:.6f} segundos")
-
-# 💡 CARACTERÍSTICAS IMPORTANTES
-
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE MERGE SORT")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Merge Sort paso a paso")
+    print("=" * 60)
+    array1 = [38, 27, 43, 3, 9, 82, 10]
+    print(f"Original: {array1}\n")
+    ordenado1 = merge_sort(array1, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Comparación con otros algoritmos")
+    print("=" * 60)
+    array2 = [64, 34, 25, 12, 22, 11, 90]
+    print(f"Original: {array2}")
+    ordenado2 = merge_sort(array2, mostrar_pasos=False)
+    print(f"Ordenado: {ordenado2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2b: Ordenar registros por una clave (estable)")
+    print("=" * 60)
+    productos = [("pan", 3), ("leche", 2), ("queso", 5), ("agua", 2), ("vino", 5)]
+    print(f"Original: {productos}")
+    print(f"Por precio: {merge_sort(productos, key=lambda p: p[1])}")
+    print(f"Por precio (mayor a menor): {merge_sort(productos, key=lambda p: p[1], reverse=True)}")
+    print("Los de igual precio mantienen su orden original: ¡es estable!")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Array grande")
+    print("=" * 60)
+    import time
+
+    array_grande = [64, 34, 25, 12, 22, 11, 90, 5, 77, 88, 99, 1, 2, 3, 4, 55, 66, 44, 33, 22]
+
+    start = time.time()
+    resultado_merge = merge_sort(array_grande.copy(), mostrar_pasos=False)
+    tiempo_merge = time.time() - start
+
+    start = time.time()
+    resultado_quick = quick_sort_simple(array_grande.copy())
+    tiempo_quick = time.time() - start
+
+    print(f"Array de {len(array_grande)} elementos:")
+    print(f"Merge Sort:  {tiempo_merge:.6f} segundos")
+    print(f"Quick Sort:  {tiempo_quick:.6f} segundos")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Merge Sort bottom-up (un solo buffer, sin recursión)")
+    print("=" * 60)
+    array4 = [38, 27, 43, 3, 9, 82, 10]
+    print(f"Original: {array4}")
+    ordenado4 = merge_sort_bottom_up(array4, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado4}")
+
+    import random
+    array_muy_grande = [random.randint(0, 1000000) for _ in range(100000)]
+
+    start = time.time()
+    merge_sort(array_muy_grande)
+    tiempo_recursivo = time.time() - start
+
+    start = time.time()
+    merge_sort_bottom_up(array_muy_grande)
+    tiempo_bottom_up = time.time() - start
+
+    print(f"\n{len(array_muy_grande)} elementos:")
+    print(f"Merge Sort recursivo: {tiempo_recursivo:.4f} segundos (crea una lista por cada merge)")
+    print(f"Merge Sort bottom-up: {tiempo_bottom_up:.4f} segundos (un solo buffer auxiliar)")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Merge Sort natural (aprovecha lo que ya está ordenado)")
+    print("=" * 60)
+    # Tres "lotes" ya ordenados pegados, uno de ellos al revés
+    array5 = [1, 4, 7, 10] + [9, 6, 3, 0] + [2, 5, 8, 11]
+    print(f"Original: {array5}")
+    ordenado5 = merge_sort_natural(array5)
+    print(f"✅ Resultado final: {ordenado5}")
+
+    # Con MIN_RUN=32 los runs cortos se alargan; para ver los runs "reales"
+    # mostramos la detección con min_run=1
+    copia5 = array5.copy()
+    limites5 = detectar_runs(copia5, min_run=1)
+    print(f"Runs reales: {[copia5[a:b] for a, b in zip(limites5, limites5[1:])]}")
+
+    # Lotes grandes ya ordenados: el caso típico de logs concatenados
+    lotes = []
+    for _ in range(10):
+        lotes.extend(sorted(random.randint(0, 1000000) for _ in range(10000)))
+
+    start = time.time()
+    merge_sort_bottom_up(lotes)
+    tiempo_bottom_up = time.time() - start
+
+    start = time.time()
+    merge_sort_natural(lotes)
+    tiempo_natural = time.time() - start
+
+    print(f"\n10 lotes ordenados de 10000 elementos:")
+    print(f"Merge Sort bottom-up: {tiempo_bottom_up:.4f} segundos")
+    print(f"Merge Sort natural:   {tiempo_natural:.4f} segundos")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 6: Merge Sort externo (como si no entrara en memoria)")
+    print("=" * 60)
+
+    def generar_eventos(cantidad):
+        # Simula leer un log enorme: los valores se generan de a uno
+        for _ in range(cantidad):
+            yield random.randint(0, 10**12)
+
+    # 50000 números, pero nunca más de 5000 en memoria a la vez
+    ordenados = merge_sort_externo(generar_eventos(50000), memoria_max=5000, mostrar_pasos=True)
+
+    anterior = None
+    cantidad = 0
+    en_orden = True
+    for valor in ordenados:
+        if anterior is not None and valor < anterior:
+            en_orden = False
+        anterior = valor
+        cantidad += 1
+    print(f"Se leyeron {cantidad} números ordenados. ¿En orden? {en_orden}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 7: Merge Sort paralelo (speedup según cantidad de núcleos)")
+    print("=" * 60)
+    array7 = [random.randint(-10**9, 10**9) for _ in range(200000)]
+
+    start = time.time()
+    esperado = merge_sort_bottom_up(array7)
+    tiempo_base = time.time() - start
+    print(f"{len(array7)} elementos, {os.cpu_count()} núcleos disponibles")
+    print(f"{'procesos':>9} {'segundos':>10} {'speedup':>8}")
+    print(f"{'(serial)':>9} {tiempo_base:>10.4f} {1.0:>7.2f}x")
+
+    procesos = 2
+    while procesos <= max(2, os.cpu_count() or 1):
+        start = time.time()
+        resultado7 = merge_sort_paralelo(array7, procesos=procesos)
+        tiempo = time.time() - start
+        assert resultado7 == esperado
+        print(f"{procesos:>9} {tiempo:>10.4f} {tiempo_base / tiempo:>7.2f}x")
+        procesos *= 2
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE MERGE SORT")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - SIEMPRE O(n log n) - muy predecible
    - Estable (mantiene orden de elementos iguales)
@@ -145,12 +811,16 @@ print("""
    - Tiempo promedio: O(n log n)
    - Tiempo peor caso: O(n log n) - SIEMPRE el mismo! ✨
    - Espacio: O(n) - necesita memoria extra
+     (merge_sort_bottom_up reserva ese O(n) UNA sola vez)
+   - merge_sort_natural: O(n) si ya está ordenado, O(n log r) con r runs
 
 🎯 CUÁNDO USARLO:
    - Cuando necesitas garantía de O(n log n)
    - Cuando necesitas estabilidad
    - Para ordenar listas enlazadas
    - Cuando tienes memoria suficiente
+   - Cuando NO tienes memoria suficiente: merge_sort_externo usa disco
+   - Cuando tienes muchos núcleos: merge_sort_paralelo los usa todos
 
 💡 COMPARACIÓN CON QUICK SORT:
    - Merge Sort: predecible pero usa más memoria
@@ -158,15 +828,16 @@ print("""
    - Ambos son excelentes algoritmos!
 """)
 
-# 🏋️ EJERCICIOS PARA PRACTICAR
+    # 🏋️ EJERCICIOS PARA PRACTICAR
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Modifica merge_sort para contar cuántas comparaciones hace
 
 2. Crea una versión que ordene de MAYOR a MENOR
+   (después compárala con merge_sort(array, reverse=True))
 
 3. Compara el uso de memoria de Merge Sort vs Quick Sort
    (Merge Sort usa más memoria, ¿puedes explicar por qué?)
@@ -176,9 +847,3 @@ print("""
 
 💡 Merge Sort es el algoritmo que usa Python para ordenar listas grandes!
 """)
-
-
-
-
-
-
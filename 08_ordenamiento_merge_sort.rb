@@ -8,15 +8,26 @@
 # 2. Ordena cada mitad recursivamente
 # 3. Combina las dos mitades ordenadas
 
-def merge_sort(array, mostrar_pasos = false)
+def merge_sort(array, mostrar_pasos = false, key = nil, reverse = false)
   # Ordena un array usando Merge Sort.
   #
   # Args:
   #     array: Lista de números a ordenar
   #     mostrar_pasos: Si true, muestra el proceso
+  #     key: Lambda que da la clave de cada elemento (como en sort_by).
+  #          Se llama UNA sola vez por elemento
+  #     reverse: Si true, ordena de MAYOR a MENOR (sigue siendo estable)
   #
   # Returns:
   #     El array ordenado
+  if !key.nil? || reverse
+    # Decorar - ordenar - desdecorar: las claves se calculan una vez,
+    # se ordenan las POSICIONES y al final se arma el resultado
+    claves = key.nil? ? array : array.map { |x| key.call(x) }
+    orden = merge_sort_indices((0...array.length).to_a, claves, reverse)
+    return orden.map { |i| array[i] }
+  end
+
   # Caso base: array con 0 o 1 elemento ya está ordenado
   return array if array.length <= 1
   
@@ -83,6 +94,441 @@ def merge(izquierda, derecha, mostrar_pasos = false)
   resultado
 end
 
+def merge_sort_indices(indices, claves, reverse)
+  # Igual que merge_sort, pero ordena posiciones comparando claves[i].
+  return indices if indices.length <= 1
+
+  medio = indices.length / 2
+  izquierda = merge_sort_indices(indices[0...medio], claves, reverse)
+  derecha = merge_sort_indices(indices[medio..-1], claves, reverse)
+
+  resultado = []
+  i = j = 0
+  while i < izquierda.length && j < derecha.length
+    clave_izq = claves[izquierda[i]]
+    clave_der = claves[derecha[j]]
+    # Solo tomamos de la derecha si va ESTRICTAMENTE antes (estabilidad)
+    if reverse ? clave_der > clave_izq : clave_der < clave_izq
+      resultado << derecha[j]
+      j += 1
+    else
+      resultado << izquierda[i]
+      i += 1
+    end
+  end
+
+  resultado.concat(izquierda[i..-1])
+  resultado.concat(derecha[j..-1])
+  resultado
+end
+
+# 🔁 MERGE SORT ITERATIVO (bottom-up) CON UN SOLO BUFFER
+#
+# merge_sort corta el array con slices y merge crea un array nuevo
+# ("resultado") en CADA combinación: con millones de elementos eso son
+# millones de arrays pequeños que luego el GC tiene que liberar.
+#
+# La versión bottom-up hace lo contrario: sin recursión, primero combina
+# pares de tramos de tamaño 1, luego de tamaño 2, 4, 8... y reserva UN solo
+# array auxiliar al principio. En cada pasada lee de un array y escribe en
+# el otro ("ping-pong"), así que la memoria extra es siempre exactamente n.
+
+def merge_en_buffer(origen, destino, inicio, medio, fin)
+  # Combina origen[inicio...medio] y origen[medio...fin] (ya ordenados)
+  # escribiendo el resultado en destino[inicio...fin].
+  #
+  # Igual que merge, pero sin crear arrays nuevos.
+  i = inicio  # Índice en el tramo izquierdo
+  j = medio   # Índice en el tramo derecho
+  k = inicio  # Dónde escribimos en destino
+
+  while i < medio && j < fin
+    if origen[i] <= origen[j]  # <= mantiene la estabilidad
+      destino[k] = origen[i]
+      i += 1
+    else
+      destino[k] = origen[j]
+      j += 1
+    end
+    k += 1
+  end
+
+  # Copiamos lo que sobre (solo uno de los dos tramos puede tener restos)
+  if i < medio
+    destino[k...fin] = origen[i...medio]
+  elsif j < fin
+    destino[k...fin] = origen[j...fin]
+  end
+end
+
+def merge_sort_bottom_up(array, mostrar_pasos = false)
+  # Ordena un array con Merge Sort iterativo (de abajo hacia arriba).
+  #
+  # Cómo funciona:
+  # 1. Considera cada elemento como un tramo ordenado de tamaño 1
+  # 2. Combina tramos vecinos de tamaño 'ancho' en tramos de tamaño 2*ancho
+  # 3. Duplica 'ancho' y repite hasta cubrir todo el array
+  #
+  # Args:
+  #     array: Lista de números a ordenar
+  #     mostrar_pasos: Si true, muestra el array después de cada pasada
+  #
+  # Returns:
+  #     El array ordenado (el original no se modifica)
+  n = array.length
+  origen = array.dup
+  destino = Array.new(n)  # El ÚNICO buffer auxiliar
+
+  ancho = 1
+  while ancho < n
+    (0...n).step(2 * ancho) do |inicio|
+      medio = [inicio + ancho, n].min
+      fin = [inicio + 2 * ancho, n].min
+      merge_en_buffer(origen, destino, inicio, medio, fin)
+    end
+
+    # Intercambiamos los papeles: lo que escribimos ahora se lee después
+    origen, destino = destino, origen
+
+    puts "Tramos de tamaño #{2 * ancho}: #{origen}" if mostrar_pasos
+
+    ancho *= 2
+  end
+
+  origen
+end
+
+# 🏃 MERGE SORT NATURAL (al estilo de TimSort)
+#
+# Los datos reales casi nunca están totalmente desordenados: muchas veces
+# son pedazos ya ordenados pegados uno detrás de otro. merge_sort igual
+# los corta hasta llegar a elementos sueltos.
+#
+# La versión "natural" primero DETECTA esos pedazos ordenados (runs):
+# - Tramos ascendentes (a <= b <= c ...) se usan tal cual
+# - Tramos estrictamente descendentes (a > b > c ...) se dan vuelta
+# Después combina los runs de a pares. Si el array ya venía ordenado,
+# hay un solo run y el costo es O(n).
+
+MIN_RUN = 32   # Runs más cortos se alargan con Insertion Sort
+GALOPE = 7     # Victorias seguidas de un lado antes de empezar a "galopar"
+
+def detectar_runs(arr, min_run = MIN_RUN)
+  # Recorre arr (se modifica in-place) buscando runs ordenados.
+  #
+  # Los runs descendentes se dan vuelta y los muy cortos se completan
+  # con Insertion Sort hasta tener min_run elementos.
+  #
+  # Returns:
+  #     Lista con los límites de los runs: [0, fin_run1, fin_run2, ..., n]
+  n = arr.length
+  limites = [0]
+  inicio = 0
+
+  while inicio < n
+    fin = inicio + 1
+    if fin < n && arr[fin] < arr[inicio]
+      # Run estrictamente descendente: lo damos vuelta
+      # (estricto para no cambiar el orden de elementos iguales)
+      fin += 1 while fin < n && arr[fin] < arr[fin - 1]
+      arr[inicio...fin] = arr[inicio...fin].reverse
+    else
+      # Run ascendente
+      fin += 1 while fin < n && arr[fin] >= arr[fin - 1]
+    end
+
+    # Run demasiado corto: lo alargamos insertando los siguientes elementos
+    if fin - inicio < min_run && fin < n
+      nuevo_fin = [inicio + min_run, n].min
+      (fin...nuevo_fin).each do |i|
+        valor_actual = arr[i]
+        j = i - 1
+        while j >= inicio && arr[j] > valor_actual
+          arr[j + 1] = arr[j]
+          j -= 1
+        end
+        arr[j + 1] = valor_actual
+      end
+      fin = nuevo_fin
+    end
+
+    limites << fin
+    inicio = fin
+  end
+
+  limites
+end
+
+def galopar(valor, arr, inicio, fin, incluir_iguales)
+  # Busca en arr[inicio...fin] (ordenado) la primera posición cuyo elemento
+  # va DESPUÉS de 'valor'.
+  #
+  # Primero da saltos de 1, 2, 4, 8... (búsqueda exponencial) y luego
+  # hace búsqueda binaria en el último salto. Si hay k elementos antes de
+  # 'valor', cuesta O(log k) en lugar de O(k).
+  #
+  # Args:
+  #     incluir_iguales: Si true, los iguales a 'valor' cuentan como "antes"
+  va_antes = lambda { |x| incluir_iguales ? x <= valor : x < valor }
+
+  return inicio if inicio >= fin || !va_antes.call(arr[inicio])
+
+  # Saltos exponenciales: arr[bajo] siempre va antes de 'valor'
+  bajo = inicio
+  salto = 1
+  alto = inicio + 1
+  while alto < fin && va_antes.call(arr[alto])
+    bajo = alto
+    salto *= 2
+    alto = inicio + salto
+  end
+  alto = [alto, fin].min
+
+  # Búsqueda binaria entre el último salto bueno y el primero malo
+  bajo += 1
+  while bajo < alto
+    medio = (bajo + alto) / 2
+    if va_antes.call(arr[medio])
+      bajo = medio + 1
+    else
+      alto = medio
+    end
+  end
+  bajo
+end
+
+def merge_galopando(origen, destino, inicio, medio, fin)
+  # Como merge_en_buffer, pero cuando un lado gana GALOPE veces seguidas
+  # copia de una vez todo el bloque que también va a ganar (usando galopar).
+  #
+  # Ideal para runs largos que casi no se intercalan.
+
+  # Atajo: si los dos runs ya están en orden, solo copiamos
+  if origen[medio - 1] <= origen[medio]
+    destino[inicio...fin] = origen[inicio...fin]
+    return
+  end
+
+  i, j, k = inicio, medio, inicio
+  racha_izq = racha_der = 0
+
+  while i < medio && j < fin
+    if origen[j] < origen[i]
+      destino[k] = origen[j]
+      j += 1
+      racha_der += 1
+      racha_izq = 0
+    else
+      destino[k] = origen[i]
+      i += 1
+      racha_izq += 1
+      racha_der = 0
+    end
+    k += 1
+
+    if racha_izq >= GALOPE && i < medio && j < fin
+      # Copiamos de una vez todos los de la izquierda <= origen[j]
+      corte = galopar(origen[j], origen, i, medio, true)
+      destino[k, corte - i] = origen[i...corte]
+      k += corte - i
+      i = corte
+      racha_izq = 0
+    elsif racha_der >= GALOPE && i < medio && j < fin
+      # Copiamos de una vez todos los de la derecha < origen[i]
+      corte = galopar(origen[i], origen, j, fin, false)
+      destino[k, corte - j] = origen[j...corte]
+      k += corte - j
+      j = corte
+      racha_der = 0
+    end
+  end
+
+  if i < medio
+    destino[k...fin] = origen[i...medio]
+  elsif j < fin
+    destino[k...fin] = origen[j...fin]
+  end
+end
+
+def merge_sort_natural(array, mostrar_pasos = false)
+  # Ordena un array aprovechando los tramos que ya vienen ordenados.
+  #
+  # Cómo funciona:
+  # 1. Detecta los runs (dando vuelta los descendentes)
+  # 2. Combina los runs de a pares con merge_galopando
+  # 3. Repite hasta que queda un solo run
+  #
+  # Args:
+  #     array: Lista de números a ordenar
+  #     mostrar_pasos: Si true, muestra los runs en cada pasada
+  #
+  # Returns:
+  #     El array ordenado (el original no se modifica)
+  origen = array.dup
+  limites = detectar_runs(origen)
+  destino = Array.new(origen.length)
+
+  if mostrar_pasos
+    puts "Runs detectados: #{limites.each_cons(2).map { |a, b| origen[a...b] }}"
+  end
+
+  while limites.length > 2
+    nuevos_limites = [0]
+    (0...limites.length - 1).step(2) do |r|
+      inicio = limites[r]
+      if r + 2 < limites.length
+        medio, fin = limites[r + 1], limites[r + 2]
+        merge_galopando(origen, destino, inicio, medio, fin)
+      else
+        # Run sin pareja: pasa tal cual a la siguiente ronda
+        fin = limites[r + 1]
+        destino[inicio...fin] = origen[inicio...fin]
+      end
+      nuevos_limites << fin
+    end
+
+    origen, destino = destino, origen
+    limites = nuevos_limites
+
+    if mostrar_pasos
+      puts "Después de combinar: #{limites.each_cons(2).map { |a, b| origen[a...b] }}"
+    end
+  end
+
+  origen
+end
+
+# 💾 MERGE SORT EXTERNO (datos que NO entran en memoria)
+#
+# ¿Y si hay que ordenar 5 GB de números con solo 100 MB de RAM?
+# La idea de merge sigue sirviendo, solo que los "mazos" ahora viven
+# en archivos:
+# 1. Leemos un pedazo que SÍ entra en memoria, lo ordenamos con merge_sort
+#    y lo guardamos en un archivo temporal (un "run")
+# 2. Repetimos hasta terminar la entrada
+# 3. Combinamos TODOS los runs a la vez (k-way merge): un heap nos dice
+#    cuál run tiene el menor elemento actual
+#
+# Los runs se guardan en binario compacto con pack ('q' = entero de
+# 8 bytes), mucho más chico y rápido que texto.
+
+require "tmpdir"
+
+def escribir_run(valores, ruta, tipo = "q")
+  # Guarda una lista ya ordenada en un archivo binario.
+  File.binwrite(ruta, valores.pack("#{tipo}*"))
+end
+
+def leer_run(ruta, elementos_por_bloque, tipo = "q")
+  # Lee un run desde disco de a bloques (nunca el archivo entero).
+  #
+  # Returns:
+  #     Un Enumerator con los valores del run, en orden
+  Enumerator.new do |salida|
+    File.open(ruta, "rb") do |archivo|
+      while (bloque = archivo.read(8 * elementos_por_bloque))
+        bloque.unpack("#{tipo}*").each { |valor| salida << valor }
+      end
+    end
+  end
+end
+
+def subir_en_heap(heap, i)
+  while i > 0
+    padre = (i - 1) / 2
+    break if (heap[padre] <=> heap[i]) <= 0
+    heap[padre], heap[i] = heap[i], heap[padre]
+    i = padre
+  end
+end
+
+def bajar_en_heap(heap, i)
+  loop do
+    menor = i
+    [2 * i + 1, 2 * i + 2].each do |hijo|
+      menor = hijo if hijo < heap.length && (heap[hijo] <=> heap[menor]) < 0
+    end
+    return if menor == i
+    heap[menor], heap[i] = heap[i], heap[menor]
+    i = menor
+  end
+end
+
+def merge_k_runs(runs)
+  # Combina k secuencias ordenadas usando un heap (k-way merge).
+  #
+  # Es merge generalizado: en vez de comparar 2 elementos, el heap
+  # nos da el menor entre k en O(log k).
+  #
+  # Returns:
+  #     Un Enumerator con todos los valores en orden
+  Enumerator.new do |salida|
+    # Guardamos [valor, indice] en el heap; el índice desempata
+    heap = []
+    runs.each_with_index do |run, indice|
+      begin
+        heap << [run.next, indice]
+        subir_en_heap(heap, heap.length - 1)
+      rescue StopIteration
+      end
+    end
+
+    until heap.empty?
+      valor, indice = heap[0]
+      salida << valor
+      begin
+        heap[0] = [runs[indice].next, indice]
+      rescue StopIteration
+        heap[0] = heap[-1]
+        heap.pop
+      end
+      bajar_en_heap(heap, 0)
+    end
+  end
+end
+
+def merge_sort_externo(numeros, memoria_max = 100000, directorio = nil, tipo = "q", mostrar_pasos = false)
+  # Ordena una secuencia de números que puede no entrar en memoria.
+  #
+  # Args:
+  #     numeros: Cualquier Enumerable de enteros (array, Enumerator, archivo...)
+  #     memoria_max: Máximo de elementos que tenemos en memoria a la vez
+  #     directorio: Dónde crear los archivos temporales (nil = el del sistema)
+  #     tipo: Código de pack para el formato binario ('q' enteros, 'd' decimales)
+  #     mostrar_pasos: Si true, muestra cuántos runs se crean
+  #
+  # Returns:
+  #     Un Enumerator con los números en orden, de a uno
+  Enumerator.new do |salida|
+    Dir.mktmpdir(nil, directorio) do |carpeta|
+      rutas = []
+      pedazo = []
+
+      guardar_pedazo = lambda do
+        ruta = File.join(carpeta, "run_#{rutas.length}.bin")
+        escribir_run(merge_sort(pedazo), ruta, tipo)
+        rutas << ruta
+        pedazo = []
+      end
+
+      # FASE 1: cortar en runs ordenados y guardarlos en disco
+      numeros.each do |numero|
+        pedazo << numero
+        guardar_pedazo.call if pedazo.length == memoria_max
+      end
+      guardar_pedazo.call unless pedazo.empty?
+
+      puts "Se crearon #{rutas.length} runs de hasta #{memoria_max} elementos" if mostrar_pasos
+
+      # FASE 2: combinar todos los runs; cada uno lee bloques pequeños
+      # para que el total en memoria siga siendo ~memoria_max
+      elementos_por_bloque = [1, memoria_max / [1, rutas.length].max].max
+      runs = rutas.map { |ruta| leer_run(ruta, elementos_por_bloque, tipo) }
+      merge_k_runs(runs).each { |valor| salida << valor }
+    end
+  end
+end
+
 # 🎯 EJEMPLOS DE USO
 
 puts "=" * 60
@@ -101,6 +547,16 @@ puts "Original: #{array2}"
 ordenado2 = merge_sort(array2, false)
 puts "Ordenado: #{ordenado2}"
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 2b: Ordenar registros por una clave (estable)"
+puts "=" * 60
+productos = [["pan", 3], ["leche", 2], ["queso", 5], ["agua", 2], ["vino", 5]]
+por_precio = ->(producto) { producto[1] }
+puts "Original: #{productos}"
+puts "Por precio: #{merge_sort(productos, false, por_precio)}"
+puts "Por precio (mayor a menor): #{merge_sort(productos, false, por_precio, true)}"
+puts "Los de igual precio mantienen su orden original: ¡es estable!"
+
 puts "\n" + "=" * 60
 puts "EJEMPLO 3: Array grande"
 puts "=" * 60
@@ -129,6 +585,81 @@ puts "Array de #{array_grande.length} elementos:"
 puts "Merge Sort:  #{tiempo_merge.round(6)} segundos"
 puts "Quick Sort:  #{tiempo_quick.round(6)} segundos"
 
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Merge Sort bottom-up (un solo buffer, sin recursión)"
+puts "=" * 60
+array4 = [38, 27, 43, 3, 9, 82, 10]
+puts "Original: #{array4}"
+ordenado4 = merge_sort_bottom_up(array4, true)
+puts "✅ Resultado final: #{ordenado4}"
+
+array_muy_grande = Array.new(100000) { rand(0..1000000) }
+
+start = Time.now
+merge_sort(array_muy_grande)
+tiempo_recursivo = Time.now - start
+
+start = Time.now
+merge_sort_bottom_up(array_muy_grande)
+tiempo_bottom_up = Time.now - start
+
+puts "\n#{array_muy_grande.length} elementos:"
+puts "Merge Sort recursivo: #{tiempo_recursivo.round(4)} segundos (crea un array por cada merge)"
+puts "Merge Sort bottom-up: #{tiempo_bottom_up.round(4)} segundos (un solo buffer auxiliar)"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 5: Merge Sort natural (aprovecha lo que ya está ordenado)"
+puts "=" * 60
+# Tres "lotes" ya ordenados pegados, uno de ellos al revés
+array5 = [1, 4, 7, 10] + [9, 6, 3, 0] + [2, 5, 8, 11]
+puts "Original: #{array5}"
+ordenado5 = merge_sort_natural(array5)
+puts "✅ Resultado final: #{ordenado5}"
+
+# Con MIN_RUN=32 los runs cortos se alargan; para ver los runs "reales"
+# mostramos la detección con min_run=1
+copia5 = array5.dup
+limites5 = detectar_runs(copia5, 1)
+puts "Runs reales: #{limites5.each_cons(2).map { |a, b| copia5[a...b] }}"
+
+# Lotes grandes ya ordenados: el caso típico de logs concatenados
+lotes = []
+10.times { lotes.concat(Array.new(10000) { rand(0..1000000) }.sort) }
+
+start = Time.now
+merge_sort_bottom_up(lotes)
+tiempo_bottom_up = Time.now - start
+
+start = Time.now
+merge_sort_natural(lotes)
+tiempo_natural = Time.now - start
+
+puts "\n10 lotes ordenados de 10000 elementos:"
+puts "Merge Sort bottom-up: #{tiempo_bottom_up.round(4)} segundos"
+puts "Merge Sort natural:   #{tiempo_natural.round(4)} segundos"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 6: Merge Sort externo (como si no entrara en memoria)"
+puts "=" * 60
+
+# Simula leer un log enorme: los valores se generan de a uno
+generar_eventos = Enumerator.new do |salida|
+  50000.times { salida << rand(0..10**12) }
+end
+
+# 50000 números, pero nunca más de 5000 en memoria a la vez
+ordenados = merge_sort_externo(generar_eventos, 5000, nil, "q", true)
+
+anterior = nil
+cantidad = 0
+en_orden = true
+ordenados.each do |valor|
+  en_orden = false if !anterior.nil? && valor < anterior
+  anterior = valor
+  cantidad += 1
+end
+puts "Se leyeron #{cantidad} números ordenados. ¿En orden? #{en_orden}"
+
 # 💡 CARACTERÍSTICAS IMPORTANTES
 
 puts "\n" + "=" * 60
@@ -151,12 +682,15 @@ puts """
    - Tiempo promedio: O(n log n)
    - Tiempo peor caso: O(n log n) - SIEMPRE el mismo! ✨
    - Espacio: O(n) - necesita memoria extra
+     (merge_sort_bottom_up reserva ese O(n) UNA sola vez)
+   - merge_sort_natural: O(n) si ya está ordenado, O(n log r) con r runs
 
 🎯 CUÁNDO USARLO:
    - Cuando necesitas garantía de O(n log n)
    - Cuando necesitas estabilidad
    - Para ordenar listas enlazadas
    - Cuando tienes memoria suficiente
+   - Cuando NO tienes memoria suficiente: merge_sort_externo usa disco
 
 💡 COMPARACIÓN CON QUICK SORT:
    - Merge Sort: predecible pero usa más memoria
@@ -173,6 +707,7 @@ puts """
 1. Modifica merge_sort para contar cuántas comparaciones hace
 
 2. Crea una versión que ordene de MAYOR a MENOR
+   (después compárala con merge_sort(array, false, nil, true))
 
 3. Compara el uso de memoria de Merge Sort vs Quick Sort
    (Merge Sort usa más memoria, ¿puedes explicar por qué?)
@@ -0,0 +1,346 @@
+"""
+Counting Sort y Radix Sort (Ordenamiento SIN comparaciones)
+
+Todos los algoritmos anteriores comparan elementos: "¿a es menor que b?".
+Se puede demostrar que ordenar comparando necesita al menos O(n log n).
+
+Pero si sabemos algo MÁS de los datos (por ejemplo, que son enteros
+entre 0 y 100, o códigos de texto), podemos ordenar sin comparar:
+- Counting Sort: cuenta cuántas veces aparece cada valor
+- Radix Sort: ordena dígito por dígito (o letra por letra)
+
+Es como repartir cartas por palo y número en montoncitos.
+"""
+
+
+def counting_sort(array, mostrar_pasos=True):
+    """
+    Ordena enteros contando cuántas veces aparece cada valor.
+
+    Cómo funciona:
+    1. Busca el mínimo y el máximo
+    2. Crea un contador para cada valor posible entre ellos
+    3. Recorre el array sumando 1 al contador de cada elemento
+    4. Reconstruye el array repitiendo cada valor tantas veces como apareció
+
+    Args:
+        array: Lista de ENTEROS (pueden ser negativos)
+        mostrar_pasos: Si True, muestra el proceso paso a paso
+
+    Returns:
+        El array ordenado
+    """
+    if len(array) <= 1:
+        return array.copy()
+
+    minimo = min(array)
+    maximo = max(array)
+    conteo = [0] * (maximo - minimo + 1)
+
+    if mostrar_pasos:
+        print(f"🔄 Ordenando: {array}")
+        print(f"Valores entre {minimo} y {maximo}: {len(conteo)} contadores\n")
+
+    # Contamos cada valor (el valor v usa la posición v - minimo)
+    for x in array:
+        conteo[x - minimo] += 1
+
+    if mostrar_pasos:
+        for i, c in enumerate(conteo):
+            if c > 0:
+                print(f"  El {i + minimo} aparece {c} vez/veces")
+
+    # Reconstruimos en orden
+    resultado = []
+    for i, c in enumerate(conteo):
+        resultado.extend([i + minimo] * c)
+
+    return resultado
+
+
+def counting_sort_sin_prints(array):
+    """Versión limpia sin prints (para usar en otros algoritmos)."""
+    if len(array) <= 1:
+        return array.copy()
+
+    minimo = min(array)
+    conteo = [0] * (max(array) - minimo + 1)
+    for x in array:
+        conteo[x - minimo] += 1
+
+    resultado = []
+    for i, c in enumerate(conteo):
+        if c:
+            resultado.extend([i + minimo] * c)
+    return resultado
+
+
+NOMBRES_POSICION = {1: "unidades", 10: "decenas", 100: "centenas", 1000: "unidades de mil"}
+
+
+def radix_sort_lsd(array, mostrar_pasos=True):
+    """
+    Ordena enteros dígito por dígito, empezando por las UNIDADES
+    (LSD = Least Significant Digit, el dígito menos significativo).
+
+    Cómo funciona:
+    1. Reparte los números en 10 cubetas según el dígito de las unidades
+    2. Los junta en orden (cubeta 0, cubeta 1, ..., cubeta 9)
+    3. Repite con las decenas, las centenas, etc.
+
+    Como cada reparto es ESTABLE (no cambia el orden dentro de una cubeta),
+    al terminar el último dígito todo queda ordenado.
+
+    Args:
+        array: Lista de ENTEROS (pueden ser negativos)
+        mostrar_pasos: Si True, muestra cada pasada
+
+    Returns:
+        El array ordenado
+    """
+    if len(array) <= 1:
+        return array.copy()
+
+    # Corremos todo para que el mínimo sea 0 (así funciona con negativos)
+    minimo = min(array)
+    arr = [x - minimo for x in array]
+    maximo = max(arr)
+
+    if mostrar_pasos:
+        print(f"🔄 Ordenando: {array}")
+        if minimo != 0:
+            print(f"  (restamos {minimo} para que todos sean >= 0: {arr})")
+
+    posicion = 1  # 1 = unidades, 10 = decenas, 100 = centenas...
+    while maximo // posicion > 0:
+        cubetas = [[] for _ in range(10)]
+        for x in arr:
+            cubetas[(x // posicion) % 10].append(x)
+        arr = [x for cubeta in cubetas for x in cubeta]
+
+        if mostrar_pasos:
+            nombre = NOMBRES_POSICION.get(posicion, f"posición {posicion}")
+            print(f"--- Dígito de las {nombre} ---")
+            for digito, cubeta in enumerate(cubetas):
+                if cubeta:
+                    print(f"  Cubeta {digito}: {cubeta}")
+            print(f"  Resultado: {[x + minimo for x in arr]}\n")
+
+        posicion *= 10
+
+    return [x + minimo for x in arr]
+
+
+def radix_sort_lsd_sin_prints(array):
+    """
+    Versión limpia sin prints (para usar en otros algoritmos).
+
+    En lugar de dígitos decimales usa "dígitos" de 8 bits (base 256):
+    menos pasadas y operaciones de bits en vez de divisiones.
+    """
+    if len(array) <= 1:
+        return array.copy()
+
+    minimo = min(array)
+    arr = [x - minimo for x in array] if minimo != 0 else list(array)
+    bits = max(arr).bit_length()
+
+    for desplazamiento in range(0, bits, 8):
+        cubetas = [[] for _ in range(256)]
+        for x in arr:
+            cubetas[(x >> desplazamiento) & 0xFF].append(x)
+        arr = [x for cubeta in cubetas for x in cubeta]
+
+    return [x + minimo for x in arr] if minimo != 0 else arr
+
+
+UMBRAL_MSD = 16  # Cubetas más chicas se ordenan con Insertion Sort
+
+
+def radix_sort_msd(strings, mostrar_pasos=True):
+    """
+    Ordena strings letra por letra, empezando por la PRIMERA
+    (MSD = Most Significant Digit, el dígito más significativo).
+
+    Cómo funciona:
+    1. Reparte los strings en cubetas según su primera letra
+    2. Los que ya se terminaron (más cortos) van primero: "sol" < "sola"
+    3. Dentro de cada cubeta, repite con la segunda letra, y así sigue
+
+    Es como ordenar un diccionario: primero por la primera letra,
+    después cada sección por la segunda letra...
+
+    Args:
+        strings: Lista de strings
+        mostrar_pasos: Si True, muestra las cubetas de cada nivel
+
+    Returns:
+        La lista ordenada
+    """
+    return _radix_sort_msd(list(strings), 0, mostrar_pasos)
+
+
+def _radix_sort_msd(strings, posicion, mostrar_pasos):
+    # En vez de recursión usamos una pila de cubetas pendientes: con strings
+    # que comparten un prefijo de 2000 letras la recursión bajaría 2000
+    # niveles (RecursionError). Sacamos siempre la cubeta de la letra más
+    # chica, así la salida sale en orden, igual que con recursión.
+    resultado = []
+    pendientes = [(strings, posicion)]
+    while pendientes:
+        strings, posicion = pendientes.pop()
+        if len(strings) <= 1:
+            resultado.extend(strings)
+            continue
+
+        if len(strings) <= UMBRAL_MSD and not mostrar_pasos:
+            resultado.extend(_insertion_sort_desde(strings, posicion))
+            continue
+
+        terminados = []  # Strings de largo == posicion (ya no tienen más letras)
+        cubetas = {}     # letra -> strings que tienen esa letra en 'posicion'
+        for s in strings:
+            if len(s) == posicion:
+                terminados.append(s)
+            else:
+                cubetas.setdefault(s[posicion], []).append(s)
+
+        if mostrar_pasos:
+            sangria = "  " * posicion
+            print(f"{sangria}Letra {posicion + 1}: {dict(sorted(cubetas.items()))}")
+
+        # Solo ordenamos las LETRAS distintas (pocas), no los strings.
+        # Se apilan de mayor a menor para que la menor salga primero.
+        resultado.extend(terminados)
+        for letra in sorted(cubetas, reverse=True):
+            pendientes.append((cubetas[letra], posicion + 1))
+    return resultado
+
+
+def _insertion_sort_desde(strings, posicion):
+    """
+    Insertion Sort para cubetas chicas. Todos comparten las primeras
+    'posicion' letras, así que la comparación de Python decide enseguida.
+    """
+    for i in range(1, len(strings)):
+        valor_actual = strings[i]
+        j = i - 1
+        while j >= 0 and strings[j] > valor_actual:
+            strings[j + 1] = strings[j]
+            j -= 1
+        strings[j + 1] = valor_actual
+    return strings
+
+
+def radix_sort_msd_sin_prints(strings):
+    """Versión limpia sin prints (para usar en otros algoritmos)."""
+    return _radix_sort_msd(list(strings), 0, False)
+
+
+def quick_sort_simple(array):
+    if len(array) <= 1:
+        return array
+    pivot = array[len(array) // 2]
+    menores = [x for x in array if x < pivot]
+    iguales = [x for x in array if x == pivot]
+    mayores = [x for x in array if x > pivot]
+    return quick_sort_simple(menores) + iguales + quick_sort_simple(mayores)
+
+
+# 🎯 EJEMPLOS DE USO
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Counting Sort paso a paso")
+    print("=" * 60)
+    array1 = [4, 2, 2, 8, 3, 3, 1]
+    ordenado1 = counting_sort(array1, mostrar_pasos=True)
+    print(f"\n✅ Resultado final: {ordenado1}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Radix Sort LSD paso a paso (con un negativo)")
+    print("=" * 60)
+    array2 = [170, 45, 75, -90, 802, 24, 2, 66]
+    ordenado2 = radix_sort_lsd(array2, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Radix Sort MSD con strings")
+    print("=" * 60)
+    array3 = ["sol", "sola", "casa", "cosa", "caso", "arbol", "sal"]
+    print(f"Original: {array3}")
+    ordenado3 = radix_sort_msd(array3, mostrar_pasos=True)
+    print(f"✅ Resultado final: {ordenado3}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Comparación de velocidad con Quick Sort")
+    print("=" * 60)
+    import random
+    import time
+
+    enteros = [random.randint(0, 100000) for _ in range(200000)]
+
+    start = time.time()
+    resultado_quick = quick_sort_simple(enteros)
+    tiempo_quick = time.time() - start
+
+    start = time.time()
+    resultado_counting = counting_sort_sin_prints(enteros)
+    tiempo_counting = time.time() - start
+
+    start = time.time()
+    resultado_radix = radix_sort_lsd_sin_prints(enteros)
+    tiempo_radix = time.time() - start
+
+    print(f"{len(enteros)} enteros entre 0 y 100000:")
+    print(f"Quick Sort:    {tiempo_quick:.4f} segundos")
+    print(f"Counting Sort: {tiempo_counting:.4f} segundos ({tiempo_quick / tiempo_counting:.1f}x)")
+    print(f"Radix Sort:    {tiempo_radix:.4f} segundos ({tiempo_quick / tiempo_radix:.1f}x)")
+    print(f"¿Mismo resultado? {resultado_quick == resultado_counting == resultado_radix}")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE COUNTING SORT Y RADIX SORT")
+    print("=" * 60)
+    print("""
+✅ VENTAJAS:
+   - No comparan elementos: pueden ser MÁS rápidos que O(n log n)
+   - Estables (Radix Sort depende de eso)
+   - Muy predecibles: no tienen "peor caso" por el orden de los datos
+
+❌ DESVENTAJAS:
+   - Solo sirven para ciertos tipos de datos (enteros, strings, fechas...)
+   - Counting Sort necesita memoria para CADA valor posible:
+     ordenar [1, 1000000000] crearía mil millones de contadores!
+   - Usan memoria extra O(n + k)
+
+📊 COMPLEJIDAD (n = elementos, k = rango de valores, d = dígitos):
+   - Counting Sort: O(n + k)
+   - Radix Sort LSD: O(d · (n + base))
+   - Radix Sort MSD (strings): O(total de letras que hay que mirar)
+
+🎯 CUÁNDO USARLOS:
+   - Counting Sort: enteros en un rango chico (edades, notas, puntajes)
+   - Radix Sort LSD: enteros grandes pero acotados (IDs, timestamps)
+   - Radix Sort MSD: strings de largo fijo o parecido (códigos, patentes)
+""")
+
+    # 🏋️ EJERCICIOS PARA PRACTICAR
+
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
+1. Modifica counting_sort para ordenar de MAYOR a MENOR
+
+2. Usa counting_sort para ordenar notas de exámenes (0 a 10)
+
+3. Cambia la base de radix_sort_lsd de 10 a 2 y cuenta las pasadas.
+   ¿Y con base 256?
+
+4. ¿Qué pasa con radix_sort_msd si mezclas mayúsculas y minúsculas?
+   Pista: compara ord("Z") con ord("a")
+
+💡 No todo se ordena comparando: conocer tus datos puede ahorrar mucho tiempo!
+""")
@@ -0,0 +1,330 @@
+# Counting Sort y Radix Sort (Ordenamiento SIN comparaciones)
+#
+# Todos los algoritmos anteriores comparan elementos: "¿a es menor que b?".
+# Se puede demostrar que ordenar comparando necesita al menos O(n log n).
+#
+# Pero si sabemos algo MÁS de los datos (por ejemplo, que son enteros
+# entre 0 y 100, o códigos de texto), podemos ordenar sin comparar:
+# - Counting Sort: cuenta cuántas veces aparece cada valor
+# - Radix Sort: ordena dígito por dígito (o letra por letra)
+#
+# Es como repartir cartas por palo y número en montoncitos.
+
+def counting_sort(array, mostrar_pasos = true)
+  # Ordena enteros contando cuántas veces aparece cada valor.
+  #
+  # Cómo funciona:
+  # 1. Busca el mínimo y el máximo
+  # 2. Crea un contador para cada valor posible entre ellos
+  # 3. Recorre el array sumando 1 al contador de cada elemento
+  # 4. Reconstruye el array repitiendo cada valor tantas veces como apareció
+  #
+  # Args:
+  #     array: Lista de ENTEROS (pueden ser negativos)
+  #     mostrar_pasos: Si true, muestra el proceso paso a paso
+  #
+  # Returns:
+  #     El array ordenado
+  return array.dup if array.length <= 1
+
+  minimo = array.min
+  maximo = array.max
+  conteo = Array.new(maximo - minimo + 1, 0)
+
+  if mostrar_pasos
+    puts "🔄 Ordenando: #{array}"
+    puts "Valores entre #{minimo} y #{maximo}: #{conteo.length} contadores\n"
+  end
+
+  # Contamos cada valor (el valor v usa la posición v - minimo)
+  array.each { |x| conteo[x - minimo] += 1 }
+
+  if mostrar_pasos
+    conteo.each_with_index do |c, i|
+      puts "  El #{i + minimo} aparece #{c} vez/veces" if c > 0
+    end
+  end
+
+  # Reconstruimos en orden
+  resultado = []
+  conteo.each_with_index { |c, i| resultado.concat([i + minimo] * c) }
+
+  resultado
+end
+
+def counting_sort_sin_prints(array)
+  # Versión limpia sin prints (para usar en otros algoritmos).
+  return array.dup if array.length <= 1
+
+  minimo = array.min
+  conteo = Array.new(array.max - minimo + 1, 0)
+  array.each { |x| conteo[x - minimo] += 1 }
+
+  resultado = []
+  conteo.each_with_index { |c, i| resultado.concat([i + minimo] * c) if c > 0 }
+  resultado
+end
+
+NOMBRES_POSICION = { 1 => "unidades", 10 => "decenas", 100 => "centenas", 1000 => "unidades de mil" }
+
+def radix_sort_lsd(array, mostrar_pasos = true)
+  # Ordena enteros dígito por dígito, empezando por las UNIDADES
+  # (LSD = Least Significant Digit, el dígito menos significativo).
+  #
+  # Cómo funciona:
+  # 1. Reparte los números en 10 cubetas según el dígito de las unidades
+  # 2. Los junta en orden (cubeta 0, cubeta 1, ..., cubeta 9)
+  # 3. Repite con las decenas, las centenas, etc.
+  #
+  # Como cada reparto es ESTABLE (no cambia el orden dentro de una cubeta),
+  # al terminar el último dígito todo queda ordenado.
+  #
+  # Args:
+  #     array: Lista de ENTEROS (pueden ser negativos)
+  #     mostrar_pasos: Si true, muestra cada pasada
+  #
+  # Returns:
+  #     El array ordenado
+  return array.dup if array.length <= 1
+
+  # Corremos todo para que el mínimo sea 0 (así funciona con negativos)
+  minimo = array.min
+  arr = array.map { |x| x - minimo }
+  maximo = arr.max
+
+  if mostrar_pasos
+    puts "🔄 Ordenando: #{array}"
+    puts "  (restamos #{minimo} para que todos sean >= 0: #{arr})" if minimo != 0
+  end
+
+  posicion = 1  # 1 = unidades, 10 = decenas, 100 = centenas...
+  while maximo / posicion > 0
+    cubetas = Array.new(10) { [] }
+    arr.each { |x| cubetas[(x / posicion) % 10] << x }
+    arr = cubetas.flatten(1)
+
+    if mostrar_pasos
+      nombre = NOMBRES_POSICION.fetch(posicion, "posición #{posicion}")
+      puts "--- Dígito de las #{nombre} ---"
+      cubetas.each_with_index do |cubeta, digito|
+        puts "  Cubeta #{digito}: #{cubeta}" unless cubeta.empty?
+      end
+      puts "  Resultado: #{arr.map { |x| x + minimo }}\n"
+    end
+
+    posicion *= 10
+  end
+
+  arr.map { |x| x + minimo }
+end
+
+def radix_sort_lsd_sin_prints(array)
+  # Versión limpia sin prints (para usar en otros algoritmos).
+  #
+  # En lugar de dígitos decimales usa "dígitos" de 8 bits (base 256):
+  # menos pasadas y operaciones de bits en vez de divisiones.
+  return array.dup if array.length <= 1
+
+  minimo = array.min
+  arr = array.map { |x| x - minimo }
+  bits = arr.max.bit_length
+
+  (0...bits).step(8) do |desplazamiento|
+    cubetas = Array.new(256) { [] }
+    arr.each { |x| cubetas[(x >> desplazamiento) & 0xFF] << x }
+    arr = cubetas.flatten(1)
+  end
+
+  arr.map { |x| x + minimo }
+end
+
+UMBRAL_MSD = 16  # Cubetas más chicas se ordenan con Insertion Sort
+
+def radix_sort_msd(strings, mostrar_pasos = true)
+  # Ordena strings letra por letra, empezando por la PRIMERA
+  # (MSD = Most Significant Digit, el dígito más significativo).
+  #
+  # Cómo funciona:
+  # 1. Reparte los strings en cubetas según su primera letra
+  # 2. Los que ya se terminaron (más cortos) van primero: "sol" < "sola"
+  # 3. Dentro de cada cubeta, repite con la segunda letra, y así sigue
+  #
+  # Es como ordenar un diccionario: primero por la primera letra,
+  # después cada sección por la segunda letra...
+  #
+  # Args:
+  #     strings: Lista de strings
+  #     mostrar_pasos: Si true, muestra las cubetas de cada nivel
+  #
+  # Returns:
+  #     La lista ordenada
+  radix_sort_msd_con_pila(strings.dup, 0, mostrar_pasos)
+end
+
+def radix_sort_msd_con_pila(strings, posicion, mostrar_pasos)
+  # En vez de recursión usamos una pila de cubetas pendientes: con strings
+  # que comparten un prefijo de miles de letras la recursión bajaría miles
+  # de niveles (SystemStackError). Sacamos siempre la cubeta de la letra
+  # más chica, así la salida sale en orden, igual que con recursión.
+  resultado = []
+  pendientes = [[strings, posicion]]
+  until pendientes.empty?
+    strings, posicion = pendientes.pop
+    if strings.length <= 1
+      resultado.concat(strings)
+      next
+    end
+
+    if strings.length <= UMBRAL_MSD && !mostrar_pasos
+      resultado.concat(insertion_sort_desde(strings, posicion))
+      next
+    end
+
+    terminados = []  # Strings de largo == posicion (ya no tienen más letras)
+    cubetas = {}     # letra -> strings que tienen esa letra en 'posicion'
+    strings.each do |s|
+      if s.length == posicion
+        terminados << s
+      else
+        (cubetas[s[posicion]] ||= []) << s
+      end
+    end
+
+    if mostrar_pasos
+      sangria = "  " * posicion
+      puts "#{sangria}Letra #{posicion + 1}: #{cubetas.sort.to_h}"
+    end
+
+    # Solo ordenamos las LETRAS distintas (pocas), no los strings.
+    # Se apilan de mayor a menor para que la menor salga primero.
+    resultado.concat(terminados)
+    cubetas.keys.sort.reverse_each do |letra|
+      pendientes << [cubetas[letra], posicion + 1]
+    end
+  end
+  resultado
+end
+
+def insertion_sort_desde(strings, posicion)
+  # Insertion Sort para cubetas chicas. Todos comparten las primeras
+  # 'posicion' letras, así que la comparación de Ruby decide enseguida.
+  (1...strings.length).each do |i|
+    valor_actual = strings[i]
+    j = i - 1
+    while j >= 0 && strings[j] > valor_actual
+      strings[j + 1] = strings[j]
+      j -= 1
+    end
+    strings[j + 1] = valor_actual
+  end
+  strings
+end
+
+def radix_sort_msd_sin_prints(strings)
+  # Versión limpia sin prints (para usar en otros algoritmos).
+  radix_sort_msd_con_pila(strings.dup, 0, false)
+end
+
+# 🎯 EJEMPLOS DE USO
+
+puts "=" * 60
+puts "EJEMPLO 1: Counting Sort paso a paso"
+puts "=" * 60
+array1 = [4, 2, 2, 8, 3, 3, 1]
+ordenado1 = counting_sort(array1, true)
+puts "\n✅ Resultado final: #{ordenado1}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 2: Radix Sort LSD paso a paso (con un negativo)"
+puts "=" * 60
+array2 = [170, 45, 75, -90, 802, 24, 2, 66]
+ordenado2 = radix_sort_lsd(array2, true)
+puts "✅ Resultado final: #{ordenado2}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 3: Radix Sort MSD con strings"
+puts "=" * 60
+array3 = ["sol", "sola", "casa", "cosa", "caso", "arbol", "sal"]
+puts "Original: #{array3}"
+ordenado3 = radix_sort_msd(array3, true)
+puts "✅ Resultado final: #{ordenado3}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 4: Comparación de velocidad con Quick Sort"
+puts "=" * 60
+
+def quick_sort_simple(array)
+  return array if array.length <= 1
+  pivot = array[array.length / 2]
+  menores = array.select { |x| x < pivot }
+  iguales = array.select { |x| x == pivot }
+  mayores = array.select { |x| x > pivot }
+  quick_sort_simple(menores) + iguales + quick_sort_simple(mayores)
+end
+
+enteros = Array.new(200000) { rand(0..100000) }
+
+start = Time.now
+resultado_quick = quick_sort_simple(enteros)
+tiempo_quick = Time.now - start
+
+start = Time.now
+resultado_counting = counting_sort_sin_prints(enteros)
+tiempo_counting = Time.now - start
+
+start = Time.now
+resultado_radix = radix_sort_lsd_sin_prints(enteros)
+tiempo_radix = Time.now - start
+
+puts "#{enteros.length} enteros entre 0 y 100000:"
+puts "Quick Sort:    #{tiempo_quick.round(4)} segundos"
+puts "Counting Sort: #{tiempo_counting.round(4)} segundos (#{(tiempo_quick / tiempo_counting).round(1)}x)"
+puts "Radix Sort:    #{tiempo_radix.round(4)} segundos (#{(tiempo_quick / tiempo_radix).round(1)}x)"
+puts "¿Mismo resultado? #{resultado_quick == resultado_counting && resultado_counting == resultado_radix}"
+
+# 💡 CARACTERÍSTICAS IMPORTANTES
+
+puts "\n" + "=" * 60
+puts "💡 CARACTERÍSTICAS DE COUNTING SORT Y RADIX SORT"
+puts "=" * 60
+puts """
+✅ VENTAJAS:
+   - No comparan elementos: pueden ser MÁS rápidos que O(n log n)
+   - Estables (Radix Sort depende de eso)
+   - Muy predecibles: no tienen peor caso por el orden de los datos
+
+❌ DESVENTAJAS:
+   - Solo sirven para ciertos tipos de datos (enteros, strings, fechas...)
+   - Counting Sort necesita memoria para CADA valor posible:
+     ordenar [1, 1000000000] crearía mil millones de contadores!
+   - Usan memoria extra O(n + k)
+
+📊 COMPLEJIDAD (n = elementos, k = rango de valores, d = dígitos):
+   - Counting Sort: O(n + k)
+   - Radix Sort LSD: O(d · (n + base))
+   - Radix Sort MSD (strings): O(total de letras que hay que mirar)
+
+🎯 CUÁNDO USARLOS:
+   - Counting Sort: enteros en un rango chico (edades, notas, puntajes)
+   - Radix Sort LSD: enteros grandes pero acotados (IDs, timestamps)
+   - Radix Sort MSD: strings de largo fijo o parecido (códigos, patentes)
+"""
+
+# 🏋️ EJERCICIOS PARA PRACTICAR
+
+puts "\n" + "=" * 60
+puts "🏋️  EJERCICIOS"
+puts "=" * 60
+puts """
+1. Modifica counting_sort para ordenar de MAYOR a MENOR
+
+2. Usa counting_sort para ordenar notas de exámenes (0 a 10)
+
+3. Cambia la base de radix_sort_lsd de 10 a 2 y cuenta las pasadas.
+   ¿Y con base 256?
+
+4. ¿Qué pasa con radix_sort_msd si mezclas mayúsculas y minúsculas?
+   Pista: compara 'Z'.ord con 'a'.ord
+
+💡 No todo se ordena comparando: conocer tus datos puede ahorrar mucho tiempo!
+"""
@@ -0,0 +1,286 @@
+"""
+Aho-Corasick: buscar MUCHOS patrones a la vez
+
+Con 5000 palabras prohibidas, buscar cada una por separado (busqueda_naive,
+KMP o Horspool del archivo 08) recorre el texto 5000 veces.
+Aho-Corasick arma UN autómata con todas las palabras y recorre el texto
+UNA sola vez: O(n + coincidencias), sin importar cuántas palabras sean.
+
+La idea: un trie (árbol de prefijos) con todas las palabras...
+
+    palabras: "he", "she", "his", "hers"
+
+                 (0)
+              h /   \\ s
+             (1)     (3)
+          e /  \\ i     \\ h
+         (2)   (6)     (4)
+       r |      | s      \\ e
+         (8)   (7)       (5)
+       s |
+         (9)
+
+...más un "enlace de fallo" en cada estado, como la tabla de fallos de
+KMP (archivo 08): si el siguiente carácter no sigue ninguna rama, en vez
+de volver a empezar saltamos al estado del sufijo más largo que sí está
+en el trie. Leyendo "she" llegamos al estado 5; su fallo es el 2 ("he"),
+y así nos enteramos de que "he" TAMBIÉN terminó ahí.
+"""
+
+import array
+import collections
+
+Coincidencia = collections.namedtuple("Coincidencia", "inicio patron")
+
+
+class AhoCorasick:
+    """
+    Autómata de Aho-Corasick: se arma una vez con todos los patrones y
+    después busca todos a la vez.
+
+    Las transiciones se guardan en UNA tabla plana (un array.array de
+    enteros, sin un diccionario por estado):
+
+        ir[estado * ancho + columna] = siguiente estado
+
+    donde columna es el número de cada carácter que aparece en algún
+    patrón (ancho = cuántos son). Los caracteres que no están en ningún
+    patrón no tienen columna: llevan siempre a la raíz.
+
+    Acepta str o bytes (los patrones y el texto tienen que ser del mismo tipo).
+    """
+
+    def __init__(self, patrones):
+        self.patrones = list(patrones)
+        if not all(self.patrones):
+            raise ValueError("Aho-Corasick no acepta patrones vacíos")
+        self.largos = [len(p) for p in self.patrones]
+
+        # 1. Un número de columna por cada carácter de los patrones
+        self.columnas = {}
+        for patron in self.patrones:
+            for c in patron:
+                self.columnas.setdefault(c, len(self.columnas))
+        self.ancho = ancho = len(self.columnas)
+
+        # 2. El trie, con diccionarios (solo mientras lo armamos)
+        hijos = [{}]
+        terminan = [[]]  # terminan[estado] = patrones que terminan justo ahí
+        for indice, patron in enumerate(self.patrones):
+            estado = 0
+            for c in patron:
+                columna = self.columnas[c]
+                if columna not in hijos[estado]:
+                    hijos[estado][columna] = len(hijos)
+                    hijos.append({})
+                    terminan.append([])
+                estado = hijos[estado][columna]
+            terminan[estado].append(indice)
+
+        # 3. Recorremos el trie por niveles (BFS, archivo 18): el fallo de
+        #    un estado siempre está en un nivel anterior, ya calculado
+        cantidad = len(hijos)
+        ir = array.array("i", [0]) * (cantidad * ancho)
+        fallo = array.array("i", [0]) * cantidad
+        # salida[estado]: el estado más cercano siguiendo los fallos donde
+        # termina algún patrón (-1 si no hay)
+        salida = array.array("i", [-1]) * cantidad
+
+        cola = collections.deque()
+        for columna, hijo in hijos[0].items():
+            ir[columna] = hijo  # Los hijos de la raíz fallan a la raíz
+            cola.append(hijo)
+        while cola:
+            estado = cola.popleft()
+            base = estado * ancho
+            base_fallo = fallo[estado] * ancho
+            # Donde no hay rama, hacemos lo mismo que haría el estado de fallo
+            ir[base:base + ancho] = ir[base_fallo:base_fallo + ancho]
+            for columna, hijo in hijos[estado].items():
+                ir[base + columna] = hijo
+                fallo[hijo] = ir[base_fallo + columna]
+                cola.append(hijo)
+            f = fallo[estado]
+            salida[estado] = f if terminan[f] else salida[f]
+
+        self.ir = ir
+        self.fallo = fallo
+        self.salida = salida
+        self.terminan = [tuple(t) for t in terminan]
+        # Un 1 en los estados donde hay algo que reportar: evita mirar
+        # terminan y salida en cada carácter
+        self.reportar = bytes(1 if t or s != -1 else 0 for t, s in zip(terminan, salida))
+        self.reiniciar()
+
+    def cantidad_estados(self):
+        """Cuántos estados tiene el autómata (nodos del trie)."""
+        return len(self.fallo)
+
+    def _recorrer(self, texto, estado, desplazamiento):
+        """
+        Pasa texto por el autómata empezando en estado.
+
+        Returns:
+            (coincidencias, estado en el que quedó)
+        """
+        ir, columnas, ancho, reportar = self.ir, self.columnas, self.ancho, self.reportar
+        encontradas = []
+        for i, c in enumerate(texto):
+            columna = columnas.get(c)
+            if columna is None:
+                estado = 0  # No está en ningún patrón: volvemos a la raíz
+                continue
+            estado = ir[estado * ancho + columna]
+            if reportar[estado]:
+                fin = desplazamiento + i + 1
+                s = estado
+                while s != -1:  # Este estado y sus sufijos que son patrones
+                    for indice in self.terminan[s]:
+                        encontradas.append(Coincidencia(fin - self.largos[indice],
+                                                        self.patrones[indice]))
+                    s = self.salida[s]
+        return encontradas, estado
+
+    def buscar(self, texto):
+        """
+        Todas las apariciones de todos los patrones en texto, en una pasada.
+
+        Returns:
+            Lista de Coincidencia(inicio, patron), ordenada por dónde termina
+            cada una (se solapan: "she" y "he" en "ushers")
+        """
+        return self._recorrer(texto, 0, 0)[0]
+
+    def feed(self, chunk):
+        """
+        Sigue buscando en el próximo pedazo de un texto que llega de a partes
+        (un archivo, un socket). El autómata recuerda en qué estado quedó,
+        así que encuentra los patrones partidos entre dos pedazos.
+
+        Returns:
+            Las coincidencias que terminan en este pedazo; inicio cuenta desde
+            el principio de TODO el texto.
+        """
+        encontradas, self._estado = self._recorrer(chunk, self._estado, self._leidos)
+        self._leidos += len(chunk)
+        return encontradas
+
+    def reiniciar(self):
+        """Olvida lo leído con feed, para empezar otro texto."""
+        self._estado = 0
+        self._leidos = 0
+
+
+def buscar_uno_por_uno(texto, patrones):
+    """Lo que hacíamos antes: una búsqueda (con str.find) por cada patrón."""
+    encontradas = []
+    for patron in patrones:
+        i = texto.find(patron)
+        while i != -1:
+            encontradas.append(Coincidencia(i, patron))
+            i = texto.find(patron, i + 1)
+    return encontradas
+
+
+# 🎯 EJEMPLOS DE USO
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: he, she, his, hers")
+    print("=" * 60)
+    ac = AhoCorasick(["he", "she", "his", "hers"])
+    print(f"Estados: {ac.cantidad_estados()}, columnas: {ac.columnas}")
+    print(f"Fallos:  {list(ac.fallo)}   (el 5, 'she', falla al 2, 'he')")
+    for coincidencia in ac.buscar("ushers"):
+        print(f"  'ushers'[{coincidencia.inicio}:] -> {coincidencia.patron!r}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Texto que llega de a pedazos (feed)")
+    print("=" * 60)
+    ac = AhoCorasick(["password", "token", "secret"])
+    pedazos = ["user=ana&pass", "word=1234&tok", "en=abc&secr", "et=x"]
+    con_feed = []
+    for pedazo in pedazos:
+        encontradas = ac.feed(pedazo)
+        con_feed += encontradas
+        print(f"  feed({pedazo!r:<17}) -> {[(c.inicio, c.patron) for c in encontradas]}")
+    print(f"¿Igual que buscar todo junto? {con_feed == ac.buscar(''.join(pedazos))}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: 5000 palabras prohibidas")
+    print("=" * 60)
+    import random
+    import time
+
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    prohibidas = list({"".join(random.choices(letras, k=random.randint(6, 12)))
+                       for _ in range(5000)})
+    palabras = ["".join(random.choices(letras, k=random.randint(2, 9))) for _ in range(20_000)]
+    for i in random.sample(range(len(palabras)), 20):
+        palabras[i] = random.choice(prohibidas)
+    cuerpo = " ".join(palabras)
+
+    start = time.time()
+    ac = AhoCorasick(prohibidas)
+    print(f"Armar el autómata: {time.time() - start:.2f} segundos (una sola vez), "
+          f"{ac.cantidad_estados():,} estados")
+    print(f"Tabla de transiciones: {len(ac.ir) * ac.ir.itemsize / 1e6:.1f} MB")
+
+    start = time.time()
+    uno_por_uno = buscar_uno_por_uno(cuerpo, prohibidas)
+    tiempo_uno_por_uno = time.time() - start
+    start = time.time()
+    todas = ac.buscar(cuerpo)
+    tiempo_ac = time.time() - start
+
+    print(f"Texto de {len(cuerpo):,} caracteres:")
+    print(f"  {len(prohibidas)} búsquedas (str.find, en C): {tiempo_uno_por_uno:.3f} segundos")
+    print(f"  Aho-Corasick (Python, 1 pasada): {tiempo_ac:.3f} segundos")
+    print(f"  ¿Mismo resultado? {sorted(uno_por_uno) == sorted(todas)} ({len(todas)} coincidencias)")
+    print("""
+💡 Una búsqueda por palabra recorre el texto 5000 veces: aunque str.find
+   esté escrito en C, el tiempo crece con la cantidad de palabras.
+   Aho-Corasick lee cada carácter UNA vez, sean 10 palabras o 100.000.""")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE AHO-CORASICK")
+    print("=" * 60)
+    print("""
+✅ VENTAJAS:
+   - Todos los patrones en UNA pasada por el texto
+   - El tiempo de buscar no depende de cuántos patrones haya
+   - Nunca retrocede: sirve para textos que llegan de a pedazos (feed)
+
+❌ DESVENTAJAS:
+   - Hay que armar el autómata: no vale la pena para 2 o 3 patrones
+   - La tabla ocupa estados × caracteres distintos (más memoria que un trie)
+   - Agregar un patrón obliga a rearmar todo
+
+📊 COMPLEJIDAD (n=texto, M=suma de largos de los patrones, σ=caracteres distintos):
+   - Armar: O(M · σ)
+   - Buscar: O(n + coincidencias)
+
+🎯 CUÁNDO USARLO:
+   - Listas de palabras prohibidas, filtros de spam, antivirus
+   - Buscar muchos genes (patrones de ADN) en un genoma
+   - Resaltar muchas palabras clave en un texto
+""")
+
+    # 🏋️ EJERCICIOS PARA PRACTICAR
+
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
+1. Dibuja el trie de "a", "ab", "bab", "bc" con sus enlaces de fallo
+
+2. Agrega un método contiene_alguno(texto) que termine en la PRIMERA
+   coincidencia (para la lista de palabras prohibidas alcanza con eso)
+
+3. Modifica feed para que ignore mayúsculas y minúsculas
+
+4. ¿Qué pasa con la memoria si los patrones usan 1000 caracteres distintos?
+   Pista: compara la tabla plana con un diccionario por estado
+""")
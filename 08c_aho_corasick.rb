@@ -0,0 +1,285 @@
+# Aho-Corasick: buscar MUCHOS patrones a la vez
+#
+# Con 5000 palabras prohibidas, buscar cada una por separado (busqueda_naive,
+# KMP o Horspool del archivo 08) recorre el texto 5000 veces.
+# Aho-Corasick arma UN autómata con todas las palabras y recorre el texto
+# UNA sola vez: O(n + coincidencias), sin importar cuántas palabras sean.
+#
+# La idea: un trie (árbol de prefijos) con todas las palabras...
+#
+#     palabras: "he", "she", "his", "hers"
+#
+#                  (0)
+#               h /   \ s
+#              (1)     (3)
+#           e /  \ i     \ h
+#          (2)   (6)     (4)
+#        r |      | s      \ e
+#          (8)   (7)       (5)
+#        s |
+#          (9)
+#
+# ...más un "enlace de fallo" en cada estado, como la tabla de fallos de
+# KMP (archivo 08): si el siguiente carácter no sigue ninguna rama, en vez
+# de volver a empezar saltamos al estado del sufijo más largo que sí está
+# en el trie. Leyendo "she" llegamos al estado 5; su fallo es el 2 ("he"),
+# y así nos enteramos de que "he" TAMBIÉN terminó ahí.
+
+Coincidencia = Struct.new(:inicio, :patron)
+
+class AhoCorasick
+  # Autómata de Aho-Corasick: se arma una vez con todos los patrones y
+  # después busca todos a la vez.
+  #
+  # Las transiciones se guardan en UNA tabla plana (un Array de enteros,
+  # sin un Hash por estado):
+  #
+  #     ir[estado * ancho + columna] = siguiente estado
+  #
+  # donde columna es el número de cada carácter que aparece en algún
+  # patrón (ancho = cuántos son). Los caracteres que no están en ningún
+  # patrón no tienen columna: llevan siempre a la raíz.
+
+  attr_reader :patrones, :columnas, :ancho, :ir, :fallo, :salida
+
+  def initialize(patrones)
+    @patrones = patrones.to_a
+    raise ArgumentError, "Aho-Corasick no acepta patrones vacíos" if @patrones.any?(&:empty?)
+
+    @largos = @patrones.map(&:length)
+
+    # 1. Un número de columna por cada carácter de los patrones
+    @columnas = {}
+    @patrones.each { |patron| patron.each_char { |c| @columnas[c] ||= @columnas.size } }
+    @ancho = ancho = @columnas.size
+
+    # 2. El trie, con Hash (solo mientras lo armamos)
+    hijos = [{}]
+    terminan = [[]] # terminan[estado] = patrones que terminan justo ahí
+    @patrones.each_with_index do |patron, indice|
+      estado = 0
+      patron.each_char do |c|
+        columna = @columnas[c]
+        unless hijos[estado].key?(columna)
+          hijos[estado][columna] = hijos.length
+          hijos << {}
+          terminan << []
+        end
+        estado = hijos[estado][columna]
+      end
+      terminan[estado] << indice
+    end
+
+    # 3. Recorremos el trie por niveles (BFS, archivo 18): el fallo de
+    #    un estado siempre está en un nivel anterior, ya calculado
+    cantidad = hijos.length
+    @ir = Array.new(cantidad * ancho, 0)
+    @fallo = Array.new(cantidad, 0)
+    # salida[estado]: el estado más cercano siguiendo los fallos donde
+    # termina algún patrón (-1 si no hay)
+    @salida = Array.new(cantidad, -1)
+
+    cola = []
+    hijos[0].each do |columna, hijo|
+      @ir[columna] = hijo # Los hijos de la raíz fallan a la raíz
+      cola << hijo
+    end
+    until cola.empty?
+      estado = cola.shift
+      base = estado * ancho
+      base_fallo = @fallo[estado] * ancho
+      # Donde no hay rama, hacemos lo mismo que haría el estado de fallo
+      # (celda por celda: @ir[base_fallo, ancho] compartiría memoria con @ir
+      # y la siguiente escritura copiaría la tabla entera)
+      ancho.times { |columna| @ir[base + columna] = @ir[base_fallo + columna] }
+      hijos[estado].each do |columna, hijo|
+        @ir[base + columna] = hijo
+        @fallo[hijo] = @ir[base_fallo + columna]
+        cola << hijo
+      end
+      f = @fallo[estado]
+      @salida[estado] = terminan[f].empty? ? @salida[f] : f
+    end
+
+    @terminan = terminan
+    # true en los estados donde hay algo que reportar: evita mirar
+    # terminan y salida en cada carácter
+    @reportar = terminan.each_with_index.map { |t, s| !t.empty? || @salida[s] != -1 }
+    reiniciar
+  end
+
+  def cantidad_estados
+    # Cuántos estados tiene el autómata (nodos del trie).
+    @fallo.length
+  end
+
+  def buscar(texto)
+    # Todas las apariciones de todos los patrones en texto, en una pasada.
+    #
+    # Returns:
+    #     Array de Coincidencia(inicio, patron), ordenado por dónde termina
+    #     cada una (se solapan: "she" y "he" en "ushers")
+    recorrer(texto, 0, 0)[0]
+  end
+
+  def feed(chunk)
+    # Sigue buscando en el próximo pedazo de un texto que llega de a partes
+    # (un archivo, un socket). El autómata recuerda en qué estado quedó,
+    # así que encuentra los patrones partidos entre dos pedazos.
+    #
+    # Returns:
+    #     Las coincidencias que terminan en este pedazo; inicio cuenta desde
+    #     el principio de TODO el texto.
+    encontradas, @estado = recorrer(chunk, @estado, @leidos)
+    @leidos += chunk.length
+    encontradas
+  end
+
+  def reiniciar
+    # Olvida lo leído con feed, para empezar otro texto.
+    @estado = 0
+    @leidos = 0
+  end
+
+  private
+
+  def recorrer(texto, estado, desplazamiento)
+    # Pasa texto por el autómata empezando en estado.
+    #
+    # Returns:
+    #     [coincidencias, estado en el que quedó]
+    encontradas = []
+    texto.each_char.with_index do |c, i|
+      columna = @columnas[c]
+      if columna.nil?
+        estado = 0 # No está en ningún patrón: volvemos a la raíz
+        next
+      end
+      estado = @ir[estado * @ancho + columna]
+      next unless @reportar[estado]
+
+      fin = desplazamiento + i + 1
+      s = estado
+      while s != -1 # Este estado y sus sufijos que son patrones
+        @terminan[s].each do |indice|
+          encontradas << Coincidencia.new(fin - @largos[indice], @patrones[indice])
+        end
+        s = @salida[s]
+      end
+    end
+    [encontradas, estado]
+  end
+end
+
+def buscar_uno_por_uno(texto, patrones)
+  # Lo que hacíamos antes: una búsqueda (con String#index) por cada patrón.
+  encontradas = []
+  patrones.each do |patron|
+    i = texto.index(patron)
+    until i.nil?
+      encontradas << Coincidencia.new(i, patron)
+      i = texto.index(patron, i + 1)
+    end
+  end
+  encontradas
+end
+
+# 🎯 EJEMPLOS DE USO
+
+puts "=" * 60
+puts "EJEMPLO 1: he, she, his, hers"
+puts "=" * 60
+ac = AhoCorasick.new(["he", "she", "his", "hers"])
+puts "Estados: #{ac.cantidad_estados}, columnas: #{ac.columnas}"
+puts "Fallos:  #{ac.fallo}   (el 5, 'she', falla al 2, 'he')"
+ac.buscar("ushers").each do |coincidencia|
+  puts "  'ushers'[#{coincidencia.inicio}..] -> #{coincidencia.patron.inspect}"
+end
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 2: Texto que llega de a pedazos (feed)"
+puts "=" * 60
+ac = AhoCorasick.new(["password", "token", "secret"])
+pedazos = ["user=ana&pass", "word=1234&tok", "en=abc&secr", "et=x"]
+con_feed = []
+pedazos.each do |pedazo|
+  encontradas = ac.feed(pedazo)
+  con_feed += encontradas
+  puts "  feed(#{pedazo.inspect.ljust(17)}) -> #{encontradas.map { |c| [c.inicio, c.patron] }}"
+end
+puts "¿Igual que buscar todo junto? #{con_feed == ac.buscar(pedazos.join)}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 3: 5000 palabras prohibidas"
+puts "=" * 60
+letras = ("a".."z").to_a
+prohibidas = Array.new(5000) { Array.new(rand(6..12)) { letras.sample }.join }.uniq
+palabras = Array.new(20_000) { Array.new(rand(2..9)) { letras.sample }.join }
+(0...palabras.length).to_a.sample(20).each { |i| palabras[i] = prohibidas.sample }
+cuerpo = palabras.join(" ")
+
+start = Time.now
+ac = AhoCorasick.new(prohibidas)
+puts "Armar el autómata: #{(Time.now - start).round(2)} segundos (una sola vez), " \
+     "#{ac.cantidad_estados} estados"
+
+start = Time.now
+uno_por_uno = buscar_uno_por_uno(cuerpo, prohibidas)
+tiempo_uno_por_uno = Time.now - start
+start = Time.now
+todas = ac.buscar(cuerpo)
+tiempo_ac = Time.now - start
+
+ordenar = ->(lista) { lista.map { |c| [c.inicio, c.patron] }.sort }
+puts "Texto de #{cuerpo.length} caracteres:"
+puts "  #{prohibidas.length} búsquedas (String#index, en C): #{tiempo_uno_por_uno.round(3)} segundos"
+puts "  Aho-Corasick (Ruby, 1 pasada): #{tiempo_ac.round(3)} segundos"
+puts "  ¿Mismo resultado? #{ordenar.call(uno_por_uno) == ordenar.call(todas)} (#{todas.length} coincidencias)"
+puts """
+💡 Una búsqueda por palabra recorre el texto 5000 veces: aunque
+   String#index esté escrito en C, el tiempo crece con la cantidad de
+   palabras. Aho-Corasick lee cada carácter UNA vez, sean 10 palabras o 100.000.
+"""
+
+# 💡 CARACTERÍSTICAS IMPORTANTES
+
+puts "\n" + "=" * 60
+puts "💡 CARACTERÍSTICAS DE AHO-CORASICK"
+puts "=" * 60
+puts """
+✅ VENTAJAS:
+   - Todos los patrones en UNA pasada por el texto
+   - El tiempo de buscar no depende de cuántos patrones haya
+   - Nunca retrocede: sirve para textos que llegan de a pedazos (feed)
+
+❌ DESVENTAJAS:
+   - Hay que armar el autómata: no vale la pena para 2 o 3 patrones
+   - La tabla ocupa estados × caracteres distintos (más memoria que un trie)
+   - Agregar un patrón obliga a rearmar todo
+
+📊 COMPLEJIDAD (n=texto, M=suma de largos de los patrones, σ=caracteres distintos):
+   - Armar: O(M · σ)
+   - Buscar: O(n + coincidencias)
+
+🎯 CUÁNDO USARLO:
+   - Listas de palabras prohibidas, filtros de spam, antivirus
+   - Buscar muchos genes (patrones de ADN) en un genoma
+   - Resaltar muchas palabras clave en un texto
+"""
+
+# 🏋️ EJERCICIOS PARA PRACTICAR
+
+puts "\n" + "=" * 60
+puts "🏋️  EJERCICIOS"
+puts "=" * 60
+puts """
+1. Dibuja el trie de \"a\", \"ab\", \"bab\", \"bc\" con sus enlaces de fallo
+
+2. Agrega un método contiene_alguno(texto) que termine en la PRIMERA
+   coincidencia (para la lista de palabras prohibidas alcanza con eso)
+
+3. Modifica feed para que ignore mayúsculas y minúsculas
+
+4. ¿Qué pasa con la memoria si los patrones usan 1000 caracteres distintos?
+   Pista: compara la tabla plana con un Hash por estado
+"""
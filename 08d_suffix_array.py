@@ -0,0 +1,381 @@
+"""
+Suffix Array: un índice para buscar MUCHAS veces en el mismo texto
+
+busqueda_naive, KMP o Horspool (archivo 08) recorren el texto entero en
+cada búsqueda. Si el texto no cambia (un libro, un genoma, los logs de
+ayer) y le vamos a hacer miles de consultas, conviene prepararlo UNA vez.
+
+El suffix array es la lista de todos los sufijos del texto, ordenados
+alfabéticamente (guardamos solo DÓNDE empieza cada uno):
+
+    texto: "banana"
+
+    i  sufijo         sa[i]   lcp[i]
+    0  a                5       0
+    1  ana              3       1     "a" en común con "a"
+    2  anana            1       3     "ana" en común con "ana"
+    3  banana           0       0
+    4  na               4       0
+    5  nana             2       2     "na" en común con "na"
+
+Todas las apariciones de un patrón son el comienzo de algún sufijo, y
+como están ordenados, quedan TODAS JUNTAS: las de "ana" son las filas
+1 y 2 (sufijos 3 y 1). Con búsqueda binaria (archivo 02b) encontramos
+ese tramo en O(m log n), sin recorrer el texto.
+
+lcp[i] es cuánto tiene en común el sufijo i con el anterior: el máximo
+es el pedazo repetido más largo del texto ("ana").
+"""
+
+import array
+import mmap
+import struct
+
+
+# ============================================
+# CONSTRUIR: DUPLICAR EL PREFIJO
+# ============================================
+#
+# Ordenar los n sufijos comparándolos enteros costaría O(n² log n).
+# El truco: si ya sabemos ordenar los sufijos por sus primeros k
+# caracteres (su "rango"), ordenarlos por los primeros 2k es ordenar
+# pares (rango del sufijo i, rango del sufijo i + k). Empezamos con k = 1
+# (la primera letra) y duplicamos hasta que todos los rangos son distintos:
+# a lo sumo log2(n) vueltas.
+
+
+def construir_suffix_array(texto):
+    """
+    Suffix array por duplicación de prefijos: O(n log² n) con sort.
+
+    Args:
+        texto: str o bytes
+
+    Returns:
+        Lista sa: sa[i] es dónde empieza el i-ésimo sufijo en orden
+    """
+    n = len(texto)
+    rango = [ord(c) for c in texto] if isinstance(texto, str) else list(texto)
+    sa = list(range(n))
+    k = 1
+    while n > 1:
+        # Un solo número por sufijo en vez del par: ordenar enteros es
+        # más rápido que ordenar tuplas. "+ 1" para que "no hay nada
+        # después" (0) vaya antes que cualquier carácter
+        tope = max(rango) + 2
+        clave = [rango[i] * tope + (rango[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        sa.sort(key=clave.__getitem__)
+
+        nuevo = [0] * n
+        for anterior, actual in zip(sa, sa[1:]):
+            nuevo[actual] = nuevo[anterior] + (clave[actual] != clave[anterior])
+        rango = nuevo
+        if rango[sa[-1]] == n - 1:  # Todos distintos: ya están ordenados
+            break
+        k *= 2
+    return sa
+
+
+def construir_lcp(texto, sa):
+    """
+    Arreglo LCP con el algoritmo de Kasai: O(n).
+
+    Recorremos los sufijos en el orden del TEXTO (0, 1, 2...). Si el
+    sufijo p tenía h caracteres en común con su vecino, el sufijo p + 1
+    (el mismo sin la primera letra) tiene al menos h - 1: no hace falta
+    volver a comparar desde cero.
+
+    Returns:
+        Lista lcp: lcp[i] = largo del prefijo común entre los sufijos
+        sa[i - 1] y sa[i] (lcp[0] = 0)
+    """
+    n = len(sa)
+    posicion = [0] * n  # posicion[p] = en qué fila del sa está el sufijo p
+    for i, p in enumerate(sa):
+        posicion[p] = i
+
+    lcp = [0] * n
+    h = 0
+    for p in range(n):
+        i = posicion[p]
+        if i == 0:
+            h = 0
+            continue
+        q = sa[i - 1]  # El sufijo que queda justo antes en el orden
+        while p + h < n and q + h < n and texto[p + h] == texto[q + h]:
+            h += 1
+        lcp[i] = h
+        if h > 0:
+            h -= 1
+    return lcp
+
+
+# ============================================
+# EL ÍNDICE: BUSCAR Y GUARDAR EN DISCO
+# ============================================
+#
+# El archivo guarda el texto y los dos arreglos uno detrás del otro:
+#
+#     "SUFIJOS1" | n | tipo | texto (n bytes) | relleno | sa | lcp
+#
+# (sa y lcp van con los bytes en el orden de la máquina: little-endian
+# en x86 y ARM, que es como los lee la versión en Ruby)
+#
+# Al abrirlo con mmap, el sistema operativo NO lo lee entero: trae cada
+# pedazo de disco cuando alguien lo usa, y si varios procesos abren el
+# mismo archivo comparten esa memoria. Diez workers, un solo índice en RAM,
+# y ninguno lo tiene que reconstruir.
+
+MAGIA = b"SUFIJOS1"
+
+
+class IndiceSufijos:
+    """
+    Índice de búsqueda sobre un texto que no cambia: suffix array + LCP.
+
+    Acepta str o bytes. Para guardarlo en disco (y abrirlo con mmap) el
+    texto tiene que ser bytes, como lo devuelve open(ruta, "rb").read().
+    """
+
+    def __init__(self, texto, sa=None, lcp=None):
+        self.texto = texto
+        self.n = len(texto)
+        # Tipo de entero justo para guardar posiciones: 4 bytes alcanzan
+        # hasta 2 GB de texto, si no, 8
+        tipo = "i" if self.n < 2**31 else "q"
+        self.sa = sa if sa is not None else array.array(tipo, construir_suffix_array(texto))
+        self.lcp = lcp if lcp is not None else array.array(tipo, construir_lcp(texto, self.sa))
+        self._mmap = None
+
+    def _tramo(self, patron):
+        """Filas [inicio, fin) del sa cuyos sufijos empiezan con patron."""
+        texto, sa, m = self.texto, self.sa, len(patron)
+
+        bajo, alto = 0, self.n
+        while bajo < alto:  # Primer sufijo >= patron (lower_bound, 02b)
+            medio = (bajo + alto) // 2
+            if texto[sa[medio]:sa[medio] + m] < patron:
+                bajo = medio + 1
+            else:
+                alto = medio
+        inicio = bajo
+
+        alto = self.n
+        while bajo < alto:  # Primer sufijo que ya NO empieza con patron
+            medio = (bajo + alto) // 2
+            if texto[sa[medio]:sa[medio] + m] <= patron:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return inicio, bajo
+
+    def buscar(self, patron):
+        """
+        Todas las posiciones donde aparece patron, en orden
+        (igual que busqueda_naive del archivo 08).
+
+        Complejidad: O(m log n + apariciones)
+        """
+        inicio, fin = self._tramo(patron)
+        return sorted(self.sa[inicio:fin])
+
+    def contar(self, patron):
+        """Cuántas veces aparece patron, en O(m log n)."""
+        inicio, fin = self._tramo(patron)
+        return fin - inicio
+
+    def repetido_mas_largo(self):
+        """
+        El pedazo que aparece al menos dos veces y es el más largo.
+
+        Returns:
+            (posición, largo), o None si no se repite nada
+        """
+        if self.n < 2:
+            return None
+        i = max(range(self.n), key=self.lcp.__getitem__)
+        if self.lcp[i] == 0:
+            return None
+        return self.sa[i], self.lcp[i]
+
+    def guardar(self, ruta):
+        """Guarda el índice en un archivo para abrirlo con IndiceSufijos.abrir."""
+        if not isinstance(self.texto[:0], bytes):
+            raise TypeError("Para guardar el índice el texto tiene que ser bytes (usa texto.encode())")
+        tipo = self.sa.typecode if hasattr(self.sa, "typecode") else self.sa.format
+        tamano = struct.calcsize(tipo)
+        relleno = -(24 + self.n) % tamano  # sa tiene que empezar en múltiplo de tamano
+        with open(ruta, "wb") as archivo:
+            archivo.write(MAGIA + struct.pack("<Q", self.n) + tipo.encode().ljust(8))
+            archivo.write(self.texto[:])  # Con bytes, [:] no copia nada
+            archivo.write(bytes(relleno))
+            archivo.write(array.array(tipo, self.sa).tobytes())
+            archivo.write(array.array(tipo, self.lcp).tobytes())
+
+    @classmethod
+    def abrir(cls, ruta):
+        """
+        Abre un índice guardado con guardar, SIN leerlo entero ni
+        reconstruirlo: el texto, sa y lcp quedan mapeados desde el archivo.
+        """
+        with open(ruta, "rb") as archivo:
+            datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if datos[:8] != MAGIA:
+            datos.close()
+            raise ValueError(f"{ruta} no es un índice de sufijos")
+        n = struct.unpack("<Q", datos[8:16])[0]
+        tipo = datos[16:24].strip().decode()
+        tamano = struct.calcsize(tipo)
+
+        inicio_sa = 24 + n + (-(24 + n) % tamano)
+        vista = memoryview(datos)
+        sa = vista[inicio_sa:inicio_sa + n * tamano].cast(tipo)
+        lcp = vista[inicio_sa + n * tamano:inicio_sa + 2 * n * tamano].cast(tipo)
+
+        indice = cls(_TextoMapeado(datos, 24, n), sa=sa, lcp=lcp)
+        indice._mmap = datos
+        return indice
+
+    def cerrar(self):
+        """Libera el archivo abierto con abrir (si lo hay)."""
+        if self._mmap is not None:
+            self.sa.release()
+            self.lcp.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+class _TextoMapeado:
+    """
+    El texto dentro del archivo mapeado: texto[a:b] devuelve bytes (para
+    comparar con el patrón) y texto[i] un número, como un bytes normal.
+    """
+
+    def __init__(self, datos, desde, n):
+        self.datos, self.desde, self.n = datos, desde, n
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            inicio, fin, _ = i.indices(self.n)
+            return self.datos[self.desde + inicio:self.desde + max(inicio, fin)]
+        return self.datos[self.desde + i]
+
+
+def busqueda_naive(texto, patron):
+    """La búsqueda del archivo 08, para comparar."""
+    return [i for i in range(len(texto) - len(patron) + 1) if texto.startswith(patron, i)]
+
+
+# 🎯 EJEMPLOS DE USO
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: El suffix array de 'banana'")
+    print("=" * 60)
+    texto = "banana"
+    sa = construir_suffix_array(texto)
+    lcp = construir_lcp(texto, sa)
+    print(f"  {'i':>2}  {'sufijo':<8} {'sa':>3} {'lcp':>4}")
+    for i, (p, comun) in enumerate(zip(sa, lcp)):
+        print(f"  {i:>2}  {texto[p:]:<8} {p:>3} {comun:>4}")
+
+    indice = IndiceSufijos(texto)
+    for patron in ["ana", "na", "b", "x"]:
+        print(f"  buscar({patron!r:>5}) = {indice.buscar(patron)}   contar = {indice.contar(patron)}")
+    print(f"  Repetido más largo: {indice.repetido_mas_largo()}  ('ana' en la posición 1)")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Muchas consultas al mismo texto")
+    print("=" * 60)
+    import os
+    import random
+    import tempfile
+    import time
+
+    palabras = ["algoritmo", "dato", "árbol", "grafo", "búsqueda", "orden", "pila",
+                "cola", "hash", "nodo", "lista", "clave", "valor", "texto", "índice"]
+    corpus = " ".join(random.choice(palabras) for _ in range(50_000)).encode()
+    consultas = [" ".join(random.sample(palabras, 2)).encode() for _ in range(1000)]
+
+    start = time.time()
+    indice = IndiceSufijos(corpus)
+    tiempo_construir = time.time() - start
+    print(f"Corpus de {len(corpus):,} bytes; construir el índice: {tiempo_construir:.2f} segundos")
+
+    start = time.time()
+    naive = [busqueda_naive(corpus, q) for q in consultas[:10]]
+    tiempo_naive = (time.time() - start) / 10
+    start = time.time()
+    con_indice = [indice.buscar(q) for q in consultas]
+    tiempo_indice = (time.time() - start) / len(consultas)
+    print(f"Por consulta: naive {tiempo_naive * 1000:.1f} ms, índice {tiempo_indice * 1000:.3f} ms "
+          f"({tiempo_naive / tiempo_indice:.0f}x)")
+    print(f"¿Mismo resultado? {naive == con_indice[:10]}")
+    print(f"Repetido más largo: {indice.repetido_mas_largo()[1]:,} bytes")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Guardar el índice y abrirlo con mmap")
+    print("=" * 60)
+    ruta = os.path.join(tempfile.mkdtemp(), "corpus.sufijos")
+    indice.guardar(ruta)
+    print(f"Archivo: {os.path.getsize(ruta):,} bytes (texto + sa + lcp)")
+
+    start = time.time()
+    abierto = IndiceSufijos.abrir(ruta)
+    print(f"Abrirlo: {(time.time() - start) * 1000:.2f} ms (construirlo tardó {tiempo_construir:.2f} s)")
+    print(f"¿Mismo resultado? {[abierto.buscar(q) for q in consultas] == con_indice}")
+    abierto.cerrar()
+    os.remove(ruta)
+    print("""
+💡 Cada proceso que abre el archivo con mmap comparte las mismas páginas
+   de memoria: diez workers no ocupan diez veces la RAM ni reconstruyen
+   el índice.""")
+
+    # 💡 CARACTERÍSTICAS IMPORTANTES
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DEL SUFFIX ARRAY")
+    print("=" * 60)
+    print("""
+✅ VENTAJAS:
+   - Se construye UNA vez y cada búsqueda es O(m log n): no recorre el texto
+   - Contar apariciones sin listarlas, también O(m log n)
+   - Con el LCP: el pedazo repetido más largo, cuántos substrings distintos hay...
+   - Son solo arrays de enteros: fácil de guardar y compartir con mmap
+
+❌ DESVENTAJAS:
+   - Construirlo cuesta O(n log² n) (hay algoritmos O(n), como SA-IS)
+   - Ocupa 4 u 8 bytes por cada carácter del texto (más el LCP)
+   - Si el texto cambia, hay que reconstruirlo
+
+📊 COMPLEJIDAD (n=texto, m=patrón):
+   - Construir: O(n log² n) duplicando prefijos, LCP en O(n) (Kasai)
+   - Buscar: O(m log n + apariciones)
+   - Espacio: O(n)
+
+🎯 CUÁNDO USARLO:
+   - Textos grandes que no cambian: genomas, libros, logs archivados
+   - Miles de consultas al mismo texto
+   - Buscadores de código, compresión (Burrows-Wheeler, bzip2)
+""")
+
+    # 🏋️ EJERCICIOS PARA PRACTICAR
+
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
+1. Escribe a mano el suffix array y el LCP de "mississippi"
+
+2. ¿Cuántos substrings distintos tiene un texto?
+   Pista: n·(n+1)/2 menos la suma del LCP
+
+3. Agrega un método primera(patron) que devuelva la posición más chica
+   sin ordenar todas las apariciones
+
+4. Usa el suffix array de "texto1#texto2" para encontrar el substring
+   común más largo entre dos textos
+""")
@@ -0,0 +1,330 @@
+# Suffix Array: un índice para buscar MUCHAS veces en el mismo texto
+#
+# busqueda_naive, KMP o Horspool (archivo 08) recorren el texto entero en
+# cada búsqueda. Si el texto no cambia (un libro, un genoma, los logs de
+# ayer) y le vamos a hacer miles de consultas, conviene prepararlo UNA vez.
+#
+# El suffix array es la lista de todos los sufijos del texto, ordenados
+# alfabéticamente (guardamos solo DÓNDE empieza cada uno):
+#
+#     texto: "banana"
+#
+#     i  sufijo         sa[i]   lcp[i]
+#     0  a                5       0
+#     1  ana              3       1     "a" en común con "a"
+#     2  anana            1       3     "ana" en común con "ana"
+#     3  banana           0       0
+#     4  na               4       0
+#     5  nana             2       2     "na" en común con "na"
+#
+# Todas las apariciones de un patrón son el comienzo de algún sufijo, y
+# como están ordenados, quedan TODAS JUNTAS: las de "ana" son las filas
+# 1 y 2 (sufijos 3 y 1). Con búsqueda binaria (archivo 02b) encontramos
+# ese tramo en O(m log n), sin recorrer el texto.
+#
+# lcp[i] es cuánto tiene en común el sufijo i con el anterior: el máximo
+# es el pedazo repetido más largo del texto ("ana").
+
+# ============================================
+# CONSTRUIR: DUPLICAR EL PREFIJO
+# ============================================
+#
+# Ordenar los n sufijos comparándolos enteros costaría O(n² log n).
+# El truco: si ya sabemos ordenar los sufijos por sus primeros k
+# caracteres (su "rango"), ordenarlos por los primeros 2k es ordenar
+# pares (rango del sufijo i, rango del sufijo i + k). Empezamos con k = 1
+# (la primera letra) y duplicamos hasta que todos los rangos son distintos:
+# a lo sumo log2(n) vueltas.
+
+def construir_suffix_array(texto)
+  # Suffix array por duplicación de prefijos: O(n log² n) con sort.
+  #
+  # Returns:
+  #     Array sa: sa[i] es dónde empieza el i-ésimo sufijo en orden
+  n = texto.length
+  rango = texto.each_char.map(&:ord)
+  sa = (0...n).to_a
+  k = 1
+  while n > 1
+    # Un solo número por sufijo en vez del par: ordenar enteros es
+    # más rápido que ordenar arrays. "+ 1" para que "no hay nada
+    # después" (0) vaya antes que cualquier carácter
+    tope = rango.max + 2
+    clave = Array.new(n) { |i| rango[i] * tope + (i + k < n ? rango[i + k] + 1 : 0) }
+    sa.sort_by! { |i| clave[i] }
+
+    nuevo = Array.new(n, 0)
+    sa.each_cons(2) do |anterior, actual|
+      nuevo[actual] = nuevo[anterior] + (clave[actual] == clave[anterior] ? 0 : 1)
+    end
+    rango = nuevo
+    break if rango[sa[-1]] == n - 1 # Todos distintos: ya están ordenados
+
+    k *= 2
+  end
+  sa
+end
+
+def construir_lcp(texto, sa)
+  # Arreglo LCP con el algoritmo de Kasai: O(n).
+  #
+  # Recorremos los sufijos en el orden del TEXTO (0, 1, 2...). Si el
+  # sufijo p tenía h caracteres en común con su vecino, el sufijo p + 1
+  # (el mismo sin la primera letra) tiene al menos h - 1: no hace falta
+  # volver a comparar desde cero.
+  #
+  # Returns:
+  #     Array lcp: lcp[i] = largo del prefijo común entre los sufijos
+  #     sa[i - 1] y sa[i] (lcp[0] = 0)
+  n = sa.length
+  posicion = Array.new(n, 0) # posicion[p] = en qué fila del sa está el sufijo p
+  sa.each_with_index { |p, i| posicion[p] = i }
+
+  caracteres = texto.chars # texto[i] crearía un string nuevo en cada vuelta
+  lcp = Array.new(n, 0)
+  h = 0
+  (0...n).each do |p|
+    i = posicion[p]
+    if i == 0
+      h = 0
+      next
+    end
+    q = sa[i - 1] # El sufijo que queda justo antes en el orden
+    h += 1 while p + h < n && q + h < n && caracteres[p + h] == caracteres[q + h]
+    lcp[i] = h
+    h -= 1 if h > 0
+  end
+  lcp
+end
+
+# ============================================
+# EL ÍNDICE: BUSCAR Y GUARDAR EN DISCO
+# ============================================
+#
+# El archivo guarda el texto y los dos arreglos uno detrás del otro:
+#
+#     "SUFIJOS1" | n | tipo | texto (n bytes) | relleno | sa | lcp
+#
+# Es el mismo formato que la versión en Python, que lo abre con mmap
+# (el sistema operativo trae cada pedazo del disco cuando se usa, y los
+# procesos que abren el mismo archivo comparten esa memoria). Ruby no trae
+# mmap en su biblioteca estándar: aquí abrir lee el archivo de una vez,
+# pero igual se ahorra reconstruir el índice.
+
+MAGIA = "SUFIJOS1".b
+# Los tipos de enteros se anotan como en el array de Python
+TAMANOS = { "i" => 4, "q" => 8 }.freeze
+EMPAQUETAR = { "i" => "l<", "q" => "q<" }.freeze
+
+class IndiceSufijos
+  # Índice de búsqueda sobre un texto que no cambia: suffix array + LCP.
+
+  attr_reader :texto, :n, :sa, :lcp
+
+  def initialize(texto, sa = nil, lcp = nil)
+    @texto = texto
+    @n = texto.length
+    @sa = sa || construir_suffix_array(texto)
+    @lcp = lcp || construir_lcp(texto, @sa)
+  end
+
+  def buscar(patron)
+    # Todas las posiciones donde aparece patron, en orden
+    # (igual que busqueda_naive del archivo 08).
+    #
+    # Complejidad: O(m log n + apariciones)
+    inicio, fin = tramo(patron)
+    @sa[inicio...fin].sort
+  end
+
+  def contar(patron)
+    # Cuántas veces aparece patron, en O(m log n).
+    inicio, fin = tramo(patron)
+    fin - inicio
+  end
+
+  def repetido_mas_largo
+    # El pedazo que aparece al menos dos veces y es el más largo.
+    #
+    # Returns:
+    #     [posición, largo], o nil si no se repite nada
+    return nil if @n < 2
+
+    i = (0...@n).max_by { |fila| @lcp[fila] }
+    @lcp[i] == 0 ? nil : [@sa[i], @lcp[i]]
+  end
+
+  def guardar(ruta)
+    # Guarda el índice en un archivo para abrirlo con IndiceSufijos.abrir.
+    # El texto se guarda tal cual en bytes (las posiciones son de bytes).
+    unless @texto.encoding == Encoding::BINARY || @texto.ascii_only?
+      raise ArgumentError, "Para guardar el índice el texto tiene que ser binario (usa texto.b)"
+    end
+
+    # "i" (4 bytes) alcanza hasta 2 GB de texto, si no, "q" (8 bytes)
+    tipo = @n < 2**31 ? "i" : "q"
+    tamano = TAMANOS[tipo]
+    relleno = -(24 + @n) % tamano # sa tiene que empezar en múltiplo de tamano
+    File.open(ruta, "wb") do |archivo|
+      archivo.write(MAGIA + [@n].pack("Q<") + tipo.ljust(8).b)
+      archivo.write(@texto.b)
+      archivo.write("\0" * relleno)
+      archivo.write(@sa.pack("#{EMPAQUETAR[tipo]}*"))
+      archivo.write(@lcp.pack("#{EMPAQUETAR[tipo]}*"))
+    end
+  end
+
+  def self.abrir(ruta)
+    # Abre un índice guardado con guardar, sin reconstruirlo.
+    datos = File.binread(ruta)
+    raise ArgumentError, "#{ruta} no es un índice de sufijos" unless datos[0, 8] == MAGIA
+
+    n = datos[8, 8].unpack1("Q<")
+    tipo = datos[16, 8].strip
+    tamano = TAMANOS[tipo]
+
+    inicio_sa = 24 + n + (-(24 + n) % tamano)
+    sa = datos[inicio_sa, n * tamano].unpack("#{EMPAQUETAR[tipo]}*")
+    lcp = datos[inicio_sa + n * tamano, n * tamano].unpack("#{EMPAQUETAR[tipo]}*")
+    new(datos[24, n], sa, lcp)
+  end
+
+  private
+
+  def tramo(patron)
+    # Filas [inicio, fin) del sa cuyos sufijos empiezan con patron.
+    m = patron.length
+
+    bajo = 0
+    alto = @n
+    while bajo < alto # Primer sufijo >= patron (lower_bound, 02b)
+      medio = (bajo + alto) / 2
+      if @texto[@sa[medio], m] < patron
+        bajo = medio + 1
+      else
+        alto = medio
+      end
+    end
+    inicio = bajo
+
+    alto = @n
+    while bajo < alto # Primer sufijo que ya NO empieza con patron
+      medio = (bajo + alto) / 2
+      if @texto[@sa[medio], m] <= patron
+        bajo = medio + 1
+      else
+        alto = medio
+      end
+    end
+    [inicio, bajo]
+  end
+end
+
+def busqueda_naive(texto, patron)
+  # La búsqueda del archivo 08, para comparar.
+  (0..texto.length - patron.length).select { |i| texto[i, patron.length] == patron }
+end
+
+# 🎯 EJEMPLOS DE USO
+
+puts "=" * 60
+puts "EJEMPLO 1: El suffix array de 'banana'"
+puts "=" * 60
+texto = "banana"
+sa = construir_suffix_array(texto)
+lcp = construir_lcp(texto, sa)
+puts "  #{'i'.rjust(2)}  #{'sufijo'.ljust(8)} #{'sa'.rjust(3)} #{'lcp'.rjust(4)}"
+sa.each_with_index do |p, i|
+  puts "  #{i.to_s.rjust(2)}  #{texto[p..].ljust(8)} #{p.to_s.rjust(3)} #{lcp[i].to_s.rjust(4)}"
+end
+
+indice = IndiceSufijos.new(texto)
+["ana", "na", "b", "x"].each do |patron|
+  puts "  buscar(#{patron.inspect.rjust(5)}) = #{indice.buscar(patron)}   contar = #{indice.contar(patron)}"
+end
+puts "  Repetido más largo: #{indice.repetido_mas_largo}  ('ana' en la posición 1)"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 2: Muchas consultas al mismo texto"
+puts "=" * 60
+require "tmpdir"
+
+palabras = ["algoritmo", "dato", "arbol", "grafo", "busqueda", "orden", "pila",
+            "cola", "hash", "nodo", "lista", "clave", "valor", "texto", "indice"]
+corpus = Array.new(20_000) { palabras.sample }.join(" ").b
+consultas = Array.new(1000) { palabras.sample(2).join(" ").b }
+
+start = Time.now
+indice = IndiceSufijos.new(corpus)
+tiempo_construir = Time.now - start
+puts "Corpus de #{corpus.length} bytes; construir el índice: #{tiempo_construir.round(2)} segundos"
+
+start = Time.now
+naive = consultas[0, 10].map { |q| busqueda_naive(corpus, q) }
+tiempo_naive = (Time.now - start) / 10
+start = Time.now
+con_indice = consultas.map { |q| indice.buscar(q) }
+tiempo_indice = (Time.now - start) / consultas.length
+puts "Por consulta: naive #{(tiempo_naive * 1000).round(1)} ms, índice #{(tiempo_indice * 1000).round(3)} ms " \
+     "(#{(tiempo_naive / tiempo_indice).round}x)"
+puts "¿Mismo resultado? #{naive == con_indice[0, 10]}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO 3: Guardar el índice y abrirlo"
+puts "=" * 60
+Dir.mktmpdir do |carpeta|
+  ruta = File.join(carpeta, "corpus.sufijos")
+  indice.guardar(ruta)
+  puts "Archivo: #{File.size(ruta)} bytes (texto + sa + lcp)"
+
+  start = Time.now
+  abierto = IndiceSufijos.abrir(ruta)
+  puts "Abrirlo: #{((Time.now - start) * 1000).round(1)} ms (construirlo tardó #{tiempo_construir.round(2)} s)"
+  puts "¿Mismo resultado? #{consultas.map { |q| abierto.buscar(q) } == con_indice}"
+end
+
+# 💡 CARACTERÍSTICAS IMPORTANTES
+
+puts "\n" + "=" * 60
+puts "💡 CARACTERÍSTICAS DEL SUFFIX ARRAY"
+puts "=" * 60
+puts """
+✅ VENTAJAS:
+   - Se construye UNA vez y cada búsqueda es O(m log n): no recorre el texto
+   - Contar apariciones sin listarlas, también O(m log n)
+   - Con el LCP: el pedazo repetido más largo, cuántos substrings distintos hay...
+   - Son solo arrays de enteros: fácil de guardar y compartir con mmap
+
+❌ DESVENTAJAS:
+   - Construirlo cuesta O(n log² n) (hay algoritmos O(n), como SA-IS)
+   - Ocupa 4 u 8 bytes por cada carácter del texto (más el LCP)
+   - Si el texto cambia, hay que reconstruirlo
+
+📊 COMPLEJIDAD (n=texto, m=patrón):
+   - Construir: O(n log² n) duplicando prefijos, LCP en O(n) (Kasai)
+   - Buscar: O(m log n + apariciones)
+   - Espacio: O(n)
+
+🎯 CUÁNDO USARLO:
+   - Textos grandes que no cambian: genomas, libros, logs archivados
+   - Miles de consultas al mismo texto
+   - Buscadores de código, compresión (Burrows-Wheeler, bzip2)
+"""
+
+# 🏋️ EJERCICIOS PARA PRACTICAR
+
+puts "\n" + "=" * 60
+puts "🏋️  EJERCICIOS"
+puts "=" * 60
+puts """
+1. Escribe a mano el suffix array y el LCP de \"mississippi\"
+
+2. ¿Cuántos substrings distintos tiene un texto?
+   Pista: n·(n+1)/2 menos la suma del LCP
+
+3. Agrega un método primera(patron) que devuelva la posición más chica
+   sin ordenar todas las apariciones
+
+4. Usa el suffix array de \"texto1#texto2\" para encontrar el substring
+   común más largo entre dos textos
+"""
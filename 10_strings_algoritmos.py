@@ -5,6 +5,12 @@ Los strings son secuencias de caracteres. Son fundamentales
 para muchos problemas de programación y tienen algoritmos propios.
 """
 
+import codecs
+import functools
+import io
+import mmap
+import re
+
 
 def operaciones_strings_basicas():
     """Operaciones básicas con strings."""
@@ -78,6 +84,9 @@ def encontrar_substring(texto, patron):
     """
     Busca un patrón en un texto (búsqueda de substring).
     Retorna todas las posiciones donde aparece.
+
+    Para buscar MUCHOS patrones no la llames una vez por patrón:
+    AhoCorasick (08c_aho_corasick.py) los busca todos en una pasada.
     """
     posiciones = []
     len_patron = len(patron)
@@ -182,6 +191,204 @@ def comprimir_string(texto):
     return resultado
 
 
+# 📂 TEXTOS QUE NO ENTRAN EN MEMORIA
+#
+# Las funciones de arriba reciben el string entero. Con un archivo de 10 GB
+# eso es imposible (o carísimo): las versiones _stream leen de a pedazos de
+# bytes y usan siempre la misma memoria, sea el archivo de 1 KB o de 10 GB.
+
+TAMANO_PEDAZO = 1 << 20  # 1 MB por lectura
+
+VOCALES = b"aeiouAEIOU"
+_RACHAS = re.compile(r"(.)\1+", re.DOTALL)  # 2 o más letras iguales seguidas
+
+
+def leer_en_pedazos(fuente, tamano=TAMANO_PEDAZO):
+    """
+    Recorre fuente de a pedazos de bytes, sin cargarla entera.
+
+    fuente puede ser:
+      - un archivo abierto (cualquier cosa con .read): se lee de a tamano
+      - bytes, bytearray o un mmap: se corta en rebanadas de tamano
+      - cualquier iterable de pedazos (un generador, una lista...)
+    Los pedazos str se pasan a bytes (UTF-8).
+    """
+    if isinstance(fuente, (bytes, bytearray, memoryview, mmap.mmap)):
+        for inicio in range(0, len(fuente), tamano):
+            yield bytes(fuente[inicio:inicio + tamano])
+        return
+    if isinstance(fuente, str):
+        fuente = [fuente]  # Ya está en memoria: es un solo pedazo
+    elif hasattr(fuente, "read"):
+        # Llama a read(tamano) hasta que devuelve b"" (o ""): fin del archivo
+        fuente = iter(functools.partial(fuente.read, tamano), fuente.read(0))
+    for pedazo in fuente:
+        yield pedazo.encode("utf-8") if isinstance(pedazo, str) else pedazo
+
+
+def contar_vocales_stream(fuente, tamano=TAMANO_PEDAZO):
+    """
+    contar_vocales de a pedazos. En vez de mirar carácter por carácter,
+    borra las vocales de cada pedazo (translate, en C) y cuenta cuántos
+    bytes desaparecieron.
+
+    Da lo mismo que contar_vocales con cualquier texto UTF-8: las letras
+    con acento ocupan 2 bytes y ninguno de los dos es una vocal ASCII.
+    """
+    total = 0
+    for pedazo in leer_en_pedazos(fuente, tamano):
+        total += len(pedazo) - len(pedazo.translate(None, VOCALES))
+    return total
+
+
+def primera_letra_no_repetida_stream(fuente, tamano=TAMANO_PEDAZO):
+    """
+    primera_letra_no_repetida de a pedazos, en UNA pasada: recuerda dónde
+    apareció cada letra por primera vez y cuáles ya se repitieron. Guarda
+    una entrada por letra DISTINTA, así que la memoria no crece con el
+    largo del archivo.
+
+    Los bytes se leen como UTF-8: una "ñ" son 2 bytes, y si queda partida
+    entre dos pedazos el decodificador espera al siguiente para armarla.
+
+    Returns:
+        La letra (str), o None si todas se repiten
+    """
+    decodificar = codecs.getincrementaldecoder("utf-8")().decode
+    primera_vez = {}  # letra -> posición donde apareció (si no se repitió)
+    repetidos = set()
+    leidos = 0
+    for pedazo in leer_en_pedazos(fuente, tamano):
+        pedazo = decodificar(pedazo)
+        # Solo las letras de este pedazo que todavía no se repitieron
+        for letra in set(pedazo) - repetidos:
+            i = pedazo.find(letra)
+            if letra in primera_vez or pedazo.find(letra, i + 1) != -1:
+                repetidos.add(letra)
+                primera_vez.pop(letra, None)
+            else:
+                primera_vez[letra] = leidos + i
+        leidos += len(pedazo)
+    decodificar(b"", final=True)  # UnicodeDecodeError si el texto quedó cortado
+    if not primera_vez:
+        return None
+    return min(primera_vez, key=primera_vez.get)
+
+
+def _de_a_una(letras_sueltas):
+    """Comprime letras sin repeticiones seguidas: "abc" -> "a1b1c1"."""
+    return "1".join(letras_sueltas) + "1" if letras_sueltas else ""
+
+
+def comprimir_stream(fuente, tamano=TAMANO_PEDAZO):
+    """
+    comprimir_string de a pedazos. Va devolviendo (yield) la salida en
+    bytes UTF-8, así se puede escribir a otro archivo sin armarla entera:
+
+        with open("salida.rle", "wb") as salida:
+            salida.writelines(comprimir_stream(open("enorme.txt", "rb")))
+
+    Cuenta letras, no bytes: "ññ" da "ñ2", igual que comprimir_string.
+    Como en primera_letra_no_repetida_stream, si una letra queda partida
+    entre dos pedazos el decodificador espera al siguiente para armarla.
+
+    Una racha también puede quedar partida ("...aa" + "ab..."): la última
+    racha de cada pedazo queda pendiente hasta ver cómo empieza el siguiente.
+    """
+    decodificar = codecs.getincrementaldecoder("utf-8")().decode
+    pendiente, cuantos = None, 0
+    for pedazo in leer_en_pedazos(fuente, tamano):
+        pedazo = decodificar(pedazo)
+        if not pedazo:
+            continue  # Pedazo vacío (un socket, un .gz) o solo media letra
+        salida = []
+        # 1. ¿El pedazo sigue la racha que quedó pendiente?
+        if pendiente is not None:
+            sigue = len(pedazo) - len(pedazo.lstrip(pendiente))
+            cuantos += sigue
+            pedazo = pedazo[sigue:]
+            if not pedazo:
+                continue
+            salida.append(f"{pendiente}{cuantos}")
+        # 2. La última racha del pedazo queda pendiente
+        pendiente = pedazo[-1]
+        cuerpo = pedazo.rstrip(pendiente)
+        cuantos = len(pedazo) - len(cuerpo)
+        # 3. El resto: las rachas de 2 o más las encuentra la regex (en C),
+        #    y las letras sueltas entre ellas se convierten todas juntas
+        anterior = 0
+        for racha in _RACHAS.finditer(cuerpo):
+            salida.append(_de_a_una(cuerpo[anterior:racha.start()]))
+            salida.append(f"{racha.group(1)}{racha.end() - racha.start()}")
+            anterior = racha.end()
+        salida.append(_de_a_una(cuerpo[anterior:]))
+        yield "".join(salida).encode("utf-8")
+    decodificar(b"", final=True)  # UnicodeDecodeError si el texto quedó cortado
+    if pendiente is not None:
+        yield f"{pendiente}{cuantos}".encode("utf-8")
+
+
+def es_palindromo_stream(fuente, tamano=TAMANO_PEDAZO):
+    """
+    es_palindromo sin cargar el texto: lee un pedazo del principio y otro
+    del final, los compara y avanza hacia el medio (dos punteros, de a
+    pedazos). Como es_palindromo, ignora espacios y mayúsculas.
+
+    Hay que poder leer desde el final, así que fuente tiene que ser bytes,
+    un mmap o un archivo abierto en "rb"; con un generador no se puede.
+    Los bytes se leen como UTF-8: los cortes se corren hasta el comienzo
+    de una letra, para no partir una "ñ" (2 bytes) por la mitad.
+    """
+    if isinstance(fuente, io.TextIOBase):
+        raise TypeError("es_palindromo_stream necesita el archivo abierto en modo 'rb'")
+    if isinstance(fuente, (bytes, bytearray, memoryview, mmap.mmap)):
+        largo = len(fuente)
+
+        def leer(inicio, fin):
+            return bytes(fuente[inicio:fin])
+    elif hasattr(fuente, "seek"):
+        largo = fuente.seek(0, io.SEEK_END)
+
+        def leer(inicio, fin):
+            fuente.seek(inicio)
+            return fuente.read(fin - inicio)
+    else:
+        raise TypeError("es_palindromo_stream necesita leer desde el final: "
+                        "usa bytes, un mmap o un archivo abierto en 'rb'")
+
+    def es_continuacion(i):
+        # En UTF-8 los bytes 10xxxxxx siguen una letra, nunca la empiezan
+        return leer(i, i + 1)[0] & 0xC0 == 0x80
+
+    def limpiar(pedazo):
+        return pedazo.decode("utf-8").lower().replace(" ", "")
+
+    # frente: lo leído del principio; fondo: lo leído del final, ya dado vuelta
+    frente = fondo = ""
+    izquierda, derecha = 0, largo  # lo que falta leer: [izquierda, derecha)
+    while izquierda < derecha:
+        if not frente:
+            fin = min(izquierda + tamano, derecha)
+            while fin < derecha and es_continuacion(fin):
+                fin += 1
+            frente = limpiar(leer(izquierda, fin))
+            izquierda = fin
+        elif not fondo:
+            inicio = max(derecha - tamano, izquierda)
+            while inicio > izquierda and es_continuacion(inicio):
+                inicio -= 1
+            fondo = limpiar(leer(inicio, derecha))[::-1]
+            derecha = inicio
+        else:
+            comun = min(len(frente), len(fondo))
+            if frente[:comun] != fondo[:comun]:
+                return False
+            frente, fondo = frente[comun:], fondo[comun:]
+    # Ya se leyó todo: lo que quedó sin comparar es el medio del texto
+    medio = frente + fondo[::-1]
+    return medio == medio[::-1]
+
+
 # 🎯 EJEMPLOS DE USO
 
 if __name__ == "__main__":
@@ -240,6 +447,48 @@ if __name__ == "__main__":
         comprimido = comprimir_string(texto)
         print(f"'{texto}' → '{comprimido}'")
     
+    print("\n" + "=" * 60)
+    print("EJEMPLO 8: Un archivo que no queremos cargar entero")
+    print("=" * 60)
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "enorme.txt")
+        with open(ruta, "wb") as archivo:
+            for _ in range(25):
+                archivo.write(b"Anita lava la tina " * 20_000)
+        print(f"Archivo de {os.path.getsize(ruta) / 1e6:.0f} MB")
+
+        tracemalloc.start()
+        start = time.time()
+        with open(ruta, encoding="utf-8") as archivo:
+            vocales = contar_vocales(archivo.read())
+        print(f"  contar_vocales(archivo.read()): {vocales:,} vocales, "
+              f"{time.time() - start:.2f} s, pico {tracemalloc.get_traced_memory()[1] / 1e6:.1f} MB")
+        tracemalloc.reset_peak()
+        start = time.time()
+        with open(ruta, "rb") as archivo:
+            vocales = contar_vocales_stream(archivo)
+        print(f"  contar_vocales_stream(archivo): {vocales:,} vocales, "
+              f"{time.time() - start:.2f} s, pico {tracemalloc.get_traced_memory()[1] / 1e6:.1f} MB")
+        tracemalloc.stop()
+
+        # Lo mismo con un mmap: el sistema operativo trae las páginas del
+        # disco a medida que se leen
+        with open(ruta, "rb") as archivo, \
+                mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            print(f"  es_palindromo_stream(mmap): {es_palindromo_stream(mapa)}")
+            print(f"  primera_letra_no_repetida_stream(mmap): "
+                  f"{primera_letra_no_repetida_stream(mapa)}")
+
+    # Cualquier generador de pedazos sirve (líneas de un socket, de un .gz...)
+    pedazos = (linea for linea in [b"aaab", b"bbbc", b"ccd"])
+    print(f"  comprimir_stream(generador): {b''.join(comprimir_stream(pedazos))}"
+          f"   (las rachas cortadas entre pedazos se unen)")
+    
     # 💡 CARACTERÍSTICAS
     print("\n" + "=" * 60)
     print("💡 ALGORITMOS CON STRINGS")
@@ -252,11 +501,19 @@ if __name__ == "__main__":
    - Concatenar: O(n + m) - crea nuevo string
 
 🔍 ALGORITMOS AVANZADOS DE STRINGS:
-   - KMP (Knuth-Morris-Pratt): búsqueda más eficiente
-   - Rabin-Karp: usando hash
+   - KMP (Knuth-Morris-Pratt): O(n + m), nunca retrocede (08_busqueda_strings.py)
+   - Boyer-Moore-Horspool: salta, ~n / m con patrones largos (08_busqueda_strings.py)
+   - Aho-Corasick: muchos patrones en una sola pasada (08c_aho_corasick.py)
+   - Suffix array: un índice para buscar muchas veces en el mismo texto (08d_suffix_array.py)
+   - Rabin-Karp: usando un hash rodante (19_hashing.py)
    - Longest Common Subsequence (LCS)
    - Edit Distance (Levenshtein)
 
+📂 ARCHIVOS QUE NO ENTRAN EN MEMORIA (funciones _stream):
+   - Leen de a pedazos de bytes: memoria constante, sea 1 KB o 10 GB
+   - Aceptan archivos abiertos en "rb", generadores de pedazos o un mmap
+   - es_palindromo_stream necesita leer desde el final: archivo o mmap
+
 🎯 PROBLEMAS COMUNES:
    - Búsqueda de patrones
    - Validación de formatos
@@ -282,6 +539,9 @@ if __name__ == "__main__":
    sin caracteres repetidos
    Ejemplo: "abcabcbb" → "abc" (longitud 3)
 
+6. Escribe anagrama_stream(archivo1, archivo2) que cuente los bytes
+   de cada archivo de a pedazos (sin ordenar nada)
+
 💡 Los strings son fundamentales en programación, practica mucho!
     """)
 
@@ -73,6 +73,9 @@ end
 def encontrar_substring(texto, patron)
   # Busca un patrón en un texto (búsqueda de substring).
   # Retorna todas las posiciones donde aparece.
+  #
+  # Para buscar MUCHOS patrones no la llames una vez por patrón:
+  # AhoCorasick (08c_aho_corasick.rb) los busca todos en una pasada.
   posiciones = []
   len_patron = patron.length
   
@@ -178,6 +181,197 @@ def comprimir_string(texto)
   resultado
 end
 
+# 📂 TEXTOS QUE NO ENTRAN EN MEMORIA
+#
+# Las funciones de arriba reciben el string entero. Con un archivo de 10 GB
+# eso es imposible (o carísimo): las versiones _stream leen de a pedazos de
+# bytes y usan siempre la misma memoria, sea el archivo de 1 KB o de 10 GB.
+
+TAMANO_PEDAZO = 1 << 20 # 1 MB por lectura
+
+VOCALES = "aeiouAEIOU"
+
+def leer_en_pedazos(fuente, tamano = TAMANO_PEDAZO)
+  # Recorre fuente de a pedazos de bytes (Strings binarios), sin cargarla
+  # entera. fuente puede ser:
+  #   - un archivo abierto (cualquier cosa con read): se lee de a tamano
+  #   - un String: se corta en rebanadas de tamano
+  #   - cualquier cosa con each que dé pedazos (un Enumerator, un Array...)
+  # Sin bloque, devuelve un Enumerator.
+  return enum_for(__method__, fuente, tamano) unless block_given?
+
+  if fuente.is_a?(String)
+    (0...fuente.bytesize).step(tamano) { |inicio| yield fuente.byteslice(inicio, tamano).b }
+  elsif fuente.respond_to?(:read)
+    while (pedazo = fuente.read(tamano)) # read devuelve nil al final
+      yield pedazo.b
+    end
+  else
+    fuente.each { |pedazo| yield pedazo.b }
+  end
+end
+
+def contar_vocales_stream(fuente, tamano = TAMANO_PEDAZO)
+  # contar_vocales de a pedazos: String#count (en C) cuenta las vocales
+  # de cada pedazo de una vez, sin recorrerlo carácter por carácter.
+  #
+  # Da lo mismo que contar_vocales con cualquier texto UTF-8: las letras
+  # con acento ocupan 2 bytes y ninguno de los dos es una vocal ASCII.
+  total = 0
+  leer_en_pedazos(fuente, tamano) { |pedazo| total += pedazo.count(VOCALES) }
+  total
+end
+
+def primera_letra_no_repetida_stream(fuente, tamano = TAMANO_PEDAZO)
+  # primera_letra_no_repetida de a pedazos, en UNA pasada: recuerda dónde
+  # apareció cada letra por primera vez y cuáles ya se repitieron. Guarda
+  # una entrada por letra DISTINTA, así que la memoria no crece con el
+  # largo del archivo.
+  #
+  # Los bytes se leen como UTF-8: una "ñ" son 2 bytes, y si queda partida
+  # entre dos pedazos sus primeros bytes esperan al pedazo siguiente.
+  #
+  # Returns:
+  #     La letra (String), o nil si todas se repiten
+  primera_vez = {} # letra -> posición donde apareció (si no se repitió)
+  repetidos = {}
+  leidos = 0
+  partida = "".b # Los primeros bytes de una letra cortada al final del pedazo
+  leer_en_pedazos(fuente, tamano) do |pedazo|
+    pedazo, partida = letras_completas(partida + pedazo)
+    # Solo las letras de este pedazo que todavía no se repitieron
+    pedazo.each_char.uniq.each do |letra|
+      next if repetidos.key?(letra)
+
+      i = pedazo.index(letra)
+      if primera_vez.key?(letra) || pedazo.index(letra, i + 1)
+        repetidos[letra] = true
+        primera_vez.delete(letra)
+      else
+        primera_vez[letra] = leidos + i
+      end
+    end
+    leidos += pedazo.length
+  end
+  raise ArgumentError, "El texto termina con una letra UTF-8 cortada" unless partida.empty?
+  return nil if primera_vez.empty?
+
+  primera_vez.min_by { |_letra, posicion| posicion }[0]
+end
+
+def letras_completas(bytes)
+  # Separa bytes en [texto UTF-8 con letras completas, bytes sobrantes].
+  # Una letra UTF-8 ocupa hasta 4 bytes, así que sobran a lo sumo 3.
+  0.upto([3, bytes.bytesize].min) do |sobran|
+    texto = bytes.byteslice(0, bytes.bytesize - sobran).force_encoding(Encoding::UTF_8)
+    return [texto, bytes.byteslice(bytes.bytesize - sobran, sobran)] if texto.valid_encoding?
+  end
+  raise ArgumentError, "El texto no es UTF-8 válido"
+end
+
+def comprimir_stream(fuente, tamano = TAMANO_PEDAZO)
+  # comprimir_string de a pedazos. Va entregando (yield) la salida, así se
+  # puede escribir a otro archivo sin armarla entera:
+  #
+  #     File.open("salida.rle", "wb") do |salida|
+  #       File.open("enorme.txt", "rb") do |archivo|
+  #         comprimir_stream(archivo) { |parte| salida.write(parte) }
+  #       end
+  #     end
+  #
+  # Cuenta letras, no bytes: "ññ" da "ñ2", igual que comprimir_string.
+  # Como en primera_letra_no_repetida_stream, si una letra queda partida
+  # entre dos pedazos se espera al siguiente para armarla.
+  #
+  # Una racha también puede quedar partida ("...aa" + "ab..."): la última
+  # racha de cada pedazo queda pendiente hasta ver cómo empieza el
+  # siguiente. Sin bloque, devuelve un Enumerator.
+  return enum_for(__method__, fuente, tamano) unless block_given?
+
+  pendiente = nil
+  cuantos = 0
+  partida = "".b # bytes de una letra que quedó cortada al final del pedazo
+  leer_en_pedazos(fuente, tamano) do |pedazo|
+    pedazo, partida = letras_completas(partida + pedazo)
+    next if pedazo.empty? # Pedazo vacío (un socket, un .gz) o solo media letra
+
+    salida = +""
+    # 1. ¿El pedazo sigue la racha que quedó pendiente?
+    unless pendiente.nil?
+      sigue = pedazo[/\A(?:#{Regexp.escape(pendiente)})*/].length
+      cuantos += sigue
+      next if sigue == pedazo.length
+
+      pedazo = pedazo[sigue..]
+      salida << pendiente << cuantos.to_s
+    end
+    # 2. La última racha del pedazo queda pendiente
+    pendiente = pedazo[-1]
+    cuantos = pedazo.reverse[/\A(?:#{Regexp.escape(pendiente)})+/].length
+    # 3. El resto: cada racha la encuentra la regex (en C)
+    salida << pedazo[0, pedazo.length - cuantos].gsub(/(.)\1*/m) { "#{$1}#{$&.length}" }
+    yield salida
+  end
+  raise ArgumentError, "El texto termina con una letra UTF-8 cortada" unless partida.empty?
+
+  yield pendiente + cuantos.to_s unless pendiente.nil?
+end
+
+def es_palindromo_stream(fuente, tamano = TAMANO_PEDAZO)
+  # es_palindromo sin cargar el texto: lee un pedazo del principio y otro
+  # del final, los compara y avanza hacia el medio (dos punteros, de a
+  # pedazos). Como es_palindromo, ignora espacios y mayúsculas.
+  #
+  # Hay que poder leer desde el final, así que fuente tiene que ser un
+  # String o un archivo abierto en "rb"; con un Enumerator no se puede.
+  # (Ruby no trae mmap: con un archivo, seek + read hace el mismo trabajo.)
+  # Los bytes se leen como UTF-8: los cortes se corren hasta el comienzo
+  # de una letra, para no partir una "ñ" (2 bytes) por la mitad.
+  if fuente.is_a?(String)
+    largo = fuente.bytesize
+    leer = ->(inicio, fin) { fuente.byteslice(inicio, fin - inicio).b }
+  elsif fuente.respond_to?(:seek)
+    largo = fuente.seek(0, IO::SEEK_END) && fuente.pos
+    leer = lambda do |inicio, fin|
+      fuente.seek(inicio)
+      fuente.read(fin - inicio).b
+    end
+  else
+    raise ArgumentError, "es_palindromo_stream necesita leer desde el final: " \
+                         "usa un String o un archivo abierto en 'rb'"
+  end
+  # En UTF-8 los bytes 10xxxxxx siguen una letra, nunca la empiezan
+  es_continuacion = ->(i) { leer.call(i, i + 1).getbyte(0) & 0xC0 == 0x80 }
+  limpiar = ->(pedazo) { pedazo.force_encoding(Encoding::UTF_8).downcase.delete(" ") }
+
+  # frente: lo leído del principio; fondo: lo leído del final, ya dado vuelta
+  frente = fondo = ""
+  izquierda = 0 # lo que falta leer: izquierda...derecha
+  derecha = largo
+  while izquierda < derecha
+    if frente.empty?
+      fin = [izquierda + tamano, derecha].min
+      fin += 1 while fin < derecha && es_continuacion.call(fin)
+      frente = limpiar.call(leer.call(izquierda, fin))
+      izquierda = fin
+    elsif fondo.empty?
+      inicio = [derecha - tamano, izquierda].max
+      inicio -= 1 while inicio > izquierda && es_continuacion.call(inicio)
+      fondo = limpiar.call(leer.call(inicio, derecha)).reverse
+      derecha = inicio
+    else
+      comun = [frente.length, fondo.length].min
+      return false if frente[0, comun] != fondo[0, comun]
+
+      frente = frente[comun..]
+      fondo = fondo[comun..]
+    end
+  end
+  # Ya se leyó todo: lo que quedó sin comparar es el medio del texto
+  medio = frente + fondo.reverse
+  medio == medio.reverse
+end
+
 # 🎯 EJEMPLOS DE USO
 
 if __FILE__ == $0
@@ -240,6 +434,40 @@ if __FILE__ == $0
     puts "'#{texto}' → '#{comprimido}'"
   end
   
+  puts "\n" + "=" * 60
+  puts "EJEMPLO 8: Un archivo que no queremos cargar entero"
+  puts "=" * 60
+  require "tmpdir"
+
+  Dir.mktmpdir do |carpeta|
+    ruta = File.join(carpeta, "enorme.txt")
+    File.open(ruta, "wb") do |archivo|
+      25.times { archivo.write("Anita lava la tina " * 20_000) }
+    end
+    puts "Archivo de #{(File.size(ruta) / 1e6).round} MB"
+
+    start = Time.now
+    vocales = contar_vocales(File.read(ruta))
+    puts "  contar_vocales(File.read): #{vocales} vocales, #{(Time.now - start).round(2)} s " \
+         "(el archivo entero en memoria)"
+    start = Time.now
+    vocales = File.open(ruta, "rb") { |archivo| contar_vocales_stream(archivo) }
+    puts "  contar_vocales_stream(archivo): #{vocales} vocales, #{(Time.now - start).round(2)} s " \
+         "(de a #{TAMANO_PEDAZO / 1_000_000} MB)"
+
+    File.open(ruta, "rb") do |archivo|
+      puts "  es_palindromo_stream(archivo): #{es_palindromo_stream(archivo)}"
+      archivo.rewind
+      puts "  primera_letra_no_repetida_stream(archivo): " \
+           "#{primera_letra_no_repetida_stream(archivo).inspect}"
+    end
+  end
+
+  # Cualquier cosa con each sirve (líneas de un socket, de un .gz...)
+  pedazos = ["aaab", "bbbc", "ccd"].each
+  puts "  comprimir_stream(Enumerator): #{comprimir_stream(pedazos).to_a.join.inspect}" \
+       "   (las rachas cortadas entre pedazos se unen)"
+  
   # 💡 CARACTERÍSTICAS
   puts "\n" + "=" * 60
   puts "💡 ALGORITMOS CON STRINGS"
@@ -252,11 +480,19 @@ if __FILE__ == $0
    - Concatenar: O(n + m) - crea nuevo string
 
 🔍 ALGORITMOS AVANZADOS DE STRINGS:
-   - KMP (Knuth-Morris-Pratt): búsqueda más eficiente
-   - Rabin-Karp: usando hash
+   - KMP (Knuth-Morris-Pratt): O(n + m), nunca retrocede (08_busqueda_strings.rb)
+   - Boyer-Moore-Horspool: salta, ~n / m con patrones largos (08_busqueda_strings.rb)
+   - Aho-Corasick: muchos patrones en una sola pasada (08c_aho_corasick.rb)
+   - Suffix array: un índice para buscar muchas veces en el mismo texto (08d_suffix_array.rb)
+   - Rabin-Karp: usando un hash rodante (19_hashing.rb)
    - Longest Common Subsequence (LCS)
    - Edit Distance (Levenshtein)
 
+📂 ARCHIVOS QUE NO ENTRAN EN MEMORIA (funciones _stream):
+   - Leen de a pedazos de bytes: memoria constante, sea 1 KB o 10 GB
+   - Aceptan archivos abiertos en \"rb\", Enumerators de pedazos o un String
+   - es_palindromo_stream necesita leer desde el final: archivo o String
+
 🎯 PROBLEMAS COMUNES:
    - Búsqueda de patrones
    - Validación de formatos
@@ -273,14 +509,17 @@ if __FILE__ == $0
 2. Implementa una función que cuente las palabras en un texto
 
 3. Escribe una función que elimine duplicados de caracteres consecutivos
-   Ejemplo: "aaabbbccc" → "abc"
+   Ejemplo: \"aaabbbccc\" → \"abc\"
 
 4. Crea una función que verifique si dos strings son permutaciones
    (tienen los mismos caracteres pero en diferente orden)
 
 5. Implementa una función que encuentre la subcadena más larga
    sin caracteres repetidos
-   Ejemplo: "abcabcbb" → "abc" (longitud 3)
+   Ejemplo: \"abcabcbb\" → \"abc\" (longitud 3)
+
+6. Escribe anagrama_stream(archivo1, archivo2) que cuente los bytes
+   de cada archivo de a pedazos (sin ordenar nada)
 
 💡 Los strings son fundamentales en programación, practica mucho!
     """
@@ -118,69 +118,6 @@ class LinkedList:
         self.cabeza = anterior
 
 
-# 🎯 EJEMPLOS DE USO
-
-print("=" * 60)
-print("EJEMPLO 1: Crear y agregar elementos")
-print("=" * 60)
-lista = LinkedList()
-print("Agregando elementos al inicio:")
-lista.agregar_al_inicio(3)
-lista.agregar_al_inicio(2)
-lista.agregar_al_inicio(1)
-lista.mostrar()
-
-print("\nAgregando elementos al final:")
-lista2 = LinkedList()
-lista2.agregar_al_final(1)
-lista2.agregar_al_final(2)
-lista2.agregar_al_final(3)
-lista2.mostrar()
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Buscar y eliminar")
-print("=" * 60)
-lista3 = LinkedList()
-for i in [5, 10, 15, 20, 25]:
-    lista3.agregar_al_final(i)
-
-print("Lista original:")
-lista3.mostrar()
-
-print(f"\n¿Existe el 15? {lista3.buscar(15)}")
-print(f"¿Existe el 99? {lista3.buscar(99)}")
-
-print("\nEliminando 15:")
-lista3.eliminar(15)
-lista3.mostrar()
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Invertir lista")
-print("=" * 60)
-lista4 = LinkedList()
-for i in [1, 2, 3, 4, 5]:
-    lista4.agregar_al_final(i)
-
-print("Lista original:")
-lista4.mostrar()
-
-print("\nLista invertida:")
-lista4.invertir()
-lista4.mostrar()
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Obtener por índice")
-print("=" * 60)
-lista5 = LinkedList()
-for i in [10, 20, 30, 40, 50]:
-    lista5.agregar_al_final(i)
-
-lista5.mostrar()
-print(f"\nElemento en índice 0: {lista5.obtener_indice(0)}")
-print(f"Elemento en índice 2: {lista5.obtener_indice(2)}")
-print(f"Elemento en índice 4: {lista5.obtener_indice(4)}")
-
-
 # 💡 LISTA DOBLEMENTE ENLAZADA
 
 class NodoDoble:
@@ -233,26 +170,89 @@ class DoublyLinkedList:
         print(" <-> ".join(elementos))
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 5: Lista Doblemente Enlazada")
-print("=" * 60)
-lista_doble = DoublyLinkedList()
-for i in [1, 2, 3, 4, 5]:
-    lista_doble.agregar_al_final(i)
-
-print("Recorriendo hacia adelante:")
-lista_doble.mostrar_adelante()
-
-print("\nRecorriendo hacia atrás:")
-lista_doble.mostrar_atras()
-
-
-# 💡 CARACTERÍSTICAS
+# 🎯 EJEMPLOS DE USO
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE LINKED LISTS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Crear y agregar elementos")
+    print("=" * 60)
+    lista = LinkedList()
+    print("Agregando elementos al inicio:")
+    lista.agregar_al_inicio(3)
+    lista.agregar_al_inicio(2)
+    lista.agregar_al_inicio(1)
+    lista.mostrar()
+
+    print("\nAgregando elementos al final:")
+    lista2 = LinkedList()
+    lista2.agregar_al_final(1)
+    lista2.agregar_al_final(2)
+    lista2.agregar_al_final(3)
+    lista2.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Buscar y eliminar")
+    print("=" * 60)
+    lista3 = LinkedList()
+    for i in [5, 10, 15, 20, 25]:
+        lista3.agregar_al_final(i)
+
+    print("Lista original:")
+    lista3.mostrar()
+
+    print(f"\n¿Existe el 15? {lista3.buscar(15)}")
+    print(f"¿Existe el 99? {lista3.buscar(99)}")
+
+    print("\nEliminando 15:")
+    lista3.eliminar(15)
+    lista3.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Invertir lista")
+    print("=" * 60)
+    lista4 = LinkedList()
+    for i in [1, 2, 3, 4, 5]:
+        lista4.agregar_al_final(i)
+
+    print("Lista original:")
+    lista4.mostrar()
+
+    print("\nLista invertida:")
+    lista4.invertir()
+    lista4.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Obtener por índice")
+    print("=" * 60)
+    lista5 = LinkedList()
+    for i in [10, 20, 30, 40, 50]:
+        lista5.agregar_al_final(i)
+
+    lista5.mostrar()
+    print(f"\nElemento en índice 0: {lista5.obtener_indice(0)}")
+    print(f"Elemento en índice 2: {lista5.obtener_indice(2)}")
+    print(f"Elemento en índice 4: {lista5.obtener_indice(4)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Lista Doblemente Enlazada")
+    print("=" * 60)
+    lista_doble = DoublyLinkedList()
+    for i in [1, 2, 3, 4, 5]:
+        lista_doble.agregar_al_final(i)
+
+    print("Recorriendo hacia adelante:")
+    lista_doble.mostrar_adelante()
+
+    print("\nRecorriendo hacia atrás:")
+    lista_doble.mostrar_atras()
+
+
+    # 💡 CARACTERÍSTICAS
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE LINKED LISTS")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Tamaño dinámico (puede crecer/shrink)
    - Insertar/eliminar al inicio es O(1)
@@ -283,10 +283,10 @@ print("""
    - Linked Lists: acceso lento O(n), tamaño dinámico
 """)
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Implementa una función que encuentre el elemento del medio de una lista
 
 2. Crea una función que detecte si hay un ciclo en la lista (detectar loop)
@@ -299,9 +299,3 @@ print("""
 
 💡 Linked Lists son fundamentales para entender estructuras más complejas!
 """)
-
-
-
-
-
-
@@ -53,27 +53,6 @@ class Stack:
             print(f"  [{self.items[i]}]")
 
 
-# 🎯 EJEMPLOS DE USO
-
-print("=" * 60)
-print("EJEMPLO 1: Operaciones básicas")
-print("=" * 60)
-pila = Stack()
-print("Agregando elementos:")
-pila.push(1)
-pila.push(2)
-pila.push(3)
-pila.mostrar()
-
-print(f"\nElemento superior (peek): {pila.peek()}")
-print(f"Tamaño: {pila.tamano()}")
-
-print("\nQuitando elementos:")
-print(f"Pop: {pila.pop()}")
-print(f"Pop: {pila.pop()}")
-pila.mostrar()
-
-
 # 🎯 APLICACIONES PRÁCTICAS
 
 def verificar_parentesis(expresion):
@@ -138,30 +117,6 @@ def evaluar_expresion_postfija(expresion):
     return pila.pop()
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Verificar paréntesis balanceados")
-print("=" * 60)
-expresiones = ["((()))", "(()", "()()", "((())"]
-for expr in expresiones:
-    resultado = verificar_parentesis(expr)
-    print(f"'{expr}' está balanceado: {resultado}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Invertir string con pila")
-print("=" * 60)
-texto = "Python"
-invertido = invertir_string_con_pila(texto)
-print(f"'{texto}' invertido: '{invertido}'")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Evaluar expresión postfija")
-print("=" * 60)
-expresiones_post = ["3 4 +", "3 4 + 2 *", "5 1 2 + 4 * + 3 -"]
-for expr in expresiones_post:
-    resultado = evaluar_expresion_postfija(expr)
-    print(f"'{expr}' = {resultado}")
-
-
 # 💡 IMPLEMENTACIÓN CON LINKED LIST
 
 class StackNode:
@@ -203,24 +158,68 @@ class StackLinkedList:
         return self.top is None
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 5: Stack con Linked List")
-print("=" * 60)
-pila_ll = StackLinkedList()
-pila_ll.push(10)
-pila_ll.push(20)
-pila_ll.push(30)
-print(f"Top: {pila_ll.peek()}")
-print(f"Pop: {pila_ll.pop()}")
-print(f"Top después del pop: {pila_ll.peek()}")
-
-
-# 💡 CARACTERÍSTICAS
+# 🎯 EJEMPLOS DE USO
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE STACKS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Operaciones básicas")
+    print("=" * 60)
+    pila = Stack()
+    print("Agregando elementos:")
+    pila.push(1)
+    pila.push(2)
+    pila.push(3)
+    pila.mostrar()
+
+    print(f"\nElemento superior (peek): {pila.peek()}")
+    print(f"Tamaño: {pila.tamano()}")
+
+    print("\nQuitando elementos:")
+    print(f"Pop: {pila.pop()}")
+    print(f"Pop: {pila.pop()}")
+    pila.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Verificar paréntesis balanceados")
+    print("=" * 60)
+    expresiones = ["((()))", "(()", "()()", "((())"]
+    for expr in expresiones:
+        resultado = verificar_parentesis(expr)
+        print(f"'{expr}' está balanceado: {resultado}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Invertir string con pila")
+    print("=" * 60)
+    texto = "Python"
+    invertido = invertir_string_con_pila(texto)
+    print(f"'{texto}' invertido: '{invertido}'")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Evaluar expresión postfija")
+    print("=" * 60)
+    expresiones_post = ["3 4 +", "3 4 + 2 *", "5 1 2 + 4 * + 3 -"]
+    for expr in expresiones_post:
+        resultado = evaluar_expresion_postfija(expr)
+        print(f"'{expr}' = {resultado}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 5: Stack con Linked List")
+    print("=" * 60)
+    pila_ll = StackLinkedList()
+    pila_ll.push(10)
+    pila_ll.push(20)
+    pila_ll.push(30)
+    print(f"Top: {pila_ll.peek()}")
+    print(f"Pop: {pila_ll.pop()}")
+    print(f"Top después del pop: {pila_ll.peek()}")
+
+
+    # 💡 CARACTERÍSTICAS
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE STACKS")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Simple y eficiente
    - Útil para muchos problemas algorítmicos
@@ -244,10 +243,10 @@ print("""
    El último que entra es el primero que sale
 """)
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Implementa una función que verifique si múltiples tipos de
    paréntesis están balanceados: (), [], {}
 
@@ -262,9 +261,3 @@ print("""
 
 💡 Las pilas son fundamentales para muchos algoritmos!
 """)
-
-
-
-
-
-
@@ -52,27 +52,6 @@ class Queue:
         print(f"Cola: [{elementos}]")
 
 
-# 🎯 EJEMPLOS DE USO
-
-print("=" * 60)
-print("EJEMPLO 1: Operaciones básicas")
-print("=" * 60)
-cola = Queue()
-print("Agregando elementos:")
-cola.enqueue(1)
-cola.enqueue(2)
-cola.enqueue(3)
-cola.mostrar()
-
-print(f"\nPrimer elemento (front): {cola.front()}")
-print(f"Tamaño: {cola.tamano()}")
-
-print("\nQuitando elementos:")
-print(f"Dequeue: {cola.dequeue()}")
-print(f"Dequeue: {cola.dequeue()}")
-cola.mostrar()
-
-
 # 💡 COLA CIRCULAR (MÁS EFICIENTE)
 
 class CircularQueue:
@@ -170,17 +149,6 @@ class Deque:
         return len(self.items)
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Deque (Cola de doble extremo)")
-print("=" * 60)
-deque = Deque()
-deque.agregar_atras(1)
-deque.agregar_atras(2)
-deque.agregar_adelante(0)
-print(f"Deque: {deque.items}")
-print(f"Primero: {deque.ver_adelante()}, Último: {deque.ver_atras()}")
-
-
 # 🎯 APLICACIONES PRÁCTICAS
 
 def generar_numeros_binarios(n):
@@ -226,13 +194,6 @@ def nivel_orden_traversal(raiz):
     return resultado
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Generar números binarios")
-print("=" * 60)
-binarios = generar_numeros_binarios(5)
-print(f"Primeros 5 números binarios: {binarios}")
-
-
 # 💡 PRIORITY QUEUE
 
 class PriorityQueue:
@@ -261,27 +222,64 @@ class PriorityQueue:
             print(f"Prioridad {prioridad}: {item}")
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO 4: Priority Queue")
-print("=" * 60)
-pq = PriorityQueue()
-pq.enqueue("Tarea baja", 1)
-pq.enqueue("Tarea alta", 5)
-pq.enqueue("Tarea media", 3)
-print("Cola de prioridad (mayor primero):")
-pq.mostrar()
-
-print("\nProcesando tareas:")
-while not pq.esta_vacia():
-    print(f"  Procesando: {pq.dequeue()}")
-
-
-# 💡 CARACTERÍSTICAS
+# 🎯 EJEMPLOS DE USO
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE QUEUES")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Operaciones básicas")
+    print("=" * 60)
+    cola = Queue()
+    print("Agregando elementos:")
+    cola.enqueue(1)
+    cola.enqueue(2)
+    cola.enqueue(3)
+    cola.mostrar()
+
+    print(f"\nPrimer elemento (front): {cola.front()}")
+    print(f"Tamaño: {cola.tamano()}")
+
+    print("\nQuitando elementos:")
+    print(f"Dequeue: {cola.dequeue()}")
+    print(f"Dequeue: {cola.dequeue()}")
+    cola.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Deque (Cola de doble extremo)")
+    print("=" * 60)
+    deque = Deque()
+    deque.agregar_atras(1)
+    deque.agregar_atras(2)
+    deque.agregar_adelante(0)
+    print(f"Deque: {deque.items}")
+    print(f"Primero: {deque.ver_adelante()}, Último: {deque.ver_atras()}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Generar números binarios")
+    print("=" * 60)
+    binarios = generar_numeros_binarios(5)
+    print(f"Primeros 5 números binarios: {binarios}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: Priority Queue")
+    print("=" * 60)
+    pq = PriorityQueue()
+    pq.enqueue("Tarea baja", 1)
+    pq.enqueue("Tarea alta", 5)
+    pq.enqueue("Tarea media", 3)
+    print("Cola de prioridad (mayor primero):")
+    pq.mostrar()
+
+    print("\nProcesando tareas:")
+    while not pq.esta_vacia():
+        print(f"  Procesando: {pq.dequeue()}")
+
+
+    # 💡 CARACTERÍSTICAS
+
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE QUEUES")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Simple y eficiente
    - Útil para procesamiento en orden
@@ -311,10 +309,10 @@ print("""
    - Priority Queue: por prioridad
 """)
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Implementa una cola usando dos pilas (stack)
 
 2. Crea una función que invierta una cola usando recursión
@@ -327,9 +325,3 @@ print("""
 
 💡 Las colas son esenciales para algoritmos de grafos como BFS!
 """)
-
-
-
-
-
-
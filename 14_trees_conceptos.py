@@ -31,42 +31,6 @@ class TreeNode:
             hijo.mostrar(nivel + 1)
 
 
-# 🎯 EJEMPLO: ÁRBOL GENERAL
-
-print("=" * 60)
-print("EJEMPLO 1: Árbol General (con múltiples hijos)")
-print("=" * 60)
-
-# Crear árbol:
-#       A
-#     / | \
-#    B  C  D
-#   /|\    |
-#  E F G   H
-
-raiz = TreeNode("A")
-nodo_b = TreeNode("B")
-nodo_c = TreeNode("C")
-nodo_d = TreeNode("D")
-nodo_e = TreeNode("E")
-nodo_f = TreeNode("F")
-nodo_g = TreeNode("G")
-nodo_h = TreeNode("H")
-
-raiz.agregar_hijo(nodo_b)
-raiz.agregar_hijo(nodo_c)
-raiz.agregar_hijo(nodo_d)
-
-nodo_b.agregar_hijo(nodo_e)
-nodo_b.agregar_hijo(nodo_f)
-nodo_b.agregar_hijo(nodo_g)
-
-nodo_d.agregar_hijo(nodo_h)
-
-print("\nÁrbol:")
-raiz.mostrar()
-
-
 # 🎯 CONCEPTOS BÁSICOS
 
 def altura_arbol(nodo):
@@ -115,22 +79,58 @@ def buscar_nodo(nodo, valor):
     return None
 
 
-print("\n" + "=" * 60)
-print("OPERACIONES BÁSICAS EN ÁRBOLES")
-print("=" * 60)
-print(f"Altura del árbol: {altura_arbol(raiz)}")
-print(f"Total de nodos: {contar_nodos(raiz)}")
-print(f"Número de hojas: {contar_hojas(raiz)}")
-print(f"Buscando 'F': {buscar_nodo(raiz, 'F') is not None}")
-print(f"Buscando 'Z': {buscar_nodo(raiz, 'Z') is not None}")
-
-
-# 🎯 TIPOS DE ÁRBOLES
+# 🎯 EJEMPLO: ÁRBOL GENERAL
 
-print("\n" + "=" * 60)
-print("TIPOS DE ÁRBOLES")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Árbol General (con múltiples hijos)")
+    print("=" * 60)
+
+    # Crear árbol:
+    #       A
+    #     / | \
+    #    B  C  D
+    #   /|\    |
+    #  E F G   H
+
+    raiz = TreeNode("A")
+    nodo_b = TreeNode("B")
+    nodo_c = TreeNode("C")
+    nodo_d = TreeNode("D")
+    nodo_e = TreeNode("E")
+    nodo_f = TreeNode("F")
+    nodo_g = TreeNode("G")
+    nodo_h = TreeNode("H")
+
+    raiz.agregar_hijo(nodo_b)
+    raiz.agregar_hijo(nodo_c)
+    raiz.agregar_hijo(nodo_d)
+
+    nodo_b.agregar_hijo(nodo_e)
+    nodo_b.agregar_hijo(nodo_f)
+    nodo_b.agregar_hijo(nodo_g)
+
+    nodo_d.agregar_hijo(nodo_h)
+
+    print("\nÁrbol:")
+    raiz.mostrar()
+
+    print("\n" + "=" * 60)
+    print("OPERACIONES BÁSICAS EN ÁRBOLES")
+    print("=" * 60)
+    print(f"Altura del árbol: {altura_arbol(raiz)}")
+    print(f"Total de nodos: {contar_nodos(raiz)}")
+    print(f"Número de hojas: {contar_hojas(raiz)}")
+    print(f"Buscando 'F': {buscar_nodo(raiz, 'F') is not None}")
+    print(f"Buscando 'Z': {buscar_nodo(raiz, 'Z') is not None}")
+
+
+    # 🎯 TIPOS DE ÁRBOLES
+
+    print("\n" + "=" * 60)
+    print("TIPOS DE ÁRBOLES")
+    print("=" * 60)
+    print("""
 1. ÁRBOL BINARIO:
    - Cada nodo tiene máximo 2 hijos (izquierdo y derecho)
 
@@ -159,12 +159,12 @@ print("""
 """)
 
 
-# 🎯 TERMINOLOGÍA
+    # 🎯 TERMINOLOGÍA
 
-print("\n" + "=" * 60)
-print("TERMINOLOGÍA IMPORTANTE")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("TERMINOLOGÍA IMPORTANTE")
+    print("=" * 60)
+    print("""
 🌳 PARTES DE UN ÁRBOL:
    - Raíz (Root): Nodo superior, sin padre
    - Nodo: Cada elemento del árbol
@@ -189,12 +189,12 @@ print("""
 """)
 
 
-# 🎯 VENTAJAS Y DESVENTAJAS
+    # 🎯 VENTAJAS Y DESVENTAJAS
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DE ÁRBOLES")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DE ÁRBOLES")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Representa relaciones jerárquicas naturalmente
    - Búsqueda más rápida que listas lineales (en BST)
@@ -220,10 +220,10 @@ print("""
 """)
 
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Crea una función que encuentre el nodo con el valor máximo en un árbol
 
 2. Implementa una función que calcule la suma de todos los valores del árbol
@@ -234,9 +234,3 @@ print("""
 
 💡 Los árboles son fundamentales para entender estructuras más avanzadas!
 """)
-
-
-
-
-
-
@@ -151,55 +151,56 @@ def buscar(nodo, valor):
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO 1: Crear árbol binario")
-print("=" * 60)
-
-# Crear árbol:
-#       1
-#      / \
-#     2   3
-#    / \
-#   4   5
-
-raiz = BinaryTreeNode(1)
-raiz.izquierda = BinaryTreeNode(2)
-raiz.derecha = BinaryTreeNode(3)
-raiz.izquierda.izquierda = BinaryTreeNode(4)
-raiz.izquierda.derecha = BinaryTreeNode(5)
-
-print("\nÁrbol:")
-print("       1")
-print("      / \\")
-print("     2   3")
-print("    / \\")
-print("   4   5")
-
-print("\n" + "=" * 60)
-print("RECORRIDOS DEL ÁRBOL")
-print("=" * 60)
-
-print(f"\nPreorder  (Raíz-Izq-Der): {preorder(raiz)}")
-print(f"Inorder   (Izq-Raíz-Der):  {inorder(raiz)}")
-print(f"Postorder (Izq-Der-Raíz):  {postorder(raiz)}")
-print(f"Level-order (por niveles): {level_order(raiz)}")
-
-print("\n" + "=" * 60)
-print("OPERACIONES")
-print("=" * 60)
-
-print(f"Altura del árbol: {altura(raiz)}")
-print(f"Total de nodos: {contar_nodos(raiz)}")
-print(f"¿Existe el valor 3? {buscar(raiz, 3)}")
-print(f"¿Existe el valor 99? {buscar(raiz, 99)}")
-
-
-# 💡 CARACTERÍSTICAS
-
-print("\n" + "=" * 60)
-print("💡 RECORRIDOS DE ÁRBOLES BINARIOS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Crear árbol binario")
+    print("=" * 60)
+
+    # Crear árbol:
+    #       1
+    #      / \
+    #     2   3
+    #    / \
+    #   4   5
+
+    raiz = BinaryTreeNode(1)
+    raiz.izquierda = BinaryTreeNode(2)
+    raiz.derecha = BinaryTreeNode(3)
+    raiz.izquierda.izquierda = BinaryTreeNode(4)
+    raiz.izquierda.derecha = BinaryTreeNode(5)
+
+    print("\nÁrbol:")
+    print("       1")
+    print("      / \\")
+    print("     2   3")
+    print("    / \\")
+    print("   4   5")
+
+    print("\n" + "=" * 60)
+    print("RECORRIDOS DEL ÁRBOL")
+    print("=" * 60)
+
+    print(f"\nPreorder  (Raíz-Izq-Der): {preorder(raiz)}")
+    print(f"Inorder   (Izq-Raíz-Der):  {inorder(raiz)}")
+    print(f"Postorder (Izq-Der-Raíz):  {postorder(raiz)}")
+    print(f"Level-order (por niveles): {level_order(raiz)}")
+
+    print("\n" + "=" * 60)
+    print("OPERACIONES")
+    print("=" * 60)
+
+    print(f"Altura del árbol: {altura(raiz)}")
+    print(f"Total de nodos: {contar_nodos(raiz)}")
+    print(f"¿Existe el valor 3? {buscar(raiz, 3)}")
+    print(f"¿Existe el valor 99? {buscar(raiz, 99)}")
+
+
+    # 💡 CARACTERÍSTICAS
+
+    print("\n" + "=" * 60)
+    print("💡 RECORRIDOS DE ÁRBOLES BINARIOS")
+    print("=" * 60)
+    print("""
 1. PREORDER (NLR):
    - Visita: Nodo, Izquierda, Derecha
    - Útil para copiar árboles
@@ -223,10 +224,10 @@ print("""
 💡 MEMORIZA: Pre/In/Post se refiere a cuándo visitas la RAÍZ
 """)
 
-print("\n" + "=" * 60)
-print("🏋️  EJERCICIOS")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("🏋️  EJERCICIOS")
+    print("=" * 60)
+    print("""
 1. Implementa una función que calcule el ancho máximo del árbol
 
 2. Crea una función que encuentre el camino más largo entre dos nodos
@@ -102,30 +102,31 @@ class BinarySearchTree:
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO: Binary Search Tree")
-print("=" * 60)
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO: Binary Search Tree")
+    print("=" * 60)
 
-bst = BinarySearchTree()
-valores = [50, 30, 70, 20, 40, 60, 80]
+    bst = BinarySearchTree()
+    valores = [50, 30, 70, 20, 40, 60, 80]
 
-print("Insertando valores:", valores)
-for valor in valores:
-    bst.insertar(valor)
+    print("Insertando valores:", valores)
+    for valor in valores:
+        bst.insertar(valor)
 
-print(f"\nBuscando 40: {bst.buscar(40)}")
-print(f"Buscando 99: {bst.buscar(99)}")
+    print(f"\nBuscando 40: {bst.buscar(40)}")
+    print(f"Buscando 99: {bst.buscar(99)}")
 
-print(f"\nValores en orden (inorder): {bst.inorder()}")
+    print(f"\nValores en orden (inorder): {bst.inorder()}")
 
-print("\nEliminando 20:")
-bst.eliminar(20)
-print(f"Valores después de eliminar: {bst.inorder()}")
+    print("\nEliminando 20:")
+    bst.eliminar(20)
+    print(f"Valores después de eliminar: {bst.inorder()}")
 
-print("\n" + "=" * 60)
-print("💡 CARACTERÍSTICAS DEL BST")
-print("=" * 60)
-print("""
+    print("\n" + "=" * 60)
+    print("💡 CARACTERÍSTICAS DEL BST")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Búsqueda eficiente: O(log n) promedio
    - Inserción y eliminación eficientes
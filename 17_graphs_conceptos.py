@@ -43,32 +43,33 @@ class Graph:
 
 # 🎯 EJEMPLO
 
-print("=" * 60)
-print("EJEMPLO: Grafo No Dirigido")
-print("=" * 60)
-
-grafo = Graph()
-grafo.agregar_arista(0, 1)
-grafo.agregar_arista(0, 2)
-grafo.agregar_arista(1, 2)
-grafo.agregar_arista(2, 3)
-grafo.agregar_arista(3, 4)
-
-print("\nGrafo (lista de adyacencia):")
-grafo.mostrar()
-
-# Visualización:
-#     0
-#    / \
-#   1---2
-#       |
-#       3---4
-
-
-print("\n" + "=" * 60)
-print("💡 CONCEPTOS DE GRAFOS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO: Grafo No Dirigido")
+    print("=" * 60)
+
+    grafo = Graph()
+    grafo.agregar_arista(0, 1)
+    grafo.agregar_arista(0, 2)
+    grafo.agregar_arista(1, 2)
+    grafo.agregar_arista(2, 3)
+    grafo.agregar_arista(3, 4)
+
+    print("\nGrafo (lista de adyacencia):")
+    grafo.mostrar()
+
+    # Visualización:
+    #     0
+    #    / \
+    #   1---2
+    #       |
+    #       3---4
+
+
+    print("\n" + "=" * 60)
+    print("💡 CONCEPTOS DE GRAFOS")
+    print("=" * 60)
+    print("""
 📐 TIPOS DE GRAFOS:
    1. Grafo No Dirigido: las aristas no tienen dirección
    2. Grafo Dirigido (Digraph): las aristas tienen dirección
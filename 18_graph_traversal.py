@@ -88,39 +88,40 @@ def DFS_iterativo(grafo, inicio):
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO: BFS vs DFS")
-print("=" * 60)
-
-g = Graph()
-# Crear grafo:
-#     0
-#    / \
-#   1   2
-#  / \   \
-# 3   4   5
-
-g.agregar_arista(0, 1)
-g.agregar_arista(0, 2)
-g.agregar_arista(1, 3)
-g.agregar_arista(1, 4)
-g.agregar_arista(2, 5)
-
-print("\nGrafo:")
-print("     0")
-print("    / \\")
-print("   1   2")
-print("  / \\   \\")
-print(" 3   4   5")
-
-print(f"\nBFS desde 0: {BFS(g, 0)}")
-print(f"DFS recursivo desde 0: {DFS_recursivo(g, 0)}")
-print(f"DFS iterativo desde 0: {DFS_iterativo(g, 0)}")
-
-print("\n" + "=" * 60)
-print("💡 BFS vs DFS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO: BFS vs DFS")
+    print("=" * 60)
+
+    g = Graph()
+    # Crear grafo:
+    #     0
+    #    / \
+    #   1   2
+    #  / \   \
+    # 3   4   5
+
+    g.agregar_arista(0, 1)
+    g.agregar_arista(0, 2)
+    g.agregar_arista(1, 3)
+    g.agregar_arista(1, 4)
+    g.agregar_arista(2, 5)
+
+    print("\nGrafo:")
+    print("     0")
+    print("    / \\")
+    print("   1   2")
+    print("  / \\   \\")
+    print(" 3   4   5")
+
+    print(f"\nBFS desde 0: {BFS(g, 0)}")
+    print(f"DFS recursivo desde 0: {DFS_recursivo(g, 0)}")
+    print(f"DFS iterativo desde 0: {DFS_iterativo(g, 0)}")
+
+    print("\n" + "=" * 60)
+    print("💡 BFS vs DFS")
+    print("=" * 60)
+    print("""
 BFS (Breadth First Search):
    - Usa COLA (FIFO)
    - Visita nivel por nivel
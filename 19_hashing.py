@@ -67,30 +67,6 @@ class HashTable:
                 print(f"Bucket {i}: {bucket}")
 
 
-# 🎯 EJEMPLOS
-
-print("=" * 60)
-print("EJEMPLO: Hash Table")
-print("=" * 60)
-
-ht = HashTable(5)
-
-ht.insertar("nombre", "Juan")
-ht.insertar("edad", 25)
-ht.insertar("ciudad", "Madrid")
-ht.insertar("profesion", "Ingeniero")
-
-print("\nTabla hash:")
-ht.mostrar()
-
-print(f"\nObtener 'nombre': {ht.obtener('nombre')}")
-print(f"Obtener 'edad': {ht.obtener('edad')}")
-
-print("\nEliminando 'ciudad':")
-ht.eliminar("ciudad")
-ht.mostrar()
-
-
 # 🎯 FUNCIONES HASH
 
 def hash_string_simple(texto, capacidad):
@@ -109,22 +85,272 @@ def hash_string_mejorado(texto, capacidad):
     return hash_valor
 
 
-print("\n" + "=" * 60)
-print("EJEMPLO: Funciones Hash")
-print("=" * 60)
+# 🎯 ROLLING HASH: BUSCAR CON RABIN-KARP
+#
+# Para buscar un patrón de largo m, podemos comparar su hash con el hash
+# de cada ventana de m caracteres del texto: si son distintos, seguro que
+# no coincide y no hace falta comparar carácter por carácter.
+#
+# El truco es no recalcular cada ventana desde cero (eso sería O(m)).
+# hash_string_mejorado trata al texto como un número en base 31:
+#
+#     "abc" -> a·31² + b·31 + c
+#
+# Para correr la ventana un lugar ("abc" -> "bcd") le sacamos lo que
+# aporta la primera letra, corremos todo un dígito y sumamos la nueva:
+#
+#     (a·31² + b·31 + c - a·31²) · 31 + d  =  b·31² + c·31 + d
+#
+# O(1) por ventana, sin importar m. Con una capacidad ENORME (un primo
+# de 61 bits) casi no hay colisiones; igual, antes de dar por buena una
+# coincidencia la comparamos de verdad.
+
+CAPACIDAD_RABIN_KARP = (1 << 61) - 1  # Un primo: 2305843009213693951
+
+
+def hashes_rodantes(valores, m, capacidad=CAPACIDAD_RABIN_KARP, base=31):
+    """
+    Hash de cada ventana de m valores seguidos, en O(1) por ventana.
+
+    Con valores = los ord() de un texto, la ventana i da lo mismo que
+    hash_string_mejorado(texto[i:i + m], capacidad).
+
+    Yields:
+        El hash de valores[0:m], después el de valores[1:m + 1], etc.
+    """
+    if m == 0 or len(valores) < m:
+        return
+    peso_primero = pow(base, m - 1, capacidad)  # Lo que aporta el que sale
+    h = 0
+    for v in valores[:m]:
+        h = (h * base + v) % capacidad
+    yield h
+    for i in range(m, len(valores)):
+        h = ((h - valores[i - m] * peso_primero) * base + valores[i]) % capacidad
+        yield h
+
+
+def rabin_karp(texto, patrones):
+    """
+    Busca varios patrones del MISMO largo en una sola pasada.
+
+    Los hashes de los patrones van a un diccionario: cada ventana del
+    texto se busca ahí en O(1), sean 1 o 1000 patrones.
+
+    Returns:
+        Diccionario patron -> lista de posiciones donde aparece
+    """
+    posiciones = {patron: [] for patron in patrones}
+    largos = {len(patron) for patron in posiciones}
+    if len(largos) > 1:
+        raise ValueError(f"Rabin-Karp necesita patrones del mismo largo, no {sorted(largos)}")
+    m = largos.pop() if largos else 0
+    if m == 0:
+        return posiciones
+
+    por_hash = {}
+    for patron in posiciones:
+        por_hash.setdefault(hash_string_mejorado(patron, CAPACIDAD_RABIN_KARP), []).append(patron)
+
+    for i, h in enumerate(hashes_rodantes([ord(c) for c in texto], m)):
+        for patron in por_hash.get(h, ()):
+            if texto.startswith(patron, i):  # Descartamos colisiones
+                posiciones[patron].append(i)
+    return posiciones
+
+
+def rabin_karp_2d(grilla, patron):
+    """
+    Busca un patrón rectangular dentro de una grilla (una lista de filas,
+    cada fila un string o una lista de números).
+
+    1. Cada fila de la grilla se resume con hashes rodantes de ancho c:
+       fila_hashes[f][j] = hash de grilla[f][j:j + c]
+    2. Cada COLUMNA de esos hashes se recorre con otro hash rodante de
+       alto r: así se resume cada rectángulo de r × c en O(1)
+
+    Returns:
+        Lista de (fila, columna) de la esquina superior izquierda de cada
+        aparición
+    """
+    r = len(patron)
+    c = len(patron[0]) if r else 0
+    if r == 0 or c == 0 or len(grilla) < r:
+        return []
+
+    def numeros(fila):
+        return [ord(x) for x in fila] if isinstance(fila, str) else fila
+
+    # Otra base para la segunda pasada: si no, "ab/cd" y "ac/bd" podrían
+    # sumar parecido
+    base_vertical = 1_000_003
+    hash_patron = next(hashes_rodantes([next(hashes_rodantes(numeros(fila), c)) for fila in patron],
+                                       r, base=base_vertical))
+    fila_hashes = [list(hashes_rodantes(numeros(fila), c)) for fila in grilla]
+    ancho = min(len(hashes) for hashes in fila_hashes)
+
+    encontrados = []
+    for j in range(ancho):
+        columna = [hashes[j] for hashes in fila_hashes]
+        for f, h in enumerate(hashes_rodantes(columna, r, base=base_vertical)):
+            if h == hash_patron and all(grilla[f + k][j:j + c] == patron[k] for k in range(r)):
+                encontrados.append((f, j))
+    encontrados.sort()
+    return encontrados
+
+
+def buscar_repetido(texto, m):
+    """
+    Busca un pedazo de largo m que aparezca DOS veces en el texto.
+    Guardando el hash de cada ventana en un diccionario, es O(n) en
+    promedio (en vez de comparar todas las ventanas contra todas).
+
+    Returns:
+        (primera, segunda) posiciones del pedazo repetido, o None
+    """
+    vistos = {}  # hash -> primera posición con ese hash
+    for i, h in enumerate(hashes_rodantes([ord(c) for c in texto], m)):
+        if h in vistos and texto.startswith(texto[i:i + m], vistos[h]):
+            return vistos[h], i
+        vistos.setdefault(h, i)
+    return None
+
+
+def payloads_parecidos(payloads, m):
+    """
+    Para deduplicar payloads casi iguales: dos payloads que comparten un
+    pedazo de m caracteres seguramente son copias con cambios chicos
+    (un id, una fecha).
+
+    Recorre todos los payloads una vez: O(largo total) en promedio.
+
+    Returns:
+        Lista del mismo largo que payloads: para cada uno, el índice del
+        PRIMER payload anterior con el que comparte un pedazo de largo m,
+        o None si no se parece a ninguno anterior
+    """
+    vistos = {}  # hash -> (payload, posición) donde apareció primero
+    parecido_a = []
+    for indice, payload in enumerate(payloads):
+        encontrado = None
+        nuevos = {}
+        for i, h in enumerate(hashes_rodantes([ord(c) for c in payload], m)):
+            if h in vistos:
+                otro, j = vistos[h]
+                # Solo comparamos si mejora lo que ya encontramos
+                if ((encontrado is None or otro < encontrado)
+                        and payloads[otro].startswith(payload[i:i + m], j)):
+                    encontrado = otro
+            nuevos.setdefault(h, (indice, i))
+        for h, lugar in nuevos.items():
+            vistos.setdefault(h, lugar)
+        parecido_a.append(encontrado)
+    return parecido_a
 
-palabras = ["hola", "mundo", "python", "algoritmo"]
-print("\nValores hash (capacidad=10):")
-for palabra in palabras:
-    hash1 = hash_string_simple(palabra, 10)
-    hash2 = hash_string_mejorado(palabra, 10)
-    print(f"'{palabra}': simple={hash1}, mejorado={hash2}")
 
+# 🎯 EJEMPLOS
 
-print("\n" + "=" * 60)
-print("💡 HASHING")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO: Hash Table")
+    print("=" * 60)
+
+    ht = HashTable(5)
+
+    ht.insertar("nombre", "Juan")
+    ht.insertar("edad", 25)
+    ht.insertar("ciudad", "Madrid")
+    ht.insertar("profesion", "Ingeniero")
+
+    print("\nTabla hash:")
+    ht.mostrar()
+
+    print(f"\nObtener 'nombre': {ht.obtener('nombre')}")
+    print(f"Obtener 'edad': {ht.obtener('edad')}")
+
+    print("\nEliminando 'ciudad':")
+    ht.eliminar("ciudad")
+    ht.mostrar()
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO: Funciones Hash")
+    print("=" * 60)
+
+    palabras = ["hola", "mundo", "python", "algoritmo"]
+    print("\nValores hash (capacidad=10):")
+    for palabra in palabras:
+        hash1 = hash_string_simple(palabra, 10)
+        hash2 = hash_string_mejorado(palabra, 10)
+        print(f"'{palabra}': simple={hash1}, mejorado={hash2}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO: Rolling hash (Rabin-Karp)")
+    print("=" * 60)
+    texto = "abracadabra"
+    m = 4
+    for i, h in enumerate(hashes_rodantes([ord(c) for c in texto], m, capacidad=1000)):
+        print(f"  '{texto[i:i + m]}': rodante={h:>3}  "
+              f"desde cero={hash_string_mejorado(texto[i:i + m], 1000):>3}")
+
+    print(f"\nBuscar 'abra' y 'cada' en '{texto}': {rabin_karp(texto, ['abra', 'cada'])}")
+
+    grilla = ["abcab",
+              "cdbcd",
+              "ababc",
+              "cdcdb"]
+    print("\nGrilla:")
+    for fila in grilla:
+        print(f"  {fila}")
+    print(f"Patrón ['ab', 'cd'] en (fila, columna): {rabin_karp_2d(grilla, ['ab', 'cd'])}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO: Detectar payloads casi iguales")
+    print("=" * 60)
+    payloads = [
+        '{"evento": "compra", "producto": "teclado mecánico", "precio": 120, "id": 1001}',
+        '{"evento": "login", "usuario": "ana", "ip": "10.0.0.7"}',
+        '{"evento": "compra", "producto": "teclado mecánico", "precio": 120, "id": 1002}',
+        '{"evento": "logout", "usuario": "ana"}',
+    ]
+    for indice, otro in enumerate(payloads_parecidos(payloads, m=40)):
+        aviso = f"casi igual al {otro}" if otro is not None else "nuevo"
+        print(f"  payload {indice}: {aviso}")
+    print(f"\nPrimer pedazo de 4 letras repetido en '{texto}': {buscar_repetido(texto, 4)}")
+
+    import random
+    import time
+
+    grande = "".join(random.choices("acgt", k=1_000_000))
+    patrones = ["".join(random.choices("acgt", k=12)) for _ in range(500)]
+    start = time.time()
+    uno_por_uno = {p: [i for i in range(len(grande) - 11) if grande.startswith(p, i)]
+                   for p in patrones[:5]}
+    tiempo_naive = (time.time() - start) / 5 * len(patrones)
+    start = time.time()
+    for p in patrones:
+        i = grande.find(p)
+        while i != -1:
+            i = grande.find(p, i + 1)
+    tiempo_find = time.time() - start
+    start = time.time()
+    todos = rabin_karp(grande, patrones)
+    tiempo_rk = time.time() - start
+    print(f"\n{len(patrones)} patrones de ADN en {len(grande):,} letras:")
+    print(f"  Naive, uno por uno: ~{tiempo_naive:.0f} segundos (estimado con 5)")
+    print(f"  str.find (en C), uno por uno: {tiempo_find:.2f} segundos")
+    print(f"  Rabin-Karp, todos juntos: {tiempo_rk:.2f} segundos")
+    print(f"  ¿Mismo resultado? {all(todos[p] == uno_por_uno[p] for p in uno_por_uno)}")
+    print("""
+💡 Rabin-Karp recorre el texto UNA vez para todos los patrones: su
+   tiempo casi no cambia con 5 o 5000 patrones. str.find recorre el
+   texto una vez POR patrón (rápido, porque es C, pero crece con la
+   cantidad de patrones).""")
+
+
+    print("\n" + "=" * 60)
+    print("💡 HASHING")
+    print("=" * 60)
+    print("""
 🔑 FUNCIÓN HASH:
    - Convierte una clave en un índice de la tabla
    - Debe ser determinística (misma clave → mismo hash)
@@ -148,10 +374,6 @@ print("""
    - Caché
    - Bases de datos
    - Verificación de integridad (checksums)
+   - Buscar patrones en textos: Rabin-Karp, O(n + m) en promedio
+   - Detectar copias y pedazos repetidos (deduplicación)
 """)
-
-
-
-
-
-
@@ -116,6 +116,163 @@ def hash_string_mejorado(texto, capacidad)
   hash_valor
 end
 
+# 🎯 ROLLING HASH: BUSCAR CON RABIN-KARP
+#
+# Para buscar un patrón de largo m, podemos comparar su hash con el hash
+# de cada ventana de m caracteres del texto: si son distintos, seguro que
+# no coincide y no hace falta comparar carácter por carácter.
+#
+# El truco es no recalcular cada ventana desde cero (eso sería O(m)).
+# hash_string_mejorado trata al texto como un número en base 31:
+#
+#     "abc" -> a·31² + b·31 + c
+#
+# Para correr la ventana un lugar ("abc" -> "bcd") le sacamos lo que
+# aporta la primera letra, corremos todo un dígito y sumamos la nueva:
+#
+#     (a·31² + b·31 + c - a·31²) · 31 + d  =  b·31² + c·31 + d
+#
+# O(1) por ventana, sin importar m. Con una capacidad ENORME (un primo
+# de 61 bits) casi no hay colisiones; igual, antes de dar por buena una
+# coincidencia la comparamos de verdad.
+
+CAPACIDAD_RABIN_KARP = (1 << 61) - 1 # Un primo: 2305843009213693951
+
+def hashes_rodantes(valores, m, capacidad = CAPACIDAD_RABIN_KARP, base = 31)
+  # Hash de cada ventana de m valores seguidos, en O(1) por ventana.
+  #
+  # Con valores = los ord de un texto, la ventana i da lo mismo que
+  # hash_string_mejorado(texto[i, m], capacidad).
+  #
+  # Returns:
+  #     Array con el hash de valores[0, m], después el de valores[1, m], etc.
+  return [] if m == 0 || valores.length < m
+
+  peso_primero = base.pow(m - 1, capacidad) # Lo que aporta el que sale
+  h = 0
+  valores[0, m].each { |v| h = (h * base + v) % capacidad }
+  hashes = [h]
+  (m...valores.length).each do |i|
+    h = ((h - valores[i - m] * peso_primero) * base + valores[i]) % capacidad
+    hashes << h
+  end
+  hashes
+end
+
+def rabin_karp(texto, patrones)
+  # Busca varios patrones del MISMO largo en una sola pasada.
+  #
+  # Los hashes de los patrones van a un Hash: cada ventana del texto se
+  # busca ahí en O(1), sean 1 o 1000 patrones.
+  #
+  # Returns:
+  #     Hash patron -> array de posiciones donde aparece
+  posiciones = patrones.to_h { |patron| [patron, []] }
+  largos = posiciones.keys.map(&:length).uniq
+  if largos.length > 1
+    raise ArgumentError, "Rabin-Karp necesita patrones del mismo largo, no #{largos.sort}"
+  end
+
+  m = largos.first || 0
+  return posiciones if m == 0
+
+  por_hash = Hash.new { |h, k| h[k] = [] }
+  posiciones.each_key { |patron| por_hash[hash_string_mejorado(patron, CAPACIDAD_RABIN_KARP)] << patron }
+
+  hashes_rodantes(texto.each_char.map(&:ord), m).each_with_index do |h, i|
+    next unless por_hash.key?(h)
+
+    por_hash[h].each do |patron|
+      posiciones[patron] << i if texto[i, m] == patron # Descartamos colisiones
+    end
+  end
+  posiciones
+end
+
+def rabin_karp_2d(grilla, patron)
+  # Busca un patrón rectangular dentro de una grilla (un array de filas,
+  # cada fila un string o un array de números).
+  #
+  # 1. Cada fila de la grilla se resume con hashes rodantes de ancho c:
+  #    fila_hashes[f][j] = hash de grilla[f][j, c]
+  # 2. Cada COLUMNA de esos hashes se recorre con otro hash rodante de
+  #    alto r: así se resume cada rectángulo de r × c en O(1)
+  #
+  # Returns:
+  #     Array de [fila, columna] de la esquina superior izquierda de cada
+  #     aparición
+  r = patron.length
+  c = r > 0 ? patron[0].length : 0
+  return [] if r == 0 || c == 0 || grilla.length < r
+
+  numeros = ->(fila) { fila.is_a?(String) ? fila.each_char.map(&:ord) : fila }
+
+  # Otra base para la segunda pasada: si no, "ab/cd" y "ac/bd" podrían
+  # sumar parecido
+  base_vertical = 1_000_003
+  hash_patron = hashes_rodantes(patron.map { |fila| hashes_rodantes(numeros.call(fila), c)[0] },
+                                r, CAPACIDAD_RABIN_KARP, base_vertical)[0]
+  fila_hashes = grilla.map { |fila| hashes_rodantes(numeros.call(fila), c) }
+  ancho = fila_hashes.map(&:length).min
+
+  encontrados = []
+  (0...ancho).each do |j|
+    columna = fila_hashes.map { |hashes| hashes[j] }
+    hashes_rodantes(columna, r, CAPACIDAD_RABIN_KARP, base_vertical).each_with_index do |h, f|
+      if h == hash_patron && (0...r).all? { |k| grilla[f + k][j, c] == patron[k] }
+        encontrados << [f, j]
+      end
+    end
+  end
+  encontrados.sort
+end
+
+def buscar_repetido(texto, m)
+  # Busca un pedazo de largo m que aparezca DOS veces en el texto.
+  # Guardando el hash de cada ventana en un Hash, es O(n) en
+  # promedio (en vez de comparar todas las ventanas contra todas).
+  #
+  # Returns:
+  #     [primera, segunda] posiciones del pedazo repetido, o nil
+  vistos = {} # hash -> primera posición con ese hash
+  hashes_rodantes(texto.each_char.map(&:ord), m).each_with_index do |h, i|
+    return [vistos[h], i] if vistos.key?(h) && texto[vistos[h], m] == texto[i, m]
+
+    vistos[h] ||= i
+  end
+  nil
+end
+
+def payloads_parecidos(payloads, m)
+  # Para deduplicar payloads casi iguales: dos payloads que comparten un
+  # pedazo de m caracteres seguramente son copias con cambios chicos
+  # (un id, una fecha).
+  #
+  # Recorre todos los payloads una vez: O(largo total) en promedio.
+  #
+  # Returns:
+  #     Array del mismo largo que payloads: para cada uno, el índice del
+  #     PRIMER payload anterior con el que comparte un pedazo de largo m,
+  #     o nil si no se parece a ninguno anterior
+  vistos = {} # hash -> [payload, posición] donde apareció primero
+  payloads.each_with_index.map do |payload, indice|
+    encontrado = nil
+    nuevos = {}
+    hashes_rodantes(payload.each_char.map(&:ord), m).each_with_index do |h, i|
+      if vistos.key?(h)
+        otro, j = vistos[h]
+        # Solo comparamos si mejora lo que ya encontramos
+        if (encontrado.nil? || otro < encontrado) && payloads[otro][j, m] == payload[i, m]
+          encontrado = otro
+        end
+      end
+      nuevos[h] ||= [indice, i]
+    end
+    nuevos.each { |h, lugar| vistos[h] ||= lugar }
+    encontrado
+  end
+end
+
 puts "\n" + "=" * 60
 puts "EJEMPLO: Funciones Hash"
 puts "=" * 60
@@ -128,6 +285,64 @@ palabras.each do |palabra|
   puts "'#{palabra}': simple=#{hash1}, mejorado=#{hash2}"
 end
 
+puts "\n" + "=" * 60
+puts "EJEMPLO: Rolling hash (Rabin-Karp)"
+puts "=" * 60
+texto = "abracadabra"
+m = 4
+hashes_rodantes(texto.each_char.map(&:ord), m, 1000).each_with_index do |h, i|
+  puts "  '#{texto[i, m]}': rodante=#{h.to_s.rjust(3)}  " \
+       "desde cero=#{hash_string_mejorado(texto[i, m], 1000).to_s.rjust(3)}"
+end
+
+puts "\nBuscar 'abra' y 'cada' en '#{texto}': #{rabin_karp(texto, ['abra', 'cada'])}"
+
+grilla = ["abcab",
+          "cdbcd",
+          "ababc",
+          "cdcdb"]
+puts "\nGrilla:"
+grilla.each { |fila| puts "  #{fila}" }
+puts "Patrón ['ab', 'cd'] en [fila, columna]: #{rabin_karp_2d(grilla, ['ab', 'cd'])}"
+
+puts "\n" + "=" * 60
+puts "EJEMPLO: Detectar payloads casi iguales"
+puts "=" * 60
+payloads = [
+  '{"evento": "compra", "producto": "teclado mecánico", "precio": 120, "id": 1001}',
+  '{"evento": "login", "usuario": "ana", "ip": "10.0.0.7"}',
+  '{"evento": "compra", "producto": "teclado mecánico", "precio": 120, "id": 1002}',
+  '{"evento": "logout", "usuario": "ana"}'
+]
+payloads_parecidos(payloads, 40).each_with_index do |otro, indice|
+  aviso = otro.nil? ? "nuevo" : "casi igual al #{otro}"
+  puts "  payload #{indice}: #{aviso}"
+end
+puts "\nPrimer pedazo de 4 letras repetido en '#{texto}': #{buscar_repetido(texto, 4).inspect}"
+
+grande = Array.new(1_000_000) { "acgt"[rand(4)] }.join
+patrones = Array.new(500) { Array.new(12) { "acgt"[rand(4)] }.join }
+start = Time.now
+patrones.each do |p|
+  i = grande.index(p)
+  i = grande.index(p, i + 1) until i.nil?
+end
+tiempo_index = Time.now - start
+start = Time.now
+todos = rabin_karp(grande, patrones)
+tiempo_rk = Time.now - start
+puts "\n#{patrones.length} patrones de ADN en #{grande.length} letras:"
+puts "  String#index (en C), uno por uno: #{tiempo_index.round(2)} segundos"
+puts "  Rabin-Karp, todos juntos: #{tiempo_rk.round(2)} segundos"
+p0 = patrones[0]
+puts "  ¿Mismo resultado? #{todos[p0] == (0..grande.length - 12).select { |i| grande[i, 12] == p0 }}"
+puts """
+💡 Rabin-Karp recorre el texto UNA vez para todos los patrones: su
+   tiempo casi no cambia con 5 o 5000 patrones. String#index recorre el
+   texto una vez POR patrón (rápido, porque es C, pero crece con la
+   cantidad de patrones).
+"""
+
 puts "\n" + "=" * 60
 puts "💡 HASHING"
 puts "=" * 60
@@ -155,5 +370,7 @@ puts """
    - Caché
    - Bases de datos
    - Verificación de integridad (checksums)
+   - Buscar patrones en textos: Rabin-Karp, O(n + m) en promedio
+   - Detectar copias y pedazos repetidos (deduplicación)
 """
 
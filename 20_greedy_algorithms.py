@@ -82,42 +82,43 @@ def fractional_knapsack(pesos, valores, capacidad):
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO 1: Cambio de Monedas")
-print("=" * 60)
-monedas = [1, 5, 10, 25]
-cantidad = 67
-cambio = cambio_monedas(monedas, cantidad)
-print(f"Monedas disponibles: {monedas}")
-print(f"Cambio para ${cantidad}: {cambio}")
-print(f"Total de monedas: {len(cambio)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Selección de Actividades")
-print("=" * 60)
-inicio = [1, 3, 0, 5, 8, 5]
-fin = [2, 4, 6, 7, 9, 9]
-seleccionadas = actividad_selector(inicio, fin)
-print(f"Horarios: inicio={inicio}, fin={fin}")
-print(f"Actividades seleccionadas (índices): {seleccionadas}")
-print(f"Total de actividades: {len(seleccionadas)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Mochila Fraccional")
-print("=" * 60)
-pesos = [10, 20, 30]
-valores = [60, 100, 120]
-capacidad = 50
-solucion, valor = fractional_knapsack(pesos, valores, capacidad)
-print(f"Pesos: {pesos}, Valores: {valores}, Capacidad: {capacidad}")
-print(f"Solución (fracciones): {solucion}")
-print(f"Valor total: {valor}")
-
-
-print("\n" + "=" * 60)
-print("💡 GREEDY ALGORITMS")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Cambio de Monedas")
+    print("=" * 60)
+    monedas = [1, 5, 10, 25]
+    cantidad = 67
+    cambio = cambio_monedas(monedas, cantidad)
+    print(f"Monedas disponibles: {monedas}")
+    print(f"Cambio para ${cantidad}: {cambio}")
+    print(f"Total de monedas: {len(cambio)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Selección de Actividades")
+    print("=" * 60)
+    inicio = [1, 3, 0, 5, 8, 5]
+    fin = [2, 4, 6, 7, 9, 9]
+    seleccionadas = actividad_selector(inicio, fin)
+    print(f"Horarios: inicio={inicio}, fin={fin}")
+    print(f"Actividades seleccionadas (índices): {seleccionadas}")
+    print(f"Total de actividades: {len(seleccionadas)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Mochila Fraccional")
+    print("=" * 60)
+    pesos = [10, 20, 30]
+    valores = [60, 100, 120]
+    capacidad = 50
+    solucion, valor = fractional_knapsack(pesos, valores, capacidad)
+    print(f"Pesos: {pesos}, Valores: {valores}, Capacidad: {capacidad}")
+    print(f"Solución (fracciones): {solucion}")
+    print(f"Valor total: {valor}")
+
+
+    print("\n" + "=" * 60)
+    print("💡 GREEDY ALGORITMS")
+    print("=" * 60)
+    print("""
 ✅ VENTAJAS:
    - Fácil de entender e implementar
    - Eficiente (rápido)
@@ -127,36 +127,37 @@ def subconjuntos(nums):
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO 1: Permutaciones")
-print("=" * 60)
-nums = [1, 2, 3]
-perms = permutaciones(nums)
-print(f"Permutaciones de {nums}:")
-for perm in perms:
-    print(f"  {perm}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: 4 Reinas")
-print("=" * 60)
-soluciones = n_reinas(4)
-print(f"Número de soluciones para 4 reinas: {len(soluciones)}")
-print(f"Primera solución: {soluciones[0] if soluciones else None}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Subconjuntos")
-print("=" * 60)
-nums = [1, 2, 3]
-subs = subconjuntos(nums)
-print(f"Subconjuntos de {nums}:")
-for sub in subs:
-    print(f"  {sub}")
-
-
-print("\n" + "=" * 60)
-print("💡 BACKTRACKING")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Permutaciones")
+    print("=" * 60)
+    nums = [1, 2, 3]
+    perms = permutaciones(nums)
+    print(f"Permutaciones de {nums}:")
+    for perm in perms:
+        print(f"  {perm}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: 4 Reinas")
+    print("=" * 60)
+    soluciones = n_reinas(4)
+    print(f"Número de soluciones para 4 reinas: {len(soluciones)}")
+    print(f"Primera solución: {soluciones[0] if soluciones else None}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Subconjuntos")
+    print("=" * 60)
+    nums = [1, 2, 3]
+    subs = subconjuntos(nums)
+    print(f"Subconjuntos de {nums}:")
+    for sub in subs:
+        print(f"  {sub}")
+
+
+    print("\n" + "=" * 60)
+    print("💡 BACKTRACKING")
+    print("=" * 60)
+    print("""
 🔑 IDEA PRINCIPAL:
    1. Construir soluciones incrementales
    2. Verificar restricciones en cada paso
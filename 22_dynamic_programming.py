@@ -100,45 +100,46 @@ def knapsack_01(pesos, valores, capacidad):
 
 # 🎯 EJEMPLOS
 
-print("=" * 60)
-print("EJEMPLO 1: Fibonacci")
-print("=" * 60)
-n = 10
-print(f"Fibonacci({n}) con memoización: {fibonacci_memo(n)}")
-print(f"Fibonacci({n}) con tabulación: {fibonacci_tabulation(n)}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 2: Coin Change")
-print("=" * 60)
-monedas = [1, 3, 4]
-cantidad = 6
-min_monedas = coin_change(monedas, cantidad)
-print(f"Monedas: {monedas}, Cantidad: {cantidad}")
-print(f"Mínimo de monedas: {min_monedas}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 3: Longest Common Subsequence")
-print("=" * 60)
-s1 = "ABCDGH"
-s2 = "AEDFHR"
-lcs = longest_common_subsequence(s1, s2)
-print(f"LCS de '{s1}' y '{s2}': {lcs}")
-
-print("\n" + "=" * 60)
-print("EJEMPLO 4: 0-1 Knapsack")
-print("=" * 60)
-pesos = [1, 3, 4, 5]
-valores = [1, 4, 5, 7]
-capacidad = 7
-max_valor = knapsack_01(pesos, valores, capacidad)
-print(f"Pesos: {pesos}, Valores: {valores}, Capacidad: {capacidad}")
-print(f"Valor máximo: {max_valor}")
-
-
-print("\n" + "=" * 60)
-print("💡 DYNAMIC PROGRAMMING")
-print("=" * 60)
-print("""
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EJEMPLO 1: Fibonacci")
+    print("=" * 60)
+    n = 10
+    print(f"Fibonacci({n}) con memoización: {fibonacci_memo(n)}")
+    print(f"Fibonacci({n}) con tabulación: {fibonacci_tabulation(n)}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 2: Coin Change")
+    print("=" * 60)
+    monedas = [1, 3, 4]
+    cantidad = 6
+    min_monedas = coin_change(monedas, cantidad)
+    print(f"Monedas: {monedas}, Cantidad: {cantidad}")
+    print(f"Mínimo de monedas: {min_monedas}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 3: Longest Common Subsequence")
+    print("=" * 60)
+    s1 = "ABCDGH"
+    s2 = "AEDFHR"
+    lcs = longest_common_subsequence(s1, s2)
+    print(f"LCS de '{s1}' y '{s2}': {lcs}")
+
+    print("\n" + "=" * 60)
+    print("EJEMPLO 4: 0-1 Knapsack")
+    print("=" * 60)
+    pesos = [1, 3, 4, 5]
+    valores = [1, 4, 5, 7]
+    capacidad = 7
+    max_valor = knapsack_01(pesos, valores, capacidad)
+    print(f"Pesos: {pesos}, Valores: {valores}, Capacidad: {capacidad}")
+    print(f"Valor máximo: {max_valor}")
+
+
+    print("\n" + "=" * 60)
+    print("💡 DYNAMIC PROGRAMMING")
+    print("=" * 60)
+    print("""
 🔑 TÉCNICAS:
 
 1. MEMOIZATION (Top-Down):
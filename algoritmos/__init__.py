@@ -0,0 +1,88 @@
+"""
+Paquete para USAR los algoritmos del curso desde tu propio código.
+
+Los archivos del curso empiezan con número (01_..., 02_...) para que se
+lean en orden, pero justamente por eso Python no los deja importar con
+"import". Este paquete los carga por nombre de archivo.
+
+Ejemplo:
+    from algoritmos.ordenamiento import ordenar
+    ordenar([5, 2, 8, 1], algoritmo="quick_sort")
+
+    from algoritmos.estructuras import Stack
+    from algoritmos.grafos import Graph, BFS
+
+Todo se carga recién cuando se usa: "import algoritmos" no carga ningún
+archivo del curso, y "from algoritmos.estructuras import Stack" carga
+solo 12_stacks.py. Los ejemplos de cada archivo están bajo
+if __name__ == "__main__", así que cargarlo no imprime nada.
+"""
+
+import os
+import sys
+
+CARPETA_CURSO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cargar_modulo(nombre_archivo):
+    """
+    Carga (una sola vez) un archivo del curso, por ejemplo
+    "06_ordenamiento_quick_sort", y devuelve el módulo.
+    """
+    if nombre_archivo in sys.modules:
+        return sys.modules[nombre_archivo]
+
+    import importlib.util  # Aquí y no arriba: "import algoritmos" queda liviano
+
+    ruta = os.path.join(CARPETA_CURSO, nombre_archivo + ".py")
+    spec = importlib.util.spec_from_file_location(nombre_archivo, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    # Lo registramos antes de ejecutarlo para que otros procesos
+    # (por ejemplo merge_sort_paralelo) puedan encontrar sus funciones
+    sys.modules[nombre_archivo] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    except BaseException:
+        del sys.modules[nombre_archivo]
+        raise
+    return modulo
+
+
+def atributos_perezosos(nombre_modulo, origen):
+    """
+    Crea el __getattr__ de un submódulo que toma sus nombres de los
+    archivos del curso, cargando cada archivo recién cuando se pide
+    algo de él.
+
+    Args:
+        nombre_modulo: __name__ del submódulo
+        origen: Diccionario nombre -> (archivo del curso, nombre en ese archivo)
+    """
+    espacio = sys.modules[nombre_modulo].__dict__
+
+    def __getattr__(nombre):
+        if nombre not in origen:
+            raise AttributeError(f"module {nombre_modulo!r} has no attribute {nombre!r}")
+        archivo, original = origen[nombre]
+        valor = getattr(cargar_modulo(archivo), original)
+        espacio[nombre] = valor  # La próxima vez Python lo encuentra directo
+        return valor
+
+    return __getattr__
+
+
+SUBMODULOS = ["ordenamiento", "busqueda", "estructuras", "grafos",
+              "programacion_dinamica", "instrumentacion", "strings"]
+
+
+def __getattr__(nombre):
+    # "import algoritmos" no importa los submódulos: algoritmos.grafos se
+    # importa la primera vez que alguien lo usa
+    if nombre in SUBMODULOS:
+        import importlib
+        return importlib.import_module(f"{__name__}.{nombre}")
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SUBMODULOS))
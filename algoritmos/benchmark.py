@@ -0,0 +1,408 @@
+"""
+Mide los ordenamientos del curso (archivos 03 a 08b) con datos de verdad.
+
+01_que_es_complejidad.py explica Big O; aquí lo comprobamos:
+
+    python -m algoritmos.benchmark                        # hasta 100000 elementos
+    python -m algoritmos.benchmark --tamano-max 10000000 --json resultados.json
+
+Para cada algoritmo, distribución de datos y tamaño se mide:
+- segundos: el mejor tiempo de varias repeticiones
+- comparaciones: cuántas veces se compararon dos elementos
+- escrituras: cuántas veces se escribió una posición del array de trabajo
+  (un intercambio son 2 escrituras). Solo para los que ordenan en su lugar
+- profundidad: el máximo de llamadas recursivas anidadas
+- memoria_pico: bytes extra que pidió el algoritmo (con tracemalloc)
+
+Al final se ajusta cada curva de tiempo a O(n), O(n log n) y O(n²): si un
+cambio vuelve cuadrático un algoritmo que era O(n log n), se ve en la tabla.
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from algoritmos import cargar_modulo
+from algoritmos.instrumentacion import Instrumentos, ejecutar_instrumentado
+
+
+# 🎲 DISTRIBUCIONES DE DATOS
+#
+# Un algoritmo puede volar con datos al azar y arrastrarse con datos ya
+# ordenados (Quick Sort clásico) o con muchos repetidos. Por eso medimos
+# con varias "formas" de datos.
+
+
+def _aleatorio(n, rng):
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def _ordenado(n, rng):
+    return list(range(n))
+
+
+def _invertido(n, rng):
+    return list(range(n, 0, -1))
+
+
+def _organo(n, rng):
+    # Sube y después baja, como los tubos de un órgano: 0 1 2 3 3 2 1 0
+    mitad = n // 2
+    return list(range(mitad)) + list(range(n - mitad - 1, -1, -1))
+
+
+def _pocos_unicos(n, rng):
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def _zipf(n, rng, s=1.1):
+    # El valor k aparece con probabilidad proporcional a 1/k^s: unos pocos
+    # valores se repiten muchísimo y la mayoría casi nunca (como las
+    # palabras de un idioma o las visitas a páginas web)
+    acumulado = list(itertools.accumulate(1 / k ** s for k in range(1, n + 1)))
+    return rng.choices(range(n), cum_weights=acumulado, k=n)
+
+
+DISTRIBUCIONES = {
+    "aleatorio": _aleatorio,
+    "ordenado": _ordenado,
+    "invertido": _invertido,
+    "organo": _organo,
+    "pocos_unicos": _pocos_unicos,
+    "zipf": _zipf,
+}
+
+
+# 📋 ALGORITMOS A MEDIR
+#
+# archivo, funcion, opciones: qué llamar y con qué argumentos extra
+# en_lugar: la función ordena la lista que recibe y devuelve None
+# cuadratico: O(n²), sirve para no lanzar tamaños que tardarían horas
+# compara: ordena comparando (counting/radix no comparan)
+# escrituras: todas sus escrituras pasan por la lista que recibe (o su
+#             .copy()), así que se pueden contar
+
+Algoritmo = collections.namedtuple(
+    "Algoritmo", "archivo funcion opciones en_lugar cuadratico compara escrituras")
+
+ALGORITMOS = {
+    "bubble_sort": Algoritmo("03_ordenamiento_bubble_sort", "bubble_sort_sin_prints",
+                             {}, False, True, True, True),
+    "bubble_sort_comb": Algoritmo("03_ordenamiento_bubble_sort", "bubble_sort_sin_prints",
+                                  {"modo": "comb"}, False, False, True, True),
+    "selection_sort": Algoritmo("04_ordenamiento_selection_sort", "selection_sort_sin_prints",
+                                {}, False, True, True, True),
+    "selection_sort_torneo": Algoritmo("04_ordenamiento_selection_sort", "selection_sort_sin_prints",
+                                       {"modo": "torneo"}, False, False, True, True),
+    "insertion_sort": Algoritmo("05_ordenamiento_insertion_sort", "insertion_sort_sin_prints",
+                                {}, False, True, True, True),
+    "insertion_sort_binaria": Algoritmo("05_ordenamiento_insertion_sort", "insertion_sort_binaria",
+                                        {}, False, True, True, True),
+    "quick_sort": Algoritmo("06_ordenamiento_quick_sort", "quick_sort",
+                            {}, False, False, True, False),
+    "quick_sort_inplace": Algoritmo("06_ordenamiento_quick_sort", "quick_sort_inplace",
+                                    {}, True, False, True, True),
+    "introsort": Algoritmo("06_ordenamiento_quick_sort", "quick_sort_inplace",
+                           {"modo": "introsort"}, True, False, True, True),
+    "quick_sort_tres_vias": Algoritmo("06_ordenamiento_quick_sort", "quick_sort_inplace",
+                                      {"modo": "tres_vias"}, True, False, True, True),
+    "merge_sort": Algoritmo("08_ordenamiento_merge_sort", "merge_sort",
+                            {}, False, False, True, False),
+    "merge_sort_bottom_up": Algoritmo("08_ordenamiento_merge_sort", "merge_sort_bottom_up",
+                                      {}, False, False, True, False),
+    "merge_sort_natural": Algoritmo("08_ordenamiento_merge_sort", "merge_sort_natural",
+                                    {}, False, False, True, False),
+    "counting_sort": Algoritmo("08b_ordenamiento_radix_sort", "counting_sort_sin_prints",
+                               {}, False, False, False, False),
+    "radix_sort": Algoritmo("08b_ordenamiento_radix_sort", "radix_sort_lsd_sin_prints",
+                            {}, False, False, False, False),
+}
+
+TAMANOS = [10, 100, 1000, 10**4, 10**5, 10**6, 10**7]
+
+
+# ⏱️ MEDICIONES
+
+
+def _ejecutar(algoritmo, datos):
+    """Ordena 'datos' (que se puede modificar) y devuelve el resultado."""
+    funcion = getattr(cargar_modulo(algoritmo.archivo), algoritmo.funcion)
+    if algoritmo.en_lugar:
+        funcion(datos, **algoritmo.opciones)
+        return datos
+    return funcion(datos, **algoritmo.opciones)
+
+
+def medir_tiempo(algoritmo, datos, tiempo_minimo=0.2, repeticiones_max=5):
+    """
+    Mejor tiempo de varias repeticiones. Con arrays chicos una sola
+    medición es puro ruido, así que repite hasta juntar 'tiempo_minimo'.
+
+    Returns:
+        (segundos, resultado de la última repetición)
+    """
+    mejor = math.inf
+    total = 0.0
+    repeticiones = 0
+    while repeticiones < repeticiones_max and (repeticiones == 0 or total < tiempo_minimo):
+        copia = list(datos)
+        inicio = time.perf_counter()
+        resultado = _ejecutar(algoritmo, copia)
+        segundos = time.perf_counter() - inicio
+        mejor = min(mejor, segundos)
+        total += segundos
+        repeticiones += 1
+    return mejor, resultado
+
+
+def medir_memoria(algoritmo, datos):
+    """Bytes extra que pidió el algoritmo (sin contar la entrada)."""
+    copia = list(datos)
+    tracemalloc.start()
+    try:
+        _ejecutar(algoritmo, copia)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def contar_operaciones(algoritmo, datos):
+    """
+    Corre el algoritmo con algoritmos.instrumentacion (es lento, por eso
+    va aparte de la medición de tiempo).
+
+    Returns:
+        (comparaciones, escrituras, profundidad); None donde no se puede contar
+    """
+    funcion = getattr(cargar_modulo(algoritmo.archivo), algoritmo.funcion)
+    instrumentos = Instrumentos()
+    ejecutar_instrumentado(funcion, datos, instrumentos, compara=algoritmo.compara,
+                           **algoritmo.opciones)
+    comparaciones = instrumentos.comparaciones if algoritmo.compara else None
+    escrituras = instrumentos.escrituras if algoritmo.escrituras else None
+    return comparaciones, escrituras, instrumentos.profundidad_max
+
+
+def _estimar_segundos(algoritmo, n_anterior, segundos_anterior, n):
+    """Cuánto tardaría con n elementos si sigue su complejidad esperada."""
+    crecimiento = n / n_anterior
+    if algoritmo.cuadratico:
+        return segundos_anterior * crecimiento ** 2
+    return segundos_anterior * crecimiento * math.log2(n) / math.log2(max(n_anterior, 2))
+
+
+def correr_benchmark(algoritmos=None, distribuciones=None, tamanos=TAMANOS,
+                     limite_segundos=2.0, limite_conteo=10**5, semilla=42,
+                     mostrar_progreso=True):
+    """
+    Corre todas las combinaciones algoritmo x distribución x tamaño.
+
+    Si se estima que un tamaño va a tardar más de 'limite_segundos', ese
+    algoritmo deja de crecer con esa distribución (Bubble Sort con 10^7
+    elementos tardaría días).
+
+    Args:
+        algoritmos: Nombres de ALGORITMOS (por defecto todos)
+        distribuciones: Nombres de DISTRIBUCIONES (por defecto todas)
+        tamanos: Lista de tamaños a probar, de menor a mayor
+        limite_segundos: Tiempo máximo estimado por medición
+        limite_conteo: Tamaño máximo para contar operaciones y memoria
+        semilla: Semilla para que los datos sean siempre los mismos
+        mostrar_progreso: Si True, imprime cada resultado al obtenerlo
+
+    Returns:
+        Lista de diccionarios, uno por medición
+    """
+    algoritmos = algoritmos or list(ALGORITMOS)
+    distribuciones = distribuciones or list(DISTRIBUCIONES)
+    resultados = []
+
+    # Importar cada archivo del curso (compilarlo y ejecutar sus "def") lleva
+    # un rato: lo hacemos antes de medir para que no se sume al primer tiempo
+    for nombre in algoritmos:
+        cargar_modulo(ALGORITMOS[nombre].archivo)
+
+    for nombre_distribucion in distribuciones:
+        for n in tamanos:
+            datos = DISTRIBUCIONES[nombre_distribucion](n, random.Random(semilla))
+            esperado = sorted(datos)
+
+            for nombre in algoritmos:
+                algoritmo = ALGORITMOS[nombre]
+                anteriores = [r for r in resultados
+                              if r["algoritmo"] == nombre and r["distribucion"] == nombre_distribucion]
+                if anteriores and (anteriores[-1]["error"] or anteriores[-1]["segundos"] is None or
+                                   _estimar_segundos(algoritmo, anteriores[-1]["n"],
+                                                     anteriores[-1]["segundos"], n) > limite_segundos):
+                    continue
+
+                resultado = {"algoritmo": nombre, "distribucion": nombre_distribucion, "n": n,
+                             "segundos": None, "comparaciones": None, "escrituras": None,
+                             "profundidad": None, "memoria_pico": None, "error": None}
+                try:
+                    resultado["segundos"], ordenado = medir_tiempo(algoritmo, datos)
+                    if list(ordenado) != esperado:
+                        resultado["error"] = "resultado incorrecto"
+                    elif n <= limite_conteo:
+                        resultado["memoria_pico"] = medir_memoria(algoritmo, datos)
+                        (resultado["comparaciones"], resultado["escrituras"],
+                         resultado["profundidad"]) = contar_operaciones(algoritmo, datos)
+                except RecursionError:
+                    # Quick Sort clásico con datos ordenados: n niveles de recursión
+                    resultado["error"] = "RecursionError"
+                resultados.append(resultado)
+
+                if mostrar_progreso:
+                    _imprimir_resultado(resultado)
+
+    return resultados
+
+
+# 📈 AJUSTE DE COMPLEJIDAD
+
+COMPLEJIDADES = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: n * n,
+}
+
+
+def ajustar_complejidad(puntos, n_minimo=100):
+    """
+    Ajusta una curva de tiempos [(n, segundos), ...].
+
+    1. El exponente es la pendiente de log(segundos) vs log(n)
+       (tiempo ~ n^exponente): 1 es lineal, 2 es cuadrático
+    2. La complejidad que "parece" es la de COMPLEJIDADES para la que
+       segundos / f(n) se mantiene más constante
+
+    Los tamaños menores a n_minimo se ignoran: ahí manda el costo fijo
+    de llamar funciones, no el algoritmo.
+
+    Returns:
+        (exponente, complejidad) o (None, None) si hay menos de 3 puntos
+    """
+    puntos = [(n, s) for n, s in puntos if n >= n_minimo and s and s > 0]
+    if len(puntos) < 3:
+        return None, None
+
+    xs = [math.log(n) for n, _ in puntos]
+    ys = [math.log(s) for _, s in puntos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    exponente = (sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+                 / sum((x - media_x) ** 2 for x in xs))
+
+    def dispersion(f):
+        logs = [math.log(s / f(n)) for n, s in puntos]
+        media = sum(logs) / len(logs)
+        return sum((v - media) ** 2 for v in logs)
+
+    complejidad = min(COMPLEJIDADES, key=lambda nombre: dispersion(COMPLEJIDADES[nombre]))
+    return exponente, complejidad
+
+
+def tabla_de_ajustes(resultados):
+    """Un ajuste por cada par (algoritmo, distribución)."""
+    curvas = {}
+    for r in resultados:
+        if r["segundos"] is not None and not r["error"]:
+            curvas.setdefault((r["algoritmo"], r["distribucion"]), []).append((r["n"], r["segundos"]))
+
+    ajustes = []
+    for (algoritmo, distribucion), puntos in curvas.items():
+        exponente, complejidad = ajustar_complejidad(puntos)
+        ajustes.append({"algoritmo": algoritmo, "distribucion": distribucion,
+                        "exponente": exponente, "complejidad": complejidad,
+                        "n_maximo": max(n for n, _ in puntos)})
+    return ajustes
+
+
+# 🖨️ SALIDA
+
+
+def _imprimir_resultado(r):
+    if r["error"]:
+        detalle = f"❌ {r['error']}"
+    else:
+        detalle = f"{r['segundos']:.6f} s"
+        if r["comparaciones"] is not None:
+            detalle += f"  comparaciones={r['comparaciones']}"
+        if r["escrituras"] is not None:
+            detalle += f"  escrituras={r['escrituras']}"
+        if r["profundidad"] is not None:
+            detalle += f"  profundidad={r['profundidad']}"
+        if r["memoria_pico"] is not None:
+            detalle += f"  memoria={r['memoria_pico']} B"
+    print(f"{r['algoritmo']:<24}{r['distribucion']:<14}n={r['n']:<10}{detalle}")
+
+
+def imprimir_ajustes(ajustes):
+    print("\n" + "=" * 72)
+    print("📈 AJUSTE DE COMPLEJIDAD (según el tiempo)")
+    print("=" * 72)
+    print(f"{'algoritmo':<24}{'distribución':<14}{'exponente':>10}  {'parece':<12}{'hasta n':>10}")
+    for a in sorted(ajustes, key=lambda a: (a["algoritmo"], a["distribucion"])):
+        if a["exponente"] is None:
+            print(f"{a['algoritmo']:<24}{a['distribucion']:<14}{'-':>10}  {'(pocos datos)':<12}{a['n_maximo']:>10}")
+        else:
+            print(f"{a['algoritmo']:<24}{a['distribucion']:<14}{a['exponente']:>10.2f}  "
+                  f"{a['complejidad']:<12}{a['n_maximo']:>10}")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algoritmos.benchmark",
+        description="Mide los ordenamientos del curso con distintas distribuciones de datos.")
+    parser.add_argument("--algoritmos", default=",".join(ALGORITMOS),
+                        help="Nombres separados por coma (por defecto todos)")
+    parser.add_argument("--distribuciones", default=",".join(DISTRIBUCIONES),
+                        help="Nombres separados por coma (por defecto todas)")
+    parser.add_argument("--tamano-max", type=int, default=10**5,
+                        help="Tamaño máximo a probar (hasta 10000000)")
+    parser.add_argument("--limite-segundos", type=float, default=2.0,
+                        help="No probar tamaños que se estima tardarían más que esto")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--json", metavar="RUTA",
+                        help="Guarda resultados y ajustes en un archivo JSON ('-' = pantalla)")
+    args = parser.parse_args(argumentos)
+
+    algoritmos = args.algoritmos.split(",")
+    distribuciones = args.distribuciones.split(",")
+    for nombre in algoritmos:
+        if nombre not in ALGORITMOS:
+            parser.error(f"Algoritmo desconocido: {nombre!r}. Opciones: {', '.join(ALGORITMOS)}")
+    for nombre in distribuciones:
+        if nombre not in DISTRIBUCIONES:
+            parser.error(f"Distribución desconocida: {nombre!r}. Opciones: {', '.join(DISTRIBUCIONES)}")
+
+    tamanos = [n for n in TAMANOS if n <= args.tamano_max]
+    con_json_en_pantalla = args.json == "-"
+    resultados = correr_benchmark(algoritmos, distribuciones, tamanos,
+                                  limite_segundos=args.limite_segundos, semilla=args.semilla,
+                                  mostrar_progreso=not con_json_en_pantalla)
+    ajustes = tabla_de_ajustes(resultados)
+
+    if args.json:
+        salida = {"python": sys.version.split()[0], "tamanos": tamanos,
+                  "resultados": resultados, "ajustes": ajustes}
+        if con_json_en_pantalla:
+            json.dump(salida, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+            return
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump(salida, archivo, ensure_ascii=False, indent=2)
+        print(f"\n💾 Resultados guardados en {args.json}")
+
+    imprimir_ajustes(ajustes)
+
+
+if __name__ == "__main__":
+    main()
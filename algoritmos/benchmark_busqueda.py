@@ -0,0 +1,195 @@
+"""
+Mide las búsquedas en arrays ordenados del curso (archivos 02b, 02c y 07).
+
+    python -m algoritmos.benchmark_busqueda                     # hasta 1000000 elementos
+    python -m algoritmos.benchmark_busqueda --tamano-max 10000000 --json resultados.json
+
+Para cada tamaño se arma un array ordenado de números distintos y un lote
+de consultas (la mitad están en el array y la otra mitad casi nunca), y se
+mide:
+- ns_por_consulta: el mejor tiempo de varias repeticiones, dividido por
+  la cantidad de consultas
+- construir_segundos: lo que tarda armar el índice (solo Eytzinger)
+
+Todas deben devolver lo mismo que binary_search; si alguna no, se marca.
+La diferencia entre el layout ordenado y el de Eytzinger aparece cuando
+el array ya no entra en la caché L2 (a partir de ~10^6 elementos).
+"""
+
+import argparse
+import array
+import collections
+import json
+import random
+import sys
+import time
+
+from algoritmos import cargar_modulo
+
+
+# 📋 BÚSQUEDAS A MEDIR
+#
+# archivo, funcion: qué llamar
+# datos: cómo recibe el array ordenado: "lista", "array" (array.array)
+#        o "numpy"
+# forma: "una"    -> funcion(datos, consulta), una llamada por consulta
+#        "lote"   -> funcion(datos, consultas), todas de una vez
+#        "indice" -> funcion(datos) arma un índice; después .buscar(consulta)
+#        "indice_lote" -> igual, pero con .buscar_muchos(consultas)
+
+Busqueda = collections.namedtuple("Busqueda", "archivo funcion datos forma")
+
+BUSQUEDAS = {
+    "binary_search": Busqueda("02b_binary_search", "binary_search_sin_prints", "lista", "una"),
+    "recursiva": Busqueda("07_recursion", "busqueda_binaria_recursiva", "lista", "una"),
+    "search_many": Busqueda("02b_binary_search", "search_many", "lista", "lote"),
+    "interpolacion": Busqueda("02b_binary_search", "interpolation_search", "lista", "una"),
+    "eytzinger": Busqueda("02c_busqueda_eytzinger", "IndiceEytzinger", "lista", "indice"),
+    "eytzinger_array": Busqueda("02c_busqueda_eytzinger", "IndiceEytzinger", "array", "indice"),
+    "numpy_searchsorted": Busqueda("02b_binary_search", "search_many", "numpy", "lote"),
+    "numpy_eytzinger": Busqueda("02c_busqueda_eytzinger", "IndiceEytzinger", "numpy", "indice_lote"),
+}
+
+TAMANOS = [10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+def _hay_numpy():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _convertir(ordenado, datos):
+    if datos == "array":
+        return array.array("q", ordenado)
+    if datos == "numpy":
+        import numpy
+        return numpy.array(ordenado, dtype=numpy.int64)
+    return ordenado
+
+
+def _preparar(busqueda, ordenado):
+    """
+    Returns:
+        (buscar_todas, segundos que tardó en armarse): buscar_todas(consultas)
+        devuelve la lista de resultados
+    """
+    funcion = getattr(cargar_modulo(busqueda.archivo), busqueda.funcion)
+    datos = _convertir(ordenado, busqueda.datos)
+    inicio = time.perf_counter()
+
+    if busqueda.forma == "una":
+        buscar_todas = lambda consultas: [funcion(datos, q) for q in consultas]
+    elif busqueda.forma == "lote":
+        buscar_todas = lambda consultas: funcion(datos, consultas)
+    else:
+        indice = funcion(datos)
+        if busqueda.forma == "indice":
+            buscar_todas = lambda consultas: [indice.buscar(q) for q in consultas]
+        else:
+            buscar_todas = indice.buscar_muchos
+
+    return buscar_todas, time.perf_counter() - inicio
+
+
+def medir_tiempo(buscar_todas, consultas, repeticiones=3):
+    """Mejor tiempo (en segundos) de buscar todas las consultas."""
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        buscar_todas(consultas)
+        segundos = time.perf_counter() - inicio
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor
+
+
+def correr_benchmark(busquedas=None, tamanos=TAMANOS, cantidad_consultas=100_000,
+                     repeticiones=3, semilla=42, mostrar_progreso=True):
+    """
+    Returns:
+        Lista de diccionarios, uno por (búsqueda, tamaño), con
+        ns_por_consulta, construir_segundos y si el resultado coincide
+        con binary_search.
+    """
+    busquedas = busquedas or list(BUSQUEDAS)
+    if not _hay_numpy():
+        busquedas = [b for b in busquedas if BUSQUEDAS[b].datos != "numpy"]
+
+    rng = random.Random(semilla)
+    resultados = []
+    for n in tamanos:
+        ordenado = sorted(rng.sample(range(10 * n), n))
+        consultas = [rng.choice(ordenado) if i % 2 else rng.randrange(10 * n)
+                     for i in range(cantidad_consultas)]
+        binary_search = getattr(cargar_modulo("02b_binary_search"), "binary_search_sin_prints")
+        esperado = [binary_search(ordenado, q) for q in consultas]
+
+        if mostrar_progreso:
+            print(f"\n📏 n = {n:,}  ({cantidad_consultas:,} consultas)")
+        for nombre in busquedas:
+            buscar_todas, construir = _preparar(BUSQUEDAS[nombre], ordenado)
+            correcto = list(buscar_todas(consultas)) == esperado
+            segundos = medir_tiempo(buscar_todas, consultas, repeticiones)
+            r = {
+                "busqueda": nombre,
+                "n": n,
+                "ns_por_consulta": segundos / cantidad_consultas * 1e9,
+                "construir_segundos": construir,
+                "correcto": correcto,
+            }
+            resultados.append(r)
+            if mostrar_progreso:
+                _imprimir_resultado(r, resultados)
+    return resultados
+
+
+def _imprimir_resultado(r, resultados):
+    base = next((x for x in resultados
+                 if x["n"] == r["n"] and x["busqueda"] == "binary_search"), None)
+    veces = f"{base['ns_por_consulta'] / r['ns_por_consulta']:>5.1f}x" if base else ""
+    construir = f"  (índice: {r['construir_segundos']:.2f} s)" if r["construir_segundos"] > 0.001 else ""
+    marca = "" if r["correcto"] else "  ⚠️  resultado distinto a binary_search"
+    print(f"  {r['busqueda']:<20}{r['ns_por_consulta']:>10.0f} ns/consulta  {veces}{construir}{marca}")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algoritmos.benchmark_busqueda",
+        description="Compara la búsqueda binaria con interpolación, el layout de Eytzinger y NumPy.")
+    parser.add_argument("--busquedas", default=",".join(BUSQUEDAS),
+                        help="Nombres separados por coma (por defecto todas)")
+    parser.add_argument("--tamano-max", type=int, default=10**6,
+                        help="Tamaño máximo a probar (hasta 10000000)")
+    parser.add_argument("--consultas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--json", metavar="RUTA",
+                        help="Guarda los resultados en un archivo JSON ('-' = pantalla)")
+    args = parser.parse_args(argumentos)
+
+    busquedas = args.busquedas.split(",")
+    for nombre in busquedas:
+        if nombre not in BUSQUEDAS:
+            parser.error(f"Búsqueda desconocida: {nombre!r}. Opciones: {', '.join(BUSQUEDAS)}")
+
+    tamanos = [n for n in TAMANOS if n <= args.tamano_max]
+    con_json_en_pantalla = args.json == "-"
+    resultados = correr_benchmark(busquedas, tamanos, args.consultas, args.repeticiones,
+                                  args.semilla, mostrar_progreso=not con_json_en_pantalla)
+
+    if args.json:
+        salida = {"python": sys.version.split()[0], "tamanos": tamanos,
+                  "consultas": args.consultas, "resultados": resultados}
+        if con_json_en_pantalla:
+            json.dump(salida, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+            return
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump(salida, archivo, ensure_ascii=False, indent=2)
+        print(f"\n💾 Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
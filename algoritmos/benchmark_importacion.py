@@ -0,0 +1,88 @@
+"""
+Mide cuánto tarda en importarse cada parte del curso y si imprime algo.
+
+    python -m algoritmos.benchmark_importacion
+
+Cada medición corre en un proceso de Python NUEVO (si no, la segunda vez
+el módulo ya está en sys.modules y tarda cero). Se toma el mejor de varias
+repeticiones y se muestra en microsegundos.
+
+Importar una estructura de datos no debería ejecutar ejemplos ni
+imprimir nada: si un archivo del curso tiene código suelto fuera de
+if __name__ == "__main__", aquí se nota.
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+from algoritmos import CARPETA_CURSO
+
+IMPORTS_DEL_PAQUETE = [
+    "import algoritmos",
+    "from algoritmos.estructuras import Stack",
+    "from algoritmos.estructuras import Queue",
+    "from algoritmos.estructuras import BinarySearchTree",
+    "from algoritmos.grafos import BFS",
+    "from algoritmos.busqueda import binary_search",
+    "from algoritmos.programacion_dinamica import coin_change",
+    "from algoritmos.ordenamiento import ordenar",
+]
+
+# Lo que corre el proceso nuevo: mide solo la sentencia, no el arranque de Python
+_MEDIDOR = """
+import contextlib, io, time
+salida = io.StringIO()
+inicio = time.perf_counter()
+with contextlib.redirect_stdout(salida):
+    exec({sentencia!r})
+print(time.perf_counter() - inicio, len(salida.getvalue()))
+"""
+
+
+def medir_importacion(sentencia, repeticiones=5):
+    """
+    Returns:
+        (mejor tiempo en segundos, caracteres que imprimió)
+    """
+    mejor = None
+    impresos = 0
+    for _ in range(repeticiones):
+        proceso = subprocess.run([sys.executable, "-c", _MEDIDOR.format(sentencia=sentencia)],
+                                 cwd=CARPETA_CURSO, capture_output=True, text=True, check=True)
+        segundos, impresos = proceso.stdout.split()
+        segundos = float(segundos)
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor, int(impresos)
+
+
+def sentencias_del_curso():
+    """Una sentencia cargar_modulo(...) por cada archivo .py del curso."""
+    archivos = sorted(glob.glob(os.path.join(CARPETA_CURSO, "[0-9]*.py")))
+    return [f"from algoritmos import cargar_modulo; cargar_modulo({os.path.basename(a)[:-3]!r})"
+            for a in archivos]
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m algoritmos.benchmark_importacion",
+        description="Mide el tiempo de importación del paquete y de cada archivo del curso.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args(argumentos)
+
+    print(f"{'sentencia':<72}{'µs':>10}  imprime")
+    hay_efectos = False
+    for sentencia in IMPORTS_DEL_PAQUETE + sentencias_del_curso():
+        segundos, impresos = medir_importacion(sentencia, args.repeticiones)
+        hay_efectos = hay_efectos or impresos > 0
+        etiqueta = sentencia.replace("from algoritmos import cargar_modulo; ", "")
+        print(f"{etiqueta:<72}{segundos * 1e6:>10.0f}  {'⚠️  sí' if impresos else 'no'}")
+
+    if hay_efectos:
+        print("\n⚠️  Algún import imprime: tiene ejemplos fuera de if __name__ == \"__main__\"")
+
+
+if __name__ == "__main__":
+    main()
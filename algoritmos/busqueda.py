@@ -0,0 +1,46 @@
+"""
+Búsquedas del curso (archivos 02, 02b y 02c).
+
+    from algoritmos.busqueda import binary_search
+    from algoritmos.busqueda import lower_bound, upper_bound, equal_range, search_many
+
+busqueda_lineal recorre en C (list.index, o todo de una vez con NumPy) y
+busqueda_lineal_multi busca muchos targets en una sola pasada, con un set.
+
+lower_bound, upper_bound, equal_range y search_many no imprimen nada y
+aceptan listas, array.array y arrays de NumPy sin copiarlos.
+
+interpolation_search es O(log log n) con valores parejos (timestamps, ids)
+y se pasa sola a búsqueda binaria si los datos están amontonados.
+exponential_search no necesita saber el largo: sirve con iteradores y
+ArrayPerezoso (un array que se va leyendo de un archivo o generador).
+
+IndiceEytzinger(ordenado) reordena el array para que buscar en arrays
+grandes tenga menos fallos de caché (ver python -m algoritmos.benchmark_busqueda).
+"""
+
+from algoritmos import atributos_perezosos
+
+# Nombre en el paquete -> (archivo del curso, nombre en ese archivo)
+ORIGEN = {
+    "busqueda_lineal": ("02_busqueda_lineal", "busqueda_lineal_rapida"),
+    "busqueda_lineal_multi": ("02_busqueda_lineal", "busqueda_lineal_multi"),
+    "Apariciones": ("02_busqueda_lineal", "Apariciones"),
+    "binary_search": ("02b_binary_search", "binary_search_sin_prints"),
+    "lower_bound": ("02b_binary_search", "lower_bound"),
+    "upper_bound": ("02b_binary_search", "upper_bound"),
+    "equal_range": ("02b_binary_search", "equal_range"),
+    "search_many": ("02b_binary_search", "search_many"),
+    "interpolation_search": ("02b_binary_search", "interpolation_search"),
+    "interpolation_lower_bound": ("02b_binary_search", "interpolation_lower_bound"),
+    "exponential_search": ("02b_binary_search", "exponential_search"),
+    "ArrayPerezoso": ("02b_binary_search", "ArrayPerezoso"),
+    "IndiceEytzinger": ("02c_busqueda_eytzinger", "IndiceEytzinger"),
+}
+
+__all__ = list(ORIGEN)
+__getattr__ = atributos_perezosos(__name__, ORIGEN)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,30 @@
+"""
+Estructuras de datos del curso (archivos 11, 12, 13, 16 y 19).
+
+    from algoritmos.estructuras import Stack, Queue
+
+Cada archivo se carga recién cuando se pide una de sus clases.
+"""
+
+from algoritmos import atributos_perezosos
+
+# Nombre en el paquete -> (archivo del curso, nombre en ese archivo)
+ORIGEN = {
+    "LinkedList": ("11_linked_list", "LinkedList"),
+    "DoublyLinkedList": ("11_linked_list", "DoublyLinkedList"),
+    "Stack": ("12_stacks", "Stack"),
+    "StackLinkedList": ("12_stacks", "StackLinkedList"),
+    "Queue": ("13_queues", "Queue"),
+    "CircularQueue": ("13_queues", "CircularQueue"),
+    "Deque": ("13_queues", "Deque"),
+    "PriorityQueue": ("13_queues", "PriorityQueue"),
+    "BinarySearchTree": ("16_binary_search_tree", "BinarySearchTree"),
+    "HashTable": ("19_hashing", "HashTable"),
+}
+
+__all__ = list(ORIGEN)
+__getattr__ = atributos_perezosos(__name__, ORIGEN)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,22 @@
+"""
+Grafos y sus recorridos (archivo 18).
+
+    from algoritmos.grafos import Graph, BFS
+"""
+
+from algoritmos import atributos_perezosos
+
+# Nombre en el paquete -> (archivo del curso, nombre en ese archivo)
+ORIGEN = {
+    "Graph": ("18_graph_traversal", "Graph"),
+    "BFS": ("18_graph_traversal", "BFS"),
+    "DFS_recursivo": ("18_graph_traversal", "DFS_recursivo"),
+    "DFS_iterativo": ("18_graph_traversal", "DFS_iterativo"),
+}
+
+__all__ = list(ORIGEN)
+__getattr__ = atributos_perezosos(__name__, ORIGEN)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
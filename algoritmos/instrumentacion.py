@@ -0,0 +1,226 @@
+"""
+Contar lo que hace un ordenamiento sin tocar su código.
+
+Los archivos del curso tienen mostrar_pasos=True para VER cada paso con
+prints. Eso sirve para aprender, pero con miles de elementos es lento y
+llena la pantalla. Aquí, en cambio, se CUENTA:
+
+    from algoritmos.instrumentacion import Instrumentos
+    from algoritmos.ordenamiento import ordenar
+
+    instrumentos = Instrumentos()
+    ordenar(datos, algoritmo="quick_sort", instrumentos=instrumentos)
+    instrumentos.resumen()
+    # {'comparaciones': ..., 'escrituras': ..., 'profundidad_max': ..., ...}
+
+¿Cómo, si las funciones no saben nada de esto? Se les da datos "espía":
+- cada elemento se envuelve en un objeto que avisa cuando lo comparan
+- la lista avisa cuando escriben una posición o sacan un pedazo (slice)
+- mientras corre, sys.setprofile avisa cada vez que se entra o se sale de
+  una función del archivo, y así se mide la profundidad de la recursión
+- tracemalloc mide cuánta memoria EXTRA pidió (las listas menores/mayores
+  de quick_sort, el "resultado" de cada merge...), sea cual sea la lista
+
+Cuando NO se usa, el costo es cero: las funciones de ordenamiento no
+tienen ningún "if contador:" adentro; se llaman igual que siempre.
+"""
+
+import sys
+import tracemalloc
+import types
+
+
+class Instrumentos:
+    """
+    Junta los contadores de UNA ejecución.
+
+    Atributos:
+        comparaciones: veces que se compararon dos elementos (o claves)
+        escrituras: posiciones escritas en la lista de trabajo
+                    (un intercambio son 2 escrituras)
+        profundidad_max: máximo de llamadas anidadas de la misma función
+                         (1 = sin recursión)
+        memoria_extra: pico de bytes que pidió la función mientras corría,
+                       sin contar la entrada (con tracemalloc). Cuenta
+                       TODAS las listas auxiliares, no solo las copias
+        copias: copias de la lista de entrada (slices o .copy()); las
+                listas que la función arma por su cuenta no cuentan acá
+        elementos_copiados: cuántos elementos copiaron esas copias
+
+    Args:
+        trazador: Función opcional trazador(evento, datos) que recibe cada
+                  evento: ("comparacion", (a, b)), ("escritura", (indice, valor)),
+                  ("llamada", (nombre_funcion, profundidad)), ("copia", cantidad).
+                  Lo que pida el trazador también suma a memoria_extra
+    """
+
+    def __init__(self, trazador=None):
+        self.trazador = trazador
+        self.comparaciones = 0
+        self.escrituras = 0
+        self.profundidad_max = 0
+        self.memoria_extra = 0
+        self.copias = 0
+        self.elementos_copiados = 0
+
+    def resumen(self):
+        return {
+            "comparaciones": self.comparaciones,
+            "escrituras": self.escrituras,
+            "profundidad_max": self.profundidad_max,
+            "memoria_extra": self.memoria_extra,
+            "copias": self.copias,
+            "elementos_copiados": self.elementos_copiados,
+        }
+
+    def _comparacion(self, a, b):
+        self.comparaciones += 1
+        if self.trazador is not None:
+            self.trazador("comparacion", (a, b))
+
+    def _escritura(self, indice, valor, cantidad=1):
+        self.escrituras += cantidad
+        if self.trazador is not None:
+            self.trazador("escritura", (indice, valor))
+
+    def _llamada(self, nombre, profundidad):
+        self.profundidad_max = max(self.profundidad_max, profundidad)
+        if self.trazador is not None:
+            self.trazador("llamada", (nombre, profundidad))
+
+    def _copia(self, cantidad):
+        self.copias += 1
+        self.elementos_copiados += cantidad
+        if self.trazador is not None:
+            self.trazador("copia", cantidad)
+
+
+class Elemento:
+    """Un valor que avisa a sus Instrumentos cada vez que lo comparan."""
+
+    __slots__ = ("valor", "instrumentos")
+
+    def __init__(self, valor, instrumentos):
+        self.valor = valor
+        self.instrumentos = instrumentos
+
+    def __lt__(self, otro):
+        self.instrumentos._comparacion(self.valor, otro.valor)
+        return self.valor < otro.valor
+
+    def __le__(self, otro):
+        self.instrumentos._comparacion(self.valor, otro.valor)
+        return self.valor <= otro.valor
+
+    def __gt__(self, otro):
+        self.instrumentos._comparacion(self.valor, otro.valor)
+        return self.valor > otro.valor
+
+    def __ge__(self, otro):
+        self.instrumentos._comparacion(self.valor, otro.valor)
+        return self.valor >= otro.valor
+
+    def __eq__(self, otro):
+        self.instrumentos._comparacion(self.valor, otro.valor)
+        return self.valor == otro.valor
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.valor)
+
+
+class ListaInstrumentada(list):
+    """Una lista que avisa de sus escrituras y de los pedazos que se copian."""
+
+    __slots__ = ("instrumentos",)
+
+    def __init__(self, elementos, instrumentos):
+        super().__init__(elementos)
+        self.instrumentos = instrumentos
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valor = list(valor)
+            self.instrumentos._escritura(indice, valor, len(valor))
+        else:
+            self.instrumentos._escritura(indice, valor)
+        super().__setitem__(indice, valor)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            pedazo = ListaInstrumentada(super().__getitem__(indice), self.instrumentos)
+            self.instrumentos._copia(len(pedazo))
+            return pedazo
+        return super().__getitem__(indice)
+
+    def copy(self):
+        self.instrumentos._copia(len(self))
+        return ListaInstrumentada(self, self.instrumentos)
+
+
+def ejecutar_instrumentado(funcion, array, instrumentos, compara=True, **opciones):
+    """
+    Llama a funcion(lista, **opciones) contando en 'instrumentos'.
+
+    Args:
+        funcion: Un ordenamiento del curso (devuelve la lista ordenada u
+                 ordena en su lugar y devuelve None)
+        array: Los datos (no se modifican)
+        instrumentos: Instrumentos donde se acumulan los contadores
+        compara: False para los que hacen cuentas con los valores
+                 (counting/radix sort): ahí no se envuelven los elementos
+        opciones: Argumentos extra para la función (key=, reverse=, modo=...)
+
+    Returns:
+        El resultado de la función, con los valores originales
+    """
+    if compara:
+        lista = ListaInstrumentada((Elemento(x, instrumentos) for x in array), instrumentos)
+        key = opciones.get("key")
+        if key is not None:
+            # La función compara CLAVES: envolvemos lo que devuelve key
+            opciones["key"] = lambda elemento: Elemento(key(elemento.valor), instrumentos)
+    else:
+        lista = ListaInstrumentada(array, instrumentos)
+
+    # Todas las funciones del archivo del algoritmo (para medir la recursión)
+    modulo = sys.modules.get(funcion.__module__)
+    codigos = {f.__code__ for f in vars(modulo).values()
+               if isinstance(f, types.FunctionType)} if modulo else set()
+    codigos.add(funcion.__code__)
+    activas = {}
+
+    def perfil(frame, evento, arg):
+        codigo = frame.f_code
+        if codigo not in codigos:
+            return
+        if evento == "call":
+            activas[codigo] = activas.get(codigo, 0) + 1
+            instrumentos._llamada(codigo.co_name, activas[codigo])
+        elif evento == "return":
+            activas[codigo] -= 1
+
+    # Si alguien ya estaba midiendo con tracemalloc, no se lo apagamos
+    ya_midiendo = tracemalloc.is_tracing()
+    if not ya_midiendo:
+        tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    perfil_anterior = sys.getprofile()
+    sys.setprofile(perfil)
+    try:
+        resultado = funcion(lista, **opciones)
+    finally:
+        sys.setprofile(perfil_anterior)
+        pico = tracemalloc.get_traced_memory()[1]
+        if not ya_midiendo:
+            tracemalloc.stop()
+    instrumentos.memoria_extra = max(instrumentos.memoria_extra, pico - antes)
+
+    if resultado is None:
+        resultado = lista  # Ordenó en su lugar
+    if compara:
+        return [x.valor if isinstance(x, Elemento) else x for x in resultado]
+    return list(resultado)
@@ -0,0 +1,377 @@
+"""
+Una sola puerta de entrada para los ordenamientos del curso.
+
+    ordenar(array, algoritmo="merge_sort", backend="python")
+
+- backend="python": usa las funciones "sin_prints" de los archivos 03 a 08b,
+  que recorren la lista elemento por elemento.
+- backend="numpy": el mismo algoritmo, pero cada paso trabaja sobre TODO
+  el array de una vez (operaciones vectorizadas). Los números no se
+  convierten en objetos de Python uno por uno, así que es mucho más rápido
+  para columnas numéricas grandes.
+
+NumPy es opcional: solo hace falta instalarlo para backend="numpy".
+"""
+
+import sys
+
+from algoritmos import cargar_modulo
+from algoritmos.instrumentacion import ejecutar_instrumentado
+
+# NumPy tarda en importarse, así que lo importamos recién cuando hace falta
+np = None
+
+
+def _cargar_numpy():
+    """Importa NumPy la primera vez; devuelve None si no está instalado."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+# Para cada algoritmo: (archivo del curso, función a usar)
+ALGORITMOS_PYTHON = {
+    "bubble_sort": ("03_ordenamiento_bubble_sort", "bubble_sort_sin_prints"),
+    "selection_sort": ("04_ordenamiento_selection_sort", "selection_sort_sin_prints"),
+    "insertion_sort": ("05_ordenamiento_insertion_sort", "insertion_sort_sin_prints"),
+    "quick_sort": ("06_ordenamiento_quick_sort", "quick_sort"),
+    "merge_sort": ("08_ordenamiento_merge_sort", "merge_sort"),
+    "counting_sort": ("08b_ordenamiento_radix_sort", "counting_sort_sin_prints"),
+    "radix_sort": ("08b_ordenamiento_radix_sort", "radix_sort_lsd_sin_prints"),
+    "radix_sort_strings": ("08b_ordenamiento_radix_sort", "radix_sort_msd_sin_prints"),
+}
+
+
+def elegir_algoritmo(array):
+    """
+    Elige el algoritmo más rápido según el TIPO de datos:
+    - Enteros en un rango chico -> counting_sort
+    - Enteros cualesquiera -> radix_sort
+    - Strings -> radix_sort_strings
+    - Cualquier otra cosa -> merge_sort (solo necesita poder comparar)
+    """
+    # Si NumPy nunca se importó, 'array' no puede ser un array de NumPy
+    if "numpy" in sys.modules and isinstance(array, _cargar_numpy().ndarray):
+        if array.ndim == 1 and len(array) > 0 and array.dtype.kind in "biu":
+            return "counting_sort" if _rango(array) <= 2 * len(array) + 256 else "radix_sort"
+        if array.ndim == 1 and array.dtype.kind == "f":
+            return "radix_sort"
+        return "merge_sort"
+
+    if len(array) == 0:
+        return "merge_sort"
+    if all(type(x) is int for x in array):
+        return "counting_sort" if max(array) - min(array) <= 2 * len(array) + 256 else "radix_sort"
+    if all(type(x) is str for x in array):
+        return "radix_sort_strings"
+    return "merge_sort"
+
+
+# Algoritmos que aceptan key= y reverse= (y garantizan estabilidad)
+ALGORITMOS_CON_CLAVE = {"insertion_sort", "quick_sort", "merge_sort"}
+
+# Algoritmos que hacen cuentas con los valores en lugar de compararlos
+ALGORITMOS_SIN_COMPARACIONES = {"counting_sort", "radix_sort", "radix_sort_strings"}
+
+
+def ordenar(array, algoritmo="merge_sort", backend="python", key=None, reverse=False,
+            instrumentos=None):
+    """
+    Ordena un array con el algoritmo y el backend elegidos.
+
+    Args:
+        array: Lista (o cualquier secuencia) de elementos comparables.
+               Con backend="numpy", un array numérico de NumPy
+        algoritmo: "bubble_sort", "selection_sort", "insertion_sort",
+                   "quick_sort", "merge_sort", "counting_sort", "radix_sort",
+                   "radix_sort_strings" o "auto" (lo elige elegir_algoritmo)
+        backend: "python" o "numpy"
+        key: Función que da la clave de cada elemento (se llama una vez
+             por elemento). Solo con backend="python" y los algoritmos
+             de ALGORITMOS_CON_CLAVE
+        reverse: Si True, ordena de MAYOR a MENOR
+        instrumentos: Un Instrumentos de algoritmos.instrumentacion donde
+                      contar comparaciones, escrituras, recursión y memoria
+                      extra. Solo con backend="python"
+
+    Returns:
+        Un array NUEVO ordenado (lista con "python", ndarray con "numpy");
+        el original no se modifica. Con "numpy", los NaN quedan al final
+        (también con reverse=True), como en np.sort
+    """
+    if algoritmo == "auto":
+        # Con key, el tipo de los elementos no dice nada de las claves
+        algoritmo = elegir_algoritmo(array) if key is None else "merge_sort"
+        if reverse and backend == "python" and algoritmo in ALGORITMOS_SIN_COMPARACIONES:
+            # Solo se eligen con ints o strs, donde dos iguales son idénticos:
+            # ordenar de menor a mayor y dar vuelta da lo mismo que reverse
+            return ordenar(array, algoritmo, backend, instrumentos=instrumentos)[::-1]
+
+    if algoritmo not in ALGORITMOS_PYTHON:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo!r}. "
+                         f"Opciones: {', '.join(ALGORITMOS_PYTHON)}")
+
+    if backend == "python":
+        archivo, funcion = ALGORITMOS_PYTHON[algoritmo]
+        funcion = getattr(cargar_modulo(archivo), funcion)
+        opciones = {}
+        if key is not None or reverse:
+            if algoritmo not in ALGORITMOS_CON_CLAVE:
+                raise ValueError(f"{algoritmo!r} no acepta key/reverse. "
+                                 f"Opciones: {', '.join(sorted(ALGORITMOS_CON_CLAVE))}")
+            opciones = {"key": key, "reverse": reverse}
+        if instrumentos is not None:
+            return ejecutar_instrumentado(funcion, array, instrumentos,
+                                          compara=algoritmo not in ALGORITMOS_SIN_COMPARACIONES,
+                                          **opciones)
+        return funcion(list(array), **opciones)
+
+    if backend == "numpy":
+        if _cargar_numpy() is None:
+            raise ImportError('backend="numpy" necesita NumPy (pip install numpy)')
+        arr = np.array(array)  # Copia: no tocamos el original
+        if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+            raise TypeError('backend="numpy" solo ordena arrays numéricos de una dimensión')
+        if algoritmo not in ALGORITMOS_NUMPY:
+            raise ValueError(f'{algoritmo!r} no tiene versión con backend="numpy"')
+        if key is not None:
+            raise ValueError('key no está disponible con backend="numpy"')
+        if instrumentos is not None:
+            raise ValueError('instrumentos no está disponible con backend="numpy"')
+        if len(arr) == 0:
+            return arr  # np.array([]) es float: counting_sort lo rechazaría
+        # NaN no es <, == ni > que nada, así que ningún algoritmo sabe dónde
+        # ponerlo. Como np.sort, los apartamos y van siempre al final.
+        nan = arr[:0]
+        if arr.dtype.kind == "f":
+            es_nan = np.isnan(arr)
+            if es_nan.any():
+                arr, nan = arr[~es_nan], arr[es_nan]
+        resultado = ALGORITMOS_NUMPY[algoritmo](arr)
+        if reverse:
+            resultado = resultado[::-1]
+        return np.concatenate((resultado, nan)) if len(nan) else resultado
+
+    raise ValueError(f'Backend desconocido: {backend!r}. Opciones: "python", "numpy"')
+
+
+# 🔢 VERSIONES VECTORIZADAS (NumPy)
+#
+# Cada función recibe un array de NumPy que puede modificar y devuelve
+# el array ordenado. La idea de cada algoritmo es la misma que en su
+# archivo del curso; lo que cambia es que cada "paso" se hace sobre muchos
+# elementos a la vez.
+
+
+def _bubble_sort_numpy(arr):
+    """
+    Bubble Sort "par-impar": en cada fase compara TODOS los pares vecinos
+    (0,1), (2,3), ... o (1,2), (3,4), ... a la vez. En n fases queda ordenado.
+    """
+    n = len(arr)
+    fases_sin_cambios = 0
+    fase = 0
+    while fases_sin_cambios < 2 and fase < n:
+        inicio = fase % 2
+        izquierda = arr[inicio:n - 1:2]    # Vistas, no copias
+        derecha = arr[inicio + 1:n:2]
+        if (izquierda > derecha).any():
+            menores = np.minimum(izquierda, derecha)
+            izquierda[...] = np.maximum(izquierda, derecha)
+            derecha[...] = izquierda
+            izquierda[...] = menores
+            fases_sin_cambios = 0
+        else:
+            fases_sin_cambios += 1
+        fase += 1
+    return arr
+
+
+def _selection_sort_numpy(arr):
+    """Selection Sort: la búsqueda del mínimo de cada pasada es un solo argmin."""
+    for i in range(len(arr) - 1):
+        min_idx = i + int(np.argmin(arr[i:]))
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+    return arr
+
+
+def _insertion_sort_numpy(arr):
+    """
+    Insertion Sort: la posición se busca con búsqueda binaria (searchsorted)
+    y los elementos se corren de a bloque (una sola copia de memoria).
+    """
+    for i in range(1, len(arr)):
+        valor_actual = arr[i]
+        pos = int(np.searchsorted(arr[:i], valor_actual, side="right"))
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]  # NumPy maneja bien el solapamiento
+            arr[pos] = valor_actual
+    return arr
+
+
+def _quick_sort_numpy(arr):
+    """Quick Sort: menores/iguales/mayores se separan con máscaras booleanas."""
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr) // 2]
+    menores = arr[arr < pivot]
+    iguales = arr[arr == pivot]
+    mayores = arr[arr > pivot]
+    return np.concatenate((_quick_sort_numpy(menores), iguales, _quick_sort_numpy(mayores)))
+
+
+def _merge_sort_numpy(arr):
+    """
+    Merge Sort bottom-up donde cada pasada combina TODOS los pares de runs
+    a la vez.
+
+    Truco: la posición final de un elemento dentro de su par es
+    (su posición en su run) + (cuántos del otro run van antes que él).
+    Ese conteo se calcula con searchsorted para todos los elementos juntos.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    if arr.dtype.kind == "f" or _rango(arr) * ((n + 1) // 2) >= 2**63:
+        return _merge_sort_numpy_por_pares(arr)
+
+    # Claves enteras >= 0; a cada par le sumamos un desplazamiento distinto
+    # para que TODOS los runs derechos juntos formen una secuencia ordenada
+    ancho_claves = _rango(arr)
+    amplio = arr.astype(np.uint64 if arr.dtype.kind == "u" else np.int64)
+    base = (amplio - amplio.min()).astype(np.int64)
+    indices = np.arange(n)
+
+    ancho = 1
+    while ancho < n:
+        grupo = indices // (2 * ancho)
+        en_derecha = (indices % (2 * ancho)) >= ancho
+        en_izquierda = ~en_derecha
+        claves = base + grupo * ancho_claves
+        inicio_grupo = grupo * ancho_claves
+
+        claves_izq = claves[en_izquierda]
+        claves_der = claves[en_derecha]
+        otros_antes = np.empty(n, dtype=np.int64)
+        # Izquierda: cuántos de la derecha de su par son MENORES (estable)
+        otros_antes[en_izquierda] = (np.searchsorted(claves_der, claves_izq, side="left")
+                                     - np.searchsorted(claves_der, inicio_grupo[en_izquierda], side="left"))
+        # Derecha: cuántos de la izquierda de su par son MENORES O IGUALES
+        otros_antes[en_derecha] = (np.searchsorted(claves_izq, claves_der, side="right")
+                                   - np.searchsorted(claves_izq, inicio_grupo[en_derecha], side="left"))
+
+        destino = grupo * 2 * ancho + indices % ancho + otros_antes
+        nuevo_arr = np.empty_like(arr)
+        nueva_base = np.empty_like(base)
+        nuevo_arr[destino] = arr
+        nueva_base[destino] = base
+        arr, base = nuevo_arr, nueva_base
+        ancho *= 2
+
+    return arr
+
+
+def _merge_sort_numpy_por_pares(arr):
+    """
+    Plan B de _merge_sort_numpy (decimales o enteros enormes): cada merge
+    es vectorizado, pero los pares se recorren uno por uno.
+    """
+    n = len(arr)
+    destino = np.empty_like(arr)
+    ancho = 1
+    while ancho < n:
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(inicio + 2 * ancho, n)
+            izquierda, derecha = arr[inicio:medio], arr[medio:fin]
+            pos_izq = np.arange(len(izquierda)) + np.searchsorted(derecha, izquierda, side="left")
+            pos_der = np.arange(len(derecha)) + np.searchsorted(izquierda, derecha, side="right")
+            destino[inicio + pos_izq] = izquierda
+            destino[inicio + pos_der] = derecha
+        arr, destino = destino, arr
+        ancho *= 2
+    return arr
+
+
+def _counting_sort_numpy(arr):
+    """Counting Sort: bincount cuenta todo de una vez y repeat reconstruye."""
+    if arr.dtype.kind not in "biu":
+        raise TypeError("counting_sort solo ordena enteros")
+    if len(arr) == 0:
+        return arr
+    # Las cuentas se hacen sin signo y del mismo tamaño: valor - mínimo
+    # siempre entra, aunque se salga de int64 (uint64 cerca de 2**64) o
+    # del propio tipo (int8: 127 - (-128) = 255)
+    sin_signo = arr.view(arr.dtype.str.replace("i", "u").replace("b", "u"))
+    minimo = sin_signo[arr.argmin()]
+    conteo = np.bincount((sin_signo - minimo).astype(np.intp))
+    valores = (minimo + np.arange(len(conteo), dtype=sin_signo.dtype)).astype(sin_signo.dtype)
+    return np.repeat(valores, conteo).view(arr.dtype)
+
+
+def _radix_sort_numpy(arr):
+    """
+    Radix Sort LSD con dígitos de 8 bits sobre claves de 64 bits.
+
+    Cada pasada es un Counting Sort estable: bincount da el tamaño de cada
+    cubeta y una máscara por dígito presente da sus elementos en orden.
+    Las pasadas donde todos tienen el mismo dígito se saltean (con enteros
+    chicos, los bytes altos son todos iguales).
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    claves = _claves_ordenables(arr)
+    for desplazamiento in range(0, 64, 8):
+        digito = ((claves >> np.uint64(desplazamiento)) & np.uint64(0xFF)).astype(np.intp)
+        if digito.min() == digito.max():
+            continue
+        conteo = np.bincount(digito, minlength=256)
+        inicios = np.cumsum(conteo) - conteo
+        orden = np.empty(n, dtype=np.intp)
+        for d in np.flatnonzero(conteo):
+            orden[inicios[d]:inicios[d] + conteo[d]] = np.flatnonzero(digito == d)
+        claves = claves[orden]
+        arr = arr[orden]
+    return arr
+
+
+def _claves_ordenables(arr):
+    """
+    Convierte el array en enteros de 64 bits SIN signo que se ordenan igual
+    que los valores originales (así el radix sort no tiene que pensar en
+    negativos ni en decimales).
+    """
+    if arr.dtype.kind == "f":
+        # Para decimales: si el signo es negativo invertimos todos los bits,
+        # si es positivo solo el bit de signo
+        bits = arr.astype(np.float64).view(np.uint64)
+        negativo = (bits >> np.uint64(63)).astype(bool)
+        return bits ^ np.where(negativo, np.uint64(0xFFFFFFFFFFFFFFFF), np.uint64(1 << 63))
+    if arr.dtype.kind == "i":
+        return arr.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    return arr.astype(np.uint64)
+
+
+def _rango(arr):
+    """Cantidad de valores posibles entre el mínimo y el máximo (en int de Python)."""
+    return int(arr.max()) - int(arr.min()) + 1
+
+
+ALGORITMOS_NUMPY = {
+    "bubble_sort": _bubble_sort_numpy,
+    "selection_sort": _selection_sort_numpy,
+    "insertion_sort": _insertion_sort_numpy,
+    "quick_sort": _quick_sort_numpy,
+    "merge_sort": _merge_sort_numpy,
+    "counting_sort": _counting_sort_numpy,
+    "radix_sort": _radix_sort_numpy,
+}
@@ -0,0 +1,23 @@
+"""
+Problemas clásicos de programación dinámica (archivo 22).
+
+    from algoritmos.programacion_dinamica import coin_change
+"""
+
+from algoritmos import atributos_perezosos
+
+# Nombre en el paquete -> (archivo del curso, nombre en ese archivo)
+ORIGEN = {
+    "fibonacci_memo": ("22_dynamic_programming", "fibonacci_memo"),
+    "fibonacci_tabulation": ("22_dynamic_programming", "fibonacci_tabulation"),
+    "coin_change": ("22_dynamic_programming", "coin_change"),
+    "longest_common_subsequence": ("22_dynamic_programming", "longest_common_subsequence"),
+    "knapsack_01": ("22_dynamic_programming", "knapsack_01"),
+}
+
+__all__ = list(ORIGEN)
+__getattr__ = atributos_perezosos(__name__, ORIGEN)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,62 @@
+"""
+Búsqueda de patrones en textos (archivos 08, 08c, 08d, 10 y 19).
+
+    from algoritmos.strings import compilar_patron, AhoCorasick
+
+    patron = compilar_patron("ERROR disk full")   # se prepara una vez
+    patron.buscar(log)                            # todas las posiciones
+
+    prohibidas = AhoCorasick(["spam", "scam", ...])
+    prohibidas.buscar(texto)                      # todas a la vez, una pasada
+
+compilar_patron elige entre KMP (alfabetos chicos o patrones repetitivos:
+O(n) garantizado) y Boyer-Moore-Horspool (patrones largos en texto normal:
+se saltea la mayor parte del texto). AhoCorasick busca miles de patrones
+en una sola pasada, y con feed(chunk) sigue un texto que llega de a pedazos.
+rabin_karp busca muchos patrones del mismo largo con un hash rodante
+(también en grillas, con rabin_karp_2d), y payloads_parecidos detecta
+textos casi iguales.
+
+IndiceSufijos (suffix array + LCP) prepara un texto que no cambia para
+responder muchas búsquedas en O(m log n); con guardar y abrir queda en un
+archivo que varios procesos comparten con mmap.
+
+Las funciones _stream (contar_vocales_stream, comprimir_stream, ...) leen
+archivos, generadores de pedazos o un mmap de a 1 MB de bytes: sirven para
+textos de varios GB sin cargarlos en memoria.
+"""
+
+from algoritmos import atributos_perezosos
+
+# Nombre en el paquete -> (archivo del curso, nombre en ese archivo)
+ORIGEN = {
+    "busqueda_naive": ("08_busqueda_strings", "busqueda_naive"),
+    "compilar_patron": ("08_busqueda_strings", "compilar_patron"),
+    "buscar_patron": ("08_busqueda_strings", "buscar_patron"),
+    "PatronKMP": ("08_busqueda_strings", "PatronKMP"),
+    "PatronHorspool": ("08_busqueda_strings", "PatronHorspool"),
+    "PatronNaive": ("08_busqueda_strings", "PatronNaive"),
+    "AhoCorasick": ("08c_aho_corasick", "AhoCorasick"),
+    "Coincidencia": ("08c_aho_corasick", "Coincidencia"),
+    "IndiceSufijos": ("08d_suffix_array", "IndiceSufijos"),
+    "construir_suffix_array": ("08d_suffix_array", "construir_suffix_array"),
+    "construir_lcp": ("08d_suffix_array", "construir_lcp"),
+    "leer_en_pedazos": ("10_strings_algoritmos", "leer_en_pedazos"),
+    "contar_vocales_stream": ("10_strings_algoritmos", "contar_vocales_stream"),
+    "primera_letra_no_repetida_stream": ("10_strings_algoritmos",
+                                         "primera_letra_no_repetida_stream"),
+    "comprimir_stream": ("10_strings_algoritmos", "comprimir_stream"),
+    "es_palindromo_stream": ("10_strings_algoritmos", "es_palindromo_stream"),
+    "hashes_rodantes": ("19_hashing", "hashes_rodantes"),
+    "rabin_karp": ("19_hashing", "rabin_karp"),
+    "rabin_karp_2d": ("19_hashing", "rabin_karp_2d"),
+    "buscar_repetido": ("19_hashing", "buscar_repetido"),
+    "payloads_parecidos": ("19_hashing", "payloads_parecidos"),
+}
+
+__all__ = list(ORIGEN)
+__getattr__ = atributos_perezosos(__name__, ORIGEN)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))